@@ -17,6 +17,16 @@ class _RunnerConfig:
 @dataclasses.dataclass(frozen=True)
 class _PyRunnerConfig(_RunnerConfig):
     name = "py"
+    memory_budget_bytes: int | None = None
+    spill_directory: str | None = None
+    num_threads: int | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class _ProcessRunnerConfig(_RunnerConfig):
+    name = "process"
+    num_workers: int | None = None
+    shared_memory_directory: str | None = None
 
 
 @dataclasses.dataclass(frozen=True)
@@ -35,6 +45,7 @@ def _get_runner_config_from_env() -> _RunnerConfig:
 
     1. PyRunner: set DAFT_RUNNER=py
     2. RayRunner: set DAFT_RUNNER=ray and optionally DAFT_RAY_ADDRESS=ray://...
+    3. ProcessRunner: set DAFT_RUNNER=process and optionally DAFT_PROCESS_NUM_WORKERS=... and DAFT_PROCESS_SHARED_MEMORY_DIR=...
     """
     if "DAFT_RUNNER" in os.environ:
         runner = os.environ["DAFT_RUNNER"]
@@ -49,9 +60,25 @@ def _get_runner_config_from_env() -> _RunnerConfig:
                 batch_dispatch_coeff=float(batch_dispatch_env) if batch_dispatch_env else None,
             )
         elif runner.upper() == "PY":
-            return _PyRunnerConfig()
+            return _get_py_runner_config_from_env()
+        elif runner.upper() == "PROCESS":
+            num_workers_env = os.getenv("DAFT_PROCESS_NUM_WORKERS")
+            return _ProcessRunnerConfig(
+                num_workers=int(num_workers_env) if num_workers_env else None,
+                shared_memory_directory=os.getenv("DAFT_PROCESS_SHARED_MEMORY_DIR"),
+            )
         raise ValueError(f"Unsupported DAFT_RUNNER variable: {os.environ['DAFT_RUNNER']}")
-    return _PyRunnerConfig()
+    return _get_py_runner_config_from_env()
+
+
+def _get_py_runner_config_from_env() -> _PyRunnerConfig:
+    memory_budget_env = os.getenv("DAFT_PYRUNNER_MEMORY_BUDGET_BYTES")
+    num_threads_env = os.getenv("DAFT_PYRUNNER_NUM_THREADS")
+    return _PyRunnerConfig(
+        memory_budget_bytes=int(memory_budget_env) if memory_budget_env else None,
+        spill_directory=os.getenv("DAFT_PYRUNNER_SPILL_DIR"),
+        num_threads=int(num_threads_env) if num_threads_env else None,
+    )
 
 
 # Global Runner singleton, initialized when accessed through the DaftContext
@@ -84,7 +111,21 @@ class DaftContext:
             from daft.runners.pyrunner import PyRunner
 
             logger.info("Using PyRunner")
-            _RUNNER = PyRunner()
+            assert isinstance(self.runner_config, _PyRunnerConfig)
+            _RUNNER = PyRunner(
+                memory_budget_bytes=self.runner_config.memory_budget_bytes,
+                spill_directory=self.runner_config.spill_directory,
+                num_threads=self.runner_config.num_threads,
+            )
+        elif self.runner_config.name == "process":
+            from daft.runners.process_runner import ProcessRunner
+
+            logger.info("Using ProcessRunner")
+            assert isinstance(self.runner_config, _ProcessRunnerConfig)
+            _RUNNER = ProcessRunner(
+                num_workers=self.runner_config.num_workers,
+                shared_memory_directory=self.runner_config.shared_memory_directory,
+            )
 
         else:
             raise NotImplementedError(f"Runner config implemented: {self.runner_config.name}")
@@ -142,10 +183,26 @@ def set_runner_ray(
     return _DaftContext
 
 
-def set_runner_py() -> DaftContext:
+def set_runner_py(
+    memory_budget_bytes: int | None = None,
+    spill_directory: str | None = None,
+    num_threads: int | None = None,
+) -> DaftContext:
     """Set the runner for executing Daft dataframes to your local Python interpreter - this is the default behavior.
 
-    Alternatively, users can set this behavior via an environment variable: DAFT_RUNNER=py
+    Alternatively, users can set this behavior via environment variables:
+
+    1. DAFT_RUNNER=py
+    2. Optionally, DAFT_PYRUNNER_MEMORY_BUDGET_BYTES=..., DAFT_PYRUNNER_SPILL_DIR=... and DAFT_PYRUNNER_NUM_THREADS=...
+
+    Args:
+        memory_budget_bytes: Maximum total size of the intermediate partitions to hold in memory, beyond which the
+            least recently used ones are spilled to disk as Arrow IPC files. Defaults to None, which holds all of them
+            in memory.
+        spill_directory: Local directory to spill partitions to. Defaults to the temporary directory of the system.
+        num_threads: Number of threads to run independent tasks on concurrently. Defaults to None, which runs tasks
+            one at a time. Running tasks on several threads overlaps I/O and computations that release the GIL, but
+            also calls UDFs concurrently from several threads, so it should only be enabled for thread-safe UDFs.
 
     Returns:
         DaftContext: Daft context after setting the Py runner
@@ -155,7 +212,36 @@ def set_runner_py() -> DaftContext:
         raise RuntimeError("Cannot set runner more than once")
     _DaftContext = dataclasses.replace(
         _DaftContext,
-        runner_config=_PyRunnerConfig(),
+        runner_config=_PyRunnerConfig(
+            memory_budget_bytes=memory_budget_bytes, spill_directory=spill_directory, num_threads=num_threads
+        ),
+        disallow_set_runner=True,
+    )
+    return _DaftContext
+
+
+def set_runner_process(num_workers: int | None = None, shared_memory_directory: str | None = None) -> DaftContext:
+    """Set the runner for executing Daft dataframes to a pool of worker processes on your local machine
+
+    Alternatively, users can set this behavior via environment variables:
+
+    1. DAFT_RUNNER=process
+    2. Optionally, DAFT_PROCESS_NUM_WORKERS=... and DAFT_PROCESS_SHARED_MEMORY_DIR=...
+
+    Args:
+        num_workers: Number of worker processes to run tasks on. Defaults to None, which uses one process per CPU.
+        shared_memory_directory: Local directory to exchange partitions between processes through. Defaults to None,
+            which uses /dev/shm if it has enough free space and the temporary directory of the system otherwise.
+
+    Returns:
+        DaftContext: Daft context after setting the process runner
+    """
+    global _DaftContext
+    if _DaftContext.disallow_set_runner:
+        raise RuntimeError("Cannot set runner more than once")
+    _DaftContext = dataclasses.replace(
+        _DaftContext,
+        runner_config=_ProcessRunnerConfig(num_workers=num_workers, shared_memory_directory=shared_memory_directory),
         disallow_set_runner=True,
     )
     return _DaftContext
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import warnings
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, TypeVar, Union
 
 import pandas
 
@@ -10,7 +12,9 @@ from daft import resource_request
 from daft.api_annotations import DataframePublicAPI
 from daft.context import get_context
 from daft.dataframe.preview import DataFramePreview
+from daft.dataframe.schema_cache import get_schema_cache
 from daft.datasources import (
+    ArrowIPCSourceInfo,
     CSVSourceInfo,
     JSONSourceInfo,
     ParquetSourceInfo,
@@ -18,9 +22,20 @@ from daft.datasources import (
     StorageType,
 )
 from daft.errors import ExpressionTypeError
+from daft.execution.hive_partitioning import (
+    hive_partition_root,
+    hive_partition_values,
+    infer_hive_partition_fields,
+)
 from daft.execution.operators import ExpressionType
+from daft.execution.scan_planning import (
+    SCAN_TASK_PATH_COLUMN_NAME,
+    plan_scan_tasks,
+    scan_task_schema,
+    scan_task_to_vpartition,
+)
 from daft.expressions import Expression, col
-from daft.filesystem import get_filesystem_from_path
+from daft.filesystem import FileVersion, clear_listing_cache, get_filesystem_from_path
 from daft.logical import logical_plan
 from daft.logical.schema import ExpressionList
 from daft.runners.partitioning import (
@@ -46,44 +61,102 @@ ColumnInputType = Union[Expression, str]
 
 
 def _get_tabular_files_scan(
-    path: str, get_schema: Callable[[str], Schema], source_info: SourceInfo
+    path: str,
+    get_schema: Callable[[str, FileVersion | None], Schema],
+    source_info: SourceInfo,
+    schema_inference_options: Hashable = None,
+    target_partition_size_bytes: int | None = None,
+    hive_partitioning: bool = True,
 ) -> logical_plan.TabularFilesScan:
-    """Returns a TabularFilesScan LogicalPlan for a given glob filepath."""
+    """Returns a TabularFilesScan LogicalPlan for a given glob filepath.
+
+    `get_schema` infers the schema of a file from its path and its version from the listing, if known.
+    `schema_inference_options` describes any options used by `get_schema` that are not part of `source_info`, and is
+    used together with `source_info` to look up previously inferred schemas in the schema cache.
+
+    If `hive_partitioning` is True, `<column>=<value>` directories in the paths of the files are added as columns.
+    """
     # Glob the path and return as a DataFrame with a column containing the filepaths
     partition_set_factory = get_context().runner().partition_set_factory()
     partition_set, filepaths_schema = partition_set_factory.glob_paths_details(path)
-    cache_entry = get_context().runner().put_partition_set_into_cache(partition_set)
-    filepath_plan = logical_plan.InMemoryScan(
-        cache_entry=cache_entry,
-        schema=filepaths_schema,
-        partition_spec=logical_plan.PartitionSpec(logical_plan.PartitionScheme.UNKNOWN, partition_set.num_partitions()),
+    listing = partition_set.to_pydict()
+
+    # Sample the first 10 filepaths, reusing schemas that were previously inferred from the same versions of the files
+    sampled_paths = listing[partition_set_factory.FS_LISTING_PATH_COLUMN_NAME][:10]
+    schema_cache = get_schema_cache()
+    schema_cache_key = (source_info, schema_inference_options)
+    sampled_versions = listing[partition_set_factory.FS_LISTING_VERSION_COLUMN_NAME][:10]
+    sampled_schemas = [
+        schema_cache.get(schema_cache_key, version) if version is not None else None for version in sampled_versions
+    ]
+
+    # Infer the schemas of the remaining sampled filepaths on the runner
+    files_to_infer = [
+        (p, version)
+        for p, version, sampled_schema in zip(sampled_paths, sampled_versions, sampled_schemas)
+        if sampled_schema is None
+    ]
+    if len(files_to_infer) > 0:
+        schema_df = DataFrame.from_pydict({"file": files_to_infer}).select(
+            col("file").apply(lambda file: get_schema(*file), return_type=ExpressionList).alias("schema")
+        )
+        schema_df.collect()
+        schema_result = schema_df._result
+        assert schema_result is not None
+        inferred_schemas = iter(schema_result.to_pydict()["schema"])
+        for i, version in enumerate(sampled_versions):
+            if sampled_schemas[i] is None:
+                sampled_schemas[i] = next(inferred_schemas)
+                if version is not None:
+                    schema_cache.put(schema_cache_key, version, sampled_schemas[i])
+
+    # Unify the sampled schemas, promoting the types of columns that differ between files
+    schema = functools.reduce(Schema.unify, sampled_schemas)
+
+    # Discover Hive-style partition columns from the directories of all listed files below the listed path, which are
+    # not stored in the files
+    listed_paths = listing[partition_set_factory.FS_LISTING_PATH_COLUMN_NAME]
+    partition_values = None
+    if hive_partitioning:
+        partition_root = hive_partition_root(path)
+        partition_fields = [
+            field
+            for field in infer_hive_partition_fields(listed_paths, partition_root)
+            if field.name not in schema.column_names()
+        ]
+        if len(partition_fields) > 0:
+            schema = Schema(list(schema.fields.values()) + partition_fields)
+            source_info = dataclasses.replace(source_info, partition_fields=tuple(partition_fields))
+            partition_values = [hive_partition_values(p, partition_fields, partition_root) for p in listed_paths]
+
+    # Plan the read tasks for the globbed filepaths, where each read task becomes one partition of the scan
+    scan_tasks = plan_scan_tasks(
+        paths=listed_paths,
+        sizes=listing[partition_set_factory.FS_LISTING_SIZE_COLUMN_NAME],
+        versions=listing[partition_set_factory.FS_LISTING_VERSION_COLUMN_NAME],
+        partition_values=partition_values,
+        storage_type=source_info.scan_type(),
+        target_partition_size_bytes=target_partition_size_bytes,
     )
-    filepath_df = DataFrame(filepath_plan)
-
-    # Sample the first 10 filepaths and infer the schema
-    schema_df = filepath_df.limit(10).select(
-        col(partition_set_factory.FS_LISTING_PATH_COLUMN_NAME)
-        .apply(get_schema, return_type=ExpressionList)
-        .alias("schema")
+    scan_tasks_pset = LocalPartitionSet(
+        {i: scan_task_to_vpartition(task, partition_id=i) for i, task in enumerate(scan_tasks)}
+    )
+    scan_tasks_cache_entry = get_context().runner().put_partition_set_into_cache(scan_tasks_pset)
+    scan_tasks_plan = logical_plan.InMemoryScan(
+        cache_entry=scan_tasks_cache_entry,
+        schema=scan_task_schema(),
+        partition_spec=logical_plan.PartitionSpec(logical_plan.PartitionScheme.UNKNOWN, len(scan_tasks)),
     )
-    schema_df.collect()
-    schema_result = schema_df._result
-    assert schema_result is not None
-    sampled_schemas = schema_result.to_pydict()["schema"]
-
-    # TODO: infer schema from all sampled schemas instead of just taking the first one
-    schema = sampled_schemas[0]
 
-    # Return a TabularFilesScan node that will scan from the globbed filepaths filepaths
+    # Return a TabularFilesScan node that will scan from the planned read tasks
     return logical_plan.TabularFilesScan(
         schema=schema,
         predicate=None,
         columns=None,
         source_info=source_info,
-        filepaths_child=filepath_plan,
-        filepaths_column_name=partition_set_factory.FS_LISTING_PATH_COLUMN_NAME,
-        # Hardcoded for now.
-        num_partitions=len(partition_set),
+        filepaths_child=scan_tasks_plan,
+        filepaths_column_name=SCAN_TASK_PATH_COLUMN_NAME,
+        num_partitions=len(scan_tasks),
     )
 
 
@@ -119,7 +192,18 @@ class DataFrame:
         if self._result_cache is None:
             return self.__plan
         else:
-            return logical_plan.InMemoryScan(self._result_cache, self.__plan.schema(), self.__plan.partition_spec())
+            return logical_plan.InMemoryScan(self._result_cache, self.__plan.schema(), self._result_partition_spec())
+
+    def _result_partition_spec(self) -> logical_plan.PartitionSpec:
+        # Adaptive repartitions may have produced fewer partitions than planned,
+        # in which case the planned partitioning does not describe the result
+        pspec = self.__plan.partition_spec()
+        result = self._result
+        if result is None or result.num_partitions() == pspec.num_partitions:
+            return pspec
+        return logical_plan.PartitionSpec(
+            scheme=logical_plan.PartitionScheme.UNKNOWN, num_partitions=result.num_partitions()
+        )
 
     @property
     def _result(self) -> PartitionSet | None:
@@ -157,7 +241,7 @@ class DataFrame:
         print(plan.pretty_print())
 
     def num_partitions(self) -> int:
-        return self.__plan.num_partitions()
+        return self._plan.num_partitions()
 
     @DataframePublicAPI
     def schema(self) -> Schema:
@@ -316,6 +400,8 @@ class DataFrame:
     def read_json(
         cls,
         path: str,
+        target_partition_size_bytes: int | None = None,
+        hive_partitioning: bool = True,
     ) -> DataFrame:
         """Creates a DataFrame from line-delimited JSON file(s)
 
@@ -327,12 +413,18 @@ class DataFrame:
 
         Args:
             path (str): Path to JSON files (allows for wildcards)
+            target_partition_size_bytes (Optional[int]): Target size in bytes of the files read into each partition.
+                If provided, small files are grouped together into partitions of up to this size. Defaults to None,
+                which reads each file into its own partition
+            hive_partitioning (bool): Whether to add the values of Hive-style ``<column>=<value>`` directories in
+                the paths of the files as columns. Filters on these columns skip reading files from directories that do
+                not match. Defaults to True
 
         returns:
             DataFrame: parsed DataFrame
         """
 
-        def get_schema(filepath: str) -> Schema:
+        def get_schema(filepath: str, version: FileVersion | None) -> Schema:
             return vPartition.from_json(
                 filepath,
                 partition_id=0,
@@ -350,6 +442,8 @@ class DataFrame:
             path,
             get_schema,
             JSONSourceInfo(),
+            target_partition_size_bytes=target_partition_size_bytes,
+            hive_partitioning=hive_partitioning,
         )
         return cls(plan)
 
@@ -367,6 +461,8 @@ class DataFrame:
         has_headers: bool = True,
         column_names: list[str] | None = None,
         delimiter: str = ",",
+        target_partition_size_bytes: int | None = None,
+        hive_partitioning: bool = True,
     ) -> DataFrame:
         """Creates a DataFrame from CSV file(s)
 
@@ -381,12 +477,18 @@ class DataFrame:
             has_headers (bool): Whether the CSV has a header or not, defaults to True
             column_names (Optional[List[str]]): Custom column names to assign to the DataFrame, defaults to None
             delimiter (Str): Delimiter used in the CSV, defaults to ","
+            target_partition_size_bytes (Optional[int]): Target size in bytes of the files read into each partition.
+                If provided, small files are grouped together into partitions of up to this size. Defaults to None,
+                which reads each file into its own partition
+            hive_partitioning (bool): Whether to add the values of Hive-style ``<column>=<value>`` directories in
+                the paths of the files as columns, such as those written by ``write_csv(partition_cols=...)``. Filters
+                on these columns skip reading files from directories that do not match. Defaults to True
 
         returns:
             DataFrame: parsed DataFrame
         """
 
-        def get_schema(filepath: str) -> Schema:
+        def get_schema(filepath: str, version: FileVersion | None) -> Schema:
             return vPartition.from_csv(
                 path=filepath,
                 partition_id=0,
@@ -413,6 +515,9 @@ class DataFrame:
                 delimiter=delimiter,
                 has_headers=has_headers,
             ),
+            schema_inference_options=tuple(column_names) if column_names is not None else None,
+            target_partition_size_bytes=target_partition_size_bytes,
+            hive_partitioning=hive_partitioning,
         )
         return cls(plan)
 
@@ -424,7 +529,9 @@ class DataFrame:
 
     @classmethod
     @DataframePublicAPI
-    def read_parquet(cls, path: str) -> DataFrame:
+    def read_parquet(
+        cls, path: str, target_partition_size_bytes: int | None = None, hive_partitioning: bool = True
+    ) -> DataFrame:
         """Creates a DataFrame from Parquet file(s)
 
         Example:
@@ -435,12 +542,19 @@ class DataFrame:
 
         Args:
             path (str): Path to Parquet file (allows for wildcards)
+            target_partition_size_bytes (Optional[int]): Target size in bytes of the files read into each partition.
+                If provided, small files are grouped together into partitions of up to this size and large files are
+                split by row groups into partitions of about this size. Defaults to None, which reads each file into its
+                own partition, only splitting very large files
+            hive_partitioning (bool): Whether to add the values of Hive-style ``<column>=<value>`` directories in
+                the paths of the files as columns, such as those written by ``write_parquet(partition_cols=...)``. Filters
+                on these columns skip reading files from directories that do not match. Defaults to True
 
         returns:
             DataFrame: parsed DataFrame
         """
 
-        def get_schema(filepath: str) -> Schema:
+        def get_schema(filepath: str, version: FileVersion | None) -> Schema:
             return vPartition.from_parquet(
                 filepath,
                 partition_id=0,
@@ -452,12 +566,67 @@ class DataFrame:
                     num_rows=0,  # sample 0 rows since Parquet has metadata
                     column_names=None,  # read all columns
                 ),
+                version=version,  # caches the footer for later planning and reads of the file
             ).get_schema()
 
         plan = _get_tabular_files_scan(
             path,
             get_schema,
             ParquetSourceInfo(),
+            target_partition_size_bytes=target_partition_size_bytes,
+            hive_partitioning=hive_partitioning,
+        )
+        return cls(plan)
+
+    @classmethod
+    @DataframePublicAPI
+    def read_arrow_ipc(
+        cls, path: str, target_partition_size_bytes: int | None = None, hive_partitioning: bool = True
+    ) -> DataFrame:
+        """Creates a DataFrame from Arrow IPC (Feather V2) file(s)
+
+        Local files are memory-mapped, so uncompressed files are read without copying or decoding their data. This makes
+        Arrow IPC well suited for intermediate datasets that are written and then read again.
+
+        Example:
+            >>> df = DataFrame.read_arrow_ipc("/path/to/file.arrow")
+            >>> df = DataFrame.read_arrow_ipc("/path/to/directory")
+            >>> df = DataFrame.read_arrow_ipc("/path/to/files-*.arrow")
+            >>> df = DataFrame.read_arrow_ipc("s3://path/to/files-*.arrow")
+
+        Args:
+            path (str): Path to Arrow IPC files (allows for wildcards)
+            target_partition_size_bytes (Optional[int]): Target size in bytes of the files read into each partition.
+                If provided, small files are grouped together into partitions of up to this size. Defaults to None,
+                which reads each file into its own partition
+            hive_partitioning (bool): Whether to add the values of Hive-style ``<column>=<value>`` directories in
+                the paths of the files as columns, such as those written by ``write_arrow_ipc(partition_cols=...)``.
+                Filters on these columns skip reading files from directories that do not match. Defaults to True
+
+        returns:
+            DataFrame: parsed DataFrame
+        """
+
+        def get_schema(filepath: str, version: FileVersion | None) -> Schema:
+            return vPartition.from_arrow_ipc(
+                filepath,
+                partition_id=0,
+                schema_options=vPartitionSchemaInferenceOptions(
+                    schema=None,
+                    inference_column_names=None,  # has no effect on schema inferencing Arrow IPC
+                ),
+                read_options=vPartitionReadOptions(
+                    num_rows=0,  # sample 0 rows since Arrow IPC files contain their schema
+                    column_names=None,  # read all columns
+                ),
+            ).get_schema()
+
+        plan = _get_tabular_files_scan(
+            path,
+            get_schema,
+            ArrowIPCSourceInfo(),
+            target_partition_size_bytes=target_partition_size_bytes,
+            hive_partitioning=hive_partitioning,
         )
         return cls(plan)
 
@@ -523,7 +692,8 @@ class DataFrame:
                 logical_plan.PartitionScheme.UNKNOWN, partition_set.num_partitions()
             ),
         )
-        return cls(filepath_plan)
+        # Versions of the listed files are only used internally by reads of the files
+        return cls(filepath_plan).exclude(partition_set_factory.FS_LISTING_VERSION_COLUMN_NAME)
 
     ###
     # Write methods
@@ -531,7 +701,12 @@ class DataFrame:
 
     @DataframePublicAPI
     def write_parquet(
-        self, root_dir: str, compression: str = "snappy", partition_cols: list[ColumnInputType] | None = None
+        self,
+        root_dir: str,
+        compression: str = "snappy",
+        partition_cols: list[ColumnInputType] | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
     ) -> DataFrame:
         """Writes the DataFrame as parquet files, returning a new DataFrame with paths to the files that were written
 
@@ -546,6 +721,11 @@ class DataFrame:
             root_dir (str): root file path to write parquet files to.
             compression (str, optional): compression algorithm. Defaults to "snappy".
             partition_cols (Optional[List[ColumnInputType]], optional): How to subpartition each partition further. Currently only supports Column Expressions with any calls. Defaults to None.
+            target_file_size_bytes (Optional[int], optional): Approximate size of each file to write, estimated from the
+                size of a sample of the rows of each partition once encoded in the file format. Larger partitions are
+                split across multiple files, which are written in parallel. Defaults to None, which writes a single
+                file per partition.
+            max_rows_per_file (Optional[int], optional): Maximum number of rows in each file to write. Defaults to None.
 
         Returns:
             DataFrame: The filenames that were written out as strings.
@@ -567,16 +747,25 @@ class DataFrame:
             partition_cols=cols,
             storage_type=StorageType.PARQUET,
             compression=compression,
+            target_file_size_bytes=target_file_size_bytes,
+            max_rows_per_file=max_rows_per_file,
         )
 
         # Block and write, then retrieve data and return a new disconnected DataFrame
         write_df = DataFrame(plan)
         write_df.collect()
         assert write_df._result is not None
+        clear_listing_cache()
         return DataFrame(write_df._plan)
 
     @DataframePublicAPI
-    def write_csv(self, root_dir: str, partition_cols: list[ColumnInputType] | None = None) -> DataFrame:
+    def write_csv(
+        self,
+        root_dir: str,
+        partition_cols: list[ColumnInputType] | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
+    ) -> DataFrame:
         """Writes the DataFrame as CSV files, returning a new DataFrame with paths to the files that were written
 
         Files will be written to ``<root_dir>/*`` with randomly generated UUIDs as the file names.
@@ -590,6 +779,11 @@ class DataFrame:
             root_dir (str): root file path to write parquet files to.
             compression (str, optional): compression algorithm. Defaults to "snappy".
             partition_cols (Optional[List[ColumnInputType]], optional): How to subpartition each partition further. Currently only supports Column Expressions with any calls. Defaults to None.
+            target_file_size_bytes (Optional[int], optional): Approximate size of each file to write, estimated from the
+                size of a sample of the rows of each partition once encoded in the file format. Larger partitions are
+                split across multiple files, which are written in parallel. Defaults to None, which writes a single
+                file per partition.
+            max_rows_per_file (Optional[int], optional): Maximum number of rows in each file to write. Defaults to None.
 
         Returns:
             DataFrame: The filenames that were written out as strings.
@@ -607,12 +801,73 @@ class DataFrame:
             root_dir=root_dir,
             partition_cols=cols,
             storage_type=StorageType.CSV,
+            target_file_size_bytes=target_file_size_bytes,
+            max_rows_per_file=max_rows_per_file,
         )
 
         # Block and write, then retrieve data and return a new disconnected DataFrame
         write_df = DataFrame(plan)
         write_df.collect()
         assert write_df._result is not None
+        clear_listing_cache()
+        return DataFrame(write_df._plan)
+
+    @DataframePublicAPI
+    def write_arrow_ipc(
+        self,
+        root_dir: str,
+        compression: str | None = None,
+        partition_cols: list[ColumnInputType] | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
+    ) -> DataFrame:
+        """Writes the DataFrame as Arrow IPC (Feather V2) files, returning a new DataFrame with paths to the files that
+        were written
+
+        Files will be written to ``<root_dir>/*`` with randomly generated UUIDs as the file names.
+
+        Currently generates an Arrow IPC file per partition unless `partition_cols` are used, then the number of files can equal the number of partitions times the number of values of partition col.
+
+        .. NOTE::
+            This call is **blocking** and will execute the DataFrame when called
+
+        Args:
+            root_dir (str): root file path to write Arrow IPC files to.
+            compression (Optional[str]): compression algorithm, one of "lz4" or "zstd". Defaults to None, which writes
+                uncompressed files that can be memory-mapped without copies when read with ``read_arrow_ipc``.
+            partition_cols (Optional[List[ColumnInputType]], optional): How to subpartition each partition further. Currently only supports Column Expressions with any calls. Defaults to None.
+            target_file_size_bytes (Optional[int], optional): Approximate size of each file to write, estimated from the
+                size of a sample of the rows of each partition once encoded in the file format. Larger partitions are
+                split across multiple files, which are written in parallel. Defaults to None, which writes a single
+                file per partition.
+            max_rows_per_file (Optional[int], optional): Maximum number of rows in each file to write. Defaults to None.
+
+        Returns:
+            DataFrame: The filenames that were written out as strings.
+        """
+        cols: ExpressionList | None = None
+        if partition_cols is not None:
+            cols = self.__column_input_to_expression(tuple(partition_cols))
+            for c in cols:
+                assert c.is_column(), "we cant support non Column Expressions for partition writing"
+            df = self.repartition(self.num_partitions(), *cols)
+        else:
+            df = self
+        plan = logical_plan.FileWrite(
+            df._plan,
+            root_dir=root_dir,
+            partition_cols=cols,
+            storage_type=StorageType.ARROW_IPC,
+            compression=compression,
+            target_file_size_bytes=target_file_size_bytes,
+            max_rows_per_file=max_rows_per_file,
+        )
+
+        # Block and write, then retrieve data and return a new disconnected DataFrame
+        write_df = DataFrame(plan)
+        write_df.collect()
+        assert write_df._result is not None
+        clear_listing_cache()
         return DataFrame(write_df._plan)
 
     ###
@@ -714,6 +969,7 @@ class DataFrame:
                 partition_by=all_exprs,
                 num_partitions=self.num_partitions(),
                 scheme=logical_plan.PartitionScheme.HASH,
+                adaptive=True,
             )
             plan = logical_plan.LocalDistinct(plan, all_exprs)
         return DataFrame(plan)
@@ -872,6 +1128,7 @@ class DataFrame:
         left_on: list[ColumnInputType] | ColumnInputType | None = None,
         right_on: list[ColumnInputType] | ColumnInputType | None = None,
         how: str = "inner",
+        strategy: str | None = None,
     ) -> DataFrame:
         """Column-wise join of the current DataFrame with an ``other`` DataFrame, similar to a SQL ``JOIN``
 
@@ -885,6 +1142,10 @@ class DataFrame:
             left_on (Optional[Union[List[ColumnInputType], ColumnInputType]], optional): key or keys to join on left DataFrame.. Defaults to None.
             right_on (Optional[Union[List[ColumnInputType], ColumnInputType]], optional): key or keys to join on right DataFrame. Defaults to None.
             how (str, optional): what type of join to performing, currently only `inner` is supported. Defaults to "inner".
+            strategy (Optional[str], optional): how to join, either "hash" to repartition both DataFrames by their join keys,
+                or "broadcast" to send the whole of the other DataFrame to every partition of this DataFrame so that this
+                DataFrame is not repartitioned. Defaults to None, which broadcasts DataFrames that are estimated to be small
+                when the DataFrame is executed and hash joins otherwise.
 
         Raises:
             ValueError: if `on` is passed in and `left_on` or `right_on` is not None.
@@ -906,7 +1167,12 @@ class DataFrame:
         left_exprs = self.__column_input_to_expression(tuple(left_on) if isinstance(left_on, list) else (left_on,))
         right_exprs = self.__column_input_to_expression(tuple(right_on) if isinstance(right_on, list) else (right_on,))
         join_op = logical_plan.Join(
-            self._plan, other._plan, left_on=left_exprs, right_on=right_exprs, how=logical_plan.JoinType.INNER
+            self._plan,
+            other._plan,
+            left_on=left_exprs,
+            right_on=right_exprs,
+            how=logical_plan.JoinType.INNER,
+            strategy=logical_plan.JoinStrategy(strategy) if strategy is not None else None,
         )
         return DataFrame(join_op)
 
@@ -1062,6 +1328,7 @@ class DataFrame:
                 num_partitions=self._plan.num_partitions(),
                 partition_by=group_by,
                 scheme=logical_plan.PartitionScheme.HASH,
+                adaptive=True,
             )
 
         gagg_op = logical_plan.LocalAggregate(repart_op, agg=second_phase_ops, group_by=group_by)
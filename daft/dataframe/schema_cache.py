@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from daft.filesystem import FileVersion
+from daft.logical.schema import Schema
+
+# Maximum number of file schemas kept in the process-wide schema cache
+DEFAULT_SCHEMA_CACHE_MAX_ENTRIES = 16384
+
+
+class SchemaCache:
+    """Thread-safe LRU cache of schemas inferred from files
+
+    Schemas are keyed by the version of the file (path, size and modification time) and by the options that were
+    used to infer the schema, so that modified files or different reader options result in a cache miss.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SCHEMA_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._schemas: OrderedDict[tuple[Hashable, FileVersion], Schema] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, options_key: Hashable, version: FileVersion) -> Schema | None:
+        with self._lock:
+            key = (options_key, version)
+            if key not in self._schemas:
+                return None
+            self._schemas.move_to_end(key)
+            return self._schemas[key]
+
+    def put(self, options_key: Hashable, version: FileVersion, schema: Schema) -> None:
+        with self._lock:
+            key = (options_key, version)
+            self._schemas[key] = schema
+            self._schemas.move_to_end(key)
+            while len(self._schemas) > self._max_entries:
+                self._schemas.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+_SCHEMA_CACHE = SchemaCache()
+
+
+def get_schema_cache() -> SchemaCache:
+    """Returns the process-wide schema cache"""
+    return _SCHEMA_CACHE
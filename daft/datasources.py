@@ -4,6 +4,8 @@ import sys
 from dataclasses import dataclass
 from enum import Enum
 
+from daft.logical.field import Field
+
 if sys.version_info < (3, 8):
     from typing_extensions import Protocol
 else:
@@ -14,10 +16,17 @@ class StorageType(Enum):
     CSV = "CSV"
     PARQUET = "PARQUET"
     JSON = "JSON"
+    ARROW_IPC = "ARROW_IPC"
 
 
 class SourceInfo(Protocol):
-    """A class that provides information about a given Datasource"""
+    """A class that provides information about a given Datasource
+
+    Every SourceInfo has `partition_fields`, the Hive-style partition columns that are parsed from the paths of the
+    files rather than read from the files.
+    """
+
+    partition_fields: tuple[Field, ...]
 
     def scan_type(self) -> StorageType:
         ...
@@ -28,6 +37,7 @@ class CSVSourceInfo(SourceInfo):
 
     delimiter: str
     has_headers: bool
+    partition_fields: tuple[Field, ...] = ()
 
     def scan_type(self):
         return StorageType.CSV
@@ -35,11 +45,23 @@ class CSVSourceInfo(SourceInfo):
 
 @dataclass(frozen=True)
 class JSONSourceInfo(SourceInfo):
+    partition_fields: tuple[Field, ...] = ()
+
     def scan_type(self):
         return StorageType.JSON
 
 
 @dataclass(frozen=True)
 class ParquetSourceInfo(SourceInfo):
+    partition_fields: tuple[Field, ...] = ()
+
     def scan_type(self):
         return StorageType.PARQUET
+
+
+@dataclass(frozen=True)
+class ArrowIPCSourceInfo(SourceInfo):
+    partition_fields: tuple[Field, ...] = ()
+
+    def scan_type(self):
+        return StorageType.ARROW_IPC
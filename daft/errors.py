@@ -3,3 +3,7 @@ from __future__ import annotations
 
 class ExpressionTypeError(Exception):
     pass
+
+
+class SchemaMismatchError(Exception):
+    pass
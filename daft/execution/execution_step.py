@@ -185,8 +185,9 @@ class Instruction(Protocol):
 @dataclass(frozen=True)
 class ReadFile(Instruction):
     partition_id: int
-    index: int | None
     logplan: logical_plan.TabularFilesScan
+    # Filepaths partitions of the read tasks that are scheduled next, whose files are prefetched after those of this one
+    next_read_tasks: tuple[vPartition, ...] = ()
 
     def run(self, inputs: list[vPartition]) -> list[vPartition]:
         return self._read_file(inputs)
@@ -198,7 +199,7 @@ class ReadFile(Instruction):
             inputs={self.logplan._filepaths_child.id(): filepaths_partition},
             scan=self.logplan,
             partition_id=self.partition_id,
-            index=self.index,
+            next_read_tasks=list(self.next_read_tasks),
         )
         return [partition]
 
@@ -324,12 +325,14 @@ class Join(Instruction):
 
     def _join(self, inputs: list[vPartition]) -> list[vPartition]:
         [left, right] = inputs
+        # Each partition of the other side is joined with the whole broadcast side, and keeps its partition ID
         result = left.join(
             right,
             left_on=self.logplan._left_on,
             right_on=self.logplan._right_on,
             output_projection=self.logplan._output_projection,
             how=self.logplan._how.value,
+            partition_id=right.partition_id if self.logplan._broadcast_left else None,
         )
         return [result]
 
@@ -364,6 +367,20 @@ class ReduceMergeAndSort(ReduceInstruction):
         return [partition]
 
 
+@dataclass(frozen=True)
+class ReduceMergeAndJoin(ReduceInstruction):
+    logplan: logical_plan.Join
+    num_left_inputs: int
+
+    def run(self, inputs: list[vPartition]) -> list[vPartition]:
+        return self._reduce_merge_and_join(inputs)
+
+    def _reduce_merge_and_join(self, inputs: list[vPartition]) -> list[vPartition]:
+        left = vPartition.merge_partitions(inputs[: self.num_left_inputs], verify_partition_id=False)
+        right = vPartition.merge_partitions(inputs[self.num_left_inputs :], verify_partition_id=False)
+        return Join(self.logplan).run([left, right])
+
+
 @dataclass(frozen=True)
 class ReduceToQuantiles(ReduceInstruction):
     num_quantiles: int
@@ -0,0 +1,101 @@
+"""
+This file contains the discovery of Hive-style partitioned directory layouts, such as those written by
+`DataFrame.write_parquet(partition_cols=...)`.
+
+In a Hive-style layout, each directory level is named `<column>=<value>`, and all files nested under that directory have
+the same `<value>` for `<column>`. The values are not stored in the files themselves, so they are parsed from the paths
+and added as columns when the files are read.
+"""
+
+from __future__ import annotations
+
+import urllib.parse
+from typing import Any
+
+from daft.expressions import ExpressionList
+from daft.filesystem import get_filesystem_from_path
+from daft.logical.field import Field
+from daft.runners.statistics import ColumnStatistics, predicate_might_match
+from daft.types import ExpressionType
+
+# Directory name used by Hive (and Arrow) for partitions where the value is null
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def hive_partition_root(path: str) -> str:
+    """Gets the directory of a listed path below which `<column>=<value>` directories are parsed as partitions
+
+    This is the directory containing the first glob component of the path, or the path itself if it is not a glob, so
+    that directories above the listed files are never parsed as partitions.
+    """
+    stripped_path = get_filesystem_from_path(path)._strip_protocol(path)
+    glob_index = min(stripped_path.find(char) if char in stripped_path else len(stripped_path) for char in "*?[")
+    if glob_index == len(stripped_path):
+        return stripped_path.rstrip("/")
+    return stripped_path[: stripped_path.rfind("/", 0, glob_index)]
+
+
+def parse_hive_partitions(path: str, root: str) -> dict[str, str | None]:
+    """Parses the `<column>=<value>` directories of a path below `root` into a mapping of column name to string value"""
+    relative_path = path.split("://")[-1]
+    root = root.split("://")[-1].rstrip("/")
+    if not relative_path.startswith(root + "/"):
+        return {}
+    directories = relative_path[len(root) + 1 :].split("/")[:-1]
+    partitions: dict[str, str | None] = {}
+    for directory in directories:
+        if "=" not in directory:
+            continue
+        key, value = directory.split("=", 1)
+        key = urllib.parse.unquote(key)
+        partitions[key] = None if value == HIVE_DEFAULT_PARTITION else urllib.parse.unquote(value)
+    return partitions
+
+
+def infer_hive_partition_fields(paths: list[str], root: str) -> list[Field]:
+    """Infers the partition columns of a list of files below `root`, in order of first appearance in the paths
+
+    Each column is typed as an integer or float if all of its non-null values can be parsed as such, or a string otherwise.
+    """
+    values_by_column: dict[str, list[str]] = {}
+    for path in paths:
+        for key, value in parse_hive_partitions(path, root).items():
+            column_values = values_by_column.setdefault(key, [])
+            if value is not None:
+                column_values.append(value)
+    return [Field(name, _infer_type(values)) for name, values in values_by_column.items()]
+
+
+def _infer_type(values: list[str]) -> ExpressionType:
+    for expr_type, parse in [(ExpressionType.integer(), int), (ExpressionType.float(), float)]:
+        try:
+            for value in values:
+                parse(value)
+        except ValueError:
+            continue
+        return expr_type
+    return ExpressionType.string()
+
+
+def hive_partition_values(path: str, partition_fields: list[Field], root: str) -> dict[str, Any]:
+    """Gets the typed values of the partition columns for a file below `root`, which are None if missing from its path"""
+    partitions = parse_hive_partitions(path, root)
+    values = {}
+    for field in partition_fields:
+        value = partitions.get(field.name)
+        if value is not None and field.dtype == ExpressionType.integer():
+            values[field.name] = int(value)
+        elif value is not None and field.dtype == ExpressionType.float():
+            values[field.name] = float(value)
+        else:
+            values[field.name] = value
+    return values
+
+
+def partition_might_match(predicate: ExpressionList, partition_values: dict[str, Any]) -> bool:
+    """Checks whether any rows of a file with the provided partition values could satisfy the predicate"""
+    statistics = {
+        name: ColumnStatistics(num_rows=1, min=value, max=value, null_count=1 if value is None else 0)
+        for name, value in partition_values.items()
+    }
+    return predicate_might_match(predicate, statistics)
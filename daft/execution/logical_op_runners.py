@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import dataclasses
+from typing import Any
+
 from daft.datasources import (
+    ArrowIPCSourceInfo,
     CSVSourceInfo,
     JSONSourceInfo,
     ParquetSourceInfo,
     StorageType,
 )
+from daft.execution.metadata_aggregation import aggregate_from_parquet_statistics
+from daft.execution.prefetching import FilePrefetcher
+from daft.execution.scan_planning import (
+    SCAN_TASK_PARTITION_VALUES_COLUMN_NAME,
+    SCAN_TASK_ROW_GROUP_END_COLUMN_NAME,
+    SCAN_TASK_ROW_GROUP_START_COLUMN_NAME,
+    SCAN_TASK_SIZE_COLUMN_NAME,
+    SCAN_TASK_VERSION_COLUMN_NAME,
+)
+from daft.filesystem import (
+    FileRanges,
+    FileVersion,
+    get_disk_cache,
+    get_protocol_from_path,
+)
 from daft.logical.logical_plan import FileWrite, TabularFilesScan
+from daft.logical.schema import Schema
 from daft.runners.blocks import DataBlock
+from daft.runners.parquet_metadata import get_parquet_metadata, parquet_byte_ranges
 from daft.runners.partitioning import (
     PyListTile,
     vPartition,
@@ -15,95 +36,301 @@ from daft.runners.partitioning import (
     vPartitionReadOptions,
     vPartitionSchemaInferenceOptions,
 )
+from daft.runners.statistics import parquet_row_group_statistics, predicate_might_match
 
 
 class LogicalPartitionOpRunner:
     # TODO(charles): move to ExecutionStep
 
     def _handle_tabular_files_scan(
-        self, inputs: dict[int, vPartition], scan: TabularFilesScan, partition_id: int, index: int | None = None
+        self,
+        inputs: dict[int, vPartition],
+        scan: TabularFilesScan,
+        partition_id: int,
+        next_read_tasks: list[vPartition] | None = None,
     ) -> vPartition:
         child_id = scan._children()[0].id()
         prev_partition = inputs[child_id]
         data = prev_partition.to_pydict()
-        assert (
-            scan._filepaths_column_name in data
-        ), f"TabularFilesScan should be ran on vPartitions with '{scan._filepaths_column_name}' column"
-        filepaths = data[scan._filepaths_column_name]
+        filepaths, row_groups, sizes, versions = self._read_task_files(scan, data)
 
-        if index is not None:
-            filepaths = [filepaths[index]]
+        # Hive-style partition columns are parsed from the filepaths when planning the scan instead of being read from
+        # the files, and files in partition directories that cannot match the predicate are pruned from the read tasks
+        partition_values = [
+            values if values is not None else {}
+            for values in data.get(SCAN_TASK_PARTITION_VALUES_COLUMN_NAME, [None for _ in filepaths])
+        ]
+        partition_fields = list(scan._source_info.partition_fields)
+        partition_column_names = {field.name for field in partition_fields}
 
         # Common options for reading vPartition
-        schema = scan._schema
+        schema = Schema([field for field in scan._schema.fields.values() if field.name not in partition_column_names])
         schema_options = vPartitionSchemaInferenceOptions(schema=schema)
+        predicate = scan._predicate if len(scan._predicate) > 0 else None
+        column_names = scan._column_names
+        if predicate is not None:
+            # Columns required by the predicate need to be read, even if they are pruned from the output
+            read_column_names = column_names if column_names is not None else schema.column_names()
+            column_names = read_column_names + sorted(predicate.required_columns() - set(read_column_names))
+        if column_names is not None and len(partition_column_names) > 0:
+            column_names = [name for name in column_names if name not in partition_column_names]
+            if len(column_names) == 0:
+                # At least one column needs to be read from each file to know its number of rows
+                column_names = schema.column_names()[:1]
         read_options = vPartitionReadOptions(
             num_rows=None,  # read all rows
-            column_names=scan._column_names,  # read only specified columns
+            column_names=column_names,  # read only specified columns
+            predicate=predicate,  # skip data that cannot match the predicate
         )
 
-        if scan._source_info.scan_type() == StorageType.CSV:
-            assert isinstance(scan._source_info, CSVSourceInfo)
-            return vPartition.merge_partitions(
-                [
-                    vPartition.from_csv(
-                        path=fp,
-                        partition_id=partition_id,
-                        csv_options=vPartitionParseCSVOptions(
-                            delimiter=scan._source_info.delimiter,
-                            has_headers=scan._source_info.has_headers,
-                            skip_rows_before_header=0,
-                            skip_rows_after_header=0,
-                        ),
-                        schema_options=schema_options,
-                        read_options=read_options,
-                    )
-                    for fp in filepaths
-                ]
+        def read_file(
+            path: str,
+            row_groups: list[int] | None,
+            version: FileVersion | None,
+            read_options: vPartitionReadOptions,
+            file_data: bytes | FileRanges | None,
+        ) -> vPartition:
+            if scan._source_info.scan_type() == StorageType.CSV:
+                assert isinstance(scan._source_info, CSVSourceInfo)
+                return vPartition.from_csv(
+                    path=path,
+                    partition_id=partition_id,
+                    csv_options=vPartitionParseCSVOptions(
+                        delimiter=scan._source_info.delimiter,
+                        has_headers=scan._source_info.has_headers,
+                        skip_rows_before_header=0,
+                        skip_rows_after_header=0,
+                    ),
+                    schema_options=schema_options,
+                    read_options=read_options,
+                    file_data=file_data,
+                )
+            elif scan._source_info.scan_type() == StorageType.JSON:
+                assert isinstance(scan._source_info, JSONSourceInfo)
+                return vPartition.from_json(
+                    path=path,
+                    partition_id=partition_id,
+                    schema_options=schema_options,
+                    read_options=read_options,
+                    file_data=file_data,
+                )
+            elif scan._source_info.scan_type() == StorageType.PARQUET:
+                assert isinstance(scan._source_info, ParquetSourceInfo)
+                return vPartition.from_parquet(
+                    path=path,
+                    partition_id=partition_id,
+                    schema_options=schema_options,
+                    read_options=read_options,
+                    row_groups=row_groups,
+                    file_data=file_data,
+                    version=version,
+                )
+            elif scan._source_info.scan_type() == StorageType.ARROW_IPC:
+                assert isinstance(scan._source_info, ArrowIPCSourceInfo)
+                return vPartition.from_arrow_ipc(
+                    path=path,
+                    partition_id=partition_id,
+                    schema_options=schema_options,
+                    read_options=read_options,
+                    file_data=file_data,
+                )
+            else:
+                raise NotImplementedError(f"PyRunner has not implemented scan: {scan._source_info.scan_type()}")
+
+        def read_file_with_partition_values(
+            path: str,
+            row_groups: list[int] | None,
+            version: FileVersion | None,
+            read_options: vPartitionReadOptions,
+            file_data: bytes | FileRanges | None,
+            partition_values: dict[str, Any],
+        ) -> vPartition:
+            file_partition = read_file(path, row_groups, version, read_options, file_data)
+            if len(partition_fields) > 0:
+                partition_values_partition = vPartition.from_pydict(
+                    data={
+                        name: [value for _ in range(len(file_partition))] for name, value in partition_values.items()
+                    },
+                    schema=Schema(partition_fields),
+                    partition_id=partition_id,
+                )
+                file_partition = vPartition(
+                    columns={**file_partition.columns, **partition_values_partition.columns},
+                    partition_id=partition_id,
+                )
+            if predicate is not None:
+                file_partition = file_partition.filter(predicate)
+            return file_partition
+
+        files_to_read = list(zip(filepaths, row_groups, sizes, versions, partition_values))
+
+        if scan._aggregation is not None:
+            # Answer the aggregation from Parquet footers, only reading row groups that statistics cannot resolve
+            return aggregate_from_parquet_statistics(
+                scan=scan,
+                files=[(fp, rg, version, partition_values) for fp, rg, _, version, partition_values in files_to_read],
+                predicate=predicate,
+                read_row_groups=lambda path, row_groups, version, partition_values: read_file_with_partition_values(
+                    path, row_groups, version, read_options, None, partition_values
+                ),
+                partition_id=partition_id,
             )
-        elif scan._source_info.scan_type() == StorageType.JSON:
-            assert isinstance(scan._source_info, JSONSourceInfo)
-            return vPartition.merge_partitions(
-                [
-                    vPartition.from_json(
-                        path=fp,
-                        partition_id=partition_id,
-                        schema_options=schema_options,
-                        read_options=read_options,
-                    )
-                    for fp in filepaths
-                ]
+
+        # Fetch remote files ahead of decoding them, followed by the files of the next read tasks, which are handed off to
+        # those read tasks once this one is done
+        limit = scan._limit_rows
+        files_to_prefetch = [(fp, rg, size, version) for fp, rg, size, version, _ in files_to_read]
+        for next_read_task in next_read_tasks if next_read_tasks is not None else []:
+            files_to_prefetch.extend(zip(*self._read_task_files(scan, next_read_task.to_pydict())))
+        prefetch_sizes, prefetch_ranges = self._prefetch_sizes_and_ranges(scan, files_to_prefetch, read_options)
+
+        # Read files in order, stopping once enough rows have been read to satisfy the limit
+        partitions: list[vPartition] = []
+        num_rows_read = 0
+        whole_file_path: str | None = None
+        whole_file_data: bytes | None = None
+        with FilePrefetcher(
+            [fp for fp, _, _, _ in files_to_prefetch],
+            prefetch_sizes,
+            versions=[version for _, _, _, version in files_to_prefetch],
+            ranges=prefetch_ranges,
+        ) as prefetcher:
+            for i, (fp, rg, _, version, partition_values) in enumerate(files_to_read):
+                if limit is not None and len(partitions) > 0 and num_rows_read >= limit:
+                    break
+                file_read_options = read_options
+                if limit is not None and predicate is None:
+                    # Readers apply limits before filtering, so we can only limit rows read when there is no predicate
+                    file_read_options = dataclasses.replace(read_options, num_rows=limit - num_rows_read)
+                file_data = prefetcher.fetch(i)
+                if file_data is None and fp == whole_file_path:
+                    # Later splits of a file read the whole file that was fetched for its first split
+                    file_data = whole_file_data
+                if isinstance(file_data, bytes):
+                    whole_file_path, whole_file_data = fp, file_data
+                file_partition = read_file_with_partition_values(
+                    fp, rg, version, file_read_options, file_data, partition_values
+                )
+                partitions.append(file_partition)
+                num_rows_read += len(file_partition)
+
+        if len(partitions) == 0:
+            # Every file of the read task was pruned by its partition values
+            return vPartition.from_pydict(
+                data={name: [] for name in scan.schema().column_names()},
+                schema=scan.schema(),
+                partition_id=partition_id,
             )
-        elif scan._source_info.scan_type() == StorageType.PARQUET:
-            assert isinstance(scan._source_info, ParquetSourceInfo)
-            return vPartition.merge_partitions(
-                [
-                    vPartition.from_parquet(
-                        path=fp,
-                        partition_id=partition_id,
-                        schema_options=schema_options,
-                        read_options=read_options,
-                    )
-                    for fp in filepaths
-                ]
+
+        partition = vPartition.merge_partitions(partitions)
+        if predicate is not None or len(partition_fields) > 0:
+            partition = vPartition(
+                columns={name: partition.columns[name] for name in scan.schema().column_names()},
+                partition_id=partition_id,
             )
-        else:
-            raise NotImplementedError(f"PyRunner has not implemented scan: {scan._source_info.scan_type()}")
+        if limit is not None:
+            partition = partition.head(limit)
+        return partition
+
+    def _read_task_files(
+        self, scan: TabularFilesScan, data: dict[str, list]
+    ) -> tuple[list[str], list[list[int] | None], list[int | None], list[FileVersion | None]]:
+        """Gets the paths, row groups, sizes and versions of the files to read of a read task"""
+        assert (
+            scan._filepaths_column_name in data
+        ), f"TabularFilesScan should be ran on vPartitions with '{scan._filepaths_column_name}' column"
+        filepaths = data[scan._filepaths_column_name]
+
+        # Read tasks may specify a range of row groups to read for each Parquet file
+        row_group_starts = data.get(SCAN_TASK_ROW_GROUP_START_COLUMN_NAME, [None for _ in filepaths])
+        row_group_ends = data.get(SCAN_TASK_ROW_GROUP_END_COLUMN_NAME, [None for _ in filepaths])
+        row_groups = [
+            list(range(start, end)) if start is not None and end is not None else None
+            for start, end in zip(row_group_starts, row_group_ends)
+        ]
+        sizes = data.get(SCAN_TASK_SIZE_COLUMN_NAME, [None for _ in filepaths])
+        versions = data.get(SCAN_TASK_VERSION_COLUMN_NAME, [None for _ in filepaths])
+        return filepaths, row_groups, sizes, versions
+
+    def _prefetch_sizes_and_ranges(
+        self,
+        scan: TabularFilesScan,
+        files: list[tuple[str, list[int] | None, int | None, FileVersion | None]],
+        read_options: vPartitionReadOptions,
+    ) -> tuple[list[int | None], list[list[tuple[int, int]] | None]]:
+        """Gets the sizes and byte ranges of files to prefetch for a FilePrefetcher
+
+        Remote files are prefetched unless only the first rows of the files may be needed. Only the footer and the column
+        chunks that are read are fetched of Parquet files with cached footers. Whole files are always fetched when they
+        are cached on local disk, so that later reads of the files are local, but only once for all of the consecutive
+        splits of a file.
+        """
+        fetch_whole_files = get_disk_cache() is not None
+        prefetch_sizes: list[int | None] = []
+        prefetch_ranges: list[list[tuple[int, int]] | None] = []
+        for i, (fp, rg, size, version) in enumerate(files):
+            file_size = size if rg is None else (version.size if version is not None else None)
+            if get_protocol_from_path(fp) == "file" or (not fetch_whole_files and scan._limit_rows is not None):
+                prefetch_sizes.append(None)
+                prefetch_ranges.append(None)
+            elif fetch_whole_files:
+                is_first_split = i == 0 or files[i - 1][0] != fp
+                prefetch_sizes.append(file_size if is_first_split else None)
+                prefetch_ranges.append(None)
+            elif scan._source_info.scan_type() == StorageType.PARQUET and version is not None and file_size is not None:
+                prefetch_sizes.append(file_size)
+                prefetch_ranges.append(self._parquet_ranges_to_read(fp, rg, version, file_size, read_options))
+            else:
+                prefetch_sizes.append(size if rg is None else None)
+                prefetch_ranges.append(None)
+        return prefetch_sizes, prefetch_ranges
+
+    def _parquet_ranges_to_read(
+        self,
+        path: str,
+        row_groups: list[int] | None,
+        version: FileVersion,
+        size: int,
+        read_options: vPartitionReadOptions,
+    ) -> list[tuple[int, int]]:
+        """Gets the byte ranges of a Parquet file that are read, from its footer that was cached when planning the scan"""
+        metadata = get_parquet_metadata(path, version=version)
+        if row_groups is None:
+            row_groups = list(range(metadata.num_row_groups))
+        if read_options.predicate is not None and len(read_options.predicate) > 0:
+            row_groups = [
+                i
+                for i in row_groups
+                if predicate_might_match(read_options.predicate, parquet_row_group_statistics(metadata, i))
+            ]
+        return parquet_byte_ranges(metadata, size, row_groups, read_options.column_names)
 
     def _handle_file_write(self, inputs: dict[int, vPartition], file_write: FileWrite, partition_id: int) -> vPartition:
         child_id = file_write._children()[0].id()
-        assert file_write._storage_type == StorageType.PARQUET or file_write._storage_type == StorageType.CSV
+        assert file_write._storage_type in (StorageType.PARQUET, StorageType.CSV, StorageType.ARROW_IPC)
         if file_write._storage_type == StorageType.PARQUET:
             file_names = inputs[child_id].to_parquet(
                 root_path=file_write._root_dir,
                 partition_cols=file_write._partition_cols,
                 compression=file_write._compression,
+                target_file_size_bytes=file_write._target_file_size_bytes,
+                max_rows_per_file=file_write._max_rows_per_file,
+            )
+        elif file_write._storage_type == StorageType.ARROW_IPC:
+            file_names = inputs[child_id].to_arrow_ipc(
+                root_path=file_write._root_dir,
+                partition_cols=file_write._partition_cols,
+                compression=file_write._compression,
+                target_file_size_bytes=file_write._target_file_size_bytes,
+                max_rows_per_file=file_write._max_rows_per_file,
             )
         else:
             file_names = inputs[child_id].to_csv(
                 root_path=file_write._root_dir,
                 partition_cols=file_write._partition_cols,
                 compression=file_write._compression,
+                target_file_size_bytes=file_write._target_file_size_bytes,
+                max_rows_per_file=file_write._max_rows_per_file,
             )
 
         output_schema = file_write.schema()
@@ -0,0 +1,136 @@
+"""
+This file contains the answering of ungrouped aggregations over Parquet files from the row counts and column statistics
+in their footers, so that aggregations such as `DataFrame.count_rows()` do not need to read any data.
+
+Each row group is resolved from its statistics when they are exact: rows are counted when the predicate is proven to
+match either all or none of the rows of the row group, and min/max are taken from the statistics of columns with types
+whose statistics are never truncated or affected by NaNs. Row groups that cannot be resolved are read and aggregated.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from daft.expressions import ExpressionList
+from daft.filesystem import FileVersion
+from daft.logical.logical_plan import COUNT_ROWS_OP, TabularFilesScan
+from daft.runners.parquet_metadata import get_parquet_metadata
+from daft.runners.partitioning import vPartition
+from daft.runners.statistics import (
+    ColumnStatistics,
+    parquet_row_group_statistics,
+    predicate_might_match,
+    predicate_must_match,
+)
+
+
+def _is_exact_min_max(value: Any) -> bool:
+    # Statistics of strings and binaries may be truncated, and floating point statistics exclude NaNs
+    return isinstance(value, int) or (hasattr(value, "year") and not hasattr(value, "hour"))
+
+
+def _aggregate_statistics(op: str, column_stats: ColumnStatistics | None, num_rows: int) -> tuple[bool, Any]:
+    """Aggregates a row group from its statistics, returning whether the statistics are exact and the aggregated value"""
+    if op == COUNT_ROWS_OP:
+        return True, num_rows
+    if column_stats is None or column_stats.null_count is None:
+        return False, None
+    if op == "count":
+        return True, num_rows - column_stats.null_count
+    if column_stats.all_null():
+        return True, None
+    value = column_stats.min if op == "min" else column_stats.max
+    return _is_exact_min_max(value), value
+
+
+def _combine(op: str, left: Any, right: Any) -> Any:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if op == "min":
+        return min(left, right)
+    elif op == "max":
+        return max(left, right)
+    return left + right
+
+
+def aggregate_from_parquet_statistics(
+    scan: TabularFilesScan,
+    files: list[tuple[str, list[int] | None, FileVersion | None, dict[str, Any]]],
+    predicate: ExpressionList | None,
+    read_row_groups: Callable[[str, list[int], FileVersion | None, dict[str, Any]], vPartition],
+    partition_id: int,
+) -> vPartition:
+    """Computes the aggregation of a scan over Parquet files, from file metadata wherever possible
+
+    Args:
+        scan: Scan with an aggregation to compute
+        files: Path, row groups to aggregate (or None for all row groups), version from the listing and Hive partition
+            values of each file
+        predicate: Predicate that rows must satisfy to be aggregated
+        read_row_groups: Reads row groups of a file that cannot be aggregated from metadata, with their partition
+            values and the predicate applied
+        partition_id: Partition ID to assign to the aggregated vPartition
+    """
+    assert scan._aggregation is not None
+    names = scan.schema().column_names()
+    ops = [op for _, op in scan._aggregation]
+    column_names = []
+    for e, _ in scan._aggregation:
+        [column_name] = e.required_columns()
+        column_names.append(column_name)
+
+    values: list[Any] = [0 if op in ("count", COUNT_ROWS_OP) else None for op in ops]
+    num_rows = 0
+    for path, row_groups, version, partition_values in files:
+        metadata = get_parquet_metadata(path, version=version)
+        unresolved_row_groups = []
+        for i in row_groups if row_groups is not None else range(metadata.num_row_groups):
+            row_group_num_rows = metadata.row_group(i).num_rows
+            statistics = {
+                **parquet_row_group_statistics(metadata, i),
+                **{
+                    name: ColumnStatistics(
+                        num_rows=row_group_num_rows,
+                        min=value,
+                        max=value,
+                        null_count=row_group_num_rows if value is None else 0,
+                    )
+                    for name, value in partition_values.items()
+                },
+            }
+            if predicate is not None:
+                if not predicate_might_match(predicate, statistics):
+                    continue
+                if not predicate_must_match(predicate, statistics):
+                    unresolved_row_groups.append(i)
+                    continue
+
+            aggregated = [
+                _aggregate_statistics(op, statistics.get(column_name), row_group_num_rows)
+                for op, column_name in zip(ops, column_names)
+            ]
+            if not all(is_exact for is_exact, _ in aggregated):
+                unresolved_row_groups.append(i)
+                continue
+            values = [_combine(op, value, new_value) for op, value, (_, new_value) in zip(ops, values, aggregated)]
+            num_rows += row_group_num_rows
+
+        if len(unresolved_row_groups) > 0:
+            partition = read_row_groups(path, unresolved_row_groups, version, partition_values)
+            to_agg = [(e, op) for e, op in scan._aggregation if op != COUNT_ROWS_OP]
+            data = partition.agg(to_agg).to_pydict() if len(to_agg) > 0 else {}
+            for j, (name, op) in enumerate(zip(names, ops)):
+                new_value = len(partition) if op == COUNT_ROWS_OP else next(iter(data[name]), None)
+                values[j] = _combine(op, values[j], new_value)
+            num_rows += len(partition)
+
+    # Aggregations of no rows have no rows, except for counting rows which always has a count like LocalCount
+    if num_rows == 0 and COUNT_ROWS_OP not in ops:
+        return vPartition.from_pydict(
+            data={name: [] for name in names}, schema=scan.schema(), partition_id=partition_id
+        )
+    return vPartition.from_pydict(
+        data={name: [value] for name, value in zip(names, values)}, schema=scan.schema(), partition_id=partition_id
+    )
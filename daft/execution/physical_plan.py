@@ -13,15 +13,21 @@ because it is waiting for the result of a previous ExecutionStep to can decide w
 
 from __future__ import annotations
 
+import itertools
 import math
+import statistics
 from collections import deque
 from typing import Generator, Iterator, List, TypeVar, Union
 
+from loguru import logger
+
 from daft.execution import execution_step
 from daft.execution.execution_step import (
     ExecutionStep,
     ExecutionStepBuilder,
     Instruction,
+    MaterializedResult,
+    MultiOutputExecutionStep,
     ReduceInstruction,
     SingleOutputExecutionStep,
 )
@@ -31,6 +37,16 @@ from daft.resource_request import ResourceRequest
 PartitionT = TypeVar("PartitionT")
 T = TypeVar("T")
 
+# Size in bytes that adaptive reduces coalesce adjacent small output partitions up to.
+ADAPTIVE_TARGET_PARTITION_BYTES = 64 * 1024 * 1024
+
+# How many times larger than the median partition a partition of a hash join must be to be split up as skewed.
+# Skewed partitions must also be larger than ADAPTIVE_TARGET_PARTITION_BYTES, which is the size they are split into.
+SKEWED_PARTITION_FACTOR = 5
+
+# Total size in bytes of the fanout outputs for a partition that pipelined reduces merge early.
+PIPELINED_REDUCE_MERGE_BYTES = 16 * 1024 * 1024
+
 
 # A PhysicalPlan that is still being built - may yield both ExecutionStepBuilders and ExecutionSteps.
 InProgressPhysicalPlan = Iterator[Union[None, ExecutionStep[PartitionT], ExecutionStepBuilder[PartitionT]]]
@@ -51,37 +67,57 @@ def partition_read(partitions: Iterator[PartitionT]) -> InProgressPhysicalPlan[P
 def file_read(
     child_plan: InProgressPhysicalPlan[PartitionT],
     scan_info: logical_plan.TabularFilesScan,
+    prefetch_read_tasks: int = 0,
 ) -> InProgressPhysicalPlan[PartitionT]:
-    """child_plan represents partitions with filenames.
+    """child_plan represents partitions with filenames, where each partition is a read task.
 
     Yield a plan to read those filenames.
+
+    Each read task also prefetches the files of up to `prefetch_read_tasks` read tasks after it, so read tasks are only
+    emitted once the filenames of the read tasks after them have materialized.
     """
 
     materializations: deque[SingleOutputExecutionStep[PartitionT]] = deque()
     output_partition_index = 0
+    child_plan_done = False
 
     while True:
         # Check if any inputs finished executing.
-        while len(materializations) > 0 and materializations[0].result is not None:
+        while (
+            len(materializations) > 0
+            and materializations[0].result is not None
+            and (child_plan_done or len(materializations) > prefetch_read_tasks)
+        ):
             result = materializations.popleft().result
             assert result is not None  # for mypy only
 
             vpartition = result.vpartition()
             file_sizes_bytes = vpartition.to_pydict()["size"]
 
-            # Emit one partition for each file (NOTE: hardcoded for now).
-            for i in range(vpartition.metadata().num_rows):
+            next_read_tasks = []
+            for next_step in itertools.islice(materializations, prefetch_read_tasks):
+                if next_step.result is None:
+                    break
+                next_read_tasks.append(next_step.result.vpartition())
+
+            # Emit one partition for each read task.
+            file_read_step = ExecutionStepBuilder[PartitionT](inputs=[result.partition()]).add_instruction(
+                instruction=execution_step.ReadFile(
+                    partition_id=output_partition_index,
+                    logplan=scan_info,
+                    next_read_tasks=tuple(next_read_tasks),
+                ),
+                resource_request=ResourceRequest(memory_bytes=sum(file_sizes_bytes)),
+            )
+            yield file_read_step
+            output_partition_index += 1
 
-                file_read_step = ExecutionStepBuilder[PartitionT](inputs=[result.partition()]).add_instruction(
-                    instruction=execution_step.ReadFile(
-                        partition_id=output_partition_index,
-                        logplan=scan_info,
-                        index=i,
-                    ),
-                    resource_request=ResourceRequest(memory_bytes=file_sizes_bytes[i]),
-                )
-                yield file_read_step
-                output_partition_index += 1
+        if child_plan_done:
+            if len(materializations) > 0:
+                yield None
+                continue
+            else:
+                return
 
         # Materialize a single dependency.
         try:
@@ -92,10 +128,7 @@ def file_read(
             yield child_step
 
         except StopIteration:
-            if len(materializations) > 0:
-                yield None
-            else:
-                return
+            child_plan_done = True
 
 
 def file_write(
@@ -183,6 +216,191 @@ def join(
                 return
 
 
+def _split_skewed_partitions(partition_slices: list[list[MaterializedResult[PartitionT]]]) -> dict[int, list[int]]:
+    """Finds the skewed partitions of a hash fanout, given the slices of each partition from each fanout.
+
+    Returns the number of adjacent slices in each split of every skewed partition, keyed by partition index.
+    """
+    slice_sizes = [[result.metadata().size_bytes for result in slices] for slices in partition_slices]
+    partition_sizes = [sum(sizes) for sizes in slice_sizes]
+    skewed_size = max(SKEWED_PARTITION_FACTOR * statistics.median(partition_sizes), ADAPTIVE_TARGET_PARTITION_BYTES)
+
+    splits = {}
+    for i, (sizes, partition_size) in enumerate(zip(slice_sizes, partition_sizes)):
+        if partition_size > skewed_size:
+            slices_per_split = _coalesce_by_size(sizes, ADAPTIVE_TARGET_PARTITION_BYTES)
+            if len(slices_per_split) > 1:
+                splits[i] = slices_per_split
+    return splits
+
+
+def _split_slices(slices: list[T], slices_per_split: list[int]) -> list[list[T]]:
+    starts = [sum(slices_per_split[:i]) for i in range(len(slices_per_split))]
+    return [slices[start : start + num_slices] for start, num_slices in zip(starts, slices_per_split)]
+
+
+def hash_join(
+    left_fanout_plan: InProgressPhysicalPlan[PartitionT],
+    right_fanout_plan: InProgressPhysicalPlan[PartitionT],
+    num_partitions: int,
+    join: logical_plan.Join,
+) -> InProgressPhysicalPlan[PartitionT]:
+    """Join the hash fanouts of the left and right sides of `join`, splitting up skewed partitions.
+
+    The child plans must each produce a 2d list of partitions, like the fanout plans of `reduce`.
+    Once all fanouts have materialized, the `i`th slices of both sides are merged and joined into partition `i`.
+
+    A partition is skewed if it is SKEWED_PARTITION_FACTOR times larger than the median partition of its side,
+    which typically happens when some join keys are much more frequent than others.
+    The slices of a skewed partition are split up into groups of about ADAPTIVE_TARGET_PARTITION_BYTES,
+    each of which is joined with the whole partition of the other side in parallel.
+    The joined splits are then merged back into partition `i`, so the output keeps the planned hash partitioning.
+    Only the left side of left joins and the right side of right joins can be split up,
+    so that their unmatched rows are only output once. Inner joins split up their left side if both sides are skewed.
+    """
+
+    left_materializations: list[MultiOutputExecutionStep[PartitionT]] = []
+    right_materializations: list[MultiOutputExecutionStep[PartitionT]] = []
+
+    # Dispatch all fanouts.
+    for fanout_plan, materializations in (
+        (left_fanout_plan, left_materializations),
+        (right_fanout_plan, right_materializations),
+    ):
+        for step in fanout_plan:
+            if isinstance(step, ExecutionStepBuilder):
+                step = step.build_materialization_request_multi(num_partitions)
+                materializations.append(step)
+            yield step
+
+    # All fanouts dispatched. Wait for all of them to materialize to find the skewed partitions.
+    while any(_.results is None for _ in left_materializations + right_materializations):
+        yield None
+
+    left_slices = [
+        [_.results[i] for _ in left_materializations if _.results is not None] for i in range(num_partitions)
+    ]
+    right_slices = [
+        [_.results[i] for _ in right_materializations if _.results is not None] for i in range(num_partitions)
+    ]
+    del left_materializations, right_materializations
+
+    left_splits = _split_skewed_partitions(left_slices) if join._how != logical_plan.JoinType.RIGHT else {}
+    right_splits = _split_skewed_partitions(right_slices) if join._how != logical_plan.JoinType.LEFT else {}
+
+    def join_step(
+        left: list[MaterializedResult[PartitionT]], right: list[MaterializedResult[PartitionT]]
+    ) -> ExecutionStepBuilder[PartitionT]:
+        return ExecutionStepBuilder[PartitionT](
+            inputs=[result.partition() for result in left + right],
+            instructions=[execution_step.ReduceMergeAndJoin(join, num_left_inputs=len(left))],
+            resource_request=None,
+        )
+
+    # Dispatch the joins of the splits of all skewed partitions up front, so that they run in parallel.
+    split_joins: dict[int, list[SingleOutputExecutionStep[PartitionT]]] = {}
+    for i in range(num_partitions):
+        if i in left_splits:
+            split_steps = [join_step(split, right_slices[i]) for split in _split_slices(left_slices[i], left_splits[i])]
+        elif i in right_splits:
+            split_steps = [
+                join_step(left_slices[i], split) for split in _split_slices(right_slices[i], right_splits[i])
+            ]
+        else:
+            continue
+        logger.debug(f"Splitting up skewed partition {i} of {join} into {len(split_steps)} joins")
+        split_joins[i] = [step.build_materialization_request_single() for step in split_steps]
+        yield from split_joins[i]
+
+    # Yield all the joins in order.
+    for i in range(num_partitions):
+        if i not in split_joins:
+            yield join_step(left_slices[i], right_slices[i])
+            continue
+
+        while any(_.result is None for _ in split_joins[i]):
+            yield None
+        yield ExecutionStepBuilder[PartitionT](
+            inputs=[_.result.partition() for _ in split_joins[i] if _.result is not None],
+            instructions=[execution_step.ReduceMerge()],
+            resource_request=None,
+        )
+
+
+def broadcast_join(
+    left_plan: InProgressPhysicalPlan[PartitionT],
+    right_plan: InProgressPhysicalPlan[PartitionT],
+    join: logical_plan.Join,
+) -> InProgressPhysicalPlan[PartitionT]:
+    """Join every partition of one side with the whole of the other (broadcast) side.
+
+    The broadcast side is materialized and merged into a single partition once, which is then used as an input of the
+    join step for each partition of the other side.
+    """
+
+    if join._broadcast_left:
+        broadcast_plan, probe_plan = left_plan, right_plan
+    else:
+        broadcast_plan, probe_plan = right_plan, left_plan
+
+    # Materialize the broadcast side and merge it into a single partition.
+    broadcast_materializations: list[SingleOutputExecutionStep[PartitionT]] = list()
+    for step in broadcast_plan:
+        if isinstance(step, ExecutionStepBuilder):
+            step = step.build_materialization_request_single()
+            broadcast_materializations.append(step)
+        yield step
+
+    while any(_.result is None for _ in broadcast_materializations):
+        yield None
+
+    broadcast_merge = (
+        ExecutionStepBuilder[PartitionT](
+            inputs=[_.result.partition() for _ in broadcast_materializations if _.result is not None]
+        )
+        .add_instruction(instruction=execution_step.ReduceMerge(), resource_request=None)
+        .build_materialization_request_single()
+    )
+    del broadcast_materializations
+    yield broadcast_merge
+
+    while broadcast_merge.result is None:
+        yield None
+
+    broadcast_partition = broadcast_merge.result.partition()
+
+    # As partitions of the other side materialize, emit steps to join each of them with the broadcast partition.
+    probe_requests: deque[SingleOutputExecutionStep[PartitionT]] = deque()
+
+    while True:
+        while len(probe_requests) > 0 and probe_requests[0].result is not None:
+            next_probe = probe_requests.popleft()
+            assert next_probe.result is not None  # for mypy only; guaranteed by while condition
+
+            probe_partition = next_probe.result.partition()
+            inputs = (
+                [broadcast_partition, probe_partition]
+                if join._broadcast_left
+                else [probe_partition, broadcast_partition]
+            )
+            yield ExecutionStepBuilder[PartitionT](inputs=inputs).add_instruction(
+                instruction=execution_step.Join(join), resource_request=None
+            )
+
+        try:
+            step = next(probe_plan)
+            if isinstance(step, ExecutionStepBuilder):
+                step = step.build_materialization_request_single()
+                probe_requests.append(step)
+            yield step
+
+        except StopIteration:
+            if len(probe_requests) > 0:
+                yield None
+            else:
+                return
+
+
 def local_limit(
     child_plan: InProgressPhysicalPlan[PartitionT],
     limit: int,
@@ -215,6 +433,8 @@ def global_limit(
 
     remaining_rows = global_limit._num
     assert remaining_rows >= 0, f"Invalid value for limit: {remaining_rows}"
+    # The planned number of partitions is only an upper bound if the child plan adaptively coalesces its partitions,
+    # so the output may have fewer partitions if the child plan runs out before the limit is reached.
     remaining_partitions = global_limit.num_partitions()
 
     materializations: deque[SingleOutputExecutionStep[PartitionT]] = deque()
@@ -337,16 +557,38 @@ def coalesce(
             yield child_step
 
         except StopIteration:
+            # The child may have been adaptively coalesced into fewer partitions than planned,
+            # in which case the last coalesced partition merges in whatever partitions remain.
             if len(materializations) > 0:
+                if len(materializations) < merges_per_result[0]:
+                    merges_per_result[0] = len(materializations)
+                    continue
                 yield None
             else:
                 return
 
 
+def _coalesce_by_size(sizes: list[int], target_bytes: int) -> list[int]:
+    """Groups adjacent partitions with the given sizes so that each group stays within target_bytes where possible,
+    returning the number of partitions in each group.
+    """
+    groups = [0]
+    group_bytes = 0
+    for size in sizes:
+        if groups[-1] > 0 and group_bytes + size > target_bytes:
+            groups.append(0)
+            group_bytes = 0
+        groups[-1] += 1
+        group_bytes += size
+    return groups
+
+
 def reduce(
     fanout_plan: InProgressPhysicalPlan[PartitionT],
     num_partitions: int,
     reduce_instruction: ReduceInstruction,
+    target_partition_bytes: int | None = None,
+    pipelined: bool = False,
 ) -> InProgressPhysicalPlan[PartitionT]:
     """Reduce the result of fanout_plan.
 
@@ -354,32 +596,92 @@ def reduce(
     by producing a single list in each step.
 
     Then, the reduce instruction is applied to each `i`th slice across the child lists.
+
+    If target_partition_bytes is set, the reduce is adaptive: once all fanouts have materialized,
+    adjacent slices are coalesced into a single reduce while their total materialized size is within target_partition_bytes,
+    so that fewer than num_partitions partitions may be produced.
+
+    If pipelined is set, reduces start before all fanouts have materialized:
+    as fanouts materialize (in order), the outputs for each reduce partition are merged early by the reduce instruction
+    once they total PIPELINED_REDUCE_MERGE_BYTES, and the final reduce then only has to combine the partial reduces.
+    This overlaps the reduces with the remaining fanouts, and lets the fanout outputs be freed early.
+    The reduce instruction must be able to cheaply reduce its own outputs, like ReduceMerge.
     """
 
-    materializations = list()
+    fanouts: deque[MultiOutputExecutionStep[PartitionT]] = deque()
+
+    # The inputs of each reduce partition, in order:
+    # partial reduces of the earlier fanout outputs, then the fanout outputs that have not been merged yet.
+    partial_reduces: list[list[SingleOutputExecutionStep[PartitionT]]] = [[] for _ in range(num_partitions)]
+    unmerged: list[list[MaterializedResult[PartitionT]]] = [[] for _ in range(num_partitions)]
+    unmerged_bytes = [0] * num_partitions
+
+    def collect_materialized_fanouts() -> None:
+        while len(fanouts) > 0 and fanouts[0].results is not None:
+            for i, result in enumerate(fanouts.popleft().results):
+                unmerged[i].append(result)
+                if pipelined:
+                    unmerged_bytes[i] += result.metadata().size_bytes
+
+    def dispatch_partial_reduces() -> Iterator[SingleOutputExecutionStep[PartitionT]]:
+        collect_materialized_fanouts()
+        for i in range(num_partitions):
+            if len(unmerged[i]) > 1 and unmerged_bytes[i] >= PIPELINED_REDUCE_MERGE_BYTES:
+                partial_reduce = ExecutionStepBuilder[PartitionT](
+                    inputs=[result.partition() for result in unmerged[i]],
+                    instructions=[reduce_instruction],
+                    resource_request=None,
+                ).build_materialization_request_single()
+                partial_reduces[i].append(partial_reduce)
+                unmerged[i] = []
+                unmerged_bytes[i] = 0
+                yield partial_reduce
 
-    # Dispatch all fanouts.
+    # Dispatch all fanouts, and partial reduces of the fanouts that have materialized so far.
     for step in fanout_plan:
         if isinstance(step, ExecutionStepBuilder):
             step = step.build_materialization_request_multi(num_partitions)
-            materializations.append(step)
+            fanouts.append(step)
         yield step
+        if pipelined:
+            yield from dispatch_partial_reduces()
 
-    # All fanouts dispatched. Wait for all of them to materialize
+    # All fanouts dispatched. Wait for all of them and all partial reduces to materialize
     # (since we need all of them to emit even a single reduce).
-    while any(_.results is None for _ in materializations):
+    while True:
+        if pipelined:
+            yield from dispatch_partial_reduces()
+        else:
+            collect_materialized_fanouts()
+        if len(fanouts) == 0:
+            break
+        yield None
+
+    while any(_.result is None for steps in partial_reduces for _ in steps):
         yield None
 
-    inputs_to_reduce = [deque(_.results) for _ in materializations if _.results is not None]
-    del materializations
+    inputs_to_reduce = [
+        [_.result for _ in steps if _.result is not None] + results for steps, results in zip(partial_reduces, unmerged)
+    ]
+    del partial_reduces, unmerged
+
+    partitions_per_reduce = [1] * num_partitions
+    if target_partition_bytes is not None:
+        partition_sizes = [sum(result.metadata().size_bytes for result in inputs) for inputs in inputs_to_reduce]
+        partitions_per_reduce = _coalesce_by_size(partition_sizes, target_partition_bytes)
+        logger.debug(f"Adaptively coalesced {num_partitions} reduce partitions into {len(partitions_per_reduce)}")
 
     # Yield all the reduces in order.
-    while len(inputs_to_reduce[0]) > 0:
+    start = 0
+    for num_to_reduce in partitions_per_reduce:
         yield ExecutionStepBuilder[PartitionT](
-            inputs=[result.partition() for result in (_.popleft() for _ in inputs_to_reduce)],
+            inputs=[
+                result.partition() for inputs in inputs_to_reduce[start : start + num_to_reduce] for result in inputs
+            ],
             instructions=[reduce_instruction],
             resource_request=None,
         )
+        start += num_to_reduce
 
 
 def sort(
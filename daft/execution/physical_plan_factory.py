@@ -3,21 +3,38 @@ from __future__ import annotations
 from typing import TypeVar
 
 from daft.execution import execution_step, physical_plan
+from daft.expressions import ExpressionList
 from daft.logical import logical_plan
-from daft.logical.logical_plan import LogicalPlan, PartitionScheme
+from daft.logical.logical_plan import LogicalPlan, PartitionScheme, PartitionSpec
 
 PartitionT = TypeVar("PartitionT")
 
 
 def get_materializing_physical_plan(
-    node: LogicalPlan, psets: dict[str, list[PartitionT]]
+    node: LogicalPlan,
+    psets: dict[str, list[PartitionT]],
+    pipeline_reduces: bool = False,
+    prefetch_read_tasks: int = 0,
 ) -> physical_plan.MaterializedPhysicalPlan:
-    """Translates a LogicalPlan into an appropriate physical plan that materializes its final results."""
+    """Translates a LogicalPlan into an appropriate physical plan that materializes its final results.
+
+    Args:
+        node: LogicalPlan to translate
+        psets: Partitions of the InMemoryScans in the plan, keyed by their cache keys
+        pipeline_reduces: Whether repartitions start reducing before all their fanouts have materialized.
+            Pipelined reduces read the metadata of each fanout output as soon as its result is set,
+            so this should only be enabled by runners that set results once they have materialized.
+        prefetch_read_tasks: Number of read tasks after each read task whose files it prefetches. The prefetched files are
+            handed off within the process that runs the read task, so this should only be enabled by runners that run
+            the next read tasks in the same process.
+    """
 
-    return physical_plan.materialize(_get_physical_plan(node, psets))
+    return physical_plan.materialize(_get_physical_plan(node, psets, pipeline_reduces, prefetch_read_tasks))
 
 
-def _get_physical_plan(node: LogicalPlan, psets: dict[str, list[PartitionT]]) -> physical_plan.InProgressPhysicalPlan:
+def _get_physical_plan(
+    node: LogicalPlan, psets: dict[str, list[PartitionT]], pipeline_reduces: bool, prefetch_read_tasks: int
+) -> physical_plan.InProgressPhysicalPlan:
     """Translates a LogicalPlan into an appropriate physical plan.
 
     See physical_plan.py for more details.
@@ -31,10 +48,12 @@ def _get_physical_plan(node: LogicalPlan, psets: dict[str, list[PartitionT]]) ->
     # -- Unary nodes. --
     elif isinstance(node, logical_plan.UnaryNode):
         [child_node] = node._children()
-        child_plan = _get_physical_plan(child_node, psets)
+        child_plan = _get_physical_plan(child_node, psets, pipeline_reduces, prefetch_read_tasks)
 
         if isinstance(node, logical_plan.TabularFilesScan):
-            return physical_plan.file_read(child_plan=child_plan, scan_info=node)
+            return physical_plan.file_read(
+                child_plan=child_plan, scan_info=node, prefetch_read_tasks=prefetch_read_tasks
+            )
 
         elif isinstance(node, logical_plan.Filter):
             return physical_plan.pipeline_instruction(
@@ -89,30 +108,19 @@ def _get_physical_plan(node: LogicalPlan, psets: dict[str, list[PartitionT]]) ->
             return physical_plan.global_limit(child_plan, node)
 
         elif isinstance(node, logical_plan.Repartition):
-            # Translate PartitionScheme to the appropriate fanout instruction.
-            fanout_instruction: execution_step.FanoutInstruction
-            if node._scheme == PartitionScheme.RANDOM:
-                fanout_instruction = execution_step.FanoutRandom(num_outputs=node.num_partitions())
-            elif node._scheme == PartitionScheme.HASH:
-                fanout_instruction = execution_step.FanoutHash(
-                    num_outputs=node.num_partitions(),
-                    partition_by=node._partition_by,
-                )
-            else:
-                raise RuntimeError(f"Unimplemented partitioning scheme {node._scheme}")
+            # Skewed partitions are only split up by hash joins (see physical_plan.hash_join): the output of a plain
+            # hash repartition must keep all the rows of each hash bucket in a single partition.
 
             # Do the fanout.
-            fanout_plan = physical_plan.pipeline_instruction(
-                child_plan=child_plan,
-                pipeable_instruction=fanout_instruction,
-                resource_request=node.resource_request(),
-            )
+            fanout_plan = _get_fanout_plan(node, child_plan)
 
             # Do the reduce.
             return physical_plan.reduce(
                 fanout_plan=fanout_plan,
                 num_partitions=node.num_partitions(),
                 reduce_instruction=execution_step.ReduceMerge(),
+                target_partition_bytes=physical_plan.ADAPTIVE_TARGET_PARTITION_BYTES if node._adaptive else None,
+                pipelined=pipeline_reduces,
             )
 
         elif isinstance(node, logical_plan.Sort):
@@ -128,10 +136,37 @@ def _get_physical_plan(node: LogicalPlan, psets: dict[str, list[PartitionT]]) ->
     elif isinstance(node, logical_plan.BinaryNode):
         [left_child, right_child] = node._children()
 
-        if isinstance(node, logical_plan.Join):
+        if isinstance(node, logical_plan.Join) and node._strategy == logical_plan.JoinStrategy.BROADCAST:
+            return physical_plan.broadcast_join(
+                left_plan=_get_physical_plan(left_child, psets, pipeline_reduces, prefetch_read_tasks),
+                right_plan=_get_physical_plan(right_child, psets, pipeline_reduces, prefetch_read_tasks),
+                join=node,
+            )
+
+        elif (
+            isinstance(node, logical_plan.Join)
+            and _is_hash_fanout_of(left_child, node._left_on, node.num_partitions())
+            and _is_hash_fanout_of(right_child, node._right_on, node.num_partitions())
+        ):
+            # Join the fanouts of both sides directly instead of reducing them first,
+            # so that skewed partitions can be split up.
+            [left_grandchild] = left_child._children()
+            [right_grandchild] = right_child._children()
+            return physical_plan.hash_join(
+                left_fanout_plan=_get_fanout_plan(
+                    left_child, _get_physical_plan(left_grandchild, psets, pipeline_reduces, prefetch_read_tasks)
+                ),
+                right_fanout_plan=_get_fanout_plan(
+                    right_child, _get_physical_plan(right_grandchild, psets, pipeline_reduces, prefetch_read_tasks)
+                ),
+                num_partitions=node.num_partitions(),
+                join=node,
+            )
+
+        elif isinstance(node, logical_plan.Join):
             return physical_plan.join(
-                left_plan=_get_physical_plan(left_child, psets),
-                right_plan=_get_physical_plan(right_child, psets),
+                left_plan=_get_physical_plan(left_child, psets, pipeline_reduces, prefetch_read_tasks),
+                right_plan=_get_physical_plan(right_child, psets, pipeline_reduces, prefetch_read_tasks),
                 join=node,
             )
 
@@ -140,3 +175,34 @@ def _get_physical_plan(node: LogicalPlan, psets: dict[str, list[PartitionT]]) ->
 
     else:
         raise NotImplementedError(f"Unsupported plan type {node}")
+
+
+def _is_hash_fanout_of(node: LogicalPlan, partition_by: ExpressionList, num_partitions: int) -> bool:
+    """Whether `node` is a Repartition that hash partitions by `partition_by` into `num_partitions` partitions."""
+    return isinstance(node, logical_plan.Repartition) and node.partition_spec() == PartitionSpec(
+        scheme=PartitionScheme.HASH, num_partitions=num_partitions, by=partition_by
+    )
+
+
+def _get_fanout_plan(
+    node: logical_plan.Repartition, child_plan: physical_plan.InProgressPhysicalPlan
+) -> physical_plan.InProgressPhysicalPlan:
+    """Translates the fanout of a Repartition into a physical plan that produces a list of partitions in each step."""
+
+    # Translate PartitionScheme to the appropriate fanout instruction.
+    fanout_instruction: execution_step.FanoutInstruction
+    if node._scheme == PartitionScheme.RANDOM:
+        fanout_instruction = execution_step.FanoutRandom(num_outputs=node.num_partitions())
+    elif node._scheme == PartitionScheme.HASH:
+        fanout_instruction = execution_step.FanoutHash(
+            num_outputs=node.num_partitions(),
+            partition_by=node._partition_by,
+        )
+    else:
+        raise RuntimeError(f"Unimplemented partitioning scheme {node._scheme}")
+
+    return physical_plan.pipeline_instruction(
+        child_plan=child_plan,
+        pipeable_instruction=fanout_instruction,
+        resource_request=node.resource_request(),
+    )
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from daft.filesystem import FileRanges, FileVersion, cat_file, cat_ranges
+
+# Maximum number of files that are fetched ahead of the file being read, where 0 disables prefetching
+DEFAULT_PREFETCH_NUM_FILES = int(os.getenv("DAFT_PREFETCH_NUM_FILES", 4))
+
+# Maximum number of bytes of files that are being fetched ahead of the file being read
+DEFAULT_PREFETCH_MAX_BYTES = int(os.getenv("DAFT_PREFETCH_MAX_BYTES", 256 * 1024 * 1024))
+
+_FetchKey = Tuple[str, FileVersion, Optional[Tuple[Tuple[int, int], ...]]]
+
+
+class _HandedOffFetches:
+    """Fetches that were started by a FilePrefetcher for files that are read by later read tasks, which are handed off
+    when the FilePrefetcher is closed so that the FilePrefetcher of the read task that reads them can take them over
+
+    Fetches are only handed off for files with known versions, so that a file that changed is never read from a stale
+    fetch. At most DEFAULT_PREFETCH_MAX_BYTES bytes of fetches are held, beyond which the oldest ones are cancelled, such
+    as when the read tasks that would take them over are run by another process or are never run.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._fetches: OrderedDict[_FetchKey, tuple[Future[bytes | FileRanges], int]] = OrderedDict()
+        self._num_bytes = 0
+
+    def put(self, key: _FetchKey, future: Future[bytes | FileRanges], size: int) -> None:
+        with self._lock:
+            previous = self._fetches.pop(key, None)
+            if previous is not None:
+                previous[0].cancel()
+                self._num_bytes -= previous[1]
+            self._fetches[key] = (future, size)
+            self._num_bytes += size
+            while self._num_bytes > DEFAULT_PREFETCH_MAX_BYTES:
+                _, (evicted, evicted_size) = self._fetches.popitem(last=False)
+                evicted.cancel()
+                self._num_bytes -= evicted_size
+
+    def take(self, key: _FetchKey) -> Future[bytes | FileRanges] | None:
+        with self._lock:
+            fetch = self._fetches.pop(key, None)
+            if fetch is None:
+                return None
+            self._num_bytes -= fetch[1]
+            return fetch[0]
+
+
+_HANDED_OFF_FETCHES = _HandedOffFetches()
+
+
+class FilePrefetcher:
+    """Fetches the contents of files on a thread pool ahead of when they are read, so that fetching the next files
+    overlaps with decoding the current file
+
+    Files are fetched in the order provided, with at most `num_files` files and `max_bytes` bytes being fetched ahead of
+    the file being read. Files of unknown size or with more than `max_bytes` bytes to fetch are not prefetched, and
+    should be opened directly when read.
+
+    The paths may end with the files of the read tasks that are scheduled after the current one, which are not read
+    through this FilePrefetcher. Their fetches are handed off when it is closed, and taken over by the FilePrefetcher of
+    the read task that reads them if it runs in the same process, so that fetching the files of the next read tasks
+    overlaps with decoding the files of the current one even when each read task reads a single file.
+
+    Args:
+        paths: Paths of the files in the order that they will be read
+        sizes: Sizes of the files in bytes, or None for files that should not be prefetched
+        versions: Versions of the files from their listing, which avoid looking up versions for the disk cache
+        ranges: Byte ranges [start, end) to fetch of each file, or None to fetch whole files, such as to only fetch the
+            column chunks of a Parquet file that are read
+        num_files: Maximum number of files to fetch ahead, defaults to DEFAULT_PREFETCH_NUM_FILES
+        max_bytes: Maximum number of bytes to fetch ahead, defaults to DEFAULT_PREFETCH_MAX_BYTES
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        sizes: list[int | None],
+        versions: list[FileVersion | None] | None = None,
+        ranges: list[list[tuple[int, int]] | None] | None = None,
+        num_files: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self._paths = paths
+        self._sizes = sizes
+        self._versions = versions if versions is not None else [None for _ in paths]
+        self._ranges = ranges if ranges is not None else [None for _ in paths]
+        self._num_files = num_files if num_files is not None else DEFAULT_PREFETCH_NUM_FILES
+        self._max_bytes = max_bytes if max_bytes is not None else DEFAULT_PREFETCH_MAX_BYTES
+
+        self._futures: dict[int, Future[bytes | FileRanges]] = {}
+        self._bytes_in_flight = 0
+        self._next_index_to_fetch = 0
+        self._next_index_to_read = 0
+        self._executor = ThreadPoolExecutor(max_workers=self._num_files) if self._num_files > 0 else None
+        self._schedule()
+
+    def __enter__(self) -> FilePrefetcher:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def bytes_in_flight(self) -> int:
+        return self._bytes_in_flight
+
+    def _schedule(self) -> None:
+        if self._executor is None:
+            return
+        while (
+            self._next_index_to_fetch < len(self._paths)
+            and self._next_index_to_fetch - self._next_index_to_read < self._num_files
+        ):
+            index = self._next_index_to_fetch
+            size = self._fetch_size(index)
+            key = self._fetch_key(index)
+            handed_off = _HANDED_OFF_FETCHES.take(key) if key is not None and size is not None else None
+            if handed_off is not None:
+                assert size is not None  # for mypy only
+                self._futures[index] = handed_off
+                self._bytes_in_flight += size
+            elif size is not None and size <= self._max_bytes:
+                if self._bytes_in_flight + size > self._max_bytes:
+                    break
+                ranges = self._ranges[index]
+                if ranges is not None:
+                    future = self._executor.submit(cat_ranges, self._paths[index], self._sizes[index], ranges)
+                else:
+                    future = self._executor.submit(cat_file, self._paths[index], self._versions[index])
+                self._futures[index] = future
+                self._bytes_in_flight += size
+            self._next_index_to_fetch += 1
+
+    def _fetch_size(self, index: int) -> int | None:
+        ranges = self._ranges[index]
+        if self._sizes[index] is None or ranges is None:
+            return self._sizes[index]
+        return sum(end - start for start, end in ranges)
+
+    def _fetch_key(self, index: int) -> _FetchKey | None:
+        version = self._versions[index]
+        if version is None:
+            return None
+        ranges = self._ranges[index]
+        return (self._paths[index], version, tuple(ranges) if ranges is not None else None)
+
+    def _release(self, index: int) -> Future[bytes | FileRanges] | None:
+        future = self._futures.pop(index, None)
+        if future is not None:
+            size = self._fetch_size(index)
+            assert size is not None
+            self._bytes_in_flight -= size
+        return future
+
+    def fetch(self, index: int) -> bytes | FileRanges | None:
+        """Gets the contents of the file at `index` (or of its byte ranges), or None if it was not prefetched
+
+        Files must be fetched in increasing order of index, and any skipped files are no longer prefetched.
+        """
+        assert index >= self._next_index_to_read, "files must be fetched in order"
+        for skipped_index in range(self._next_index_to_read, index):
+            skipped = self._release(skipped_index)
+            if skipped is not None:
+                skipped.cancel()
+        self._next_index_to_read = index + 1
+        self._next_index_to_fetch = max(self._next_index_to_fetch, self._next_index_to_read)
+
+        future = self._futures.get(index)
+        data = future.result() if future is not None else None
+        self._release(index)
+        self._schedule()
+        return data
+
+    def close(self) -> None:
+        """Stops fetching any files that have not been read, other than those that can be handed off"""
+        for index in list(self._futures.keys()):
+            size = self._fetch_size(index)
+            future = self._release(index)
+            assert future is not None and size is not None
+            key = self._fetch_key(index)
+            if key is not None and not future.cancelled():
+                _HANDED_OFF_FETCHES.put(key, future, size)
+            else:
+                future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,212 @@
+"""
+This file contains the planning of read tasks for a TabularFilesScan.
+
+A read task is a list of FileSplits that are read together into a single output partition. Each FileSplit is either a
+whole file, or a contiguous range of row groups of a Parquet file. Read tasks are planned from the file listing when
+the scan is created, so that the scan knows its number of output partitions ahead of execution.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+from dataclasses import dataclass
+from typing import Any
+
+from daft.datasources import StorageType
+from daft.execution.hive_partitioning import partition_might_match
+from daft.expressions import ExpressionList
+from daft.filesystem import FileVersion
+from daft.logical.field import Field
+from daft.logical.schema import Schema
+from daft.runners.parquet_metadata import get_parquet_metadata
+from daft.runners.partitioning import PartID, PartitionSet, vPartition
+from daft.types import ExpressionType
+
+# Default target size of each read task in bytes of the files on disk, above which Parquet files are split by row groups
+DEFAULT_TARGET_PARTITION_SIZE_BYTES = 512 * 1024 * 1024
+
+SCAN_TASK_PATH_COLUMN_NAME = "path"
+SCAN_TASK_SIZE_COLUMN_NAME = "size"
+SCAN_TASK_ROW_GROUP_START_COLUMN_NAME = "row_group_start"
+SCAN_TASK_ROW_GROUP_END_COLUMN_NAME = "row_group_end"
+SCAN_TASK_VERSION_COLUMN_NAME = "version"
+SCAN_TASK_PARTITION_VALUES_COLUMN_NAME = "partition_values"
+
+
+@dataclass(frozen=True)
+class FileSplit:
+    """A chunk of a file to be read by a read task
+
+    Args:
+        path: Path to the file
+        size: Size of the chunk of the file in bytes
+        row_groups: Range [start, end) of Parquet row groups to read, or None to read the whole file
+        version: Version of the file from its listing, or None if the filesystem does not provide versions
+        partition_values: Values of the Hive-style partition columns parsed from the path of the file
+    """
+
+    path: str
+    size: int
+    row_groups: tuple[int, int] | None = None
+    version: FileVersion | None = None
+    partition_values: dict[str, Any] | None = None
+
+
+def split_parquet_file(
+    path: str, size: int, target_size_bytes: int, version: FileVersion | None = None
+) -> list[FileSplit]:
+    """Splits a Parquet file into ranges of contiguous row groups, each of roughly `target_size_bytes` on disk
+
+    Each split contains at least one row group, so row groups larger than `target_size_bytes` are read on their own.
+    """
+    metadata = get_parquet_metadata(path, version=version)
+    if metadata.num_row_groups <= 1:
+        return [FileSplit(path=path, size=size, version=version)]
+
+    splits = []
+    start = 0
+    split_size = 0
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        row_group_size = sum(row_group.column(j).total_compressed_size for j in range(row_group.num_columns))
+        if i > start and split_size + row_group_size > target_size_bytes:
+            splits.append(FileSplit(path=path, size=split_size, row_groups=(start, i), version=version))
+            start = i
+            split_size = 0
+        split_size += row_group_size
+    splits.append(FileSplit(path=path, size=split_size, row_groups=(start, metadata.num_row_groups), version=version))
+
+    if len(splits) == 1:
+        return [FileSplit(path=path, size=size, version=version)]
+    return splits
+
+
+def plan_scan_tasks(
+    paths: list[str],
+    sizes: list[int],
+    storage_type: StorageType,
+    target_partition_size_bytes: int | None = None,
+    versions: list[FileVersion | None] | None = None,
+    partition_values: list[dict[str, Any]] | None = None,
+) -> list[list[FileSplit]]:
+    """Plans the read tasks for the listed files of a scan, one read task per output partition
+
+    Args:
+        paths: Paths of the listed files
+        sizes: Sizes of the listed files in bytes
+        storage_type: Storage type of the listed files
+        target_partition_size_bytes: Target size of each read task. If provided, consecutive small files are packed
+            into read tasks of up to this size. Otherwise each file is read in its own read task. In both cases,
+            Parquet files larger than the target (or DEFAULT_TARGET_PARTITION_SIZE_BYTES) are split by row groups.
+        versions: Versions of the listed files, which metadata of the files is cached by, or None if unknown
+        partition_values: Values of the Hive-style partition columns of the listed files, or None if not partitioned
+    """
+    if versions is None:
+        versions = [None for _ in paths]
+    if partition_values is None:
+        partition_values = [{} for _ in paths]
+    split_size_bytes = (
+        target_partition_size_bytes if target_partition_size_bytes is not None else DEFAULT_TARGET_PARTITION_SIZE_BYTES
+    )
+
+    tasks = []
+    current_task: list[FileSplit] = []
+    current_task_size = 0
+    for path, size, version, values in zip(paths, sizes, versions, partition_values):
+        if storage_type == StorageType.PARQUET and size > split_size_bytes:
+            splits = split_parquet_file(path, size, split_size_bytes, version=version)
+        else:
+            splits = [FileSplit(path=path, size=size, version=version)]
+        if len(values) > 0:
+            splits = [dataclasses.replace(split, partition_values=values) for split in splits]
+
+        for split in splits:
+            if target_partition_size_bytes is None:
+                tasks.append([split])
+                continue
+
+            # Bin-pack splits in listing order, starting a new read task when the current one would exceed the target
+            if len(current_task) > 0 and current_task_size + split.size > target_partition_size_bytes:
+                tasks.append(current_task)
+                current_task = []
+                current_task_size = 0
+            current_task.append(split)
+            current_task_size += split.size
+
+    if len(current_task) > 0:
+        tasks.append(current_task)
+    return tasks
+
+
+def scan_task_schema() -> Schema:
+    """Construct the schema for a vPartition describing a read task"""
+    return Schema(
+        [
+            Field(SCAN_TASK_PATH_COLUMN_NAME, ExpressionType.string()),
+            Field(SCAN_TASK_SIZE_COLUMN_NAME, ExpressionType.integer()),
+            Field(SCAN_TASK_ROW_GROUP_START_COLUMN_NAME, ExpressionType.integer()),
+            Field(SCAN_TASK_ROW_GROUP_END_COLUMN_NAME, ExpressionType.integer()),
+            Field(SCAN_TASK_VERSION_COLUMN_NAME, ExpressionType.python_object()),
+            Field(SCAN_TASK_PARTITION_VALUES_COLUMN_NAME, ExpressionType.python_object()),
+        ]
+    )
+
+
+def scan_task_to_vpartition(task: list[FileSplit], partition_id: PartID) -> vPartition:
+    """Builds a vPartition with one row per FileSplit of the read task"""
+    return vPartition.from_pydict(
+        data={
+            SCAN_TASK_PATH_COLUMN_NAME: [split.path for split in task],
+            SCAN_TASK_SIZE_COLUMN_NAME: [split.size for split in task],
+            SCAN_TASK_ROW_GROUP_START_COLUMN_NAME: [
+                split.row_groups[0] if split.row_groups is not None else None for split in task
+            ],
+            SCAN_TASK_ROW_GROUP_END_COLUMN_NAME: [
+                split.row_groups[1] if split.row_groups is not None else None for split in task
+            ],
+            SCAN_TASK_VERSION_COLUMN_NAME: [split.version for split in task],
+            SCAN_TASK_PARTITION_VALUES_COLUMN_NAME: [split.partition_values for split in task],
+        },
+        schema=scan_task_schema(),
+        partition_id=partition_id,
+    )
+
+
+def prune_scan_tasks(scan_tasks: PartitionSet, predicate: ExpressionList) -> dict[PartID, vPartition] | None:
+    """Removes the FileSplits from read tasks whose Hive-style partition values cannot match the predicate
+
+    Read tasks that have all of their FileSplits removed are kept as empty read tasks, so that the number of partitions
+    of the scan stays the same. Returns None if no FileSplits can be removed.
+    """
+    data = scan_tasks.to_pydict()
+    if not any(values is not None for values in data[SCAN_TASK_PARTITION_VALUES_COLUMN_NAME]):
+        return None
+
+    rows = iter(
+        zip(
+            data[SCAN_TASK_PATH_COLUMN_NAME],
+            data[SCAN_TASK_SIZE_COLUMN_NAME],
+            data[SCAN_TASK_ROW_GROUP_START_COLUMN_NAME],
+            data[SCAN_TASK_ROW_GROUP_END_COLUMN_NAME],
+            data[SCAN_TASK_VERSION_COLUMN_NAME],
+            data[SCAN_TASK_PARTITION_VALUES_COLUMN_NAME],
+        )
+    )
+    num_pruned = 0
+    pruned_tasks: dict[PartID, vPartition] = {}
+    for partition_id, num_splits in enumerate(scan_tasks.len_of_partitions()):
+        task = []
+        for path, size, start, end, version, values in itertools.islice(rows, num_splits):
+            if values is not None and not partition_might_match(predicate, values):
+                num_pruned += 1
+                continue
+            row_groups = (start, end) if start is not None and end is not None else None
+            task.append(
+                FileSplit(path=path, size=size, row_groups=row_groups, version=version, partition_values=values)
+            )
+        pruned_tasks[partition_id] = scan_task_to_vpartition(task, partition_id=partition_id)
+
+    if num_pruned == 0:
+        return None
+    return pruned_tasks
@@ -841,11 +841,47 @@ class BaseMethodAccessor:
 
 
 class UrlMethodAccessor(BaseMethodAccessor):
-    def download(self) -> UdfExpression:
-        """Treats each string as a URL, and downloads the bytes contents as a bytes column"""
+    def download(
+        self,
+        max_connections: int | None = None,
+        max_connections_per_host: int | None = None,
+        max_retries: int | None = None,
+        max_size_bytes: int | None = None,
+    ) -> UdfExpression:
+        """Treats each string as a URL, and downloads the bytes contents as a bytes column
+
+        URLs are downloaded concurrently, and failed downloads are retried with exponential backoff. URLs that could not
+        be downloaded are returned as None.
+
+        Args:
+            max_connections (Optional[int]): maximum number of URLs to download concurrently in each partition.
+                Defaults to None, which uses DEFAULT_DOWNLOAD_MAX_CONNECTIONS.
+            max_connections_per_host (Optional[int]): maximum number of URLs to download concurrently from the same
+                host in each partition. Defaults to None, which uses DEFAULT_DOWNLOAD_MAX_CONNECTIONS_PER_HOST.
+            max_retries (Optional[int]): number of times to retry a failed download. Defaults to None, which uses
+                DEFAULT_DOWNLOAD_MAX_RETRIES.
+            max_size_bytes (Optional[int]): maximum size of each download, where larger files are returned as None.
+                Defaults to None, which downloads files of any size.
+
+        Returns:
+            UdfExpression: a BYTES expression of the downloaded contents of each URL
+        """
         from daft.udf_library import url_udfs
 
-        return url_udfs.download_udf(self._expr)
+        if max_connections is None:
+            max_connections = url_udfs.DEFAULT_DOWNLOAD_MAX_CONNECTIONS
+        if max_connections_per_host is None:
+            max_connections_per_host = url_udfs.DEFAULT_DOWNLOAD_MAX_CONNECTIONS_PER_HOST
+        if max_retries is None:
+            max_retries = url_udfs.DEFAULT_DOWNLOAD_MAX_RETRIES
+
+        return url_udfs.download_udf(
+            self._expr,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            max_retries=max_retries,
+            max_size_bytes=max_size_bytes,
+        )
 
 
 class StringMethodAccessor(BaseMethodAccessor):
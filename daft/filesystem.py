@@ -1,24 +1,53 @@
 from __future__ import annotations
 
+import bisect
+import contextlib
 import dataclasses
+import hashlib
+import io
+import os
+import re
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 if sys.version_info < (3, 8):
     from typing_extensions import Literal
 else:
     from typing import Literal
 
-from typing import Any
+from typing import IO, Any, Iterator
 
 from fsspec import AbstractFileSystem, get_filesystem_class
+from fsspec.utils import tokenize
 from loguru import logger
 
 
+@dataclasses.dataclass(frozen=True)
+class FileVersion:
+    """Identifies a version of a file, so that results derived from its contents can be cached"""
+
+    path: str
+    size: int
+    mtime: Any
+    etag: Any = None
+
+
 @dataclasses.dataclass(frozen=True)
 class ListingInfo:
     path: str
     size: int
     type: Literal["file"] | Literal["directory"]
+    mtime: Any = None
+    etag: Any = None
+
+    def version(self) -> FileVersion | None:
+        """Returns the version of the listed file, or None if the listing has neither a modification time nor an ETag"""
+        if self.mtime is None and self.etag is None:
+            return None
+        return FileVersion(path=self.path, size=self.size, mtime=self.mtime, etag=self.etag)
 
 
 def _get_s3fs_kwargs() -> dict[str, Any]:
@@ -45,8 +74,7 @@ def _get_s3fs_kwargs() -> dict[str, Any]:
     return kwargs
 
 
-def get_filesystem(protocol: str, **kwargs) -> AbstractFileSystem:
-
+def _create_filesystem(protocol: str, **kwargs) -> AbstractFileSystem:
     if protocol == "s3" or protocol == "s3a":
         kwargs = {**kwargs, **_get_s3fs_kwargs()}
 
@@ -62,6 +90,58 @@ def get_filesystem(protocol: str, **kwargs) -> AbstractFileSystem:
     return fs
 
 
+class _FilesystemPool:
+    """Thread-safe pool of filesystem instances, keyed by protocol and the options that each filesystem was created with
+
+    Filesystems are shared by all threads of a process, so that their connections and credentials are reused across
+    files instead of being set up for every file. The pool is emptied in forked processes, which must not reuse the
+    connections of their parent.
+    """
+
+    def __init__(self) -> None:
+        self._filesystems: dict[str, AbstractFileSystem] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def get(self, protocol: str, **kwargs) -> AbstractFileSystem:
+        key = tokenize(protocol, sorted(kwargs.items()))
+        with self._lock:
+            if self._pid != os.getpid():
+                self._filesystems.clear()
+                self._pid = os.getpid()
+            if key not in self._filesystems:
+                self._filesystems[key] = _create_filesystem(protocol, **kwargs)
+            return self._filesystems[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            # Also clear FSSpec's own cache of instances, so that the next filesystems are created from scratch
+            for fs in self._filesystems.values():
+                type(fs).clear_instance_cache()
+            self._filesystems.clear()
+
+    def __len__(self) -> int:
+        return len(self._filesystems)
+
+
+_FILESYSTEM_POOL = _FilesystemPool()
+
+
+def get_filesystem(protocol: str, **kwargs) -> AbstractFileSystem:
+    """Gets the filesystem for a protocol from the process-wide pool of filesystems, creating it on first use
+
+    Args:
+        protocol: FSSpec protocol of the filesystem, such as "file" or "s3"
+        **kwargs: Options to create the filesystem with, where different options result in separate filesystems
+    """
+    return _FILESYSTEM_POOL.get(protocol, **kwargs)
+
+
+def clear_filesystem_pool() -> None:
+    """Removes all filesystems from the pool, so that they are created again with fresh connections and credentials"""
+    _FILESYSTEM_POOL.clear()
+
+
 def get_protocol_from_path(path: str, **kwargs) -> str:
     split = path.split(":")
     assert len(split) <= 2, f"too many colons found in {path}"
@@ -75,6 +155,345 @@ def get_filesystem_from_path(path: str, **kwargs) -> AbstractFileSystem:
     return fs
 
 
+def _get_modification_time(details: dict[str, Any]) -> Any | None:
+    """Gets the modification time from fsspec file details, which each filesystem names differently"""
+    for key in ["mtime", "LastModified", "last_modified", "updated", "created"]:
+        if details.get(key) is not None:
+            return details[key]
+    return None
+
+
+def _get_etag(details: dict[str, Any]) -> Any | None:
+    """Gets the entity tag from fsspec file details, which object stores change whenever an object is overwritten"""
+    for key in ["ETag", "etag", "md5Hash"]:
+        if details.get(key) is not None:
+            return details[key]
+    return None
+
+
+def get_file_version(path: str) -> FileVersion | None:
+    """Gets the current version of a file, or None if the filesystem provides neither modification times nor ETags"""
+    fs = get_filesystem_from_path(path)
+    details = fs.info(path)
+    mtime = _get_modification_time(details)
+    etag = _get_etag(details)
+    if mtime is None and etag is None:
+        return None
+    return FileVersion(path=path, size=details["size"], mtime=mtime, etag=etag)
+
+
+###
+# Local disk cache
+###
+
+# Default maximum total size in bytes of the files kept in the local disk cache
+DEFAULT_DISK_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class DiskCacheStats:
+    """Counters of the lookups made to a DiskCache by the current process"""
+
+    hits: int
+    misses: int
+    evictions: int
+
+
+class DiskCache:
+    """Content-addressed cache of remote files on local disk, with least-recently-used eviction down to a byte capacity
+
+    Entries are keyed by a hash of the version of a file (its path, size, modification time and ETag), so overwritten
+    files are downloaded again. The cache directory can be shared by multiple processes on the same node, such as Ray
+    workers: entries are written to temporary files that are atomically renamed into place, and entries that are
+    evicted by another process are treated as misses.
+
+    Args:
+        cache_dir: Local directory to store cached files in, which is created if it does not exist
+        max_bytes: Maximum total size of the cached files, defaults to DEFAULT_DISK_CACHE_MAX_BYTES
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_DISK_CACHE_MAX_BYTES) -> None:
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Estimate of the size of the cache, which is recomputed from the directory when it exceeds the capacity to
+        # account for entries written and evicted by other processes
+        self._size_bytes = sum(size for _, size, _ in self._list_entries())
+
+    def _entry_path(self, version: FileVersion) -> str:
+        key = hashlib.sha256(repr(dataclasses.astuple(version)).encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, key)
+
+    def _list_entries(self) -> list[tuple[str, int, float]]:
+        entries = []
+        for entry in os.scandir(self._cache_dir):
+            if entry.name.startswith("."):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def get(self, version: FileVersion) -> bytes | None:
+        path = self._entry_path(version)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        try:
+            # Mark the entry as recently used, since entries are evicted in order of modification time
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data
+
+    def put(self, version: FileVersion, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        path = self._entry_path(version)
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._size_bytes += len(data)
+            if self._size_bytes > self._max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._list_entries(), key=lambda entry: entry[2])
+        self._size_bytes = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._size_bytes <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+                self._evictions += 1
+            except FileNotFoundError:
+                # Already evicted by another process
+                pass
+            self._size_bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for path, _, _ in self._list_entries():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._size_bytes = 0
+
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def stats(self) -> DiskCacheStats:
+        with self._lock:
+            return DiskCacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions)
+
+
+_DISK_CACHE: DiskCache | None = None
+
+
+def enable_disk_cache(cache_dir: str | None = None, max_bytes: int = DEFAULT_DISK_CACHE_MAX_BYTES) -> DiskCache:
+    """Caches the contents of remote files that are read or downloaded on local disk, so that repeated reads of the same
+    files are served locally
+
+    Args:
+        cache_dir: Local directory to store cached files in, defaults to a `daft-cache` directory in the temporary
+            directory of the system
+        max_bytes: Maximum total size of the cached files, defaults to DEFAULT_DISK_CACHE_MAX_BYTES
+    """
+    global _DISK_CACHE
+    if cache_dir is None:
+        cache_dir = os.path.join(tempfile.gettempdir(), "daft-cache")
+    _DISK_CACHE = DiskCache(cache_dir, max_bytes=max_bytes)
+    return _DISK_CACHE
+
+
+def disable_disk_cache() -> None:
+    """Stops caching remote files on local disk, leaving any files that are already cached in the cache directory"""
+    global _DISK_CACHE
+    _DISK_CACHE = None
+
+
+def get_disk_cache() -> DiskCache | None:
+    """Returns the process-wide disk cache, or None if disk caching is not enabled"""
+    return _DISK_CACHE
+
+
+# The disk cache can also be enabled for all processes, such as Ray workers, by setting DAFT_DISK_CACHE_DIR
+if os.getenv("DAFT_DISK_CACHE_DIR"):
+    enable_disk_cache(
+        os.environ["DAFT_DISK_CACHE_DIR"],
+        max_bytes=int(os.getenv("DAFT_DISK_CACHE_MAX_BYTES", DEFAULT_DISK_CACHE_MAX_BYTES)),
+    )
+
+
+class _KeyedLocks:
+    """Locks that are created on demand for each key, and removed once no thread holds or waits for them"""
+
+    def __init__(self) -> None:
+        self._locks: dict[Any, threading.Lock] = {}
+        self._num_holders: dict[Any, int] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def hold(self, key: Any) -> Iterator[None]:
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+            self._num_holders[key] = self._num_holders.get(key, 0) + 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                self._num_holders[key] -= 1
+                if self._num_holders[key] == 0:
+                    del self._num_holders[key]
+                    del self._locks[key]
+
+
+_DOWNLOAD_LOCKS = _KeyedLocks()
+
+
+def cat_file(path: str, version: FileVersion | None = None) -> bytes:
+    """Gets the contents of a file, from the local disk cache if it is enabled and the file is remote
+
+    Args:
+        path: FSSpec compatible path to the file
+        version: Version of the file if known from its listing, which is otherwise looked up from the filesystem
+    """
+    fs = get_filesystem_from_path(path)
+    if _DISK_CACHE is None or get_protocol_from_path(path) == "file":
+        return fs.cat_file(path)
+
+    if version is None:
+        version = get_file_version(path)
+    if version is None:
+        return fs.cat_file(path)
+
+    # Concurrent reads of the same file in this process wait for a single download, instead of each downloading it
+    with _DOWNLOAD_LOCKS.hold(version):
+        data = _DISK_CACHE.get(version)
+        if data is None:
+            data = fs.cat_file(path)
+            _DISK_CACHE.put(version, data)
+    return data
+
+
+@dataclasses.dataclass(frozen=True)
+class FileRanges:
+    """Contents of byte ranges of a file that were fetched ahead of reading it
+
+    Args:
+        path: FSSpec compatible path to the file
+        size: Size of the whole file in bytes
+        ranges: Contents of the fetched ranges, keyed by the offset of their first byte in the file
+    """
+
+    path: str
+    size: int
+    ranges: dict[int, bytes]
+
+    def size_bytes(self) -> int:
+        return sum(len(data) for data in self.ranges.values())
+
+    def open(self) -> IO[bytes]:
+        """Opens the file for reading, where reads outside of the fetched ranges are read from the filesystem"""
+        return _FileRangesReader(self)
+
+
+class _FileRangesReader(io.RawIOBase):
+    def __init__(self, file_ranges: FileRanges) -> None:
+        self._file_ranges = file_ranges
+        self._starts = sorted(file_ranges.ranges.keys())
+        self._position = 0
+        # Opened lazily on the first read that is not within a fetched range
+        self._file: IO[bytes] | None = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        else:
+            self._position = self._file_ranges.size + offset
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        end = self._file_ranges.size if size < 0 else min(self._position + size, self._file_ranges.size)
+        if end <= self._position:
+            return b""
+
+        i = bisect.bisect_right(self._starts, self._position) - 1
+        if i >= 0:
+            start = self._starts[i]
+            data = self._file_ranges.ranges[start]
+            if end <= start + len(data):
+                result = data[self._position - start : end - start]
+                self._position = end
+                return result
+
+        if self._file is None:
+            self._file = get_filesystem_from_path(self._file_ranges.path).open(self._file_ranges.path)
+        self._file.seek(self._position)
+        result = self._file.read(end - self._position)
+        self._position += len(result)
+        return result
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+
+def cat_ranges(path: str, size: int, ranges: list[tuple[int, int]]) -> FileRanges:
+    """Fetches byte ranges of a file concurrently
+
+    Args:
+        path: FSSpec compatible path to the file
+        size: Size of the whole file in bytes
+        ranges: Ranges [start, end) of bytes to fetch
+    """
+    fs = get_filesystem_from_path(path)
+    contents = fs.cat_ranges(
+        [path for _ in ranges], [start for start, _ in ranges], [end for _, end in ranges], on_error="raise"
+    )
+    return FileRanges(path=path, size=size, ranges={start: data for (start, _), data in zip(ranges, contents)})
+
+
 ###
 # File globbing
 ###
@@ -91,31 +510,170 @@ def _path_is_glob(path: str) -> bool:
     return any([char in path for char in ["*", "?", "["]])
 
 
+# Number of threads used to list directories concurrently when globbing
+_LISTING_NUM_THREADS = 16
+
+# Number of seconds that listings of remote filesystems are cached for, where 0 disables caching. Cached listings do not
+# reflect files written by other processes, so caching is opt-in. Local listings are cheap and are never cached.
+_LISTING_CACHE_TTL_SECONDS = float(os.getenv("DAFT_LISTING_CACHE_TTL_SECONDS", 0))
+
+
+class _ListingCache:
+    """Thread-safe cache of path listings, where each listing expires after a time-to-live"""
+
+    def __init__(self) -> None:
+        self._listings: dict[str, tuple[float, list[ListingInfo]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, ttl_seconds: float) -> list[ListingInfo] | None:
+        with self._lock:
+            if path not in self._listings:
+                return None
+            listed_at, listing = self._listings[path]
+            if time.monotonic() - listed_at > ttl_seconds:
+                del self._listings[path]
+                return None
+            return listing
+
+    def put(self, path: str, listing: list[ListingInfo]) -> None:
+        with self._lock:
+            self._listings[path] = (time.monotonic(), listing)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+
+
+_LISTING_CACHE = _ListingCache()
+
+
+def clear_listing_cache() -> None:
+    """Clears all cached listings, such as after writing new files"""
+    _LISTING_CACHE.clear()
+
+
+def _glob_component_regex(component: str) -> re.Pattern:
+    """Translates a component of a glob path into a regex the same way as fsspec's glob"""
+    escaped = re.sub(r"([\\.+()|^${}])", r"\\\1", component).replace("?", ".")
+    return re.compile("^" + escaped.replace("*", "[^/]*") + "$")
+
+
+class _ConcurrentListingFilesystem:
+    """Wraps a filesystem so that fsspec's glob finds the paths below its root by listing directories concurrently
+
+    Directories are walked level by level, listing all directories of a level at once on a pool of
+    _LISTING_NUM_THREADS threads. Directories that can't contain matches of the glob are not walked: only those that
+    match the components of the glob up to the first `**` component are.
+
+    Args:
+        fs: Filesystem to list directories of
+        path: Glob path, without its protocol
+    """
+
+    def __init__(self, fs: AbstractFileSystem, path: str) -> None:
+        self._fs = fs
+        ind = min(path.find(char) if path.find(char) >= 0 else len(path) for char in ["*", "?", "["])
+        self._root = path[: path.rfind("/", 0, ind) + 1].rstrip("/")
+        components = path[len(self._root) :].strip("/").split("/")
+        self._component_regexes = []
+        for component in components:
+            if "**" in component:
+                break
+            self._component_regexes.append(_glob_component_regex(component))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fs, name)
+
+    def _may_contain_matches(self, directory: str) -> bool:
+        if not directory.startswith(self._root + "/"):
+            return True
+        components = directory[len(self._root) + 1 :].split("/")
+        return all(regex.match(c) for regex, c in zip(self._component_regexes, components))
+
+    def _ls(self, directory: str, **kwargs) -> list[dict[str, Any]]:
+        try:
+            return self._fs.ls(directory, detail=True, **kwargs)
+        except (FileNotFoundError, IOError):
+            return []
+
+    def find(
+        self, path: str, maxdepth: int | None = None, withdirs: bool = False, detail: bool = False, **kwargs
+    ) -> dict[str, dict[str, Any]] | list[str]:
+        """Equivalent to `fs.find`, listing the directories of each level below `path` concurrently"""
+        path = self._fs._strip_protocol(path)
+        found: dict[str, dict[str, Any]] = {}
+        directories = [path]
+        depth = 1
+        with ThreadPoolExecutor(max_workers=_LISTING_NUM_THREADS) as executor:
+            while len(directories) > 0:
+                next_directories = []
+                for directory, listing in zip(
+                    directories, executor.map(lambda directory: self._ls(directory, **kwargs), directories)
+                ):
+                    for info in listing:
+                        name = info["name"].rstrip("/")
+                        if info["type"] == "directory" and name != directory:
+                            if withdirs:
+                                found[info["name"]] = info
+                            if (maxdepth is None or depth < maxdepth) and self._may_contain_matches(name):
+                                next_directories.append(name)
+                        else:
+                            found[info["name"]] = info
+                directories = next_directories
+                depth += 1
+        if len(found) == 0 and self._fs.isfile(path):
+            # Like fs.find, a path that is a file finds itself
+            found[path] = {}
+        names = sorted(found)
+        return {name: found[name] for name in names} if detail else names
+
+
+def _glob(fs: AbstractFileSystem, path: str) -> dict[str, dict[str, Any]]:
+    """Equivalent to `fs.glob(path, detail=True)` for a path containing a glob, but lists the directories below the root
+    of the glob concurrently, including those of recursive `**` globs
+    """
+    path = fs._strip_protocol(path)
+    return AbstractFileSystem.glob(_ConcurrentListingFilesystem(fs, path), path, detail=True)
+
+
 def glob_path_with_stats(path: str) -> list[ListingInfo]:
-    """Glob a path, returning a list ListingInfo."""
-    fs = get_filesystem_from_path(path)
+    """Glob a path, returning a list ListingInfo.
+
+    Listings of remote filesystems are cached for `DAFT_LISTING_CACHE_TTL_SECONDS` seconds if it is set, and are not
+    cached by default.
+    """
     protocol = get_protocol_from_path(path)
+    use_cache = protocol != "file" and _LISTING_CACHE_TTL_SECONDS > 0
+    if use_cache:
+        cached_listing = _LISTING_CACHE.get(path, _LISTING_CACHE_TTL_SECONDS)
+        if cached_listing is not None:
+            return cached_listing
+
+    listing = _glob_path_with_stats(path, protocol)
+    if use_cache:
+        _LISTING_CACHE.put(path, listing)
+    return listing
+
+
+def _listing_info(protocol: str, details: dict[str, Any]) -> ListingInfo:
+    return ListingInfo(
+        path=_fix_returned_path(protocol, details["name"]),
+        size=details["size"],
+        type=details["type"],
+        mtime=_get_modification_time(details),
+        etag=_get_etag(details),
+    )
+
+
+def _glob_path_with_stats(path: str, protocol: str) -> list[ListingInfo]:
+    fs = get_filesystem_from_path(path)
 
     if _path_is_glob(path):
-        globbed_data = fs.glob(path, detail=True)
-        return [
-            ListingInfo(path=_fix_returned_path(protocol, path), size=details["size"], type=details["type"])
-            for path, details in globbed_data.items()
-        ]
+        globbed_data = _glob(fs, path)
+        return [_listing_info(protocol, details) for details in globbed_data.values()]
 
     if fs.isfile(path):
-        file_info = fs.info(path)
-        return [
-            ListingInfo(
-                path=_fix_returned_path(protocol, file_info["name"]), size=file_info["size"], type=file_info["type"]
-            )
-        ]
+        return [_listing_info(protocol, fs.info(path))]
     elif fs.isdir(path):
-        files_info = fs.ls(path, detail=True)
-        return [
-            ListingInfo(
-                path=_fix_returned_path(protocol, file_info["name"]), size=file_info["size"], type=file_info["type"]
-            )
-            for file_info in files_info
-        ]
+        return [_listing_info(protocol, file_info) for file_info in fs.ls(path, detail=True)]
     raise FileNotFoundError(f"File or directory not found: {path}")
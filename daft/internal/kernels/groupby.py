@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import threading
+from typing import Iterator
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pac
+
+from daft.daft import kernels
+
+# Native extensions built before the grouping and aggregation kernels were added fall back to aggregating with Polars
+NATIVE_GROUPBY_AVAILABLE = hasattr(kernels, "group_rows_pyarrow_arrays")
+
+# Number of threads that each grouping or aggregation kernel call may use, unless limited by `kernel_num_threads`
+_NUM_THREADS = multiprocessing.cpu_count()
+
+_thread_budget = threading.local()
+
+
+@contextlib.contextmanager
+def kernel_num_threads(num_threads: int) -> Iterator[None]:
+    """Limits the number of threads that grouping and aggregation kernel calls on the calling thread may use
+
+    Runners that run several steps at once limit each step to the CPUs that it reserved, so that the threads of the
+    kernels of concurrent steps do not oversubscribe the CPUs.
+    """
+    previous = getattr(_thread_budget, "num_threads", None)
+    _thread_budget.num_threads = num_threads
+    try:
+        yield
+    finally:
+        _thread_budget.num_threads = previous
+
+
+def _num_threads() -> int:
+    num_threads = getattr(_thread_budget, "num_threads", None)
+    return num_threads if num_threads is not None else _NUM_THREADS
+
+
+def _to_array(arr: pa.ChunkedArray | pa.Array) -> pa.Array:
+    if isinstance(arr, pa.ChunkedArray):
+        return arr.combine_chunks()
+    return arr
+
+
+def group_rows(keys: list[pa.ChunkedArray], expected_num_groups: int | None = None) -> tuple[pa.Array, pa.Array]:
+    """Groups rows with equal keys, returning the first row of each group and the group ID of each row
+
+    Groups are numbered in the order of their first rows, and rows with null keys are grouped together.
+
+    Args:
+        keys (list[pa.ChunkedArray]): one array for each key column
+        expected_num_groups (int | None): expected number of groups to pre-size hash tables for, or None to grow them
+            as groups are found
+    """
+    assert len(keys) > 0, "expected at least one key to group by"
+    return kernels.group_rows_pyarrow_arrays([_to_array(k) for k in keys], expected_num_groups, _num_threads(), pa)
+
+
+def _group_offsets(group_ids: pa.Array, num_groups: int) -> tuple[pa.Array, np.ndarray]:
+    order, offsets = kernels.group_order_pyarrow_array(group_ids, num_groups, pa)
+    return order, offsets.to_numpy()
+
+
+def _list_array(offsets: np.ndarray, values: pa.Array) -> pa.Array:
+    return pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), values)
+
+
+def grouped_aggregate(arr: pa.ChunkedArray | pa.Array, group_ids: pa.Array, num_groups: int, op: str) -> pa.Array:
+    """Aggregates the values of each group, given the group ID of each row from `group_rows`
+
+    Nulls are ignored, so groups with only nulls have a null sum, mean, min or max, and NaNs are only the min or max
+    of groups with no other values. "list" collects the values of each group into a list, and "concat" concatenates
+    the lists of each group.
+
+    Args:
+        arr (pa.ChunkedArray | pa.Array): values to aggregate
+        group_ids (pa.Array): uint64 group ID of each row
+        num_groups (int): number of groups
+        op (str): one of "sum", "mean", "min", "max", "count", "list" or "concat"
+    """
+    arr = _to_array(arr)
+    if op in ("sum", "mean", "count"):
+        return kernels.grouped_aggregate_pyarrow_array(arr, group_ids, num_groups, op, _num_threads(), pa)
+    elif op in ("min", "max"):
+        indices = kernels.grouped_aggregate_pyarrow_array(arr, group_ids, num_groups, f"arg{op}", _num_threads(), pa)
+        return arr.take(indices)
+    elif op == "list":
+        order, offsets = _group_offsets(group_ids, num_groups)
+        return _list_array(offsets, arr.take(order))
+    elif op == "concat":
+        if pa.types.is_null(arr.type):
+            # Lists of Python objects with no non-null lists are inferred as nulls by Arrow
+            arr = arr.cast(pa.list_(pa.null()))
+        order, offsets = _group_offsets(group_ids, num_groups)
+        lists = arr.take(order)
+        list_lengths = pac.list_value_length(lists).fill_null(0).to_numpy(zero_copy_only=False)
+        value_offsets = np.concatenate([[0], np.cumsum(list_lengths)])[offsets]
+        return _list_array(value_offsets, pac.list_flatten(lists))
+    raise NotImplementedError(f"Grouped aggregation {op} not implemented")
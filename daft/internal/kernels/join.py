@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pac
+from pandas.core.reshape.merge import get_join_indexers
+
+from daft.daft import kernels
+
+# Native extensions built before the hash join kernel was added fall back to joining with pandas
+_HAS_NATIVE_HASH_JOIN = hasattr(kernels, "hash_join_pyarrow_arrays")
+
+
+def _unify_key_types(left: pa.Array, right: pa.Array) -> tuple[pa.Array, pa.Array]:
+    if left.type == right.type:
+        return left, right
+    try:
+        return left, pac.cast(right, left.type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return pac.cast(left, right.type), right
+
+
+def hash_join(
+    left_keys: list[pa.ChunkedArray], right_keys: list[pa.ChunkedArray]
+) -> tuple[pa.ChunkedArray, pa.ChunkedArray]:
+    """Inner joins rows on their keys, returning the indices of the matching rows of the left and right keys
+
+    Rows with a null or NaN in any of their keys do not match any rows. The left indices are in ascending order.
+    """
+    assert len(left_keys) > 0, "expected at least one key to join on"
+    assert len(left_keys) == len(right_keys), "expected the same number of left and right keys"
+    if len(left_keys[0]) == 0 or len(right_keys[0]) == 0:
+        empty = pa.chunked_array([[]], type=pa.uint64())
+        return empty, empty
+
+    if not _HAS_NATIVE_HASH_JOIN:
+        return _pandas_join(left_keys, right_keys)
+
+    left_arrays, right_arrays = [], []
+    for left, right in zip(left_keys, right_keys):
+        left_array, right_array = _unify_key_types(left.combine_chunks(), right.combine_chunks())
+        left_arrays.append(left_array)
+        right_arrays.append(right_array)
+
+    left_indices, right_indices = kernels.hash_join_pyarrow_arrays(left_arrays, right_arrays, pa)
+    return pa.chunked_array([left_indices], type=pa.uint64()), pa.chunked_array([right_indices], type=pa.uint64())
+
+
+def _get_null_nan_mask(keys: list[pa.ChunkedArray]) -> pa.Array:
+    """Returns a mask which indicates the rows without nulls/nans across a list of keys"""
+    mask_list = [pac.invert(pac.is_null(k, nan_is_null=True)) for k in keys]
+    return functools.reduce(lambda a, b: pac.and_(a, b), mask_list)
+
+
+def _pandas_join(
+    left_keys: list[pa.ChunkedArray], right_keys: list[pa.ChunkedArray]
+) -> tuple[pa.ChunkedArray, pa.ChunkedArray]:
+    left_null_nan_mask = _get_null_nan_mask(left_keys)
+    left_no_nulls = pac.all(left_null_nan_mask).as_py()
+    right_null_nan_mask = _get_null_nan_mask(right_keys)
+    right_no_nulls = pac.all(right_null_nan_mask).as_py()
+
+    # Filter out rows with NaNs/None entries
+    left_keys_arrs = left_keys if left_no_nulls else [pac.array_filter(k, left_null_nan_mask) for k in left_keys]
+    right_keys_arrs = right_keys if right_no_nulls else [pac.array_filter(k, right_null_nan_mask) for k in right_keys]
+
+    left_index, right_index = get_join_indexers(
+        [arr.to_pandas() for arr in left_keys_arrs], [arr.to_pandas() for arr in right_keys_arrs], how="inner"
+    )
+
+    # Restore the join indices to original indices before filtering rows with NaNs/Nones
+    if not left_no_nulls:
+        num_nulls_cumsum = np.invert(left_null_nan_mask.to_numpy()).cumsum()[left_null_nan_mask.to_numpy()]
+        left_index = left_index + num_nulls_cumsum[left_index]
+    if not right_no_nulls:
+        num_nulls_cumsum = np.invert(right_null_nan_mask.to_numpy()).cumsum()[right_null_nan_mask.to_numpy()]
+        right_index = right_index + num_nulls_cumsum[right_index]
+
+    # Order the matches by their left rows, like the native kernel
+    order = np.argsort(left_index, kind="stable")
+    return (
+        pa.chunked_array([left_index[order]], type=pa.uint64()),
+        pa.chunked_array([right_index[order]], type=pa.uint64()),
+    )
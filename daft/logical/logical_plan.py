@@ -7,10 +7,18 @@ from enum import Enum, IntEnum
 from pprint import pformat
 from typing import Any, Generic, TypeVar
 
+from fsspec.utils import infer_compression
+
 from daft.datasources import SourceInfo, StorageType
 from daft.errors import ExpressionTypeError
 from daft.execution.operators import OperatorEnum
-from daft.expressions import CallExpression, Expression, ExpressionList, col
+from daft.expressions import (
+    CallExpression,
+    Expression,
+    ExpressionList,
+    UdfExpression,
+    col,
+)
 from daft.internal.treenode import TreeNode
 from daft.logical.field import Field
 from daft.logical.map_partition_ops import ExplodeOp, MapPartitionOp
@@ -53,6 +61,13 @@ class LogicalPlan(TreeNode["LogicalPlan"]):
         """
         return None
 
+    def size_bytes_estimate(self) -> int | None:
+        """Returns an estimate of the size in bytes of the output of this LogicalPlan, or None if it is unknown
+
+        Implementations should override this if their output size can be estimated without executing the plan.
+        """
+        return None
+
     @abstractmethod
     def required_columns(self) -> set[str]:
         raise NotImplementedError()
@@ -187,13 +202,35 @@ class LogicalPlan(TreeNode["LogicalPlan"]):
 
 
 class UnaryNode(LogicalPlan):
-    ...
+    def size_bytes_estimate(self) -> int | None:
+        # Most unary operations output at most as much data as their child, so its size is an upper bound
+        [child] = self._children()
+        return child.size_bytes_estimate()
 
 
 class BinaryNode(LogicalPlan):
     ...
 
 
+# Rough ratios of the size in memory of the data read from files to the size of the files on disk, so that the sizes of
+# scans are not underestimated by the sizes of encoded and compressed files
+PARQUET_IN_MEMORY_EXPANSION_FACTOR = 4
+COMPRESSED_FILE_IN_MEMORY_EXPANSION_FACTOR = 4
+
+
+# Aggregation op of a TabularFilesScan that counts all rows like LocalCount, rather than the non-null values of a column
+COUNT_ROWS_OP = "count_rows"
+
+
+def _aggregations_eq(left: list[tuple[Expression, str]] | None, right: list[tuple[Expression, str]] | None) -> bool:
+    if left is None or right is None:
+        return left is None and right is None
+    return len(left) == len(right) and all(
+        left_expr.is_eq(right_expr) and left_op == right_op
+        for (left_expr, left_op), (right_expr, right_op) in zip(left, right)
+    )
+
+
 class TabularFilesScan(UnaryNode):
     def __init__(
         self,
@@ -202,6 +239,8 @@ class TabularFilesScan(UnaryNode):
         source_info: SourceInfo,
         predicate: ExpressionList | None = None,
         columns: list[str] | None = None,
+        limit_rows: int | None = None,
+        aggregation: list[tuple[Expression, str]] | None = None,
         filepaths_child: LogicalPlan,
         filepaths_column_name: str,
         num_partitions: int | None = None,
@@ -223,8 +262,15 @@ class TabularFilesScan(UnaryNode):
 
         self._column_names = columns
         self._columns = self._schema
+        self._limit_rows = limit_rows
         self._source_info = source_info
 
+        # An ungrouped aggregation of the scanned rows, which scans output instead of the rows themselves so that
+        # aggregations can be answered from file metadata
+        self._aggregation = aggregation
+        if aggregation is not None:
+            self._output_schema = ExpressionList([e for e, _ in aggregation]).to_schema(self._output_schema)
+
         # TabularFilesScan has a single child node that provides the filepaths to read from.
         assert (
             filepaths_child.schema()[filepaths_column_name] is not None
@@ -241,17 +287,51 @@ class TabularFilesScan(UnaryNode):
         return self._output_schema
 
     def __repr__(self) -> str:
-        return self._repr_helper(columns_pruned=len(self._columns) - len(self.schema()), source_info=self._source_info)
+        return self._repr_helper(
+            columns_pruned=len(self._columns) - len(self.schema()),
+            predicate=self._predicate,
+            limit_rows=self._limit_rows,
+            aggregation=[e for e, _ in self._aggregation] if self._aggregation is not None else None,
+            source_info=self._source_info,
+        )
 
     def required_columns(self) -> set[str]:
         return {self._filepaths_column_name} | self._predicate.required_columns()
 
+    def size_bytes_estimate(self) -> int | None:
+        filepaths_child = self._filepaths_child
+        if not isinstance(filepaths_child, InMemoryScan) or filepaths_child._cache_entry.value is None:
+            return None
+        scan_tasks = filepaths_child._cache_entry.value.to_pydict()
+        file_paths, file_sizes = scan_tasks.get("path"), scan_tasks.get("size")
+        if file_paths is None or file_sizes is None or any(size is None for size in file_sizes):
+            return None
+        if self._aggregation is not None:
+            return 0
+
+        # Files are encoded and often compressed on disk, so their data takes up more space once read into memory
+        size_bytes = 0
+        for path, size in zip(file_paths, file_sizes):
+            if self._source_info.scan_type() == StorageType.PARQUET:
+                size_bytes += size * PARQUET_IN_MEMORY_EXPANSION_FACTOR
+            elif infer_compression(path) is not None:
+                size_bytes += size * COMPRESSED_FILE_IN_MEMORY_EXPANSION_FACTOR
+            else:
+                size_bytes += size
+
+        # Scale the size of the files by the fraction of their columns that are read
+        if self._column_names is not None and len(self._columns) > 0:
+            size_bytes = size_bytes * len(self._column_names) // len(self._columns)
+        return size_bytes
+
     def _local_eq(self, other: Any) -> bool:
         return (
             isinstance(other, TabularFilesScan)
             and self.schema() == other.schema()
             and self._predicate == other._predicate
             and self._columns == other._columns
+            and self._limit_rows == other._limit_rows
+            and _aggregations_eq(self._aggregation, other._aggregation)
             and self._source_info == other._source_info
             and self._filepaths_column_name == other._filepaths_column_name
         )
@@ -259,23 +339,29 @@ class TabularFilesScan(UnaryNode):
     def rebuild(self) -> LogicalPlan:
         child = self._filepaths_child.rebuild()
         return TabularFilesScan(
-            schema=self.schema(),
+            schema=self._schema,
             source_info=self._source_info,
             predicate=self._predicate if self._predicate is not None else None,
             columns=self._column_names,
+            limit_rows=self._limit_rows,
+            aggregation=self._aggregation,
             filepaths_child=child,
             filepaths_column_name=self._filepaths_column_name,
+            num_partitions=self.num_partitions(),
         )
 
     def copy_with_new_children(self, new_children: list[LogicalPlan]) -> LogicalPlan:
         assert len(new_children) == 1
         return TabularFilesScan(
-            schema=self.schema(),
+            schema=self._schema,
             source_info=self._source_info,
             predicate=self._predicate,
             columns=self._column_names,
+            limit_rows=self._limit_rows,
+            aggregation=self._aggregation,
             filepaths_child=new_children[0],
             filepaths_column_name=self._filepaths_column_name,
+            num_partitions=self.num_partitions(),
         )
 
 
@@ -303,6 +389,11 @@ class InMemoryScan(UnaryNode):
     def required_columns(self) -> set[str]:
         return set()
 
+    def size_bytes_estimate(self) -> int | None:
+        if self._cache_entry.value is None:
+            return None
+        return self._cache_entry.value.size_bytes()
+
     def rebuild(self) -> LogicalPlan:
         # if we are rebuilding, this will be cached when this is ran
         return InMemoryScan(
@@ -324,13 +415,19 @@ class FileWrite(UnaryNode):
         storage_type: StorageType,
         partition_cols: ExpressionList | None = None,
         compression: str | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
     ) -> None:
-        assert (
-            storage_type == StorageType.PARQUET or storage_type == StorageType.CSV
-        ), "only parquet and csv is supported currently"
+        assert storage_type in (
+            StorageType.PARQUET,
+            StorageType.CSV,
+            StorageType.ARROW_IPC,
+        ), "only parquet, csv and arrow ipc are supported currently"
         self._storage_type = storage_type
         self._root_dir = root_dir
         self._compression = compression
+        self._target_file_size_bytes = target_file_size_bytes
+        self._max_rows_per_file = max_rows_per_file
         if partition_cols is not None:
             self._partition_cols = partition_cols
         else:
@@ -358,6 +455,8 @@ class FileWrite(UnaryNode):
             and self._storage_type == other._storage_type
             and self._root_dir == other._root_dir
             and self._compression == other._compression
+            and self._target_file_size_bytes == other._target_file_size_bytes
+            and self._max_rows_per_file == other._max_rows_per_file
         )
 
     def rebuild(self) -> LogicalPlan:
@@ -371,6 +470,8 @@ class FileWrite(UnaryNode):
             storage_type=self._storage_type,
             partition_cols=self._partition_cols,
             compression=self._compression,
+            target_file_size_bytes=self._target_file_size_bytes,
+            max_rows_per_file=self._max_rows_per_file,
         )
 
 
@@ -429,6 +530,12 @@ class Projection(UnaryNode):
     def required_columns(self) -> set[str]:
         return self._projection.required_columns()
 
+    def size_bytes_estimate(self) -> int | None:
+        # UDFs can produce arbitrarily large outputs from their inputs
+        if any(isinstance(node, UdfExpression) for e in self._projection for node in e.post_order()):
+            return None
+        return super().size_bytes_estimate()
+
     def _local_eq(self, other: Any) -> bool:
         return (
             isinstance(other, Projection) and self.schema() == other.schema() and self._projection == other._projection
@@ -508,6 +615,9 @@ class MapPartition(UnaryNode, Generic[TMapPartitionOp]):
             and self._map_partition_op == other._map_partition_op
         )
 
+    def size_bytes_estimate(self) -> int | None:
+        return None
+
     def eval_partition(self, partition: vPartition) -> vPartition:
         return self._map_partition_op.run(partition)
 
@@ -631,23 +741,42 @@ class PartitionSpec:
 
 class Repartition(UnaryNode):
     def __init__(
-        self, input: LogicalPlan, partition_by: ExpressionList, num_partitions: int, scheme: PartitionScheme
+        self,
+        input: LogicalPlan,
+        partition_by: ExpressionList,
+        num_partitions: int,
+        scheme: PartitionScheme,
+        adaptive: bool = False,
     ) -> None:
+        # Adaptive repartitions may coalesce adjacent output partitions at execution time based on their materialized
+        # sizes, so `num_partitions` is only an upper bound and parents cannot rely on the output partitioning
         pspec = PartitionSpec(
-            scheme=scheme,
+            scheme=PartitionScheme.UNKNOWN if adaptive else scheme,
             num_partitions=num_partitions,
-            by=partition_by if len(partition_by) > 0 else None,
+            by=partition_by if len(partition_by) > 0 and not adaptive else None,
         )
         super().__init__(input.schema(), partition_spec=pspec, op_level=OpLevel.GLOBAL)
         self._register_child(input)
         self._partition_by = partition_by
         self._scheme = scheme
+        self._adaptive = adaptive
         if scheme == PartitionScheme.RANDOM and len(partition_by.names) > 0:
             raise ValueError("Can not pass in random partitioning and partition_by args")
 
     def __repr__(self) -> str:
         return self._repr_helper(
-            partition_by=self._partition_by, num_partitions=self.num_partitions(), scheme=self._scheme
+            partition_by=self._partition_by,
+            num_partitions=self.num_partitions(),
+            scheme=self._scheme,
+            adaptive=self._adaptive,
+        )
+
+    def requested_partition_spec(self) -> PartitionSpec:
+        """Returns the partitioning that this node repartitions into, before any adaptive coalescing"""
+        return PartitionSpec(
+            scheme=self._scheme,
+            num_partitions=self.num_partitions(),
+            by=self._partition_by if len(self._partition_by) > 0 else None,
         )
 
     def copy_with_new_children(self, new_children: list[LogicalPlan]) -> LogicalPlan:
@@ -657,6 +786,7 @@ class Repartition(UnaryNode):
             partition_by=self._partition_by,
             num_partitions=self.num_partitions(),
             scheme=self._scheme,
+            adaptive=self._adaptive,
         )
 
     def required_columns(self) -> set[str]:
@@ -668,6 +798,7 @@ class Repartition(UnaryNode):
             and self.schema() == other.schema()
             and self._partition_by == other._partition_by
             and self._scheme == other._scheme
+            and self._adaptive == other._adaptive
         )
 
     def rebuild(self) -> LogicalPlan:
@@ -676,6 +807,7 @@ class Repartition(UnaryNode):
             partition_by=self._partition_by,
             num_partitions=self.num_partitions(),
             scheme=self._scheme,
+            adaptive=self._adaptive,
         )
 
 
@@ -864,6 +996,22 @@ class JoinType(Enum):
     RIGHT = "right"
 
 
+class JoinStrategy(Enum):
+    """How the partitions of the two sides of a Join are paired up to be joined
+
+    HASH repartitions both sides by their join keys, so that matching rows end up in partitions with the same index.
+    BROADCAST merges the whole of one (small) side into a single partition that is joined with every partition of the
+    other side, so that the other side does not need to be repartitioned.
+    """
+
+    HASH = "hash"
+    BROADCAST = "broadcast"
+
+
+# Largest estimated size of a side of a Join that is broadcast when no JoinStrategy is specified
+BROADCAST_JOIN_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
 class Join(BinaryNode):
     def __init__(
         self,
@@ -872,7 +1020,21 @@ class Join(BinaryNode):
         left_on: ExpressionList,
         right_on: ExpressionList,
         how: JoinType = JoinType.INNER,
+        strategy: JoinStrategy | None = None,
+        broadcast_left: bool | None = None,
     ) -> None:
+        """Joins the rows of `left` and `right` on `left_on` and `right_on`
+
+        Args:
+            left: Left side of the join
+            right: Right side of the join
+            left_on: Join keys of the left side
+            right_on: Join keys of the right side
+            how: Type of join
+            strategy: How to pair up the partitions of both sides, or None to hash join unless the optimizer
+                chooses to broadcast a side that is estimated to be at most BROADCAST_JOIN_THRESHOLD_BYTES large
+            broadcast_left: Whether to broadcast the left side rather than the right side of a BROADCAST join
+        """
         assert len(left_on) == len(right_on), "left_on and right_on must match size"
 
         if not left.is_disjoint(right):
@@ -911,6 +1073,23 @@ class Join(BinaryNode):
                 self._right_columns.to_schema(right.schema())
             )
 
+        # Broadcasting only avoids repartitioning if there is more than one partition to join
+        if strategy is None and num_partitions <= 1:
+            strategy = JoinStrategy.HASH
+        self._strategy = strategy
+        self._broadcast_left = bool(broadcast_left) if strategy == JoinStrategy.BROADCAST else None
+
+        if self._strategy == JoinStrategy.BROADCAST:
+            # Each partition of the other side is joined with the whole broadcast side, and keeps its partitioning
+            if self._broadcast_left:
+                pspec = PartitionSpec(scheme=PartitionScheme.UNKNOWN, num_partitions=right.num_partitions())
+            else:
+                pspec = left.partition_spec()
+            super().__init__(output_schema, partition_spec=pspec, op_level=OpLevel.PARTITION)
+            self._register_child(left)
+            self._register_child(right)
+            return
+
         left_pspec = PartitionSpec(scheme=PartitionScheme.HASH, num_partitions=num_partitions, by=self._left_on)
         right_pspec = PartitionSpec(scheme=PartitionScheme.HASH, num_partitions=num_partitions, by=self._right_on)
 
@@ -931,16 +1110,36 @@ class Join(BinaryNode):
         elif right.partition_spec() != right_pspec:
             right = new_right
 
-        super().__init__(output_schema, partition_spec=left.partition_spec(), op_level=OpLevel.PARTITION)
+        # Joins without a strategy are only planned as hash joins until the optimizer estimates the sizes of their sides
+        # and chooses a strategy, so their output partitioning is unknown, except for its number of partitions
+        if self._strategy is None:
+            pspec = PartitionSpec(scheme=PartitionScheme.UNKNOWN, num_partitions=num_partitions)
+        else:
+            pspec = left.partition_spec()
+        super().__init__(output_schema, partition_spec=pspec, op_level=OpLevel.PARTITION)
         self._register_child(left)
         self._register_child(right)
 
     def __repr__(self) -> str:
-        return self._repr_helper(left_on=self._left_on, right_on=self._right_on, num_partitions=self.num_partitions())
+        return self._repr_helper(
+            left_on=self._left_on,
+            right_on=self._right_on,
+            num_partitions=self.num_partitions(),
+            strategy=self._strategy,
+            broadcast_left=self._broadcast_left,
+        )
 
     def copy_with_new_children(self, new_children: list[LogicalPlan]) -> LogicalPlan:
         assert len(new_children) == 2
-        return Join(new_children[0], new_children[1], left_on=self._left_on, right_on=self._right_on, how=self._how)
+        return Join(
+            new_children[0],
+            new_children[1],
+            left_on=self._left_on,
+            right_on=self._right_on,
+            how=self._how,
+            strategy=self._strategy,
+            broadcast_left=self._broadcast_left,
+        )
 
     def required_columns(self) -> set[str]:
         return self._left_on.required_columns() | self._right_on.required_columns()
@@ -952,6 +1151,8 @@ class Join(BinaryNode):
             and self._left_on == other._left_on
             and self._right_on == other._right_on
             and self.num_partitions() == other.num_partitions()
+            and self._strategy == other._strategy
+            and self._broadcast_left == other._broadcast_left
         )
 
     def rebuild(self) -> LogicalPlan:
@@ -961,4 +1162,6 @@ class Join(BinaryNode):
             left_on=self._left_on,
             right_on=self._right_on,
             how=self._how,
+            strategy=self._strategy,
+            broadcast_left=self._broadcast_left,
         )
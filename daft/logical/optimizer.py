@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 import copy
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from daft import resource_request
-from daft.expressions import col
+from daft.datasources import ParquetSourceInfo
+from daft.execution.operators import OperatorEnum
+from daft.execution.scan_planning import prune_scan_tasks
+from daft.expressions import (
+    AliasExpression,
+    CallExpression,
+    ColumnExpression,
+    Expression,
+    col,
+)
 from daft.internal.rule import Rule
+from daft.logical import logical_plan
 from daft.logical.logical_plan import (
+    COUNT_ROWS_OP,
     Coalesce,
     Filter,
     GlobalLimit,
+    InMemoryScan,
     Join,
+    JoinStrategy,
     LocalAggregate,
+    LocalCount,
     LocalLimit,
     LogicalPlan,
     PartitionScheme,
+    PartitionSpec,
     Projection,
     Repartition,
     Sort,
@@ -24,6 +40,9 @@ from daft.logical.logical_plan import (
 )
 from daft.logical.schema import ExpressionList
 
+if TYPE_CHECKING:
+    from daft.runners.runner import Runner
+
 
 class PushDownPredicates(Rule[LogicalPlan]):
     def __init__(self) -> None:
@@ -221,8 +240,8 @@ class DropRepartition(Rule[LogicalPlan]):
 
     def _drop_repartition_if_same_spec(self, parent: Repartition, child: LogicalPlan) -> LogicalPlan | None:
         if (
-            parent.partition_spec() == child.partition_spec()
-            and parent.partition_spec().scheme != PartitionScheme.RANGE
+            parent.requested_partition_spec() == child.partition_spec()
+            and parent.requested_partition_spec().scheme != PartitionScheme.RANGE
         ):
             logger.debug(f"Dropping Repartition due to same spec: {parent} ")
             return child
@@ -240,12 +259,63 @@ class DropRepartition(Rule[LogicalPlan]):
 
 
 class PushDownClausesIntoScan(Rule[LogicalPlan]):
-    def __init__(self) -> None:
+    """Pushes clauses into TabularFilesScans, so that they are applied while the files are read
+
+    Args:
+        runner: Runner whose partition set cache holds the read tasks of scans. If provided, files in Hive-style
+            partition directories that cannot match a pushed-down predicate are removed from the read tasks.
+    """
+
+    def __init__(self, runner: Runner | None = None) -> None:
         super().__init__()
-        # self.register_fn(Filter, TabularFilesScan, self._push_down_predicates_into_scan)
+        self._runner = runner
+        self.register_fn(Filter, TabularFilesScan, self._push_down_predicates_into_scan)
         self.register_fn(Projection, TabularFilesScan, self._push_down_projections_into_scan)
+        self.register_fn(LocalCount, TabularFilesScan, self._push_down_count_into_scan)
+        self.register_fn(LocalAggregate, TabularFilesScan, self._push_down_aggregation_into_scan)
+
+    def _push_down_predicates_into_scan(self, parent: Filter, child: TabularFilesScan) -> LogicalPlan | None:
+        # Scans apply their predicate before their limit, so a filter can't be pushed into a scan that has a limit
+        if child._limit_rows is not None or child._aggregation is not None:
+            return None
+
+        new_predicate = parent._predicate.union(child._predicate, rename_dup="copyname.")
+        return TabularFilesScan(
+            schema=child._schema,
+            predicate=new_predicate,
+            columns=child._column_names,
+            limit_rows=child._limit_rows,
+            source_info=child._source_info,
+            filepaths_child=self._prune_partition_directories(child, new_predicate),
+            filepaths_column_name=child._filepaths_column_name,
+            num_partitions=child.num_partitions(),
+        )
+
+    def _prune_partition_directories(self, scan: TabularFilesScan, predicate: ExpressionList) -> LogicalPlan:
+        """Removes files in partition directories that cannot match the predicate from the read tasks of the scan"""
+        filepaths_child = scan._filepaths_child
+        if (
+            self._runner is None
+            or len(scan._source_info.partition_fields) == 0
+            or not isinstance(filepaths_child, InMemoryScan)
+        ):
+            return filepaths_child
+
+        scan_tasks = filepaths_child._cache_entry.value
+        assert scan_tasks is not None
+        pruned_scan_tasks = prune_scan_tasks(scan_tasks, predicate)
+        if pruned_scan_tasks is None:
+            return filepaths_child
+        logger.debug(f"pruning partition directories of {scan} with predicate {predicate}")
+        return InMemoryScan(
+            cache_entry=self._runner.put_partitions_into_cache(pruned_scan_tasks),
+            schema=filepaths_child.schema(),
+            partition_spec=filepaths_child.partition_spec(),
+        )
 
     def _push_down_projections_into_scan(self, parent: Projection, child: TabularFilesScan) -> LogicalPlan | None:
+        if child._aggregation is not None:
+            return None
         required_columns = parent._projection.required_columns()
         scan_columns = child.schema()
         if required_columns == scan_columns.to_name_set():
@@ -255,15 +325,68 @@ class PushDownClausesIntoScan(Rule[LogicalPlan]):
             schema=child._schema,
             predicate=child._predicate,
             columns=list(required_columns),
+            limit_rows=child._limit_rows,
             source_info=child._source_info,
             filepaths_child=child._filepaths_child,
             filepaths_column_name=child._filepaths_column_name,
+            num_partitions=child.num_partitions(),
         )
         if any(not e.is_column() for e in parent._projection):
             return parent.copy_with_new_children([new_scan])
         else:
             return new_scan
 
+    def _push_down_count_into_scan(self, parent: LocalCount, child: TabularFilesScan) -> LogicalPlan | None:
+        if not self._can_aggregate_in_scan(child):
+            return None
+        first_column = child.schema().column_names()[0]
+        return self._scan_with_aggregation(child, [(col(first_column)._count().alias("count"), COUNT_ROWS_OP)])
+
+    def _push_down_aggregation_into_scan(self, parent: LocalAggregate, child: TabularFilesScan) -> LogicalPlan | None:
+        if parent._group_by is not None or not self._can_aggregate_in_scan(child):
+            return None
+        for e, op in parent._agg:
+            if op not in _SCAN_AGGREGATION_OPERATORS:
+                return None
+            call = e._expr if isinstance(e, AliasExpression) else e
+            if not (
+                isinstance(call, CallExpression)
+                and call._operator == _SCAN_AGGREGATION_OPERATORS[op]
+                and isinstance(call._args[0], ColumnExpression)
+            ):
+                return None
+        return self._scan_with_aggregation(child, parent._agg)
+
+    def _can_aggregate_in_scan(self, scan: TabularFilesScan) -> bool:
+        # Only Parquet files have footers with the row counts and column statistics needed to answer aggregations
+        return (
+            isinstance(scan._source_info, ParquetSourceInfo) and scan._limit_rows is None and scan._aggregation is None
+        )
+
+    def _scan_with_aggregation(
+        self, scan: TabularFilesScan, aggregation: list[tuple[Expression, str]]
+    ) -> TabularFilesScan:
+        logger.debug(f"pushing aggregation {aggregation} into {scan}")
+        return TabularFilesScan(
+            schema=scan._schema,
+            predicate=scan._predicate,
+            columns=scan._column_names,
+            limit_rows=scan._limit_rows,
+            aggregation=aggregation,
+            source_info=scan._source_info,
+            filepaths_child=scan._filepaths_child,
+            filepaths_column_name=scan._filepaths_column_name,
+            num_partitions=scan.num_partitions(),
+        )
+
+
+# Aggregations that can be pushed into scans, and the operator of their aggregated expressions
+_SCAN_AGGREGATION_OPERATORS = {
+    "count": OperatorEnum.COUNT,
+    "min": OperatorEnum.MIN,
+    "max": OperatorEnum.MAX,
+}
+
 
 class FoldProjections(Rule[LogicalPlan]):
     def __init__(self) -> None:
@@ -330,6 +453,8 @@ class PushDownLimit(Rule[LogicalPlan]):
         for op in self._supported_unary_nodes:
             self.register_fn(LocalLimit, op, self._push_down_local_limit_into_unary_node)
             self.register_fn(GlobalLimit, op, self._push_down_global_limit_into_unary_node)
+        self.register_fn(LocalLimit, TabularFilesScan, self._push_down_local_limit_into_scan)
+        self.register_fn(GlobalLimit, TabularFilesScan, self._push_down_global_limit_into_scan)
 
     def _push_down_local_limit_into_unary_node(self, parent: LocalLimit, child: UnaryNode) -> LogicalPlan | None:
         logger.debug(f"pushing {parent} into {child}")
@@ -341,6 +466,93 @@ class PushDownLimit(Rule[LogicalPlan]):
         grandchild = child._children()[0]
         return child.copy_with_new_children([GlobalLimit(grandchild, num=parent._num)])
 
+    def _push_down_local_limit_into_scan(self, parent: LocalLimit, child: TabularFilesScan) -> LogicalPlan | None:
+        # Limits apply to the rows read before aggregation, so they can't be pushed into a scan that aggregates them
+        if child._aggregation is not None:
+            return None
+        logger.debug(f"pushing {parent} into {child}")
+        return self._scan_with_limit(child, parent._num)
+
+    def _push_down_global_limit_into_scan(self, parent: GlobalLimit, child: TabularFilesScan) -> LogicalPlan | None:
+        if child._aggregation is not None:
+            return None
+        # No partition of the scan needs more rows than the global limit, but the global limit is still required
+        if child._limit_rows is not None and child._limit_rows <= parent._num:
+            return None
+        logger.debug(f"pushing {parent} into {child}")
+        return parent.copy_with_new_children([self._scan_with_limit(child, parent._num)])
+
+    def _scan_with_limit(self, scan: TabularFilesScan, num: int) -> TabularFilesScan:
+        return TabularFilesScan(
+            schema=scan._schema,
+            predicate=scan._predicate,
+            columns=scan._column_names,
+            limit_rows=num if scan._limit_rows is None else min(num, scan._limit_rows),
+            source_info=scan._source_info,
+            filepaths_child=scan._filepaths_child,
+            filepaths_column_name=scan._filepaths_column_name,
+            num_partitions=scan.num_partitions(),
+        )
+
     @property
     def _supported_unary_nodes(self) -> set[type[LogicalPlan]]:
         return {Repartition, Coalesce, Projection}
+
+
+class ChooseJoinStrategy(Rule[LogicalPlan]):
+    """Chooses the JoinStrategy of Joins that were planned without one, from the estimated sizes of their sides
+
+    Sizes are estimated by the optimizer rather than when Joins are planned, since estimating them may need to fetch
+    the metadata of partitions. A side that is estimated to be at most BROADCAST_JOIN_THRESHOLD_BYTES large is broadcast
+    if the other side has as many partitions as the Join, so that the Join keeps its number of partitions. Otherwise
+    both sides are hash joined.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.register_fn(Join, LogicalPlan, self._choose_join_strategy)
+
+    def _choose_join_strategy(self, parent: Join, child: LogicalPlan) -> LogicalPlan | None:
+        if parent._strategy is not None:
+            return None
+        [left, right] = parent._children()
+        left = self._without_hash_repartition(left, parent._left_on, parent.num_partitions())
+        right = self._without_hash_repartition(right, parent._right_on, parent.num_partitions())
+
+        # The smaller side by estimated size is broadcast, preferring the right side
+        left_size = left.size_bytes_estimate()
+        right_size = right.size_bytes_estimate()
+        broadcast_left = left_size is not None and (right_size is None or left_size < right_size)
+        broadcast_size, probe = (left_size, right) if broadcast_left else (right_size, left)
+        if (
+            broadcast_size is not None
+            and broadcast_size <= logical_plan.BROADCAST_JOIN_THRESHOLD_BYTES
+            and probe.num_partitions() == parent.num_partitions()
+        ):
+            logger.debug(f"broadcasting the {'left' if broadcast_left else 'right'} side of {parent}")
+            return Join(
+                left,
+                right,
+                left_on=parent._left_on,
+                right_on=parent._right_on,
+                how=parent._how,
+                strategy=JoinStrategy.BROADCAST,
+                broadcast_left=broadcast_left,
+            )
+
+        return Join(
+            parent._children()[0],
+            parent._children()[1],
+            left_on=parent._left_on,
+            right_on=parent._right_on,
+            how=parent._how,
+            strategy=JoinStrategy.HASH,
+        )
+
+    def _without_hash_repartition(self, node: LogicalPlan, keys: ExpressionList, num_partitions: int) -> LogicalPlan:
+        """Removes the Repartition of a side of a Join by its join keys, which is only needed to hash join it"""
+        hash_pspec = PartitionSpec(scheme=PartitionScheme.HASH, num_partitions=num_partitions, by=keys)
+        if isinstance(node, Repartition) and not node._adaptive and node.requested_partition_spec() == hash_pspec:
+            [child] = node._children()
+            return child
+        return node
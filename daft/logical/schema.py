@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from typing import Iterator, TypeVar
-
-from daft.expressions import Expression, ExpressionList, col
-
-ExpressionType = TypeVar("ExpressionType", bound=Expression)
+from typing import Iterator
 
+from daft.errors import SchemaMismatchError
+from daft.expressions import ExpressionList, col
 from daft.logical.field import Field
+from daft.types import ExpressionType
 
 
 class Schema:
@@ -60,3 +59,40 @@ class Schema:
             seen[f.name] = f
 
         return Schema([f for f in seen.values()])
+
+    def unify(self, other: Schema) -> Schema:
+        """Unifies two schemas, such as the schemas of two files being read into the same DataFrame
+
+        Columns are ordered by their first appearance in either schema. Columns that appear in both schemas with
+        different types are promoted to a type that can hold the values of both without loss, and a
+        SchemaMismatchError is raised if there is no such type.
+        """
+        assert isinstance(other, Schema), f"expected Schema, got {type(other)}"
+        fields = dict(self.fields)
+        for f in other.fields.values():
+            if f.name in fields:
+                unified_type = _unify_types(fields[f.name].dtype, f.dtype)
+                if unified_type is None:
+                    raise SchemaMismatchError(
+                        f"Column {f.name} has mismatched types {fields[f.name].dtype} and {f.dtype}, "
+                        "which can not be unified without loss"
+                    )
+                fields[f.name] = Field(f.name, unified_type)
+            else:
+                fields[f.name] = f
+        return Schema(list(fields.values()))
+
+
+def _unify_types(left: ExpressionType, right: ExpressionType) -> ExpressionType | None:
+    """Returns the type that both types can be safely widened to, or None if there is none"""
+    if left == right:
+        return left
+    elif left == ExpressionType.null():
+        return right
+    elif right == ExpressionType.null():
+        return left
+    elif ExpressionType.is_py(left) or ExpressionType.is_py(right):
+        return ExpressionType.python_object()
+    elif {left, right} == {ExpressionType.integer(), ExpressionType.float()}:
+        return ExpressionType.float()
+    return None
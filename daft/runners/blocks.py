@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import collections
 import datetime
-import functools
 import math
 import operator
 import random
+import sys
 from abc import abstractmethod
 from functools import partial
 from typing import (
@@ -32,10 +32,15 @@ except ImportError:
 import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pac
-from pandas.core.reshape.merge import get_join_indexers
 
 from daft.execution.operators import OperatorEnum, OperatorEvaluator
+from daft.internal.kernels.groupby import (
+    NATIVE_GROUPBY_AVAILABLE,
+    group_rows,
+    grouped_aggregate,
+)
 from daft.internal.kernels.hashing import hash_chunked_array
+from daft.internal.kernels.join import hash_join
 from daft.internal.kernels.search_sorted import search_sorted
 from daft.types import ExpressionType, PrimitiveExpressionType, PythonExpressionType
 
@@ -129,6 +134,11 @@ class DataBlock(Generic[ArrType]):
     def to_arrow(self) -> pa.ChunkedArray:
         raise NotImplementedError()
 
+    @abstractmethod
+    def size_bytes(self) -> int:
+        """Returns the (possibly approximate) size in bytes of the data held by this DataBlock"""
+        raise NotImplementedError()
+
     @classmethod
     def make_block(cls, data: Any) -> DataBlock:
         # Data is a sequence of data
@@ -429,6 +439,12 @@ class PyListDataBlock(DataBlock[List[T]]):
     def to_arrow(self) -> pa.ChunkedArray:
         raise NotImplementedError("can not convert pylist block to arrow")
 
+    def size_bytes(self) -> int:
+        if self.is_scalar():
+            return 0
+        # Shallow sizes of the Python objects, which do not include the objects that they reference
+        return sys.getsizeof(self.data) + sum(sys.getsizeof(item) for item in self.data)
+
     def _filter(self, mask: DataBlock[ArrowArrType]) -> DataBlock[list[T]]:
         return PyListDataBlock(data=[item for keep, item in zip(mask.iter_py(), self.data) if keep])
 
@@ -537,6 +553,11 @@ class ArrowDataBlock(DataBlock[ArrowArrType]):
     def to_arrow(self) -> pa.ChunkedArray:
         return self.data
 
+    def size_bytes(self) -> int:
+        if self.is_scalar():
+            return 0
+        return self.data.nbytes
+
     def is_scalar(self) -> bool:
         return isinstance(self.data, pa.Scalar)
 
@@ -698,6 +719,25 @@ class ArrowDataBlock(DataBlock[ArrowArrType]):
     @staticmethod
     def _group_by_agg(
         group_by: list[DataBlock[ArrowArrType]], to_agg: list[DataBlock[ArrowArrType]], agg_ops: list[str]
+    ) -> tuple[list[DataBlock[ArrowArrType]], list[DataBlock[ArrowArrType]]]:
+        if not NATIVE_GROUPBY_AVAILABLE:
+            return ArrowDataBlock._polars_group_by_agg(group_by, to_agg, agg_ops)
+
+        group_arrs = [a.data for a in group_by]
+        first_rows, group_ids = group_rows(group_arrs)
+        num_groups = len(first_rows)
+
+        gcols: list[DataBlock] = [DataBlock.make_block(arr.take(first_rows)) for arr in group_arrs]
+        acols: list[DataBlock] = []
+        for block, op in zip(to_agg, agg_ops):
+            arr = block.data if isinstance(block, ArrowDataBlock) else pa.array(block.data)
+            acols.append(DataBlock.make_block(grouped_aggregate(arr, group_ids, num_groups, op)))
+
+        return gcols, acols
+
+    @staticmethod
+    def _polars_group_by_agg(
+        group_by: list[DataBlock[ArrowArrType]], to_agg: list[DataBlock[ArrowArrType]], agg_ops: list[str]
     ) -> tuple[list[DataBlock[ArrowArrType]], list[DataBlock[ArrowArrType]]]:
         group_arrs = [a.data for a in group_by]
         agg_arrs = [a.data for a in to_agg]
@@ -768,48 +808,13 @@ class ArrowDataBlock(DataBlock[ArrowArrType]):
 
         return gcols, acols
 
-    @staticmethod
-    def _get_null_nan_mask(keys: list[DataBlock[ArrowArrType]]) -> pa.Array:
-        """Returns a mask which indicates the presence of nulls/nans across a list of DataBlocks"""
-        mask_list = [pac.invert(pac.is_null(k.data, nan_is_null=True)) for k in keys]
-        mask = functools.reduce(lambda a, b: pac.and_(a, b), mask_list)
-        return mask
-
     @staticmethod
     def _join_keys(
         left_keys: list[DataBlock[ArrowArrType]], right_keys: list[DataBlock[ArrowArrType]]
     ) -> tuple[DataBlock[ArrowArrType], DataBlock[ArrowArrType]]:
         assert len(left_keys) == len(right_keys)
-        left_null_nan_mask = ArrowDataBlock._get_null_nan_mask(left_keys)
-        left_no_nulls = pac.all(left_null_nan_mask).as_py()
-        right_null_nan_mask = ArrowDataBlock._get_null_nan_mask(right_keys)
-        right_no_nulls = pac.all(right_null_nan_mask).as_py()
-
-        # Filter out rows with NaNs/None entries
-        left_keys_arrs = (
-            [k.data for k in left_keys]
-            if left_no_nulls
-            else [pac.array_filter(k.data, left_null_nan_mask) for k in left_keys]
-        )
-        right_keys_arrs = (
-            [k.data for k in right_keys]
-            if right_no_nulls
-            else [pac.array_filter(k.data, right_null_nan_mask) for k in right_keys]
-        )
-
-        left_index, right_index = get_join_indexers(
-            [arr.to_pandas() for arr in left_keys_arrs], [arr.to_pandas() for arr in right_keys_arrs], how="inner"
-        )
-
-        # Restore the join indices to original indices before filtering rows with NaNs/Nones
-        if not left_no_nulls:
-            num_nulls_cumsum = np.invert(left_null_nan_mask.to_numpy()).cumsum()[left_null_nan_mask.to_numpy()]
-            left_index = left_index + num_nulls_cumsum[left_index]
-        if not right_no_nulls:
-            num_nulls_cumsum = np.invert(right_null_nan_mask.to_numpy()).cumsum()[right_null_nan_mask.to_numpy()]
-            right_index = right_index + num_nulls_cumsum[right_index]
-
-        # NOTE: the results presented here are always an INNER join because all the NaN/Null keys are always filtered out
+        # NOTE: the results presented here are always an INNER join because rows with NaN/Null keys never match
+        left_index, right_index = hash_join([k.data for k in left_keys], [k.data for k in right_keys])
         return DataBlock.make_block(left_index), DataBlock.make_block(right_index)
 
     def list_explode(self) -> tuple[DataBlock[ArrType], DataBlock[ArrowArrType]]:
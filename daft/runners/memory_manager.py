@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import collections
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+
+import pyarrow as pa
+from loguru import logger
+
+from daft.runners.blocks import ArrowDataBlock
+from daft.runners.partitioning import PartitionMetadata, vPartition
+
+
+def _remove_if_exists(path: str) -> None:
+    # The spill directory may already have been removed along with its PartitionMemoryManager
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def is_arrow_partition(partition: vPartition) -> bool:
+    """Whether all columns of a vPartition are Arrow arrays, which is required to write it to an Arrow IPC file"""
+    return all(
+        isinstance(tile.block, ArrowDataBlock) and isinstance(tile.block.data, pa.ChunkedArray)
+        for tile in partition.columns.values()
+    )
+
+
+def write_arrow_ipc_file(partition: vPartition, path: str) -> None:
+    """Writes a vPartition of Arrow arrays to an uncompressed Arrow IPC file, which can be memory-mapped back with
+    vPartition.from_arrow_ipc
+    """
+    table = pa.table({name: tile.block.data for name, tile in partition.columns.items()})
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+class SpillablePartition:
+    """A materialized vPartition that is held in memory until its PartitionMemoryManager spills it to disk
+
+    Spilled partitions are transparently read back from disk when they are needed, and their files are deleted once
+    the SpillablePartition is garbage collected.
+    """
+
+    def __init__(self, partition: vPartition, manager: PartitionMemoryManager) -> None:
+        self.partition_id = partition.partition_id
+        self._metadata = partition.metadata()
+        self._partition: vPartition | None = partition
+        self._path: str | None = None
+        self._manager = manager
+
+    def size_bytes(self) -> int:
+        return self._metadata.size_bytes
+
+    def metadata(self) -> PartitionMetadata:
+        return self._metadata
+
+    def is_spilled(self) -> bool:
+        return self._partition is None
+
+    def get(self) -> vPartition:
+        """Returns the vPartition, reading it back from disk if it was spilled"""
+        return self._manager.get(self)
+
+    def _spill(self, path: str) -> None:
+        assert self._partition is not None
+        write_arrow_ipc_file(self._partition, path)
+        self._path = path
+        self._partition = None
+        weakref.finalize(self, _remove_if_exists, path)
+
+    def _load(self) -> vPartition:
+        if self._partition is not None:
+            return self._partition
+        assert self._path is not None
+        # The file is memory-mapped, which leaves it to the OS to page the data in as it is accessed
+        return vPartition.from_arrow_ipc(self._path, partition_id=self.partition_id)
+
+
+class PartitionMemoryManager:
+    """Keeps the total size of the materialized partitions of a runner that are held in memory within a budget
+
+    When the partitions that are held in memory exceed `memory_budget_bytes`, the least recently used ones are spilled
+    to Arrow IPC files in a temporary directory under `spill_directory`.
+
+    Args:
+        memory_budget_bytes: Maximum total size of the partitions to hold in memory
+        spill_directory: Local directory to spill partitions to, defaults to the temporary directory of the system
+    """
+
+    def __init__(self, memory_budget_bytes: int, spill_directory: str | None = None) -> None:
+        self._memory_budget_bytes = memory_budget_bytes
+        self._spill_directory = tempfile.mkdtemp(prefix="daft-spill-", dir=spill_directory)
+        weakref.finalize(self, shutil.rmtree, self._spill_directory, ignore_errors=True)
+
+        # Partitions in memory by their id(), from least to most recently used, and their total size.
+        # Partitions are weakly referenced so that they stop counting towards the budget once they are garbage collected
+        self._in_memory: collections.OrderedDict[int, weakref.ref[SpillablePartition]] = collections.OrderedDict()
+        self._in_memory_bytes = 0
+        self._spilled_bytes = 0
+        # Partitions are read back by the threads that run execution steps. The lock is reentrant since the garbage
+        # collector may release a partition while the lock is held
+        self._lock = threading.RLock()
+
+    def in_memory_bytes(self) -> int:
+        return self._in_memory_bytes
+
+    def spilled_bytes(self) -> int:
+        """Total size of the partitions that have been spilled to disk, including ones that were since deleted"""
+        return self._spilled_bytes
+
+    def add(self, partition: vPartition) -> SpillablePartition:
+        """Starts managing a vPartition, spilling the least recently used partitions if the budget is exceeded"""
+        spillable = SpillablePartition(partition, manager=self)
+        key = id(spillable)
+        size_bytes = spillable.size_bytes()
+
+        def release(_: weakref.ref[SpillablePartition]) -> None:
+            with self._lock:
+                if self._in_memory.pop(key, None) is not None:
+                    self._in_memory_bytes -= size_bytes
+
+        with self._lock:
+            self._in_memory[key] = weakref.ref(spillable, release)
+            self._in_memory_bytes += size_bytes
+            to_spill = self._take_partitions_to_spill()
+
+        # Spills are written by the calling thread without holding the lock, so that they don't block other threads
+        for spilled in to_spill:
+            spilled._spill(os.path.join(self._spill_directory, f"{uuid.uuid4()}.arrow"))
+            with self._lock:
+                self._spilled_bytes += spilled.size_bytes()
+            logger.debug(f"Spilled partition {spilled.partition_id} of {spilled.size_bytes()} bytes to disk")
+        return spillable
+
+    def get(self, spillable: SpillablePartition) -> vPartition:
+        with self._lock:
+            # Partitions that are being spilled are no longer tracked as in memory
+            if id(spillable) in self._in_memory:
+                self._in_memory.move_to_end(id(spillable))
+        # SpillablePartition._spill sets the path of a partition before dropping it, so it can be loaded without the lock
+        return spillable._load()
+
+    def _take_partitions_to_spill(self) -> list[SpillablePartition]:
+        """Stops tracking the least recently used partitions that have to be spilled to get back within the budget
+        as in memory, and returns them to be spilled
+        """
+        to_spill = []
+        # The most recently used partition is never spilled, since it is about to be used
+        for key in list(self._in_memory.keys())[:-1]:
+            if self._in_memory_bytes <= self._memory_budget_bytes:
+                break
+            ref = self._in_memory.get(key)
+            spillable = ref() if ref is not None else None
+            if spillable is None or not is_arrow_partition(spillable._load()):
+                continue
+            self._in_memory.pop(key, None)
+            self._in_memory_bytes -= spillable.size_bytes()
+            to_spill.append(spillable)
+        return to_spill
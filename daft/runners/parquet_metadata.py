@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import io
+import threading
+from collections import OrderedDict
+
+import pyarrow as pa
+from pyarrow import parquet
+
+from daft.filesystem import FileRanges, FileVersion, get_filesystem_from_path
+
+# Maximum total size in bytes of the serialized Parquet footers kept in the process-wide metadata cache
+DEFAULT_PARQUET_METADATA_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Column chunks separated by at most this many bytes are fetched as a single range, as in Arrow's default read coalescing
+PARQUET_RANGE_HOLE_SIZE_LIMIT_BYTES = 8 * 1024
+
+
+class ParquetMetadataCache:
+    """Thread-safe LRU cache of Parquet file metadata (footers), bounded by the total serialized size of the footers
+
+    Metadata is keyed by the version of the file (path, size and modification time), so modified files are read again.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PARQUET_METADATA_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._size_bytes = 0
+        self._metadata: OrderedDict[FileVersion, parquet.FileMetaData] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version: FileVersion) -> parquet.FileMetaData | None:
+        with self._lock:
+            if version not in self._metadata:
+                return None
+            self._metadata.move_to_end(version)
+            return self._metadata[version]
+
+    def put(self, version: FileVersion, metadata: parquet.FileMetaData) -> None:
+        size_bytes = metadata.serialized_size
+        if size_bytes > self._max_bytes:
+            return
+        with self._lock:
+            if version in self._metadata:
+                self._size_bytes -= self._metadata.pop(version).serialized_size
+            self._metadata[version] = metadata
+            self._size_bytes += size_bytes
+            while self._size_bytes > self._max_bytes:
+                _, evicted = self._metadata.popitem(last=False)
+                self._size_bytes -= evicted.serialized_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._metadata.clear()
+            self._size_bytes = 0
+
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._metadata)
+
+
+_PARQUET_METADATA_CACHE = ParquetMetadataCache()
+
+
+def get_parquet_metadata_cache() -> ParquetMetadataCache:
+    """Returns the process-wide Parquet metadata cache"""
+    return _PARQUET_METADATA_CACHE
+
+
+def get_parquet_metadata(
+    path: str, file_data: bytes | FileRanges | None = None, version: FileVersion | None = None
+) -> parquet.FileMetaData:
+    """Gets the metadata of a Parquet file, reading its footer only if it is not already in the metadata cache
+
+    Footers are only cached for files whose version is known, such as from the listing of the files, so that looking up
+    the cache never makes a request to the filesystem.
+
+    Args:
+        path: FSSpec compatible path to the Parquet file
+        file_data: Contents of the file (or of byte ranges of the file that include its footer) if already fetched, which
+            the footer is read from instead of opening the file
+        version: Version of the file from its listing, or None to neither look up nor populate the metadata cache
+    """
+    if version is not None:
+        metadata = _PARQUET_METADATA_CACHE.get(version)
+        if metadata is not None:
+            return metadata
+
+    if isinstance(file_data, FileRanges):
+        with file_data.open() as f:
+            metadata = parquet.ParquetFile(f).metadata
+    elif file_data is not None:
+        metadata = parquet.ParquetFile(io.BytesIO(file_data)).metadata
+    else:
+        fs = get_filesystem_from_path(path)
+        with fs.open(path) as f:
+            metadata = parquet.ParquetFile(f).metadata
+
+    if version is not None:
+        _PARQUET_METADATA_CACHE.put(version, metadata)
+    return metadata
+
+
+def _num_leaves(arrow_type: pa.DataType) -> int:
+    """Gets the number of leaf columns that a field of an Arrow type is stored as in Parquet"""
+    return max(sum(_num_leaves(arrow_type.field(i).type) for i in range(arrow_type.num_fields)), 1)
+
+
+def parquet_byte_ranges(
+    metadata: parquet.FileMetaData, size: int, row_groups: list[int], column_names: list[str] | None
+) -> list[tuple[int, int]]:
+    """Gets the byte ranges [start, end) of a Parquet file that are read to read some columns of some row groups
+
+    The ranges include the footer of the file and the column chunks of the columns in the row groups, where column chunks
+    that are close together are coalesced into a single range.
+
+    Args:
+        metadata: Metadata of the Parquet file
+        size: Size of the Parquet file in bytes
+        row_groups: Indices of the row groups to read
+        column_names: Names of the columns to read, or None to read all columns
+    """
+    # Each field of the Arrow schema is stored as a column chunk for each of its leaves, in the order of the schema
+    leaf_indices = []
+    num_leaves_before = 0
+    for field in metadata.schema.to_arrow_schema():
+        num_leaves = _num_leaves(field.type)
+        if column_names is None or field.name in column_names:
+            leaf_indices.extend(range(num_leaves_before, num_leaves_before + num_leaves))
+        num_leaves_before += num_leaves
+
+    # The footer is followed by its 4 byte length and the 4 byte magic number
+    ranges = [(size - metadata.serialized_size - 8, size)]
+    for i in row_groups:
+        row_group = metadata.row_group(i)
+        for j in leaf_indices:
+            column = row_group.column(j)
+            start = column.data_page_offset
+            if column.has_dictionary_page and 0 < column.dictionary_page_offset < start:
+                start = column.dictionary_page_offset
+            ranges.append((start, start + column.total_compressed_size))
+
+    coalesced_ranges: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if len(coalesced_ranges) > 0 and start - coalesced_ranges[-1][1] <= PARQUET_RANGE_HOLE_SIZE_LIMIT_BYTES:
+            coalesced_ranges[-1] = (coalesced_ranges[-1][0], max(coalesced_ranges[-1][1], end))
+        else:
+            coalesced_ranges.append((start, end))
+    return coalesced_ranges
@@ -2,26 +2,39 @@ from __future__ import annotations
 
 import dataclasses
 import io
+import os
+import tempfile
 import weakref
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
-from typing import IO, Any, Callable, Generic, TypeVar
+from typing import IO, Any, Callable, Generic, Iterator, TypeVar
 from uuid import uuid4
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+from fsspec.compression import compr
+from fsspec.utils import infer_compression
 from pyarrow import csv
 from pyarrow import dataset as pada
-from pyarrow import json, parquet
+from pyarrow import ipc, json, parquet
 
 from daft.execution.operators import OperatorEnum
 from daft.expressions import Expression, ExpressionExecutor, ExpressionList
-from daft.filesystem import get_filesystem_from_path
+from daft.filesystem import (
+    FileRanges,
+    FileVersion,
+    ListingInfo,
+    get_filesystem_from_path,
+    get_protocol_from_path,
+)
 from daft.logical.field import Field
 from daft.logical.schema import Schema
 from daft.runners.blocks import ArrowArrType, ArrowDataBlock, DataBlock, PyListDataBlock
+from daft.runners.parquet_metadata import get_parquet_metadata
+from daft.runners.statistics import parquet_row_group_statistics, predicate_might_match
 from daft.types import ExpressionType, PythonExpressionType
 
 PartID = int
@@ -34,10 +47,13 @@ class vPartitionReadOptions:
     Args:
         num_rows: Number of rows to read, or None to read all rows
         column_names: Column names to include when reading, or None to read all columns
+        predicate: Predicate that rows are going to be filtered by, which readers may use to skip chunks of data that
+            are guaranteed to contain no matching rows. Readers do not filter the rows that they do read.
     """
 
     num_rows: int | None = None
     column_names: list[str] | None = None
+    predicate: ExpressionList | None = None
 
 
 @dataclass(frozen=True)
@@ -76,15 +92,174 @@ class vPartitionParseCSVOptions:
     skip_rows_after_header: int = 0
 
 
-def _limit_num_rows(buf: IO, num_rows: int) -> IO:
-    """Limites a buffer to a certain number of rows using an in-memory buffer."""
-    sampled_bytes = io.BytesIO()
-    for i, line in enumerate(buf):
-        if i >= num_rows:
+# Size of the blocks of bytes that CSV and JSON files are streamed in, which bounds the memory used for parsing
+_STREAMING_READ_BLOCK_SIZE_BYTES = 16 * 1024 * 1024
+
+# Maximum number of files of a partition that are encoded and written concurrently, defaulting to the number of CPUs
+_WRITE_NUM_THREADS = int(os.getenv("DAFT_WRITE_NUM_THREADS", os.cpu_count() or 1))
+
+# Number of rows that are encoded as a sample to estimate how many rows fit in the target size of written files
+_WRITE_SIZE_SAMPLE_ROWS = 10_000
+
+# Maximum number of rows in each row group or record batch of written files, which is the default of pyarrow
+_WRITE_MAX_ROWS_PER_GROUP = 1024 * 1024
+
+
+def _open_file(path: str, file_data: bytes | FileRanges | None, compression: str | None = "infer") -> IO[bytes]:
+    """Opens a file for reading, from its contents if they were already fetched
+
+    Args:
+        path: FSSpec compatible path to the file
+        file_data: Contents of the file if already fetched, byte ranges of the uncompressed file if only those were
+            fetched, or None to open the file from its filesystem
+        compression: Compression of the file, where "infer" infers it from the file extension like FSSpec
+    """
+    if file_data is None:
+        fs = get_filesystem_from_path(path)
+        return fs.open(path, compression=compression)
+    if isinstance(file_data, FileRanges):
+        assert compression is None, "only byte ranges of uncompressed files can be read"
+        return file_data.open()
+    if compression == "infer":
+        compression = infer_compression(path)
+    return compr[compression](io.BytesIO(file_data), mode="rb")
+
+
+# Compressions of files that are decompressed by native Arrow streams, as named by FSSpec
+_ARROW_STREAM_COMPRESSIONS = {"gzip", "bz2", "lz4", "zstd"}
+
+
+class _CancellableFile(io.RawIOBase):
+    """Wraps a Python file object so that reading from it can be cancelled, after which every read is at end-of-file"""
+
+    def __init__(self, f: IO[bytes]) -> None:
+        self._f = f
+        self._cancelled = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if self._cancelled:
+            return b""
+        return self._f.read(size)
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def close(self) -> None:
+        self._f.close()
+        super().close()
+
+
+def _open_arrow_stream(path: str, file_data: bytes | None) -> pa.NativeFile | _CancellableFile:
+    """Opens a file for reading as a native Arrow stream if it is local or already fetched and its compression is supported
+    by Arrow, falling back to a cancellable Python file object otherwise
+
+    Arrow streaming readers read ahead on background threads, which can deadlock when the reader is closed before it is
+    exhausted if those threads are reading from a Python file object that needs the GIL. Readers of a Python file object
+    must cancel it and exhaust the reader before closing it.
+    """
+    compression = infer_compression(path)
+    if compression is None or (compression in _ARROW_STREAM_COMPRESSIONS and pa.Codec.is_available(compression)):
+        if file_data is not None:
+            return pa.input_stream(pa.py_buffer(file_data), compression=compression)
+        if get_protocol_from_path(path) == "file":
+            return pa.input_stream(get_filesystem_from_path(path)._strip_protocol(path), compression=compression)
+    return _CancellableFile(_open_file(path, file_data))
+
+
+def _read_record_batches(reader: pa.RecordBatchReader, num_rows: int | None) -> pa.Table:
+    """Reads record batches from a streaming reader into a table, stopping once `num_rows` rows have been read."""
+    batches = []
+    rows_read = 0
+    while num_rows is None or rows_read < num_rows:
+        try:
+            batch = reader.read_next_batch()
+        except StopIteration:
             break
-        sampled_bytes.write(line)
-    sampled_bytes.seek(0)
-    return sampled_bytes
+        if num_rows is not None and rows_read + len(batch) > num_rows:
+            batch = batch.slice(length=num_rows - rows_read)
+        batches.append(batch)
+        rows_read += len(batch)
+    return pa.Table.from_batches(batches, schema=reader.schema)
+
+
+def _cast_table_to_schema(table: pa.Table, schema: Schema | None, column_names: list[str] | None) -> pa.Table:
+    """Casts a table read from one of the files of a read to the schema that was inferred for all files of the read
+
+    Files may store the same column as different types, for which the schema holds a type that can represent the values
+    of every file. Columns of the schema that are missing from the file are filled with nulls.
+
+    Args:
+        table: Table read from the file
+        schema: Schema of the read, or None if the table was read without a schema
+        column_names: Column names that were read, or None if all columns of the schema were read
+    """
+    if schema is None:
+        return table
+    names = column_names if column_names is not None else schema.column_names()
+    arrays = []
+    for name in names:
+        dtype = schema.fields[name].dtype if name in schema.fields else None
+        arrow_type = None
+        if dtype is not None and not ExpressionType.is_py(dtype) and dtype != ExpressionType.null():
+            arrow_type = dtype.to_arrow_type()
+        if name not in table.column_names:
+            arrays.append(pa.nulls(len(table), type=arrow_type if arrow_type is not None else pa.null()))
+        elif arrow_type is not None and ExpressionType.from_arrow_type(table[name].type) != dtype:
+            arrays.append(table[name].cast(arrow_type))
+        else:
+            arrays.append(table[name])
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def _iter_line_blocks(buf: IO, block_size: int) -> Iterator[bytes]:
+    """Iterates over blocks of roughly `block_size` bytes from a buffer, where each block ends on a line boundary."""
+    remainder = b""
+    while True:
+        block = buf.read(block_size)
+        if not block:
+            break
+        block = remainder + block
+        last_newline = block.rfind(b"\n")
+        if last_newline == -1:
+            remainder = block
+            continue
+        remainder = block[last_newline + 1 :]
+        yield block[: last_newline + 1]
+    if remainder.strip():
+        yield remainder
+
+
+def _merge_json_tables(tables: list[pa.Table], partition_id: PartID) -> vPartition:
+    """Merges tables parsed from blocks of a JSON file into a vPartition
+
+    Blocks of a JSON file are parsed independently, so a column may have been inferred as different types for different
+    blocks (e.g. a null type for a block of all nulls, or struct types with different fields). Such columns fall back
+    to being stored as Python objects.
+    """
+    try:
+        return vPartition.from_arrow_table(pa.concat_tables(tables, promote=True), partition_id=partition_id)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    column_names = list(dict.fromkeys(name for table in tables for name in table.column_names))
+    tiles = {}
+    for name in column_names:
+        arrays = [
+            table[name] if name in table.column_names else pa.chunked_array([pa.nulls(len(table))]) for table in tables
+        ]
+        non_null_types = {arr.type for arr in arrays if not pa.types.is_null(arr.type)}
+        if len(non_null_types) <= 1:
+            arrow_type = non_null_types.pop() if non_null_types else pa.null()
+            block = DataBlock.make_block(
+                pa.chunked_array([chunk for arr in arrays for chunk in arr.cast(arrow_type).chunks], type=arrow_type)
+            )
+        else:
+            block = PyListDataBlock(data=[item for arr in arrays for item in arr.to_pylist()])
+        tiles[name] = PyListTile(column_name=name, partition_id=partition_id, block=block)
+    return vPartition(columns=tiles, partition_id=partition_id)
 
 
 @dataclass(frozen=True)
@@ -140,6 +315,7 @@ class PyListTile:
 @dataclass(frozen=True)
 class PartitionMetadata:
     num_rows: int
+    size_bytes: int
 
 
 @dataclass(frozen=True)
@@ -165,7 +341,11 @@ class vPartition:
         return len(next(iter(self.columns.values())))
 
     def metadata(self) -> PartitionMetadata:
-        return PartitionMetadata(num_rows=len(self))
+        return PartitionMetadata(num_rows=len(self), size_bytes=self.size_bytes())
+
+    def size_bytes(self) -> int:
+        """Returns the (possibly approximate) size in bytes of the data in this vPartition"""
+        return sum(tile.block.size_bytes() for tile in self.columns.values())
 
     def get_schema(self) -> Schema:
         """Generates column expressions that represent the vPartition's schema"""
@@ -244,6 +424,7 @@ class vPartition:
         csv_options: vPartitionParseCSVOptions = vPartitionParseCSVOptions(),
         schema_options: vPartitionSchemaInferenceOptions = vPartitionSchemaInferenceOptions(),
         read_options: vPartitionReadOptions = vPartitionReadOptions(),
+        file_data: bytes | None = None,
     ) -> vPartition:
         """Gets a vPartition from a CSV file.
 
@@ -253,6 +434,7 @@ class vPartition:
             csv_options: Options for parsing the CSV file.
             schema_options: Options for inferring the schema from the CSV file.
             read_options: Options for building a vPartition.
+            file_data: Contents of the file if already fetched, which are read instead of opening the file.
         """
         # Use provided CSV column names, or None if nothing provided
         full_column_names = schema_options.full_schema_column_names()
@@ -264,13 +446,17 @@ class vPartition:
         skip_header_row = full_column_names is not None and csv_options.has_headers
         pyarrow_skip_rows_after_names = (1 if skip_header_row else 0) + csv_options.skip_rows_after_header
 
-        fs = get_filesystem_from_path(path)
-        with fs.open(path, compression="infer") as f:
-
-            if read_options.num_rows is not None:
-                f = _limit_num_rows(f, read_options.num_rows)
-
-            table = csv.read_csv(
+        # Parse columns as the types in the provided schema, so that all streamed batches have consistent types
+        column_types = None
+        if schema_options.schema is not None:
+            column_types = {
+                field.name: field.dtype.to_arrow_type()
+                for field in schema_options.schema
+                if not ExpressionType.is_py(field.dtype) and field.dtype != ExpressionType.null()
+            }
+
+        with _open_arrow_stream(path, file_data) as f:
+            reader = csv.open_csv(
                 f,
                 parse_options=csv.ParseOptions(
                     delimiter=csv_options.delimiter,
@@ -281,9 +467,24 @@ class vPartition:
                     column_names=full_column_names,
                     skip_rows_after_names=pyarrow_skip_rows_after_names,
                     skip_rows=csv_options.skip_rows_before_header,
+                    block_size=_STREAMING_READ_BLOCK_SIZE_BYTES,
+                ),
+                convert_options=csv.ConvertOptions(
+                    include_columns=read_options.column_names,
+                    column_types=column_types,
                 ),
-                convert_options=csv.ConvertOptions(include_columns=read_options.column_names),
             )
+            table = _read_record_batches(reader, read_options.num_rows)
+            if isinstance(f, _CancellableFile):
+                # Stop reading the rest of the file, and exhaust the reader of the blocks that it has already read ahead
+                # so that no read is in progress on the Python file object when it is closed
+                f.cancel()
+                try:
+                    for _ in reader:
+                        pass
+                except pa.ArrowInvalid:
+                    # The last block read before cancelling may end in the middle of a row
+                    pass
 
         return vPartition.from_arrow_table(table, partition_id=partition_id)
 
@@ -294,6 +495,7 @@ class vPartition:
         partition_id: PartID,
         schema_options: vPartitionSchemaInferenceOptions = vPartitionSchemaInferenceOptions(),
         read_options: vPartitionReadOptions = vPartitionReadOptions(),
+        file_data: bytes | None = None,
     ) -> vPartition:
         """Gets a vPartition from a Line-delimited JSON file
 
@@ -302,17 +504,43 @@ class vPartition:
             partition_id: Partition ID to assign to the vPartition.
             schema_options: Options for inferring the schema from the JSON file.
             read_options: Options for building a vPartition.
+            file_data: Contents of the file if already fetched, which are read instead of opening the file.
         """
-        fs = get_filesystem_from_path(path)
-        with fs.open(path, compression="infer") as f:
-            if read_options.num_rows is not None:
-                f = _limit_num_rows(f, read_options.num_rows)
-            table = json.read_json(f)
-
-        if read_options.column_names is not None:
-            table = table.select(read_options.column_names)
+        # Parse columns as the types in the provided schema, so that all parsed blocks have consistent types
+        parse_options = json.ParseOptions()
+        if schema_options.schema is not None:
+            parse_options = json.ParseOptions(
+                explicit_schema=pa.schema(
+                    [
+                        (field.name, field.dtype.to_arrow_type())
+                        for field in schema_options.schema
+                        if not ExpressionType.is_py(field.dtype) and field.dtype != ExpressionType.null()
+                    ]
+                ),
+                unexpected_field_behavior="infer",
+            )
 
-        return vPartition.from_arrow_table(table, partition_id=partition_id)
+        # Parse the file incrementally in blocks of lines, stopping once enough rows have been read
+        tables = []
+        rows_read = 0
+        with _open_file(path, file_data) as f:
+            for block in _iter_line_blocks(f, _STREAMING_READ_BLOCK_SIZE_BYTES):
+                # Always parse at least one block, so that the columns of the file are known even if no rows are needed
+                if read_options.num_rows is not None and rows_read >= read_options.num_rows and len(tables) > 0:
+                    break
+                table = json.read_json(io.BytesIO(block), parse_options=parse_options)
+                if read_options.num_rows is not None and rows_read + len(table) > read_options.num_rows:
+                    table = table.slice(length=read_options.num_rows - rows_read)
+                if read_options.column_names is not None:
+                    table = table.select(read_options.column_names)
+                tables.append(table)
+                rows_read += len(table)
+
+        if len(tables) == 0:
+            # Raises the same error as PyArrow for an empty JSON file
+            json.read_json(io.BytesIO(b""), parse_options=parse_options)
+
+        return _merge_json_tables(tables, partition_id=partition_id)
 
     @classmethod
     def from_parquet(
@@ -321,6 +549,9 @@ class vPartition:
         partition_id: PartID,
         schema_options: vPartitionSchemaInferenceOptions = vPartitionSchemaInferenceOptions(),
         read_options: vPartitionReadOptions = vPartitionReadOptions(),
+        row_groups: list[int] | None = None,
+        file_data: bytes | FileRanges | None = None,
+        version: FileVersion | None = None,
     ) -> vPartition:
         """Gets a vPartition from a Parquet file
 
@@ -329,25 +560,104 @@ class vPartition:
             partition_id: Partition ID to assign to the vPartition.
             schema_options: Options for inferring the schema from the Parquet file.
             read_options: Options for building a vPartition.
+            row_groups: Indices of the row groups to read, or None to read all row groups.
+            file_data: Contents of the file, or of the byte ranges of the file that are read, if already fetched, which
+                are read instead of opening the file.
+            version: Version of the file from its listing, which the footer of the file is cached by.
         """
-        fs = get_filesystem_from_path(path)
+        # The footer is read at most once across schema inference, scan planning and reads of the file
+        metadata = get_parquet_metadata(path, file_data=file_data, version=version)
+
+        # If no rows required, we manually construct an empty table with the right schema
+        if read_options.num_rows == 0:
+            arrow_schema = metadata.schema.to_arrow_schema()
+            table = pa.Table.from_arrays([pa.array([], type=field.type) for field in arrow_schema], schema=arrow_schema)
+        else:
+            with _open_file(path, file_data, compression=None) as f:
+                parquet_file = parquet.ParquetFile(f, metadata=metadata)
+                if row_groups is None and read_options.predicate is None and read_options.num_rows is None:
+                    table = parquet_file.read(columns=read_options.column_names)
+                else:
+                    if row_groups is None:
+                        row_groups = list(range(metadata.num_row_groups))
+
+                    # Skip row groups whose statistics show that they cannot contain any rows matching the predicate
+                    if read_options.predicate is not None and len(read_options.predicate) > 0:
+                        row_groups = [
+                            i
+                            for i in row_groups
+                            if predicate_might_match(read_options.predicate, parquet_row_group_statistics(metadata, i))
+                        ]
+
+                    # Only read as many row groups as needed to reach the requested number of rows
+                    if read_options.num_rows is not None:
+                        num_rows_in_row_groups = 0
+                        for num_row_groups_needed, i in enumerate(row_groups, start=1):
+                            num_rows_in_row_groups += metadata.row_group(i).num_rows
+                            if num_rows_in_row_groups >= read_options.num_rows:
+                                row_groups = row_groups[:num_row_groups_needed]
+                                break
+
+                    table = parquet_file.read_row_groups(row_groups, columns=read_options.column_names)
+                    if read_options.num_rows is not None:
+                        table = table.slice(length=read_options.num_rows)
+
+        table = _cast_table_to_schema(table, schema_options.schema, read_options.column_names)
+        return vPartition.from_arrow_table(table, partition_id=partition_id)
+
+    @classmethod
+    def from_arrow_ipc(
+        cls,
+        path: str,
+        partition_id: PartID,
+        schema_options: vPartitionSchemaInferenceOptions = vPartitionSchemaInferenceOptions(),
+        read_options: vPartitionReadOptions = vPartitionReadOptions(),
+        file_data: bytes | None = None,
+    ) -> vPartition:
+        """Gets a vPartition from an Arrow IPC (Feather V2) file
+
+        Local files are memory-mapped, so that the data of uncompressed files is read without any copies.
 
-        with fs.open(path) as f:
-            # If no rows required, we manually construct an empty table with the right schema
-            if read_options.num_rows == 0:
-                arrow_schema = parquet.ParquetFile(f).metadata.schema.to_arrow_schema()
-                table = pa.Table.from_arrays(
-                    [pa.array([], type=field.type) for field in arrow_schema], schema=arrow_schema
-                )
+        Args:
+            path: FSSpec compatible path to the Arrow IPC file.
+            partition_id: Partition ID to assign to the vPartition.
+            schema_options: Options for inferring the schema from the Arrow IPC file.
+            read_options: Options for building a vPartition.
+            file_data: Contents of the file if already fetched, which are read instead of opening the file.
+        """
+        if file_data is None and get_protocol_from_path(path) == "file":
+            source = pa.memory_map(path.split("://")[-1])
+        else:
+            source = _open_file(path, file_data, compression=None)
+
+        with source:
+            reader = ipc.open_file(source)
+            # Columns that are missing from the file are filled with nulls when casting to the schema of the read
+            column_names = read_options.column_names
+            if column_names is not None:
+                column_names = [name for name in column_names if name in reader.schema.names]
+            batches = []
+            rows_read = 0
+            for i in range(reader.num_record_batches):
+                if read_options.num_rows is not None and rows_read >= read_options.num_rows:
+                    break
+                batch = reader.get_batch(i)
+                if column_names is not None:
+                    batch = pa.RecordBatch.from_arrays(
+                        [batch.column(name) for name in column_names], names=column_names
+                    )
+                batches.append(batch)
+                rows_read += len(batch)
+
+            if column_names is not None:
+                arrow_schema = pa.schema([reader.schema.field(name) for name in column_names])
             else:
-                table = parquet.read_table(
-                    f,
-                    columns=read_options.column_names,
-                )
-                # PyArrow API does not provide a way to limit the number of rows read from a Parquet file
-                if read_options.num_rows is not None:
-                    table = table.slice(length=read_options.num_rows)
+                arrow_schema = reader.schema
+            table = pa.Table.from_batches(batches, schema=arrow_schema)
+            if read_options.num_rows is not None:
+                table = table.slice(length=read_options.num_rows)
 
+        table = _cast_table_to_schema(table, schema_options.schema, read_options.column_names)
         return vPartition.from_arrow_table(table, partition_id=partition_id)
 
     def to_pydict(self) -> dict[str, list[Any]]:
@@ -556,8 +866,21 @@ class vPartition:
         right_on: ExpressionList,
         output_projection: ExpressionList,
         how: str = "inner",
+        partition_id: PartID | None = None,
     ) -> vPartition:
+        """Joins the rows of this vPartition with the rows of `right`
+
+        Args:
+            right: Right side of the join
+            left_on: Join keys of this vPartition
+            right_on: Join keys of `right`
+            output_projection: Projection of the joined columns to output
+            how: Type of join
+            partition_id: Partition ID of the joined vPartition, or None for the partition ID of this vPartition
+        """
         assert how == "inner"
+        if partition_id is None:
+            partition_id = self.partition_id
         left_key_part = self.eval_expression_list(left_on)
         left_key_ids = list(left_key_part.columns.keys())
 
@@ -578,21 +901,28 @@ class vPartition:
         assert len(joined_blocks) == len(result_keys)
         joined_block_idx = 0
         result_columns = {}
+        # Either side may have a different partition ID from the output when it is broadcast to every other partition
         for k in left_key_ids:
-            result_columns[k] = left_key_part.columns[k].replace_block(block=joined_blocks[joined_block_idx])
+            result_columns[k] = dataclasses.replace(
+                left_key_part.columns[k], partition_id=partition_id, block=joined_blocks[joined_block_idx]
+            )
             joined_block_idx += 1
 
         for k in left_nonjoin_ids:
-            result_columns[k] = self.columns[k].replace_block(block=joined_blocks[joined_block_idx])
+            result_columns[k] = dataclasses.replace(
+                self.columns[k], partition_id=partition_id, block=joined_blocks[joined_block_idx]
+            )
             joined_block_idx += 1
 
         for k in right_nonjoin_ids:
-            result_columns[k] = right.columns[k].replace_block(block=joined_blocks[joined_block_idx])
+            result_columns[k] = dataclasses.replace(
+                right.columns[k], partition_id=partition_id, block=joined_blocks[joined_block_idx]
+            )
             joined_block_idx += 1
 
         assert joined_block_idx == len(result_keys)
 
-        output = vPartition(columns=result_columns, partition_id=self.partition_id)
+        output = vPartition(columns=result_columns, partition_id=partition_id)
         return output.eval_expression_list(output_projection)
 
     def _to_file(
@@ -601,6 +931,8 @@ class vPartition:
         root_path: str,
         partition_cols: ExpressionList | None = None,
         compression: str | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
     ) -> list[str]:
         keys = [col_name for col_name in self.columns.keys()]
         names = [self.columns[k].column_name for k in keys]
@@ -615,11 +947,6 @@ class vPartition:
                 assert col_name in keys
                 partition_col_names.append(col_name)
 
-        visited_paths = []
-
-        def file_visitor(written_file):
-            visited_paths.append(written_file.path)
-
         format: pada.FileFormat
         opts = None
 
@@ -629,29 +956,101 @@ class vPartition:
         elif file_format == "csv":
             format = pada.CsvFileFormat()
             assert compression is None
+        elif file_format == "ipc":
+            format = pada.IpcFileFormat()
+            opts = format.make_write_options(compression=compression)
 
-        pada.write_dataset(
-            arrow_table,
-            base_dir=root_path,
-            basename_template=str(uuid4()) + "-{i}." + format.default_extname,
-            format=format,
-            partitioning=partition_col_names,
-            file_options=opts,
-            file_visitor=file_visitor,
-            use_threads=False,
-            existing_data_behavior="overwrite_or_ignore",
-        )
-        return visited_paths
+        # Roll over to a new file every `rows_per_file` rows, estimating the number of rows that fit in the target file
+        # size from the encoded size of a sample of the rows, since encoding and compression change the size of the data
+        rows_per_file = max(len(arrow_table), 1)
+        if max_rows_per_file is not None:
+            rows_per_file = min(rows_per_file, max_rows_per_file)
+        if target_file_size_bytes is not None and len(arrow_table) > 0:
+            bytes_per_row = _encoded_bytes_per_row(arrow_table.drop(partition_col_names), format, opts)
+            if bytes_per_row > 0:
+                rows_per_file = min(rows_per_file, max(int(target_file_size_bytes // bytes_per_row), 1))
+
+        basename_prefix = str(uuid4())
+
+        def write_chunk(chunk_index: int) -> list[str]:
+            visited_paths = []
+
+            def file_visitor(written_file):
+                visited_paths.append(written_file.path)
+
+            pada.write_dataset(
+                arrow_table.slice(chunk_index * rows_per_file, rows_per_file),
+                base_dir=root_path,
+                basename_template=f"{basename_prefix}-{chunk_index}-{{i}}.{format.default_extname}",
+                format=format,
+                partitioning=partition_col_names,
+                partitioning_flavor="hive",  # write `<column>=<value>` directories that are discovered when read back
+                file_options=opts,
+                file_visitor=file_visitor,
+                use_threads=False,
+                max_rows_per_file=rows_per_file,
+                max_rows_per_group=min(rows_per_file, _WRITE_MAX_ROWS_PER_GROUP),
+                existing_data_behavior="overwrite_or_ignore",
+            )
+            return visited_paths
+
+        # Files are encoded and compressed in parallel threads, and returned in the order of the rows they contain
+        num_chunks = max((len(arrow_table) + rows_per_file - 1) // rows_per_file, 1)
+        if num_chunks == 1:
+            return write_chunk(0)
+        with ThreadPoolExecutor(max_workers=min(num_chunks, _WRITE_NUM_THREADS)) as executor:
+            return [path for chunk_paths in executor.map(write_chunk, range(num_chunks)) for path in chunk_paths]
 
     def to_parquet(
-        self, root_path: str, partition_cols: ExpressionList | None = None, compression: str | None = None
+        self,
+        root_path: str,
+        partition_cols: ExpressionList | None = None,
+        compression: str | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
     ) -> list[str]:
-        return self._to_file("parquet", root_path=root_path, partition_cols=partition_cols, compression=compression)
+        return self._to_file(
+            "parquet",
+            root_path=root_path,
+            partition_cols=partition_cols,
+            compression=compression,
+            target_file_size_bytes=target_file_size_bytes,
+            max_rows_per_file=max_rows_per_file,
+        )
 
     def to_csv(
-        self, root_path: str, partition_cols: ExpressionList | None = None, compression: str | None = None
+        self,
+        root_path: str,
+        partition_cols: ExpressionList | None = None,
+        compression: str | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
     ) -> list[str]:
-        return self._to_file("csv", root_path=root_path, partition_cols=partition_cols, compression=compression)
+        return self._to_file(
+            "csv",
+            root_path=root_path,
+            partition_cols=partition_cols,
+            compression=compression,
+            target_file_size_bytes=target_file_size_bytes,
+            max_rows_per_file=max_rows_per_file,
+        )
+
+    def to_arrow_ipc(
+        self,
+        root_path: str,
+        partition_cols: ExpressionList | None = None,
+        compression: str | None = None,
+        target_file_size_bytes: int | None = None,
+        max_rows_per_file: int | None = None,
+    ) -> list[str]:
+        return self._to_file(
+            "ipc",
+            root_path=root_path,
+            partition_cols=partition_cols,
+            compression=compression,
+            target_file_size_bytes=target_file_size_bytes,
+            max_rows_per_file=max_rows_per_file,
+        )
 
     @classmethod
     def merge_partitions(cls, to_merge: list[vPartition], verify_partition_id: bool = True) -> vPartition:
@@ -675,6 +1074,22 @@ class vPartition:
         return dataclasses.replace(to_merge[0], columns=new_columns)
 
 
+def _encoded_bytes_per_row(table: pa.Table, format: pada.FileFormat, opts: pada.FileWriteOptions | None) -> float:
+    """Estimates the size of each row of a table once written in a file format, by writing a sample of the rows"""
+    sample = table.slice(0, _WRITE_SIZE_SAMPLE_ROWS)
+    with tempfile.TemporaryDirectory() as sample_dir:
+        pada.write_dataset(
+            sample,
+            base_dir=sample_dir,
+            basename_template=f"sample-{{i}}.{format.default_extname}",
+            format=format,
+            file_options=opts,
+            use_threads=False,
+        )
+        sample_size = sum(entry.stat().st_size for entry in os.scandir(sample_dir))
+    return sample_size / len(sample)
+
+
 PartitionT = TypeVar("PartitionT")
 
 
@@ -729,6 +1144,13 @@ class PartitionSet(Generic[PartitionT]):
     def num_partitions(self) -> int:
         raise NotImplementedError()
 
+    def size_bytes(self) -> int | None:
+        """Returns the (possibly approximate) size in bytes of the data in this PartitionSet, or None if it is unknown
+
+        Implementations should override this if the size can be computed without fetching the partitions.
+        """
+        return None
+
     @abstractmethod
     def wait(self) -> None:
         raise NotImplementedError()
@@ -745,6 +1167,10 @@ class PartitionCacheEntry:
     def __repr__(self) -> str:
         return f"PartitionCacheEntry: {self.key}"
 
+    def __deepcopy__(self, memo: dict) -> PartitionCacheEntry:
+        # Copies of plans (such as those made by the optimizer) refer to the same cached partitions as the original plan
+        return self
+
     def __getstate__(self):
         return self.key
 
@@ -784,6 +1210,12 @@ class PartitionSetFactory(Generic[PartitionT]):
     FS_LISTING_PATH_COLUMN_NAME = "path"
     FS_LISTING_SIZE_COLUMN_NAME = "size"
     FS_LISTING_TYPE_COLUMN_NAME = "type"
+    # Versions of the listed files, so that metadata and contents of the files can be cached without looking up their
+    # versions again
+    FS_LISTING_VERSION_COLUMN_NAME = "version"
+
+    # Maximum number of listed paths in each partition of a PartitionSet of path listings
+    FS_LISTING_PARTITION_NUM_ROWS = 10_000
 
     def _get_listing_paths_schema(self) -> Schema:
         """Construct the schema for a DataFrame of path listing"""
@@ -800,6 +1232,7 @@ class PartitionSetFactory(Generic[PartitionT]):
                 Field(self.FS_LISTING_PATH_COLUMN_NAME, ExpressionType.string()),
                 Field(self.FS_LISTING_SIZE_COLUMN_NAME, ExpressionType.integer()),
                 Field(self.FS_LISTING_TYPE_COLUMN_NAME, ExpressionType.string()),
+                Field(self.FS_LISTING_VERSION_COLUMN_NAME, ExpressionType.python_object()),
             ]
         )
 
@@ -818,3 +1251,36 @@ class PartitionSetFactory(Generic[PartitionT]):
             ExpressionList: Schema of the PartitionSet that was constructed
         """
         raise NotImplementedError()
+
+
+def listing_infos_to_vpartitions(
+    listing_infos: list[ListingInfo],
+    schema: Schema,
+    num_rows_per_partition: int | None = None,
+) -> list[vPartition]:
+    """Splits a detailed path listing into vPartitions of up to `num_rows_per_partition` rows each, in listing order
+
+    Args:
+        listing_infos: Listed paths
+        schema: Schema of a detailed path listing, with path, size, type and version columns in that order
+        num_rows_per_partition: Maximum number of listed paths in each vPartition, defaults to
+            PartitionSetFactory.FS_LISTING_PARTITION_NUM_ROWS
+    """
+    if num_rows_per_partition is None:
+        num_rows_per_partition = PartitionSetFactory.FS_LISTING_PARTITION_NUM_ROWS
+    path_name, size_name, type_name, version_name = schema.column_names()
+    return [
+        vPartition.from_pydict(
+            data={
+                path_name: [f.path for f in chunk],
+                size_name: [f.size for f in chunk],
+                type_name: [f.type for f in chunk],
+                version_name: [f.version() for f in chunk],
+            },
+            schema=schema,
+            partition_id=partition_id,
+        )
+        for partition_id, chunk in enumerate(
+            listing_infos[i : i + num_rows_per_partition] for i in range(0, len(listing_infos), num_rows_per_partition)
+        )
+    ]
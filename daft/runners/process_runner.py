@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import uuid
+import weakref
+from concurrent import futures
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import ContextManager
+
+import cloudpickle
+from loguru import logger
+
+from daft.execution.execution_step import ExecutionStep, Instruction
+from daft.internal.kernels.groupby import kernel_num_threads
+from daft.runners.memory_manager import is_arrow_partition, write_arrow_ipc_file
+from daft.runners.partitioning import PartID, PartitionMetadata, vPartition
+from daft.runners.pyrunner import PartitionHandle, PyRunner, _get_num_threads
+
+# Memory-backed filesystem that partitions are exchanged through, which Linux mounts at /dev/shm
+SHARED_MEMORY_ROOT = "/dev/shm"
+
+# Free space in bytes that SHARED_MEMORY_ROOT must have to be used, since it can be small (64MB by default in Docker)
+SHARED_MEMORY_MIN_FREE_BYTES = 1024 * 1024 * 1024
+
+
+def _get_shared_memory_root() -> str | None:
+    # Otherwise, files are exchanged through the temporary directory of the system, where they are read from the page cache
+    if not os.path.isdir(SHARED_MEMORY_ROOT):
+        return None
+    free_bytes = shutil.disk_usage(SHARED_MEMORY_ROOT).free
+    if free_bytes < SHARED_MEMORY_MIN_FREE_BYTES:
+        logger.warning(
+            f"Only {free_bytes} bytes are free in {SHARED_MEMORY_ROOT}, so partitions are exchanged through the "
+            f"temporary directory of the system instead. Pass a shared_memory_directory to the ProcessRunner to override"
+        )
+        return None
+    return SHARED_MEMORY_ROOT
+
+
+def _remove_shared_file(path: str) -> None:
+    # The shared memory directory may already have been removed along with its ProcessRunner
+    if os.path.exists(path):
+        os.remove(path)
+
+
+@dataclass(frozen=True)
+class _SharedPartitionFile:
+    """An Arrow IPC file in shared memory that holds a vPartition, which is what is sent between processes"""
+
+    path: str
+    partition_id: PartID
+    metadata: PartitionMetadata
+
+    @classmethod
+    def write(cls, partition: vPartition, directory: str) -> _SharedPartitionFile:
+        path = os.path.join(directory, f"{uuid.uuid4()}.arrow")
+        write_arrow_ipc_file(partition, path)
+        return cls(path=path, partition_id=partition.partition_id, metadata=partition.metadata())
+
+    def read(self) -> vPartition:
+        # Memory mapping the file shares its pages with every other process that reads it, so nothing is copied
+        return vPartition.from_arrow_ipc(self.path, partition_id=self.partition_id)
+
+
+class SharedMemoryPartition:
+    """A materialized vPartition that is held in shared memory by a ProcessRunner
+
+    The file that holds the partition is deleted once the SharedMemoryPartition is garbage collected.
+    """
+
+    def __init__(self, file: _SharedPartitionFile) -> None:
+        self.partition_id = file.partition_id
+        self._file = file
+        weakref.finalize(self, _remove_shared_file, file.path)
+
+    def get(self) -> vPartition:
+        return self._file.read()
+
+    def metadata(self) -> PartitionMetadata:
+        return self._file.metadata
+
+
+def _share(partition: vPartition, directory: str) -> _SharedPartitionFile | vPartition:
+    # Only Arrow arrays can be written to Arrow IPC files, so partitions with Python objects are pickled instead
+    return _SharedPartitionFile.write(partition, directory) if is_arrow_partition(partition) else partition
+
+
+def _run_instructions_in_worker(payload: bytes, shared_memory_directory: str, num_threads: int) -> bytes:
+    instructions: list[Instruction]
+    inputs: list[_SharedPartitionFile | vPartition]
+    instructions, inputs = cloudpickle.loads(payload)
+    partitions = [input.read() if isinstance(input, _SharedPartitionFile) else input for input in inputs]
+    with kernel_num_threads(num_threads):
+        for instruction in instructions:
+            partitions = instruction.run(partitions)
+    return cloudpickle.dumps([_share(partition, shared_memory_directory) for partition in partitions])
+
+
+class ProcessRunner(PyRunner):
+    def __init__(self, num_workers: int | None = None, shared_memory_directory: str | None = None) -> None:
+        """Runs plans in a pool of local worker processes, which sidesteps the GIL for Python-heavy steps such as UDFs
+
+        Steps are scheduled by the local Python process as in the PyRunner, and run by the worker processes. Partitions
+        are exchanged between processes as Arrow IPC files in shared memory, which every process memory-maps instead of
+        copying. Partitions with Python objects are pickled instead.
+
+        Args:
+            num_workers: Number of worker processes, defaults to the number of CPUs. With a single worker, steps are run
+                one at a time in the local Python process.
+            shared_memory_directory: Local directory to exchange partitions through, defaults to /dev/shm if it has
+                at least SHARED_MEMORY_MIN_FREE_BYTES free, and to the temporary directory of the system otherwise
+        """
+        super().__init__(num_threads=num_workers if num_workers is not None else multiprocessing.cpu_count())
+        self._pool: futures.ProcessPoolExecutor | None = None
+        self._shared_memory_directory = tempfile.mkdtemp(
+            prefix="daft-shm-",
+            dir=shared_memory_directory if shared_memory_directory is not None else _get_shared_memory_root(),
+        )
+        weakref.finalize(self, shutil.rmtree, self._shared_memory_directory, ignore_errors=True)
+
+    def _prefetch_read_tasks(self) -> int:
+        # Read tasks are spread over the worker processes, so the next read task rarely runs where its files were fetched
+        return super()._prefetch_read_tasks() if self._num_threads == 1 else 0
+
+    def _executor(self) -> ContextManager[futures.Executor]:
+        # Worker processes are expensive to start, so they are kept around across plans
+        if self._pool is None:
+            self._pool = futures.ProcessPoolExecutor(
+                max_workers=self._num_threads,
+                # Forking a process that runs threads, such as those of Arrow, can deadlock the forked process
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            weakref.finalize(self, self._pool.shutdown)
+        return nullcontext(self._pool)
+
+    def _submit(
+        self, executor: futures.Executor, step: ExecutionStep[vPartition | PartitionHandle]
+    ) -> futures.Future[list[vPartition | PartitionHandle]]:
+        inputs = [self._to_shared_memory(partition) for partition in step.inputs]
+        payload = cloudpickle.dumps(
+            (
+                step.instructions,
+                [input._file if isinstance(input, SharedMemoryPartition) else input for input in inputs],
+            )
+        )
+        worker_future = executor.submit(
+            _run_instructions_in_worker,
+            payload,
+            self._shared_memory_directory,
+            _get_num_threads(step.resource_request),
+        )
+
+        result: futures.Future[list[vPartition | PartitionHandle]] = futures.Future()
+
+        def set_result(worker_future: futures.Future[bytes]) -> None:
+            # The inputs are referenced until the worker is done, so that their shared memory is not deleted before
+            inputs.clear()
+            try:
+                outputs = [
+                    SharedMemoryPartition(output) if isinstance(output, _SharedPartitionFile) else output
+                    for output in cloudpickle.loads(worker_future.result())
+                ]
+            except BaseException as e:
+                if result.set_running_or_notify_cancel():
+                    result.set_exception(e)
+                return
+            # The outputs of a cancelled step are dropped, which deletes their shared memory
+            if result.set_running_or_notify_cancel():
+                result.set_result(outputs)
+
+        def cancel_worker(result: futures.Future[list[vPartition | PartitionHandle]]) -> None:
+            if result.cancelled():
+                worker_future.cancel()
+
+        worker_future.add_done_callback(set_result)
+        result.add_done_callback(cancel_worker)
+        return result
+
+    def _to_shared_memory(self, partition: vPartition | PartitionHandle) -> vPartition | SharedMemoryPartition:
+        if isinstance(partition, SharedMemoryPartition):
+            return partition
+        vpartition = partition if isinstance(partition, vPartition) else partition.get()
+        shared = _share(vpartition, self._shared_memory_directory)
+        return SharedMemoryPartition(shared) if isinstance(shared, _SharedPartitionFile) else shared
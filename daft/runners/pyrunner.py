@@ -1,23 +1,36 @@
 from __future__ import annotations
 
 import multiprocessing
+import sys
+from concurrent import futures
+from contextlib import nullcontext
 from dataclasses import dataclass
+from typing import ContextManager, Iterator
+
+if sys.version_info < (3, 8):
+    from typing_extensions import Protocol
+else:
+    from typing import Protocol
 
 import psutil
 
 from daft.execution import physical_plan_factory
 from daft.execution.execution_step import (
     ExecutionStep,
+    Instruction,
     MaterializedResult,
     MultiOutputExecutionStep,
     SingleOutputExecutionStep,
 )
 from daft.execution.logical_op_runners import LogicalPartitionOpRunner
+from daft.execution.prefetching import DEFAULT_PREFETCH_NUM_FILES
 from daft.filesystem import glob_path_with_stats
 from daft.internal.gpu import cuda_device_count
+from daft.internal.kernels.groupby import kernel_num_threads
 from daft.internal.rule_runner import FixedPointPolicy, Once, RuleBatch, RuleRunner
 from daft.logical import logical_plan
 from daft.logical.optimizer import (
+    ChooseJoinStrategy,
     DropProjections,
     DropRepartition,
     FoldProjections,
@@ -28,12 +41,14 @@ from daft.logical.optimizer import (
 )
 from daft.logical.schema import Schema
 from daft.resource_request import ResourceRequest
+from daft.runners.memory_manager import PartitionMemoryManager
 from daft.runners.partitioning import (
     PartID,
     PartitionCacheEntry,
     PartitionMetadata,
     PartitionSet,
     PartitionSetFactory,
+    listing_infos_to_vpartitions,
     vPartition,
 )
 from daft.runners.profiler import profiler
@@ -75,10 +90,23 @@ class LocalPartitionSet(PartitionSet[vPartition]):
     def num_partitions(self) -> int:
         return len(self._partitions)
 
+    def size_bytes(self) -> int | None:
+        return sum(partition.size_bytes() for partition in self._partitions.values())
+
     def wait(self) -> None:
         pass
 
 
+class PartitionHandle(Protocol):
+    """A materialized vPartition that is held outside of the Python heap, such as on disk, until it is needed"""
+
+    def get(self) -> vPartition:
+        ...
+
+    def metadata(self) -> PartitionMetadata:
+        ...
+
+
 class LocalPartitionSetFactory(PartitionSetFactory[vPartition]):
     def glob_paths_details(
         self,
@@ -91,18 +119,7 @@ class LocalPartitionSetFactory(PartitionSetFactory[vPartition]):
 
         schema = self._get_listing_paths_details_schema()
         pset = LocalPartitionSet(
-            {
-                # Hardcoded to 1 partition
-                0: vPartition.from_pydict(
-                    data={
-                        self.FS_LISTING_PATH_COLUMN_NAME: [f.path for f in files_info],
-                        self.FS_LISTING_SIZE_COLUMN_NAME: [f.size for f in files_info],
-                        self.FS_LISTING_TYPE_COLUMN_NAME: [f.type for f in files_info],
-                    },
-                    schema=schema,
-                    partition_id=0,
-                ),
-            }
+            {partition.partition_id: partition for partition in listing_infos_to_vpartitions(files_info, schema)}
         )
         return pset, schema
 
@@ -112,10 +129,37 @@ class LocalLogicalPartitionOpRunner(LogicalPartitionOpRunner):
 
 
 class PyRunner(Runner):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        memory_budget_bytes: int | None = None,
+        spill_directory: str | None = None,
+        num_threads: int | None = None,
+    ) -> None:
+        """Runs plans in the local Python process
+
+        Args:
+            memory_budget_bytes: Maximum total size of the intermediate partitions to hold in memory, beyond which the
+                least recently used ones are spilled to disk, or None to hold all of them in memory. Defaults to None.
+            spill_directory: Local directory to spill partitions to, defaults to the temporary directory of the system
+            num_threads: Number of threads to run independent execution steps on concurrently, defaults to 1. With a
+                single thread, steps are run one at a time on the calling thread. With more threads, UDFs may be
+                called concurrently from several threads, so they must be thread-safe.
+        """
         super().__init__()
+        self._num_threads = num_threads if num_threads is not None else 1
+        self._memory_manager = (
+            PartitionMemoryManager(memory_budget_bytes, spill_directory=spill_directory)
+            if memory_budget_bytes is not None
+            else None
+        )
         self._optimizer = RuleRunner(
             [
+                # Join strategies are chosen before the Repartitions that Joins plan are combined with those of their sides
+                RuleBatch(
+                    "ChooseJoinStrategies",
+                    Once,
+                    [ChooseJoinStrategy()],
+                ),
                 RuleBatch(
                     "SinglePassPushDowns",
                     Once,
@@ -124,17 +168,25 @@ class PyRunner(Runner):
                         PushDownPredicates(),
                         PruneColumns(),
                         FoldProjections(),
-                        PushDownClausesIntoScan(),
+                        PushDownClausesIntoScan(runner=self),
                     ],
                 ),
                 RuleBatch(
                     "PushDownLimitsAndRepartitions",
                     FixedPointPolicy(3),
-                    [PushDownLimit(), DropRepartition(), DropProjections()],
+                    [
+                        PushDownLimit(),
+                        DropRepartition(),
+                        DropProjections(),
+                        PushDownClausesIntoScan(runner=self),
+                    ],
                 ),
             ]
         )
 
+    def put_partitions_into_cache(self, partitions: dict[PartID, vPartition]) -> PartitionCacheEntry:
+        return self.put_partition_set_into_cache(LocalPartitionSet(partitions))
+
     def optimize(self, plan: logical_plan.LogicalPlan) -> logical_plan.LogicalPlan:
         # From PyRunner
         return self._optimizer.optimize(plan)
@@ -150,24 +202,91 @@ class PyRunner(Runner):
             for key, entry in self._part_set_cache._uuid_to_partition_set.items()
             if entry.value is not None
         }
-        phys_plan = physical_plan_factory.get_materializing_physical_plan(plan, psets)
+        # Results are only set once steps have materialized, so reduces can be pipelined with their fanouts
+        phys_plan = physical_plan_factory.get_materializing_physical_plan(
+            plan, psets, pipeline_reduces=True, prefetch_read_tasks=self._prefetch_read_tasks()
+        )
 
         result_pset = LocalPartitionSet({})
 
         with profiler("profile_PyRunner.run_{datetime.now().isoformat()}.json"):
-            try:
-                while True:
-                    next_step = next(phys_plan)
-                    assert next_step is not None, "Got a None ExecutionStep in singlethreaded mode"
-                    self._check_resource_requests(next_step.resource_request)
-                    self._build_partitions(next_step)
-            except StopIteration as e:
-                for i, partition in enumerate(e.value):
-                    result_pset.set_partition(i, partition)
+            if self._num_threads == 1:
+                partitions = self._run_serially(phys_plan)
+            else:
+                partitions = self._run_concurrently(phys_plan)
+            for i, partition in enumerate(partitions):
+                result_pset.set_partition(i, _get_vpartition(partition))
 
         pset_entry = self.put_partition_set_into_cache(result_pset)
         return pset_entry
 
+    def _prefetch_read_tasks(self) -> int:
+        # Read tasks run in this process, so they can take over the files that the read tasks before them prefetched
+        return DEFAULT_PREFETCH_NUM_FILES
+
+    def _run_serially(
+        self, phys_plan: Iterator[ExecutionStep[vPartition | PartitionHandle] | None]
+    ) -> list[vPartition | PartitionHandle]:
+        try:
+            while True:
+                next_step = next(phys_plan)
+                assert next_step is not None, "Got a None ExecutionStep in singlethreaded mode"
+                self._check_resource_requests(next_step.resource_request)
+                self._build_partitions(next_step)
+        except StopIteration as e:
+            return e.value
+
+    def _run_concurrently(
+        self, phys_plan: Iterator[ExecutionStep[vPartition | PartitionHandle] | None]
+    ) -> list[vPartition | PartitionHandle]:
+        """Runs the steps of a physical plan on a thread pool, dispatching them for as long as their resource requests
+        fit in the resources of the machine and waiting on running steps whenever the plan or the resources require it
+        """
+        resources = _LocalResources(
+            num_cpus=self._num_threads,
+            num_gpus=cuda_device_count(),
+            memory_bytes=psutil.virtual_memory().total,
+        )
+        inflight: dict[
+            futures.Future[list[vPartition | PartitionHandle]], ExecutionStep[vPartition | PartitionHandle]
+        ] = {}
+        next_step: ExecutionStep[vPartition | PartitionHandle] | None = None
+
+        with self._executor() as executor:
+            try:
+                while True:
+                    # Dispatch steps until the plan waits on running steps or the next step does not fit.
+                    while True:
+                        if next_step is None:
+                            try:
+                                next_step = next(phys_plan)
+                            except StopIteration as e:
+                                return e.value
+                            if next_step is None:
+                                break
+                            self._check_resource_requests(next_step.resource_request)
+
+                        # No-op steps just pass on their inputs, so they are run immediately.
+                        if len(next_step.instructions) == 0:
+                            self._build_partitions(next_step)
+                        # A step that does not fit on its own is run once it is the only step running.
+                        elif len(inflight) == 0 or resources.fits(next_step.resource_request):
+                            resources.reserve(next_step.resource_request)
+                            inflight[self._submit(executor, next_step)] = next_step
+                        else:
+                            break
+                        next_step = None
+
+                    assert len(inflight) > 0, "Physical plan is waiting on results without any steps running"
+                    done, _ = futures.wait(inflight, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        step = inflight.pop(future)
+                        resources.release(step.resource_request)
+                        self._set_results(step, future.result())
+            finally:
+                for future in inflight:
+                    future.cancel()
+
     def _check_resource_requests(self, resource_request: ResourceRequest | None) -> None:
         """Validates that the requested ResourceRequest is possible to run locally"""
         if resource_request is None:
@@ -185,10 +304,35 @@ class PyRunner(Runner):
                 f"Requested {resource_request.memory_bytes} bytes of memory but found only {psutil.virtual_memory().total} available"
             )
 
-    def _build_partitions(self, partspec: ExecutionStep[vPartition]) -> None:
-        partitions = partspec.inputs
-        for instruction in partspec.instructions:
-            partitions = instruction.run(partitions)
+    def _executor(self) -> ContextManager[futures.Executor]:
+        """Executor that runs the steps of a plan concurrently, which is shut down once the plan is done"""
+        return futures.ThreadPoolExecutor(max_workers=self._num_threads, thread_name_prefix="PyRunner")
+
+    def _submit(
+        self, executor: futures.Executor, step: ExecutionStep[vPartition | PartitionHandle]
+    ) -> futures.Future[list[vPartition | PartitionHandle]]:
+        return executor.submit(self._run_step, step)
+
+    def _run_step(self, step: ExecutionStep[vPartition | PartitionHandle]) -> list[vPartition | PartitionHandle]:
+        # The outputs are handed to the memory manager by the thread that ran the step,
+        # which then also writes the partitions that are spilled to make room for them
+        partitions = _run_instructions(
+            step.instructions, step.inputs, num_threads=_get_num_threads(step.resource_request)
+        )
+        return [self._manage(partition) for partition in partitions]
+
+    def _build_partitions(self, partspec: ExecutionStep[vPartition | PartitionHandle]) -> None:
+        # No-op steps pass on their inputs as they are, so partitions that are held outside of the Python heap
+        # are not read back just to be written out again
+        if len(partspec.instructions) == 0:
+            self._set_results(partspec, list(partspec.inputs))
+            return
+        partitions = _run_instructions(partspec.instructions, partspec.inputs)
+        self._set_results(partspec, [self._manage(partition) for partition in partitions])
+
+    def _set_results(
+        self, partspec: ExecutionStep[vPartition | PartitionHandle], partitions: list[vPartition | PartitionHandle]
+    ) -> None:
         if isinstance(partspec, MultiOutputExecutionStep):
             partspec.results = [PyMaterializedResult(partition) for partition in partitions]
         elif isinstance(partspec, SingleOutputExecutionStep):
@@ -197,16 +341,81 @@ class PyRunner(Runner):
         else:
             raise TypeError(f"Cannot typematch input {partspec}")
 
+    def _manage(self, partition: vPartition | PartitionHandle) -> vPartition | PartitionHandle:
+        if self._memory_manager is None or not isinstance(partition, vPartition):
+            return partition
+        return self._memory_manager.add(partition)
+
+
+def _get_vpartition(partition: vPartition | PartitionHandle) -> vPartition:
+    return partition if isinstance(partition, vPartition) else partition.get()
+
+
+def _run_instructions(
+    instructions: list[Instruction], inputs: list[vPartition | PartitionHandle], num_threads: int | None = None
+) -> list[vPartition]:
+    """Runs the instructions of a step on its inputs, with kernels limited to `num_threads` threads if provided"""
+    partitions = [_get_vpartition(partition) for partition in inputs]
+    with kernel_num_threads(num_threads) if num_threads is not None else nullcontext():
+        for instruction in instructions:
+            partitions = instruction.run(partitions)
+    return partitions
+
+
+def _get_num_threads(resource_request: ResourceRequest | None) -> int:
+    # Steps that run concurrently with other steps may only use the CPUs that they reserved, which is one by default
+    return max(1, int(_get_requested_resources(resource_request)["num_cpus"]))
+
+
+class _LocalResources:
+    """Keeps track of the resources of the local machine that are reserved by running execution steps
+
+    Steps reserve a single CPU unless they request otherwise.
+
+    Args:
+        num_cpus: Number of CPUs that steps can reserve
+        num_gpus: Number of GPUs that steps can reserve
+        memory_bytes: Amount of memory that steps can reserve
+    """
+
+    def __init__(self, num_cpus: int | float, num_gpus: int | float, memory_bytes: int | float) -> None:
+        self._available = {"num_cpus": num_cpus, "num_gpus": num_gpus, "memory_bytes": memory_bytes}
+        self._reserved = {name: 0.0 for name in self._available}
+
+    def fits(self, resource_request: ResourceRequest | None) -> bool:
+        """Whether the requested resources can be reserved on top of the ones that are already reserved"""
+        return all(
+            self._reserved[name] + amount <= self._available[name]
+            for name, amount in _get_requested_resources(resource_request).items()
+        )
+
+    def reserve(self, resource_request: ResourceRequest | None) -> None:
+        for name, amount in _get_requested_resources(resource_request).items():
+            self._reserved[name] += amount
+
+    def release(self, resource_request: ResourceRequest | None) -> None:
+        for name, amount in _get_requested_resources(resource_request).items():
+            self._reserved[name] -= amount
+
+
+def _get_requested_resources(resource_request: ResourceRequest | None) -> dict[str, int | float]:
+    requested: dict[str, int | float] = {"num_cpus": 1, "num_gpus": 0, "memory_bytes": 0}
+    if resource_request is not None:
+        for name in requested:
+            if getattr(resource_request, name) is not None:
+                requested[name] = getattr(resource_request, name)
+    return requested
+
 
 @dataclass(frozen=True)
 class PyMaterializedResult(MaterializedResult[vPartition]):
-    _partition: vPartition
+    _partition: vPartition | PartitionHandle
 
-    def partition(self) -> vPartition:
+    def partition(self) -> vPartition | PartitionHandle:
         return self._partition
 
     def vpartition(self) -> vPartition:
-        return self._partition
+        return _get_vpartition(self._partition)
 
     def metadata(self) -> PartitionMetadata:
         return self._partition.metadata()
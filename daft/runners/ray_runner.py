@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -29,6 +29,7 @@ from daft.filesystem import glob_path_with_stats
 from daft.internal.rule_runner import FixedPointPolicy, Once, RuleBatch, RuleRunner
 from daft.logical import logical_plan
 from daft.logical.optimizer import (
+    ChooseJoinStrategy,
     DropProjections,
     DropRepartition,
     FoldProjections,
@@ -45,6 +46,7 @@ from daft.runners.partitioning import (
     PartitionMetadata,
     PartitionSet,
     PartitionSetFactory,
+    listing_infos_to_vpartitions,
     vPartition,
 )
 from daft.runners.profiler import profiler
@@ -66,24 +68,13 @@ from daft.logical.schema import Schema
 
 @ray.remote
 def _glob_path_into_details_vpartitions(path: str, schema: Schema) -> list[tuple[PartID, vPartition]]:
-    assert len(schema) == 3
-    listing_path_name, listing_size_name, listing_type_name = ["path", "size", "type"]
+    assert len(schema) == 4
     listing_infos = glob_path_with_stats(path)
     if len(listing_infos) == 0:
         raise FileNotFoundError(f"No files found at {path}")
 
-    # Hardcoded to 1 partition
-    partition = vPartition.from_pydict(
-        {
-            listing_path_name: [file_info.path for file_info in listing_infos],
-            listing_size_name: [file_info.size for file_info in listing_infos],
-            listing_type_name: [file_info.type for file_info in listing_infos],
-        },
-        schema=schema,
-        partition_id=0,
-    )
-    partition_ref = ray.put(partition)
-    partition_refs = [(0, partition_ref)]
+    partitions = listing_infos_to_vpartitions(listing_infos, schema)
+    partition_refs = [(partition.partition_id, ray.put(partition)) for partition in partitions]
 
     return partition_refs
 
@@ -106,6 +97,11 @@ def remote_len_partition(p: vPartition) -> int:
     return len(p)
 
 
+@ray.remote
+def remote_size_bytes_partition(p: vPartition) -> int:
+    return p.size_bytes()
+
+
 @dataclass
 class RayPartitionSet(PartitionSet[ray.ObjectRef]):
     _partitions: dict[PartID, ray.ObjectRef]
@@ -155,6 +151,9 @@ class RayPartitionSet(PartitionSet[ray.ObjectRef]):
     def num_partitions(self) -> int:
         return len(self._partitions)
 
+    def size_bytes(self) -> int | None:
+        return sum(ray.get([remote_size_bytes_partition.remote(p) for p in self._partitions.values()]))
+
     def wait(self) -> None:
         ray.wait([o for o in self._partitions.values()])
 
@@ -263,6 +262,8 @@ class SchedulerActor:
 
         from loguru import logger
 
+        # Reduces are not pipelined: results are set as soon as their tasks are dispatched,
+        # so reading the metadata of fanout outputs early would block the scheduler until the fanouts finish
         phys_plan = physical_plan_factory.get_materializing_physical_plan(plan, psets)
 
         # Note: For autoscaling clusters, we will probably want to query cores dynamically.
@@ -366,7 +367,8 @@ def _build_partitions(task: ExecutionStep[ray.ObjectRef]) -> list[ray.ObjectRef]
         partitions = [partitions]
 
     if isinstance(task, MultiOutputExecutionStep):
-        task.results = [RayMaterializedResult(partition) for partition in partitions]
+        task_metadatas = _TaskMetadatas(partitions)
+        task.results = [RayMaterializedResult(partition, task_metadatas, i) for i, partition in enumerate(partitions)]
     elif isinstance(task, SingleOutputExecutionStep):
         [partition] = partitions
         task.result = RayMaterializedResult(partition)
@@ -391,6 +393,12 @@ class RayRunner(Runner):
             ray.init(address=address)
         self._optimizer = RuleRunner(
             [
+                # Join strategies are chosen before the Repartitions that Joins plan are combined with those of their sides
+                RuleBatch(
+                    "ChooseJoinStrategies",
+                    Once,
+                    [ChooseJoinStrategy()],
+                ),
                 RuleBatch(
                     "SinglePassPushDowns",
                     Once,
@@ -399,13 +407,18 @@ class RayRunner(Runner):
                         PushDownPredicates(),
                         PruneColumns(),
                         FoldProjections(),
-                        PushDownClausesIntoScan(),
+                        PushDownClausesIntoScan(runner=self),
                     ],
                 ),
                 RuleBatch(
                     "PushDownLimitsAndRepartitions",
                     FixedPointPolicy(3),
-                    [PushDownLimit(), DropRepartition(), DropProjections()],
+                    [
+                        PushDownLimit(),
+                        DropRepartition(),
+                        DropProjections(),
+                        PushDownClausesIntoScan(runner=self),
+                    ],
                 ),
             ]
         )
@@ -446,6 +459,9 @@ class RayRunner(Runner):
 
         return self._part_set_cache.put_partition_set(pset=pset)
 
+    def put_partitions_into_cache(self, partitions: dict[PartID, vPartition]) -> PartitionCacheEntry:
+        return self.put_partition_set_into_cache(LocalPartitionSet(partitions))
+
     def optimize(self, plan: logical_plan.LogicalPlan) -> logical_plan.LogicalPlan:
         return self._optimizer.optimize(plan)
 
@@ -453,9 +469,27 @@ class RayRunner(Runner):
         return RayPartitionSetFactory()
 
 
+class _TaskMetadatas:
+    """The metadata of all the output partitions of a task,
+    which is fetched with a single ray.get the first time that any of it is needed.
+    """
+
+    def __init__(self, partitions: list[ray.ObjectRef]) -> None:
+        self._partitions = partitions
+        self._metadatas: list[PartitionMetadata] | None = None
+
+    def get(self, index: int) -> PartitionMetadata:
+        if self._metadatas is None:
+            self._metadatas = ray.get([get_meta.remote(partition) for partition in self._partitions])
+        return self._metadatas[index]
+
+
 @dataclass(frozen=True)
 class RayMaterializedResult(MaterializedResult[ray.ObjectRef]):
     _partition: ray.ObjectRef
+    # Shared by all the results of a multi-output task, so that e.g. the slices of a fanout are sized together.
+    _task_metadatas: _TaskMetadatas | None = field(default=None, compare=False)
+    _index: int = 0
 
     def partition(self) -> ray.ObjectRef:
         return self._partition
@@ -464,6 +498,8 @@ class RayMaterializedResult(MaterializedResult[ray.ObjectRef]):
         return ray.get(self._partition)
 
     def metadata(self) -> PartitionMetadata:
+        if self._task_metadatas is not None:
+            return self._task_metadatas.get(self._index)
         return ray.get(get_meta.remote(self._partition))
 
     def cancel(self) -> None:
@@ -4,10 +4,12 @@ from abc import abstractmethod
 
 from daft.logical.logical_plan import LogicalPlan
 from daft.runners.partitioning import (
+    PartID,
     PartitionCacheEntry,
     PartitionSet,
     PartitionSetCache,
     PartitionSetFactory,
+    vPartition,
 )
 
 
@@ -21,6 +23,11 @@ class Runner:
     def put_partition_set_into_cache(self, pset: PartitionSet) -> PartitionCacheEntry:
         return self._part_set_cache.put_partition_set(pset=pset)
 
+    @abstractmethod
+    def put_partitions_into_cache(self, partitions: dict[PartID, vPartition]) -> PartitionCacheEntry:
+        """Puts vPartitions that are held by this process into the cache, as a PartitionSet of this runner"""
+        ...
+
     @abstractmethod
     def partition_set_factory(self) -> PartitionSetFactory:
         ...
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+from pyarrow import parquet
+
+from daft.execution.operators import OperatorEnum
+from daft.expressions import (
+    AliasExpression,
+    CallExpression,
+    ColumnExpression,
+    Expression,
+    ExpressionList,
+    LiteralExpression,
+)
+
+
+@dataclass(frozen=True)
+class ColumnStatistics:
+    """Statistics for a column over a chunk of data (e.g. a Parquet row group)
+
+    Args:
+        num_rows: Number of rows in the chunk of data
+        min: Minimum non-null value of the column, or None if unknown
+        max: Maximum non-null value of the column, or None if unknown
+        null_count: Number of nulls in the column, or None if unknown
+    """
+
+    num_rows: int
+    min: Any = None
+    max: Any = None
+    null_count: int | None = None
+
+    def all_null(self) -> bool:
+        return self.null_count is not None and self.null_count == self.num_rows
+
+
+# Mirrored comparison operators, used to normalize `lit <op> col` into `col <op'> lit`
+_FLIPPED_COMPARISONS = {
+    OperatorEnum.LT: OperatorEnum.GT,
+    OperatorEnum.LE: OperatorEnum.GE,
+    OperatorEnum.EQ: OperatorEnum.EQ,
+    OperatorEnum.NEQ: OperatorEnum.NEQ,
+    OperatorEnum.GT: OperatorEnum.LT,
+    OperatorEnum.GE: OperatorEnum.LE,
+}
+
+# Comparison operators that are equivalent to the negation of the key
+_NEGATED_COMPARISONS = {
+    OperatorEnum.LT: OperatorEnum.GE,
+    OperatorEnum.LE: OperatorEnum.GT,
+    OperatorEnum.EQ: OperatorEnum.NEQ,
+    OperatorEnum.NEQ: OperatorEnum.EQ,
+    OperatorEnum.GT: OperatorEnum.LE,
+    OperatorEnum.GE: OperatorEnum.LT,
+}
+
+
+def predicate_might_match(predicate: ExpressionList, statistics: dict[str, ColumnStatistics]) -> bool:
+    """Checks whether any row of a chunk of data described by `statistics` could satisfy every expression in `predicate`
+
+    This check is conservative: it only returns False if it can prove that no row matches, and returns True for any
+    expression that cannot be evaluated against the provided statistics.
+
+    Args:
+        predicate: Filter predicate, where a row satisfies the predicate if every expression evaluates to True
+        statistics: Statistics for the chunk of data, keyed by column name
+    """
+    return all(_might_match(e, statistics, negated=False) for e in predicate)
+
+
+def predicate_must_match(predicate: ExpressionList, statistics: dict[str, ColumnStatistics]) -> bool:
+    """Checks whether every row of a chunk of data described by `statistics` satisfies every expression in `predicate`
+
+    This check is conservative: it only returns True if it can prove that every row matches. Columns with nulls or
+    floating point statistics are never proven to match, since nulls and NaNs fail every comparison while being excluded
+    from the min and max statistics.
+
+    Args:
+        predicate: Filter predicate, where a row satisfies the predicate if every expression evaluates to True
+        statistics: Statistics for the chunk of data, keyed by column name
+    """
+    for e in predicate:
+        for name in e.required_columns():
+            column_stats = statistics.get(name)
+            if column_stats is None or column_stats.null_count != 0:
+                return False
+            if isinstance(column_stats.min, float) or isinstance(column_stats.max, float):
+                return False
+        # Without nulls, every row satisfies an expression if no row can satisfy its negation
+        if _might_match(e, statistics, negated=True):
+            return False
+    return True
+
+
+def _might_match(expr: Expression, statistics: dict[str, ColumnStatistics], negated: bool) -> bool:
+    if isinstance(expr, AliasExpression):
+        return _might_match(expr._expr, statistics, negated)
+
+    if not isinstance(expr, CallExpression):
+        return True
+
+    op = expr._operator
+    args = expr._args
+
+    if op == OperatorEnum.INVERT:
+        return _might_match(args[0], statistics, not negated)
+    elif op in (OperatorEnum.AND, OperatorEnum.OR):
+        # De Morgan's laws: ~(a & b) == ~a | ~b and ~(a | b) == ~a & ~b
+        is_conjunction = (op == OperatorEnum.AND) != negated
+        left, right = (_might_match(arg, statistics, negated) for arg in args)
+        return (left and right) if is_conjunction else (left or right)
+    elif op == OperatorEnum.IS_NULL:
+        column_stats = _get_column_statistics(args[0], statistics)
+        if column_stats is None or column_stats.null_count is None:
+            return True
+        return not column_stats.all_null() if negated else column_stats.null_count > 0
+    elif op in _FLIPPED_COMPARISONS:
+        left, right = args
+        if isinstance(left, LiteralExpression) and not isinstance(right, LiteralExpression):
+            op = _FLIPPED_COMPARISONS[op]
+            left, right = right, left
+        if not isinstance(right, LiteralExpression):
+            return True
+        column_stats = _get_column_statistics(left, statistics)
+        if column_stats is None:
+            return True
+        # Comparisons against nulls evaluate to null, which are never selected by a filter regardless of negation
+        if column_stats.all_null():
+            return False
+        if negated:
+            op = _NEGATED_COMPARISONS[op]
+        return _comparison_might_match(op, column_stats.min, column_stats.max, right._value)
+
+    return True
+
+
+def _get_column_statistics(expr: Expression, statistics: dict[str, ColumnStatistics]) -> ColumnStatistics | None:
+    if isinstance(expr, AliasExpression):
+        return _get_column_statistics(expr._expr, statistics)
+    if isinstance(expr, ColumnExpression):
+        return statistics.get(expr.name())
+    return None
+
+
+def _comparison_might_match(op: OperatorEnum, min_value: Any, max_value: Any, value: Any) -> bool:
+    if min_value is None or max_value is None or value is None:
+        return True
+    if any(isinstance(v, float) and math.isnan(v) for v in (min_value, max_value, value)):
+        return True
+    try:
+        if op == OperatorEnum.LT:
+            return bool(min_value < value)
+        elif op == OperatorEnum.LE:
+            return bool(min_value <= value)
+        elif op == OperatorEnum.GT:
+            return bool(max_value > value)
+        elif op == OperatorEnum.GE:
+            return bool(max_value >= value)
+        elif op == OperatorEnum.EQ:
+            return bool(min_value <= value <= max_value)
+        elif op == OperatorEnum.NEQ:
+            return not bool(min_value == max_value == value)
+    except TypeError:
+        # Statistics and literal are not comparable (e.g. mismatched types), so we cannot prune
+        return True
+    return True
+
+
+def parquet_row_group_statistics(metadata: parquet.FileMetaData, row_group_index: int) -> dict[str, ColumnStatistics]:
+    """Extracts statistics for each top-level, non-nested column of a Parquet row group from the file metadata"""
+    row_group = metadata.row_group(row_group_index)
+
+    # Parquet column chunks are stored per leaf column, so we find the leaf index of every non-nested top-level field
+    leaf_indices = {}
+    leaf_index = 0
+    for field in metadata.schema.to_arrow_schema():
+        if not pa.types.is_nested(field.type):
+            leaf_indices[field.name] = leaf_index
+        leaf_index += _num_parquet_leaves(field.type)
+
+    result = {}
+    for name, i in leaf_indices.items():
+        column = row_group.column(i)
+        stats = column.statistics if column.is_stats_set else None
+        if stats is None:
+            result[name] = ColumnStatistics(num_rows=row_group.num_rows)
+            continue
+        has_min_max = stats.has_min_max
+        result[name] = ColumnStatistics(
+            num_rows=row_group.num_rows,
+            min=stats.min if has_min_max else None,
+            max=stats.max if has_min_max else None,
+            null_count=stats.null_count if stats.has_null_count else None,
+        )
+    return result
+
+
+def _num_parquet_leaves(arrow_type: pa.DataType) -> int:
+    if pa.types.is_struct(arrow_type):
+        return sum(_num_parquet_leaves(arrow_type[i].type) for i in range(arrow_type.num_fields))
+    elif pa.types.is_map(arrow_type):
+        return _num_parquet_leaves(arrow_type.key_type) + _num_parquet_leaves(arrow_type.item_type)
+    elif pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type) or pa.types.is_fixed_size_list(arrow_type):
+        return _num_parquet_leaves(arrow_type.value_type)
+    return 1
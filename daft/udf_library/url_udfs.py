@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import random
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from loguru import logger
@@ -7,30 +12,123 @@ from loguru import logger
 from daft import filesystem
 from daft.udf import udf
 
+# Default maximum number of URLs that are downloaded concurrently by each download task
+DEFAULT_DOWNLOAD_MAX_CONNECTIONS = 32
 
-def _download_udf(urls: list[str | None]) -> list[bytes | None]:
+# Default maximum number of URLs that are downloaded concurrently from the same host by each download task
+DEFAULT_DOWNLOAD_MAX_CONNECTIONS_PER_HOST = 8
+
+# Default number of times that a failed download is retried before its result is None
+DEFAULT_DOWNLOAD_MAX_RETRIES = 3
+
+# Delay before the first retry of a failed download, which doubles on each subsequent retry
+_DOWNLOAD_RETRY_BACKOFF_SECONDS = 0.1
+
+# Errors that will not succeed when retried
+_NON_RETRYABLE_ERRORS = (FileNotFoundError, IsADirectoryError, PermissionError)
+
+
+def _get_host(url: str) -> str:
+    parsed = urllib.parse.urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class URLDownloader:
+    """Downloads the contents of URLs concurrently on a thread pool, retrying failed downloads with exponential backoff
+
+    Filesystems are shared across downloads from the process-wide filesystem pool, so that connections to each host are
+    reused. URLs that fail to download after all retries, or that are larger than `max_size_bytes`, have a result of None.
+
+    Args:
+        max_connections: Maximum number of URLs to download concurrently
+        max_connections_per_host: Maximum number of URLs to download concurrently from the same host
+        max_retries: Number of times to retry a failed download
+        max_size_bytes: Maximum size of each download, or None for no limit
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_DOWNLOAD_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_DOWNLOAD_MAX_CONNECTIONS_PER_HOST,
+        max_retries: int = DEFAULT_DOWNLOAD_MAX_RETRIES,
+        max_size_bytes: int | None = None,
+    ) -> None:
+        assert max_connections > 0, "max_connections must be positive"
+        assert max_connections_per_host > 0, "max_connections_per_host must be positive"
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._max_retries = max_retries
+        self._max_size_bytes = max_size_bytes
+        self._host_semaphores: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def _get_host_semaphore(self, url: str) -> threading.Semaphore:
+        host = _get_host(url)
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.Semaphore(self._max_connections_per_host)
+            return self._host_semaphores[host]
+
+    def _fetch(self, url: str) -> bytes | None:
+        if self._max_size_bytes is None:
+            return filesystem.cat_file(url)
+
+        # Read at most one byte past the limit, which is enough to tell whether the file is too large
+        fs = filesystem.get_filesystem_from_path(url)
+        data = fs.cat_file(url, start=0, end=self._max_size_bytes + 1)
+        if len(data) > self._max_size_bytes:
+            logger.error(f"Skipping download from URL {url}: larger than the limit of {self._max_size_bytes} bytes")
+            return None
+        return data
+
+    def _download(self, url: str) -> bytes | None:
+        semaphore = self._get_host_semaphore(url)
+        for attempt in range(self._max_retries + 1):
+            try:
+                with semaphore:
+                    return self._fetch(url)
+            except _NON_RETRYABLE_ERRORS as e:
+                logger.error(f"Encountered error during download from URL {url}: {str(e)}")
+                return None
+            except Exception as e:
+                if attempt == self._max_retries:
+                    logger.error(f"Encountered error during download from URL {url}: {str(e)}")
+                    return None
+                # Jitter the backoff so that retries of downloads that failed together are spread out
+                backoff = _DOWNLOAD_RETRY_BACKOFF_SECONDS * (2**attempt) * (1 + random.random())
+                logger.debug(f"Retrying download from URL {url} in {backoff:.2f}s after error: {str(e)}")
+                time.sleep(backoff)
+        return None
+
+    def download(self, urls: list[str | None]) -> list[bytes | None]:
+        """Downloads the contents of the URLs, returning results in the same order as `urls`
+
+        URLs that appear more than once are only downloaded once, and a URL of None has a result of None.
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url is not None))
+        if len(unique_urls) == 0:
+            return [None for _ in urls]
+
+        with ThreadPoolExecutor(max_workers=min(self._max_connections, len(unique_urls))) as executor:
+            contents = dict(zip(unique_urls, executor.map(self._download, unique_urls)))
+        return [contents[url] if url is not None else None for url in urls]
+
+
+def _download_udf(
+    urls: list[str | None],
+    max_connections: int = DEFAULT_DOWNLOAD_MAX_CONNECTIONS,
+    max_connections_per_host: int = DEFAULT_DOWNLOAD_MAX_CONNECTIONS_PER_HOST,
+    max_retries: int = DEFAULT_DOWNLOAD_MAX_RETRIES,
+    max_size_bytes: int | None = None,
+) -> list[bytes | None]:
     """Downloads the contents of the supplied URLs."""
-    results: list[bytes | None] = []
-    filesystems: dict[str, filesystem.AbstractFileSystem] = {}
-
-    for path in urls:
-        if path is None:
-            results.append(None)
-            continue
-
-        protocol = filesystem.get_protocol_from_path(path)
-        if protocol not in filesystems:
-            filesystems[protocol] = filesystem.get_filesystem(protocol)
-        fs = filesystems[protocol]
-
-        try:
-            result = fs.cat_file(path)
-        except Exception as e:
-            logger.error(f"Encountered error during download from URL {path}: {str(e)}")
-            result = None
-        results.append(result)
-
-    return results
+    downloader = URLDownloader(
+        max_connections=max_connections,
+        max_connections_per_host=max_connections_per_host,
+        max_retries=max_retries,
+        max_size_bytes=max_size_bytes,
+    )
+    return downloader.download(urls)
 
 
 # HACK: Workaround for Ray pickling issues if we use the @polars_udf decorator instead.
@@ -0,0 +1,614 @@
+use std::{
+    cmp::Ordering,
+    collections::{hash_map::Entry, HashMap},
+    iter::zip,
+    ops::{Add, Range},
+    thread,
+};
+
+use arrow2::{
+    array::ord::{build_compare, DynComparator},
+    array::{Array, PrimitiveArray},
+    datatypes::{DataType, PhysicalType, PrimitiveType},
+    error::{Error, Result},
+    types::NativeType,
+};
+use num_traits::ToPrimitive;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyList;
+
+use crate::ffi;
+use crate::kernels::hashing::{hash_rows, IdentityBuildHasher};
+
+// Minimum number of rows for each thread to group or aggregate, so that small inputs are not split across threads
+const MIN_ROWS_PER_THREAD: usize = 1 << 16;
+
+/// Splits rows into contiguous ranges to be processed in parallel by up to `num_threads` threads
+fn row_ranges(num_rows: usize, num_threads: usize) -> Vec<Range<usize>> {
+    let num_ranges = num_threads.min(num_rows / MIN_ROWS_PER_THREAD).max(1);
+    let rows_per_range = (num_rows + num_ranges - 1) / num_ranges;
+    (0..num_ranges)
+        .map(|i| (i * rows_per_range).min(num_rows)..((i + 1) * rows_per_range).min(num_rows))
+        .collect()
+}
+
+/// Compares the keys of rows, where nulls are equal to each other
+struct RowComparator<'a> {
+    arrays: &'a [&'a dyn Array],
+    comparators: Vec<DynComparator>,
+}
+
+impl<'a> RowComparator<'a> {
+    fn try_new(arrays: &'a [&'a dyn Array]) -> Result<Self> {
+        let comparators = arrays
+            .iter()
+            .map(|array| build_compare(*array, *array))
+            .collect::<Result<Vec<DynComparator>>>()?;
+        Ok(Self {
+            arrays,
+            comparators,
+        })
+    }
+
+    fn eq(&self, a: usize, b: usize) -> bool {
+        zip(self.arrays, &self.comparators).all(|(array, cmp)| {
+            match (array.is_valid(a), array.is_valid(b)) {
+                (true, true) => cmp(a, b) == Ordering::Equal,
+                (false, false) => true,
+                _ => false,
+            }
+        })
+    }
+}
+
+const NO_GROUP: usize = usize::MAX;
+
+/// Hash table of groups of rows with equal keys, where groups whose keys have the same hash are chained together
+struct Groups {
+    table: HashMap<u64, usize, IdentityBuildHasher>,
+    next_with_same_hash: Vec<usize>,
+    first_rows: Vec<usize>,
+}
+
+impl Groups {
+    fn with_capacity(capacity: usize) -> Self {
+        Self {
+            table: HashMap::with_capacity_and_hasher(capacity, Default::default()),
+            next_with_same_hash: Vec::with_capacity(capacity),
+            first_rows: Vec::with_capacity(capacity),
+        }
+    }
+
+    /// Returns the group of a row, which is a new group if no row with equal keys has been seen before
+    fn find_or_insert(&mut self, hash: u64, row: usize, rows: &RowComparator) -> usize {
+        let new_group = self.first_rows.len();
+        match self.table.entry(hash) {
+            Entry::Vacant(entry) => {
+                entry.insert(new_group);
+            }
+            Entry::Occupied(entry) => {
+                let mut group = *entry.get();
+                loop {
+                    if rows.eq(self.first_rows[group], row) {
+                        return group;
+                    }
+                    if self.next_with_same_hash[group] == NO_GROUP {
+                        self.next_with_same_hash[group] = new_group;
+                        break;
+                    }
+                    group = self.next_with_same_hash[group];
+                }
+            }
+        }
+        self.first_rows.push(row);
+        self.next_with_same_hash.push(NO_GROUP);
+        new_group
+    }
+}
+
+/// Groups rows with equal keys, returning the first row of each group and the group of each row
+///
+/// Groups are numbered in the order of their first rows, and null keys are grouped together. Ranges of rows are grouped
+/// in parallel into partial groups, which are then merged in order. Hash tables are pre-sized for `expected_num_groups`
+/// groups, or grow as groups are found if it is None.
+pub fn group_rows(
+    keys: &[&dyn Array],
+    expected_num_groups: Option<usize>,
+    num_threads: usize,
+) -> Result<(Vec<usize>, Vec<u64>)> {
+    if keys.is_empty() {
+        return Err(Error::InvalidArgumentError(
+            "expected at least one key to group by".to_string(),
+        ));
+    }
+    let num_rows = keys[0].len();
+    if let Some(array) = keys.iter().find(|array| array.len() != num_rows) {
+        return Err(Error::InvalidArgumentError(format!(
+            "key lengths do not match: {} vs {}",
+            num_rows,
+            array.len()
+        )));
+    }
+
+    let rows = RowComparator::try_new(keys)?;
+    let hashes = hash_rows(keys)?;
+    let hashes = hashes.values().as_slice();
+    let capacity = |num_rows: usize| expected_num_groups.unwrap_or(0).min(num_rows);
+
+    let ranges = row_ranges(num_rows, num_threads);
+    if ranges.len() == 1 {
+        let mut groups = Groups::with_capacity(capacity(num_rows));
+        let group_ids = (0..num_rows)
+            .map(|row| groups.find_or_insert(hashes[row], row, &rows) as u64)
+            .collect();
+        return Ok((groups.first_rows, group_ids));
+    }
+
+    // Group each range of rows into partial groups, with group IDs that are local to the range
+    let partial_groups: Vec<(Groups, Vec<usize>)> = thread::scope(|s| {
+        let handles = ranges
+            .into_iter()
+            .map(|range| {
+                let rows = &rows;
+                s.spawn(move || {
+                    let mut groups = Groups::with_capacity(capacity(range.len()));
+                    let local_group_ids = range
+                        .map(|row| groups.find_or_insert(hashes[row], row, rows))
+                        .collect::<Vec<_>>();
+                    (groups, local_group_ids)
+                })
+            })
+            .collect::<Vec<_>>();
+        handles
+            .into_iter()
+            .map(|handle| handle.join().unwrap())
+            .collect()
+    });
+
+    let mut groups = Groups::with_capacity(capacity(num_rows));
+    let mut group_ids = Vec::with_capacity(num_rows);
+    for (partial, local_group_ids) in partial_groups {
+        let to_group = partial
+            .first_rows
+            .iter()
+            .map(|row| groups.find_or_insert(hashes[*row], *row, &rows))
+            .collect::<Vec<_>>();
+        group_ids.extend(local_group_ids.iter().map(|g| to_group[*g] as u64));
+    }
+    Ok((groups.first_rows, group_ids))
+}
+
+/// Aggregates rows into an accumulator for each group
+///
+/// Ranges of rows are aggregated in parallel into partial accumulators, which are then merged in the order of the
+/// ranges.
+fn aggregate_groups<A, U, M>(
+    group_ids: &[u64],
+    num_groups: usize,
+    num_threads: usize,
+    init: A,
+    update: U,
+    merge: M,
+) -> Vec<A>
+where
+    A: Clone + Send + Sync,
+    U: Fn(&mut A, usize) + Sync,
+    M: Fn(&mut A, A),
+{
+    let aggregate_range = |range: Range<usize>| {
+        let mut accumulators = vec![init.clone(); num_groups];
+        for row in range {
+            update(&mut accumulators[group_ids[row] as usize], row);
+        }
+        accumulators
+    };
+
+    let ranges = row_ranges(group_ids.len(), num_threads);
+    if ranges.len() == 1 {
+        return aggregate_range(0..group_ids.len());
+    }
+
+    let aggregate_range = &aggregate_range;
+    let partials: Vec<Vec<A>> = thread::scope(|s| {
+        let handles = ranges
+            .into_iter()
+            .map(|range| s.spawn(move || aggregate_range(range)))
+            .collect::<Vec<_>>();
+        handles
+            .into_iter()
+            .map(|handle| handle.join().unwrap())
+            .collect()
+    });
+
+    let mut partials = partials.into_iter();
+    let mut accumulators = partials.next().unwrap();
+    for partial in partials {
+        for (accumulator, partial_accumulator) in zip(accumulators.iter_mut(), partial) {
+            merge(accumulator, partial_accumulator);
+        }
+    }
+    accumulators
+}
+
+fn grouped_sum<T: NativeType + Add<Output = T>>(
+    array: &PrimitiveArray<T>,
+    group_ids: &[u64],
+    num_groups: usize,
+    num_threads: usize,
+) -> PrimitiveArray<T> {
+    let add = |accumulator: &mut Option<T>, value: T| {
+        *accumulator = Some(accumulator.map_or(value, |sum| sum + value));
+    };
+    let sums = aggregate_groups(
+        group_ids,
+        num_groups,
+        num_threads,
+        None,
+        |sum, row| {
+            if array.is_valid(row) {
+                add(sum, array.value(row));
+            }
+        },
+        |sum, partial_sum| {
+            if let Some(partial_sum) = partial_sum {
+                add(sum, partial_sum);
+            }
+        },
+    );
+    PrimitiveArray::<T>::from(sums).to(array.data_type().clone())
+}
+
+fn grouped_mean<T: NativeType + ToPrimitive>(
+    array: &PrimitiveArray<T>,
+    group_ids: &[u64],
+    num_groups: usize,
+    num_threads: usize,
+) -> PrimitiveArray<f64> {
+    let sums_and_counts = aggregate_groups(
+        group_ids,
+        num_groups,
+        num_threads,
+        (0.0_f64, 0_u64),
+        |(sum, count), row| {
+            if array.is_valid(row) {
+                *sum += array.value(row).to_f64().unwrap_or(f64::NAN);
+                *count += 1;
+            }
+        },
+        |(sum, count), (partial_sum, partial_count)| {
+            *sum += partial_sum;
+            *count += partial_count;
+        },
+    );
+    PrimitiveArray::<f64>::from(
+        sums_and_counts
+            .into_iter()
+            .map(|(sum, count)| (count > 0).then(|| sum / count as f64))
+            .collect::<Vec<_>>(),
+    )
+}
+
+fn grouped_count(
+    array: &dyn Array,
+    group_ids: &[u64],
+    num_groups: usize,
+    num_threads: usize,
+) -> PrimitiveArray<i64> {
+    let counts = aggregate_groups(
+        group_ids,
+        num_groups,
+        num_threads,
+        0_i64,
+        |count, row| {
+            if array.is_valid(row) {
+                *count += 1;
+            }
+        },
+        |count, partial_count| *count += partial_count,
+    );
+    PrimitiveArray::<i64>::from_vec(counts)
+}
+
+fn nan_mask(array: &dyn Array) -> Option<Vec<bool>> {
+    match array.data_type().to_physical_type() {
+        PhysicalType::Primitive(PrimitiveType::Float32) => Some(
+            array
+                .as_any()
+                .downcast_ref::<PrimitiveArray<f32>>()
+                .unwrap()
+                .values_iter()
+                .map(|v| v.is_nan())
+                .collect(),
+        ),
+        PhysicalType::Primitive(PrimitiveType::Float64) => Some(
+            array
+                .as_any()
+                .downcast_ref::<PrimitiveArray<f64>>()
+                .unwrap()
+                .values_iter()
+                .map(|v| v.is_nan())
+                .collect(),
+        ),
+        _ => None,
+    }
+}
+
+/// Returns the row of the smallest (`target` of Ordering::Less) or largest (Ordering::Greater) value of each group
+///
+/// Nulls are ignored and NaNs are only returned for groups with no other values, so groups with only nulls have a null
+/// row. The first row is returned for groups with several smallest or largest values.
+fn grouped_arg_extremum(
+    array: &dyn Array,
+    group_ids: &[u64],
+    num_groups: usize,
+    num_threads: usize,
+    target: Ordering,
+) -> Result<PrimitiveArray<u64>> {
+    let cmp = build_compare(array, array)?;
+    let nans = nan_mask(array);
+    let is_nan = |row: usize| nans.as_ref().map_or(false, |nans| nans[row]);
+    let is_better = |row: usize, best: Option<usize>| match best {
+        None => true,
+        Some(best) => match (is_nan(row), is_nan(best)) {
+            (false, true) => true,
+            (true, _) => false,
+            (false, false) => cmp(row, best) == target,
+        },
+    };
+
+    let rows = aggregate_groups(
+        group_ids,
+        num_groups,
+        num_threads,
+        None,
+        |best, row| {
+            if array.is_valid(row) && is_better(row, *best) {
+                *best = Some(row);
+            }
+        },
+        |best, partial_best| {
+            if let Some(row) = partial_best {
+                if is_better(row, *best) {
+                    *best = Some(row);
+                }
+            }
+        },
+    );
+    Ok(PrimitiveArray::<u64>::from(
+        rows.into_iter()
+            .map(|row| row.map(|row| row as u64))
+            .collect::<Vec<_>>(),
+    ))
+}
+
+macro_rules! with_match_numeric_type {(
+    $key_type:expr, | $_:tt $T:ident | $($body:tt)*
+) => ({
+    macro_rules! __with_ty__ {( $_ $T:ident ) => ( $($body)* )}
+    use arrow2::datatypes::PrimitiveType::*;
+    match $key_type {
+        Int8 => __with_ty__! { i8 },
+        Int16 => __with_ty__! { i16 },
+        Int32 => __with_ty__! { i32 },
+        Int64 => __with_ty__! { i64 },
+        UInt8 => __with_ty__! { u8 },
+        UInt16 => __with_ty__! { u16 },
+        UInt32 => __with_ty__! { u32 },
+        UInt64 => __with_ty__! { u64 },
+        Float32 => __with_ty__! { f32 },
+        Float64 => __with_ty__! { f64 },
+        _ => return Err(Error::NotYetImplemented(format!(
+            "Aggregation not implemented for type {:?}",
+            $key_type
+        )))
+    }
+})}
+
+/// Aggregates the values of `array` in each group, where `group_ids` holds the group of each row
+///
+/// `op` is one of "sum", "mean", "count", "argmin" or "argmax", where "argmin" and "argmax" result in the row of the
+/// smallest or largest value of each group, which works for values of any type that can be compared.
+pub fn grouped_aggregate(
+    array: &dyn Array,
+    group_ids: &[u64],
+    num_groups: usize,
+    op: &str,
+    num_threads: usize,
+) -> Result<Box<dyn Array>> {
+    if array.len() != group_ids.len() {
+        return Err(Error::InvalidArgumentError(format!(
+            "array length does not match group IDs length: {} vs {}",
+            array.len(),
+            group_ids.len()
+        )));
+    }
+    Ok(match op {
+        "count" => Box::new(grouped_count(array, group_ids, num_groups, num_threads)),
+        "argmin" => Box::new(grouped_arg_extremum(
+            array,
+            group_ids,
+            num_groups,
+            num_threads,
+            Ordering::Less,
+        )?),
+        "argmax" => Box::new(grouped_arg_extremum(
+            array,
+            group_ids,
+            num_groups,
+            num_threads,
+            Ordering::Greater,
+        )?),
+        "sum" | "mean" => match array.data_type().to_physical_type() {
+            PhysicalType::Primitive(primitive) => with_match_numeric_type!(primitive, |$T| {
+                let array = array.as_any().downcast_ref::<PrimitiveArray<$T>>().unwrap();
+                if op == "sum" {
+                    Box::new(grouped_sum::<$T>(array, group_ids, num_groups, num_threads)) as Box<dyn Array>
+                } else {
+                    Box::new(grouped_mean::<$T>(array, group_ids, num_groups, num_threads)) as Box<dyn Array>
+                }
+            }),
+            t => {
+                return Err(Error::NotYetImplemented(format!(
+                    "Aggregation not implemented for type {t:?}"
+                )))
+            }
+        },
+        _ => {
+            return Err(Error::InvalidArgumentError(format!(
+                "unknown aggregation: {op}"
+            )))
+        }
+    })
+}
+
+/// Orders rows by their group, keeping the order of rows within each group, and returns the order along with the
+/// offsets of the rows of each group in that order
+pub fn group_order(group_ids: &[u64], num_groups: usize) -> (Vec<u64>, Vec<i64>) {
+    let mut offsets = vec![0_i64; num_groups + 1];
+    for group in group_ids {
+        offsets[*group as usize + 1] += 1;
+    }
+    for group in 0..num_groups {
+        offsets[group + 1] += offsets[group];
+    }
+
+    let mut next_positions = offsets[..num_groups].to_vec();
+    let mut order = vec![0_u64; group_ids.len()];
+    for (row, group) in group_ids.iter().enumerate() {
+        let position = &mut next_positions[*group as usize];
+        order[*position as usize] = row as u64;
+        *position += 1;
+    }
+    (order, offsets)
+}
+
+fn group_ids_to_rust(group_ids: &PyAny) -> PyResult<PrimitiveArray<u64>> {
+    let rgroup_ids = ffi::array_to_rust(group_ids)?;
+    if *rgroup_ids.data_type() != DataType::UInt64 {
+        return Err(PyValueError::new_err(format!(
+            "group IDs data type expected to be UInt64, got {:?}",
+            *rgroup_ids.data_type()
+        )));
+    }
+    Ok(rgroup_ids
+        .as_any()
+        .downcast_ref::<PrimitiveArray<u64>>()
+        .unwrap()
+        .clone())
+}
+
+#[pyfunction]
+pub fn group_rows_pyarrow_arrays(
+    key_arrays: &PyList,
+    expected_num_groups: Option<usize>,
+    num_threads: usize,
+    py: Python,
+    pyarrow: &PyModule,
+) -> PyResult<(PyObject, PyObject)> {
+    let rkey_arrays = key_arrays
+        .iter()
+        .map(ffi::array_to_rust)
+        .collect::<PyResult<Vec<Box<dyn Array>>>>()?;
+    let key_arrays_refs = rkey_arrays
+        .iter()
+        .map(Box::as_ref)
+        .collect::<Vec<&dyn Array>>();
+
+    let grouped =
+        py.allow_threads(move || group_rows(&key_arrays_refs, expected_num_groups, num_threads));
+    match grouped {
+        Err(e) => Err(PyValueError::new_err(e.to_string())),
+        Ok((first_rows, group_ids)) => {
+            let first_rows = first_rows.into_iter().map(|row| row as u64).collect();
+            Ok((
+                ffi::to_py_array(
+                    Box::new(PrimitiveArray::<u64>::from_vec(first_rows)),
+                    py,
+                    pyarrow,
+                )?,
+                ffi::to_py_array(
+                    Box::new(PrimitiveArray::<u64>::from_vec(group_ids)),
+                    py,
+                    pyarrow,
+                )?,
+            ))
+        }
+    }
+}
+
+#[pyfunction]
+pub fn grouped_aggregate_pyarrow_array(
+    pyarray: &PyAny,
+    group_ids: &PyAny,
+    num_groups: usize,
+    op: &str,
+    num_threads: usize,
+    py: Python,
+    pyarrow: &PyModule,
+) -> PyResult<PyObject> {
+    let rarray = ffi::array_to_rust(pyarray)?;
+    let rgroup_ids = group_ids_to_rust(group_ids)?;
+
+    let aggregated = py.allow_threads(move || {
+        grouped_aggregate(
+            rarray.as_ref(),
+            rgroup_ids.values().as_slice(),
+            num_groups,
+            op,
+            num_threads,
+        )
+    });
+    match aggregated {
+        Err(e) => Err(PyValueError::new_err(e.to_string())),
+        Ok(s) => ffi::to_py_array(s, py, pyarrow),
+    }
+}
+
+#[pyfunction]
+pub fn group_order_pyarrow_array(
+    group_ids: &PyAny,
+    num_groups: usize,
+    py: Python,
+    pyarrow: &PyModule,
+) -> PyResult<(PyObject, PyObject)> {
+    let rgroup_ids = group_ids_to_rust(group_ids)?;
+
+    let (order, offsets) =
+        py.allow_threads(move || group_order(rgroup_ids.values().as_slice(), num_groups));
+    Ok((
+        ffi::to_py_array(
+            Box::new(PrimitiveArray::<u64>::from_vec(order)),
+            py,
+            pyarrow,
+        )?,
+        ffi::to_py_array(
+            Box::new(PrimitiveArray::<i64>::from_vec(offsets)),
+            py,
+            pyarrow,
+        )?,
+    ))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn check_group_rows_multiple_keys_with_nulls() -> Result<()> {
+        // Rows with a null key are grouped by their other keys, whether they are grouped by one or more threads
+        let num_rows = 4 * MIN_ROWS_PER_THREAD;
+        let first =
+            PrimitiveArray::<i64>::from_vec((0..num_rows as i64).map(|i| i % 1000).collect());
+        let second = PrimitiveArray::<i64>::from(vec![None; num_rows]);
+        for num_threads in [1, 4] {
+            let (first_rows, group_ids) = group_rows(&[&first, &second], None, num_threads)?;
+            assert_eq!(first_rows, (0..1000).collect::<Vec<_>>());
+            for (row, group) in group_ids.iter().enumerate() {
+                assert_eq!(*group, (row % 1000) as u64);
+            }
+        }
+        Ok(())
+    }
+}
@@ -1,6 +1,8 @@
+use std::hash::{BuildHasherDefault, Hasher};
+
 use arrow2::{
     array::Array,
-    array::{BinaryArray, PrimitiveArray, Utf8Array},
+    array::{BinaryArray, BooleanArray, PrimitiveArray, Utf8Array},
     datatypes::{DataType, PhysicalType},
     error::{Error, Result},
     types::{NativeType, Offset},
@@ -13,21 +15,22 @@ use pyo3::prelude::*;
 
 use crate::ffi;
 
+// Nulls are hashed like empty values with the seed, so that the hashes of rows with nulls still depend on their other keys
 fn hash_primitive<T: NativeType>(
     array: &PrimitiveArray<T>,
     seed: Option<&PrimitiveArray<u64>>,
 ) -> PrimitiveArray<u64> {
-    let null_hash = xxh3_64(b"");
     let hashes = if let Some(seed) = seed {
         array
             .iter()
             .zip(seed.values_iter())
             .map(|(v, s)| match v {
                 Some(v) => xxh3_64_with_seed(v.to_le_bytes().as_ref(), *s),
-                None => null_hash,
+                None => xxh3_64_with_seed(b"", *s),
             })
             .collect::<Vec<_>>()
     } else {
+        let null_hash = xxh3_64(b"");
         array
             .iter()
             .map(|v| match v {
@@ -39,18 +42,45 @@ fn hash_primitive<T: NativeType>(
     PrimitiveArray::<u64>::new(DataType::UInt64, hashes.into(), None)
 }
 
+fn hash_boolean(array: &BooleanArray, seed: Option<&PrimitiveArray<u64>>) -> PrimitiveArray<u64> {
+    let to_bytes = |v: Option<bool>| -> &'static [u8] {
+        match v {
+            Some(true) => &[1],
+            Some(false) => &[0],
+            None => b"",
+        }
+    };
+    let hashes = if let Some(seed) = seed {
+        array
+            .iter()
+            .zip(seed.values_iter())
+            .map(|(v, s)| xxh3_64_with_seed(to_bytes(v), *s))
+            .collect::<Vec<_>>()
+    } else {
+        array
+            .iter()
+            .map(|v| xxh3_64(to_bytes(v)))
+            .collect::<Vec<_>>()
+    };
+    PrimitiveArray::<u64>::new(DataType::UInt64, hashes.into(), None)
+}
+
+// Nulls are hashed like empty values, so that their hashes do not depend on the values underneath them
 fn hash_binary<O: Offset>(
     array: &BinaryArray<O>,
     seed: Option<&PrimitiveArray<u64>>,
 ) -> PrimitiveArray<u64> {
     let hashes = if let Some(seed) = seed {
         array
-            .values_iter()
+            .iter()
             .zip(seed.values_iter())
-            .map(|(v, s)| xxh3_64_with_seed(v, *s))
+            .map(|(v, s)| xxh3_64_with_seed(v.unwrap_or(b""), *s))
             .collect::<Vec<_>>()
     } else {
-        array.values_iter().map(xxh3_64).collect::<Vec<_>>()
+        array
+            .iter()
+            .map(|v| xxh3_64(v.unwrap_or(b"")))
+            .collect::<Vec<_>>()
     };
     PrimitiveArray::<u64>::new(DataType::UInt64, hashes.into(), None)
 }
@@ -61,14 +91,14 @@ fn hash_utf8<O: Offset>(
 ) -> PrimitiveArray<u64> {
     let hashes = if let Some(seed) = seed {
         array
-            .values_iter()
+            .iter()
             .zip(seed.values_iter())
-            .map(|(v, s)| xxh3_64_with_seed(v.as_bytes(), *s))
+            .map(|(v, s)| xxh3_64_with_seed(v.unwrap_or("").as_bytes(), *s))
             .collect::<Vec<_>>()
     } else {
         array
-            .values_iter()
-            .map(|v| xxh3_64(v.as_bytes()))
+            .iter()
+            .map(|v| xxh3_64(v.unwrap_or("").as_bytes()))
             .collect::<Vec<_>>()
     };
     PrimitiveArray::<u64>::new(DataType::UInt64, hashes.into(), None)
@@ -121,7 +151,7 @@ pub fn hash(array: &dyn Array, seed: Option<&PrimitiveArray<u64>>) -> Result<Pri
 
     use PhysicalType::*;
     Ok(match array.data_type().to_physical_type() {
-        // Boolean => hash_boolean(array.as_any().downcast_ref().unwrap()),
+        Boolean => hash_boolean(array.as_any().downcast_ref().unwrap(), seed),
         Primitive(primitive) => with_match_primitive_type!(primitive, |$T| {
             hash_primitive::<$T>(array.as_any().downcast_ref().unwrap(), seed)
         }),
@@ -137,6 +167,35 @@ pub fn hash(array: &dyn Array, seed: Option<&PrimitiveArray<u64>>) -> Result<Pri
     })
 }
 
+/// Hashes each row of the arrays, which must all have the same length, by chaining the hashes of each array as seeds
+pub fn hash_rows(arrays: &[&dyn Array]) -> Result<PrimitiveArray<u64>> {
+    let mut hashes = hash(arrays[0], None)?;
+    for array in &arrays[1..] {
+        hashes = hash(*array, Some(&hashes))?;
+    }
+    Ok(hashes)
+}
+
+/// Hasher for keys that are already hashes, which uses them as they are
+#[derive(Default)]
+pub struct IdentityHasher(u64);
+
+impl Hasher for IdentityHasher {
+    fn finish(&self) -> u64 {
+        self.0
+    }
+
+    fn write(&mut self, _bytes: &[u8]) {
+        unreachable!("IdentityHasher can only hash u64 values")
+    }
+
+    fn write_u64(&mut self, i: u64) {
+        self.0 = i;
+    }
+}
+
+pub type IdentityBuildHasher = BuildHasherDefault<IdentityHasher>;
+
 #[pyfunction]
 pub fn hash_pyarrow_array(
     pyarray: &PyAny,
@@ -176,3 +235,37 @@ pub fn hash_pyarrow_array(
         Ok(s) => ffi::to_py_array(Box::new(s), py, pyarrow),
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use std::collections::HashSet;
+
+    use super::*;
+
+    #[test]
+    fn check_null_hashes_depend_on_seed() -> Result<()> {
+        let seed = PrimitiveArray::<u64>::from_vec(vec![1, 2]);
+        let arrays: Vec<Box<dyn Array>> = vec![
+            Box::new(PrimitiveArray::<i64>::from(vec![None, None])),
+            Box::new(PrimitiveArray::<f64>::from(vec![None, None])),
+            Box::new(BooleanArray::from(vec![None, None])),
+            Box::new(Utf8Array::<i32>::from(vec![None::<&str>, None])),
+            Box::new(BinaryArray::<i32>::from(vec![None::<&[u8]>, None])),
+        ];
+        for array in arrays {
+            let hashes = hash(array.as_ref(), Some(&seed))?;
+            assert_ne!(hashes.value(0), hashes.value(1));
+        }
+        Ok(())
+    }
+
+    #[test]
+    fn check_hash_rows_with_null_keys_are_distinct() -> Result<()> {
+        let first = PrimitiveArray::<i64>::from_vec((0..1000).collect());
+        let second = PrimitiveArray::<i64>::from(vec![None; 1000]);
+        let hashes = hash_rows(&[&first, &second])?;
+        let distinct = hashes.values_iter().collect::<HashSet<_>>();
+        assert_eq!(distinct.len(), 1000);
+        Ok(())
+    }
+}
@@ -0,0 +1,207 @@
+use std::{cmp::Ordering, collections::HashMap, iter::zip};
+
+use arrow2::{
+    array::ord::{build_compare, DynComparator},
+    array::{Array, PrimitiveArray},
+    datatypes::{DataType, PhysicalType, PrimitiveType},
+    error::{Error, Result},
+};
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyList;
+
+use crate::ffi;
+use crate::kernels::hashing::{hash_rows, IdentityBuildHasher};
+
+/// Returns whether each row has no nulls or NaNs in any of its keys, since such keys never match any other keys
+fn valid_rows(arrays: &[&dyn Array]) -> Vec<bool> {
+    let mut valid = vec![true; arrays[0].len()];
+    for array in arrays {
+        if let Some(validity) = array.validity() {
+            for (v, is_valid) in zip(valid.iter_mut(), validity.iter()) {
+                *v &= is_valid;
+            }
+        }
+        match array.data_type().to_physical_type() {
+            PhysicalType::Primitive(PrimitiveType::Float32) => {
+                let array = array
+                    .as_any()
+                    .downcast_ref::<PrimitiveArray<f32>>()
+                    .unwrap();
+                for (v, value) in zip(valid.iter_mut(), array.values_iter()) {
+                    *v &= !value.is_nan();
+                }
+            }
+            PhysicalType::Primitive(PrimitiveType::Float64) => {
+                let array = array
+                    .as_any()
+                    .downcast_ref::<PrimitiveArray<f64>>()
+                    .unwrap();
+                for (v, value) in zip(valid.iter_mut(), array.values_iter()) {
+                    *v &= !value.is_nan();
+                }
+            }
+            _ => {}
+        }
+    }
+    valid
+}
+
+fn check_keys(arrays: &[&dyn Array], side: &str) -> Result<usize> {
+    let len = arrays[0].len();
+    if let Some(array) = arrays.iter().find(|array| array.len() != len) {
+        return Err(Error::InvalidArgumentError(format!(
+            "{side} key lengths do not match: {} vs {}",
+            len,
+            array.len()
+        )));
+    }
+    Ok(len)
+}
+
+/// Inner joins the rows of `left` and `right` on their keys, returning the indices of the matching left and right rows
+///
+/// Each of `left` and `right` holds one array for each key column. The right rows are built into a hash table, which
+/// is probed by each left row in order, so the left indices are in ascending order. Rows with a null or NaN in any of
+/// their keys do not match any rows.
+pub fn hash_join(
+    left: &[&dyn Array],
+    right: &[&dyn Array],
+) -> Result<(PrimitiveArray<u64>, PrimitiveArray<u64>)> {
+    if left.is_empty() || left.len() != right.len() {
+        return Err(Error::InvalidArgumentError(format!(
+            "expected the same nonzero number of left and right keys, got {} vs {}",
+            left.len(),
+            right.len()
+        )));
+    }
+    for (l, r) in zip(left, right) {
+        if l.data_type() != r.data_type() {
+            return Err(Error::InvalidArgumentError(format!(
+                "left and right key data types do not match: {:?} vs {:?}",
+                l.data_type(),
+                r.data_type()
+            )));
+        }
+    }
+    let left_len = check_keys(left, "left")?;
+    let right_len = check_keys(right, "right")?;
+
+    let comparators = zip(left, right)
+        .map(|(l, r)| build_compare(*l, *r))
+        .collect::<Result<Vec<DynComparator>>>()?;
+    let left_hashes = hash_rows(left)?;
+    let right_hashes = hash_rows(right)?;
+
+    let mut table: HashMap<u64, Vec<u64>, IdentityBuildHasher> =
+        HashMap::with_capacity_and_hasher(right_len, Default::default());
+    for (j, (h, valid)) in zip(right_hashes.values_iter(), valid_rows(right)).enumerate() {
+        if valid {
+            table.entry(*h).or_default().push(j as u64);
+        }
+    }
+
+    let mut left_indices: Vec<u64> = Vec::with_capacity(left_len);
+    let mut right_indices: Vec<u64> = Vec::with_capacity(left_len);
+    for (i, (h, valid)) in zip(left_hashes.values_iter(), valid_rows(left)).enumerate() {
+        if !valid {
+            continue;
+        }
+        if let Some(candidates) = table.get(h) {
+            // Rows with the same hash may still have different keys
+            for j in candidates {
+                if comparators
+                    .iter()
+                    .all(|cmp| cmp(i, *j as usize) == Ordering::Equal)
+                {
+                    left_indices.push(i as u64);
+                    right_indices.push(*j);
+                }
+            }
+        }
+    }
+
+    Ok((
+        PrimitiveArray::<u64>::new(DataType::UInt64, left_indices.into(), None),
+        PrimitiveArray::<u64>::new(DataType::UInt64, right_indices.into(), None),
+    ))
+}
+
+#[pyfunction]
+pub fn hash_join_pyarrow_arrays(
+    left_arrays: &PyList,
+    right_arrays: &PyList,
+    py: Python,
+    pyarrow: &PyModule,
+) -> PyResult<(PyObject, PyObject)> {
+    if left_arrays.len() != right_arrays.len() {
+        return Err(PyValueError::new_err(
+            "number of columns for left arrays and right arrays does not match",
+        ));
+    }
+    let mut rleft_arrays: Vec<Box<dyn Array>> = Vec::with_capacity(left_arrays.len());
+    let mut rright_arrays: Vec<Box<dyn Array>> = Vec::with_capacity(right_arrays.len());
+
+    for (left_arr, right_arr) in zip(left_arrays.iter(), right_arrays.iter()) {
+        rleft_arrays.push(ffi::array_to_rust(left_arr)?);
+        rright_arrays.push(ffi::array_to_rust(right_arr)?);
+    }
+
+    let left_arrays_refs = rleft_arrays
+        .iter()
+        .map(Box::as_ref)
+        .collect::<Vec<&dyn Array>>();
+    let right_arrays_refs = rright_arrays
+        .iter()
+        .map(Box::as_ref)
+        .collect::<Vec<&dyn Array>>();
+
+    let result_idx = py.allow_threads(move || hash_join(&left_arrays_refs, &right_arrays_refs));
+    match result_idx {
+        Err(e) => Err(PyValueError::new_err(e.to_string())),
+        Ok((left_idx, right_idx)) => Ok((
+            ffi::to_py_array(Box::new(left_idx), py, pyarrow)?,
+            ffi::to_py_array(Box::new(right_idx), py, pyarrow)?,
+        )),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn check_hash_join_multiple_keys_with_nulls() -> Result<()> {
+        // Rows with a null in any key do not match, and rows whose other keys differ do not share a hash chain
+        let num_rows = 10_000;
+        let left_first = PrimitiveArray::<i64>::from_vec((0..num_rows).collect());
+        let left_second = PrimitiveArray::<i64>::from(
+            (0..num_rows)
+                .map(|i| if i % 2 == 0 { None } else { Some(i) })
+                .collect::<Vec<_>>(),
+        );
+        let right_first = PrimitiveArray::<i64>::from_vec((0..num_rows).rev().collect());
+        let right_second = PrimitiveArray::<i64>::from(
+            (0..num_rows)
+                .rev()
+                .map(|i| if i % 3 == 0 { None } else { Some(i) })
+                .collect::<Vec<_>>(),
+        );
+        let (left_indices, right_indices) =
+            hash_join(&[&left_first, &left_second], &[&right_first, &right_second])?;
+
+        let expected = (0..num_rows)
+            .filter(|i| i % 2 != 0 && i % 3 != 0)
+            .collect::<Vec<_>>();
+        assert_eq!(left_indices.len(), expected.len());
+        for ((l, r), i) in zip(
+            zip(left_indices.values_iter(), right_indices.values_iter()),
+            expected,
+        ) {
+            assert_eq!(*l, i as u64);
+            assert_eq!(*r, (num_rows - 1 - i) as u64);
+        }
+        Ok(())
+    }
+}
@@ -1,4 +1,6 @@
+pub mod groupby;
 pub mod hashing;
+pub mod join;
 pub mod utf8;
 
 pub mod search_sorted;
@@ -16,6 +18,22 @@ pub fn register_kernels(py: Python, parent: &PyModule) -> PyResult<()> {
         search_sorted::search_sorted_multiple_pyarrow_array,
         kernels_mod
     )?)?;
+    kernels_mod.add_function(wrap_pyfunction!(
+        join::hash_join_pyarrow_arrays,
+        kernels_mod
+    )?)?;
+    kernels_mod.add_function(wrap_pyfunction!(
+        groupby::group_rows_pyarrow_arrays,
+        kernels_mod
+    )?)?;
+    kernels_mod.add_function(wrap_pyfunction!(
+        groupby::grouped_aggregate_pyarrow_array,
+        kernels_mod
+    )?)?;
+    kernels_mod.add_function(wrap_pyfunction!(
+        groupby::group_order_pyarrow_array,
+        kernels_mod
+    )?)?;
     parent.add_submodule(kernels_mod)?;
     Ok(())
 }
@@ -11,6 +11,7 @@ import pyarrow.parquet as papq
 import pytest
 
 from daft.dataframe import DataFrame
+from daft.execution import scan_planning
 from daft.types import ExpressionType
 
 
@@ -310,3 +311,17 @@ def test_create_dataframe_parquet_column_projection(valid_data: list[dict[str, f
         pd_df = df.to_pandas()
         assert list(pd_df.columns) == col_subset
         assert len(pd_df) == len(valid_data)
+
+
+def test_create_dataframe_parquet_split_by_row_groups(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "data.parquet")
+    table = pa.Table.from_pydict({"foo": list(range(100))})
+    # Disable compression, dictionaries and statistics so that all row groups have the same size
+    papq.write_table(table, path, row_group_size=10, compression="NONE", use_dictionary=False, write_statistics=False)
+    row_group_size = papq.ParquetFile(path).metadata.row_group(0).column(0).total_compressed_size
+
+    # Target two row groups per partition
+    monkeypatch.setattr(scan_planning, "DEFAULT_TARGET_PARTITION_SIZE_BYTES", 2 * row_group_size)
+    df = DataFrame.read_parquet(path)
+    assert df.num_partitions() == 5
+    assert df.to_pandas()["foo"].tolist() == list(range(100))
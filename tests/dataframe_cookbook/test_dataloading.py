@@ -1,14 +1,38 @@
 from __future__ import annotations
 
 import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
+import pyarrow as pa
 import pytest
+from pyarrow import ipc
+from pyarrow import parquet as pq
 
+from daft import filesystem
+from daft.context import get_context
 from daft.dataframe import DataFrame
+from daft.dataframe.schema_cache import get_schema_cache
+from daft.errors import SchemaMismatchError
+from daft.execution.scan_planning import SCAN_TASK_PATH_COLUMN_NAME
 from daft.expressions import col
-from daft.filesystem import get_filesystem_from_path
-from daft.types import PythonExpressionType
+from daft.filesystem import (
+    DiskCache,
+    DiskCacheStats,
+    FileVersion,
+    clear_filesystem_pool,
+    clear_listing_cache,
+    disable_disk_cache,
+    enable_disk_cache,
+    get_filesystem,
+    get_filesystem_from_path,
+    glob_path_with_stats,
+)
+from daft.logical.logical_plan import TabularFilesScan
+from daft.runners.partitioning import PartitionSetFactory
+from daft.types import ExpressionType, PythonExpressionType
 from tests.assets.assets import (
     IRIS_CSV,
     SERVICE_REQUESTS_PARQUET,
@@ -41,6 +65,173 @@ def test_load_parquet(parquet_path, service_requests_csv_pd_df, repartition_npar
     assert_df_equals(daft_pd_df, pd_slice)
 
 
+def test_load_parquet_with_filter(tmp_path: pathlib.Path):
+    """Filters pushed into a Parquet scan return the same rows, even if the filtered column is not selected"""
+    pd_df = pd.read_csv(IRIS_CSV)
+    parquet_file = tmp_path / "iris.parquet"
+    pd_df.to_parquet(parquet_file, row_group_size=20, index=False)
+
+    daft_df = DataFrame.read_parquet(str(parquet_file))
+    daft_df = daft_df.where((col("sepal.length") > 6.5) & (col("variety") != "Setosa")).select(col("petal.width"))
+    pd_slice = pd_df[(pd_df["sepal.length"] > 6.5) & (pd_df["variety"] != "Setosa")][["petal.width"]]
+    assert_df_equals(daft_df.to_pandas(), pd_slice, assert_ordering=True)
+
+
+@pytest.mark.parametrize("num_rows", [0, 5, 30, 1000])
+def test_load_parquet_with_limit(tmp_path: pathlib.Path, num_rows):
+    """Limits pushed into a Parquet scan stop reading once enough rows are read, with or without a filter"""
+    pd_df = pd.read_csv(IRIS_CSV)
+    parquet_file = tmp_path / "iris.parquet"
+    pd_df.to_parquet(parquet_file, row_group_size=20, index=False)
+
+    daft_df = DataFrame.read_parquet(str(parquet_file))
+    assert_df_equals(daft_df.limit(num_rows).to_pandas(), pd_df.head(num_rows), assert_ordering=True)
+
+    daft_df = daft_df.where(col("variety") != "Setosa").limit(num_rows)
+    pd_slice = pd_df[pd_df["variety"] != "Setosa"].head(num_rows)
+    assert_df_equals(daft_df.to_pandas(), pd_slice, assert_ordering=True)
+
+
+@pytest.mark.parametrize("target_partition_size_bytes", [None, 1, 1_000, 1_000_000])
+def test_load_csv_many_files_into_target_size_partitions(tmp_path: pathlib.Path, target_partition_size_bytes):
+    """Small files are grouped into partitions of up to the target size"""
+    pd_df = pd.read_csv(IRIS_CSV)
+    for i in range(0, len(pd_df), 10):
+        pd_df.iloc[i : i + 10].to_csv(tmp_path / f"iris-{i:03}.csv", index=False)
+
+    daft_df = DataFrame.read_csv(str(tmp_path / "*.csv"), target_partition_size_bytes=target_partition_size_bytes)
+    num_files = len(range(0, len(pd_df), 10))
+    if target_partition_size_bytes is None or target_partition_size_bytes == 1:
+        assert daft_df.num_partitions() == num_files
+    elif target_partition_size_bytes == 1_000_000:
+        assert daft_df.num_partitions() == 1
+    else:
+        assert 1 < daft_df.num_partitions() < num_files
+    assert_df_equals(daft_df.to_pandas(), pd_df, assert_ordering=True)
+
+
+def test_load_parquet_hive_partitioned(tmp_path: pathlib.Path):
+    """Hive-style partition directories are read as columns, and directories not matching a filter are never opened"""
+    pd_df = pd.read_csv(IRIS_CSV)
+    DataFrame.read_csv(IRIS_CSV).write_parquet(str(tmp_path), partition_cols=["variety"])
+
+    daft_df = DataFrame.read_parquet(str(tmp_path / "**" / "*.parquet"))
+    assert daft_df.schema()["variety"].dtype == ExpressionType.string()
+    filtered_df = daft_df.where(col("variety") == "Virginica").select(col("sepal.length"), col("variety"))
+    partition_column_df = daft_df.where(col("variety") != "Setosa").select(col("variety"))
+
+    # Files in pruned directories are never opened, so they may even be corrupted after the DataFrame is created
+    for corrupted_file in (tmp_path / "variety=Setosa").iterdir():
+        corrupted_file.write_text("not a parquet file")
+
+    pd_slice = pd_df[pd_df["variety"] == "Virginica"][["sepal.length", "variety"]]
+    assert_df_equals(filtered_df.to_pandas(), pd_slice, assert_ordering=True)
+    pd_slice = pd_df[pd_df["variety"] != "Setosa"][["variety"]]
+    assert_df_equals(partition_column_df.to_pandas(), pd_slice, sort_key="variety")
+
+
+def test_load_parquet_hive_partitioned_prunes_when_planning(tmp_path: pathlib.Path):
+    """Files in partition directories not matching a filter are removed from the read tasks when the plan is optimized"""
+    DataFrame.read_csv(IRIS_CSV).write_parquet(str(tmp_path), partition_cols=["variety"])
+    daft_df = DataFrame.read_parquet(str(tmp_path / "**" / "*.parquet")).where(col("variety") == "Virginica")
+
+    optimized_plan = get_context().runner().optimize(daft_df.plan())
+    [scan] = [node for node in optimized_plan.post_order() if isinstance(node, TabularFilesScan)]
+    scan_tasks = scan._filepaths_child._cache_entry.value.to_pydict()
+    assert len(scan_tasks[SCAN_TASK_PATH_COLUMN_NAME]) > 0
+    assert all("variety=Virginica" in path for path in scan_tasks[SCAN_TASK_PATH_COLUMN_NAME])
+    assert scan.num_partitions() == daft_df.num_partitions()
+
+
+def test_load_parquet_hive_partitioned_ignores_directories_above_path(tmp_path: pathlib.Path):
+    """Only `<column>=<value>` directories below the read path become columns"""
+    table_dir = tmp_path / "env=prod" / "table"
+    DataFrame.read_csv(IRIS_CSV).write_parquet(str(table_dir), partition_cols=["variety"])
+
+    daft_df = DataFrame.read_parquet(str(table_dir / "**" / "*.parquet"))
+    assert "env" not in daft_df.column_names
+    assert "variety" in daft_df.column_names
+
+    daft_df = DataFrame.read_parquet(str(table_dir / "variety=Setosa"))
+    assert "env" not in daft_df.column_names
+    assert "variety" not in daft_df.column_names
+
+
+def test_load_csv_many_files_unify_schemas(tmp_path: pathlib.Path):
+    """Column types are unified across all sampled files, instead of taken from the first file"""
+    (tmp_path / "0.csv").write_text("a,b\n1,x\n2,y\n")
+    (tmp_path / "1.csv").write_text("a,b\n3.5,z\n")
+
+    daft_df = DataFrame.read_csv(str(tmp_path / "*.csv"))
+    assert daft_df.schema()["a"].dtype == ExpressionType.float()
+    pd_df = pd.DataFrame({"a": [1.0, 2.0, 3.5], "b": ["x", "y", "z"]})
+    assert_df_equals(daft_df.to_pandas(), pd_df, assert_ordering=True)
+
+
+@pytest.mark.parametrize("repartition_nparts", [1, 2])
+def test_load_parquet_many_files_unify_schemas(tmp_path: pathlib.Path, repartition_nparts):
+    """Columns of Parquet files are cast to the types unified across all sampled files"""
+    pq.write_table(
+        pa.table({"a": pa.array([1, 2], type=pa.int64()), "b": ["x", "y"], "c": [1, 2]}), tmp_path / "0.parquet"
+    )
+    pq.write_table(pa.table({"a": pa.array([3.5], type=pa.float64()), "b": ["z"], "c": [None]}), tmp_path / "1.parquet")
+
+    daft_df = DataFrame.read_parquet(str(tmp_path / "*.parquet"))
+    assert daft_df.schema()["a"].dtype == ExpressionType.float()
+    assert daft_df.schema()["b"].dtype == ExpressionType.string()
+    assert daft_df.schema()["c"].dtype == ExpressionType.integer()
+
+    daft_df = daft_df.repartition(repartition_nparts).with_column("a_plus_one", col("a") + 1.0)
+    pd_df = pd.DataFrame({"a": [1.0, 2.0, 3.5], "b": ["x", "y", "z"], "c": [1, 2, None], "a_plus_one": [2.0, 3.0, 4.5]})
+    assert_df_equals(daft_df.to_pandas(), pd_df, sort_key="a")
+
+
+def test_load_parquet_many_files_mismatched_schemas(tmp_path: pathlib.Path):
+    """Files that store a column as types that can not be unified without loss raise an error"""
+    pq.write_table(pa.table({"a": [1, 2]}), tmp_path / "0.parquet")
+    pq.write_table(pa.table({"a": [True]}), tmp_path / "1.parquet")
+
+    with pytest.raises(SchemaMismatchError, match="Column a has mismatched types"):
+        DataFrame.read_parquet(str(tmp_path / "*.parquet"))
+
+
+def test_load_parquet_many_files_missing_columns(tmp_path: pathlib.Path):
+    """Columns of the unified schema that are missing from a Parquet file are read as nulls"""
+    pq.write_table(pa.table({"a": [1, 2], "b": ["x", "y"]}), tmp_path / "0.parquet")
+    pq.write_table(pa.table({"a": [3]}), tmp_path / "1.parquet")
+
+    daft_df = DataFrame.read_parquet(str(tmp_path / "*.parquet"))
+    pd_df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None]})
+    assert_df_equals(daft_df.to_pandas(), pd_df, sort_key="a")
+
+
+def test_load_arrow_ipc_many_files_unify_schemas(tmp_path: pathlib.Path):
+    """Columns of Arrow IPC files are cast to the types unified across all sampled files"""
+    for i, table in enumerate([pa.table({"a": pa.array([1, 2], type=pa.int64())}), pa.table({"a": [3.5]})]):
+        with ipc.new_file(str(tmp_path / f"{i}.arrow"), table.schema) as writer:
+            writer.write_table(table)
+
+    daft_df = DataFrame.read_arrow_ipc(str(tmp_path / "*.arrow"))
+    assert daft_df.schema()["a"].dtype == ExpressionType.float()
+    assert_df_equals(daft_df.to_pandas(), pd.DataFrame({"a": [1.0, 2.0, 3.5]}), sort_key="a")
+
+
+def test_load_csv_schema_cache(tmp_path: pathlib.Path):
+    """Schemas inferred from unchanged files are reused, and changed files have their schemas inferred again"""
+    get_schema_cache().clear()
+    csv = tmp_path / "data.csv"
+    csv.write_text("a,b\n1,x\n")
+    assert DataFrame.read_csv(str(csv)).schema()["a"].dtype == ExpressionType.integer()
+    assert len(get_schema_cache()) == 1
+
+    # Reading the same file with different options infers a separate schema
+    DataFrame.read_csv(str(csv), has_headers=False)
+    assert len(get_schema_cache()) == 2
+
+    csv.write_text("a,b\n1.5,x\n2.5,y\n")
+    assert DataFrame.read_csv(str(csv)).schema()["a"].dtype == ExpressionType.float()
+
+
 def test_load_csv_no_headers(tmp_path: pathlib.Path):
     """Generate a default set of headers `f0, f1, ... f{n}` when loading a CSV that has no headers"""
     csv = tmp_path / "headerless_iris.csv"
@@ -190,3 +381,148 @@ def test_glob_files_recursive(tmpdir):
     pd_df = pd.DataFrame.from_records(listing_records)
 
     assert_df_equals(daft_pd_df, pd_df, sort_key="path")
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        "*.foo",
+        "*/*.foo",
+        "**",
+        "**/*.foo",
+        "bar/**/file_?.foo",
+        "bar/*/file_[0-4].foo",
+        "b?r/ba*/*.foo",
+        "*/baz/**",
+        "missing/*",
+    ],
+)
+def test_glob_files_matches_fsspec(tmpdir, pattern):
+    """Directories are listed concurrently, matching the same paths as a sequential fsspec glob"""
+    for prefix in [pathlib.Path(tmpdir), pathlib.Path(tmpdir) / "bar", pathlib.Path(tmpdir) / "bar" / "baz"]:
+        prefix.mkdir(exist_ok=True)
+        for i in range(10):
+            (prefix / f"file_{i}.foo").write_text("a" * i)
+            (prefix / f"file_{i}.bar").write_text("b" * i)
+
+    fs = get_filesystem_from_path(str(tmpdir))
+    expected = fs.glob(f"{tmpdir}/{pattern}", detail=True)
+    listing = glob_path_with_stats(f"{tmpdir}/{pattern}")
+    assert [f.path for f in listing] == list(expected.keys())
+    assert [f.size for f in listing] == [details["size"] for details in expected.values()]
+
+
+def test_glob_files_recursive_lists_directories_concurrently(tmpdir, monkeypatch):
+    """The directories of each level of a recursive glob are listed at the same time"""
+    directories = [pathlib.Path(tmpdir) / f"dir_{i}" for i in range(4)]
+    for directory in directories:
+        (directory / "nested").mkdir(parents=True)
+        (directory / "file.foo").write_text("a")
+        (directory / "nested" / "file.foo").write_text("b")
+
+    fs = get_filesystem_from_path(str(tmpdir))
+    expected = fs.glob(f"{tmpdir}/**/*.foo", detail=True)
+
+    # Listing any of the directories blocks until all of them are being listed
+    barrier = threading.Barrier(len(directories), timeout=10)
+    ls = fs.ls
+
+    def waiting_ls(path, *args, **kwargs):
+        if pathlib.Path(path) in directories:
+            barrier.wait()
+        return ls(path, *args, **kwargs)
+
+    monkeypatch.setattr(fs, "ls", waiting_ls)
+    listing = glob_path_with_stats(f"{tmpdir}/**/*.foo")
+    assert [f.path for f in listing] == list(expected.keys())
+    assert len(listing) == 2 * len(directories)
+
+
+def test_glob_files_into_many_partitions(tmpdir, monkeypatch):
+    monkeypatch.setattr(PartitionSetFactory, "FS_LISTING_PARTITION_NUM_ROWS", 3)
+    for i in range(10):
+        (pathlib.Path(tmpdir) / f"file_{i}.foo").write_text("a" * i)
+
+    daft_df = DataFrame.from_glob_path(f"{tmpdir}/*.foo")
+    assert daft_df.num_partitions() == 4
+    assert daft_df.to_pandas()["path"].tolist() == [str(pathlib.Path(tmpdir) / f"file_{i}.foo") for i in range(10)]
+
+
+def test_filesystem_pool():
+    """Filesystems are shared across threads and calls, and only recreated for different options or after clearing"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        filesystems = list(executor.map(lambda _: get_filesystem("file"), range(32)))
+    assert all(fs is filesystems[0] for fs in filesystems)
+    assert get_filesystem_from_path("/tmp/foo.csv") is filesystems[0]
+    assert get_filesystem("file", auto_mkdir=True) is not filesystems[0]
+    assert get_filesystem("file", auto_mkdir=True) is get_filesystem("file", auto_mkdir=True)
+
+    clear_filesystem_pool()
+    assert get_filesystem("file") is not filesystems[0]
+
+
+def test_disk_cache_evicts_least_recently_used(tmpdir):
+    cache = DiskCache(str(tmpdir), max_bytes=25)
+    versions = [FileVersion(path=f"s3://bucket/file_{i}", size=10, mtime=0) for i in range(3)]
+
+    cache.put(versions[0], b"0" * 10)
+    cache.put(versions[1], b"1" * 10)
+    assert cache.get(versions[0]) == b"0" * 10
+    time.sleep(0.01)
+    cache.put(versions[2], b"2" * 10)
+
+    # The second file was least recently used, so it is evicted to stay within capacity
+    assert cache.get(versions[1]) is None
+    assert cache.get(versions[0]) == b"0" * 10
+    assert cache.get(versions[2]) == b"2" * 10
+    assert cache.get(FileVersion(path="s3://bucket/file_0", size=10, mtime=1)) is None
+    assert cache.size_bytes() == 20
+    assert cache.stats() == DiskCacheStats(hits=3, misses=2, evictions=1)
+
+    # Another cache sharing the same directory sees the same entries
+    assert DiskCache(str(tmpdir), max_bytes=25).get(versions[2]) == b"2" * 10
+
+
+def test_load_csv_disk_cache(tmpdir):
+    """Remote files are read from the local disk cache after they are first downloaded"""
+    fs = get_filesystem_from_path("memory://")
+    fs.pipe("/test_load_csv_disk_cache/file.csv", b"a,b\n1,foo\n2,bar\n")
+    path = "memory://test_load_csv_disk_cache/file.csv"
+
+    cache = enable_disk_cache(str(tmpdir))
+    try:
+        for _ in range(2):
+            df = DataFrame.read_csv(path)
+            assert df.to_pandas().to_dict(orient="list") == {"a": [1, 2], "b": ["foo", "bar"]}
+        assert cache.stats() == DiskCacheStats(hits=1, misses=1, evictions=0)
+
+        # Files are downloaded again when they are modified
+        time.sleep(0.01)
+        fs.pipe("/test_load_csv_disk_cache/file.csv", b"a,b\n3,baz\n")
+        df = DataFrame.read_csv(path)
+        assert df.to_pandas().to_dict(orient="list") == {"a": [3], "b": ["baz"]}
+        assert cache.stats() == DiskCacheStats(hits=1, misses=2, evictions=0)
+    finally:
+        disable_disk_cache()
+
+
+def test_glob_files_listing_cache(monkeypatch):
+    """Listings of remote filesystems are only cached when enabled, until they expire or are cleared"""
+    fs = get_filesystem_from_path("memory://")
+    fs.pipe("/test_glob_files_listing_cache/file_0.foo", b"a")
+    path = "memory://test_glob_files_listing_cache/*.foo"
+    assert len(glob_path_with_stats(path)) == 1
+
+    # Listings are not cached by default, so files written by other processes are always seen
+    fs.pipe("/test_glob_files_listing_cache/file_1.foo", b"a")
+    assert len(glob_path_with_stats(path)) == 2
+
+    monkeypatch.setattr(filesystem, "_LISTING_CACHE_TTL_SECONDS", 60)
+    fs.pipe("/test_glob_files_listing_cache/file_2.foo", b"a")
+    assert len(glob_path_with_stats(path)) == 3
+    fs.pipe("/test_glob_files_listing_cache/file_3.foo", b"a")
+    assert len(glob_path_with_stats(path)) == 3
+
+    clear_listing_cache()
+    assert len(glob_path_with_stats(path)) == 4
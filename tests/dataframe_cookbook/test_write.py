@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from daft.dataframe import DataFrame
@@ -23,6 +25,10 @@ def test_parquet_write_with_partitioning(tmp_path):
     pd_df = df.write_parquet(tmp_path, partition_cols=["Borough"])
 
     read_back_pd_df = DataFrame.read_parquet(tmp_path.as_posix() + "/**/*.parquet").to_pandas()
+    assert_df_equals(df.to_pandas(), read_back_pd_df)
+
+    # Partition columns are not discovered from the directories when Hive partitioning is disabled
+    read_back_pd_df = DataFrame.read_parquet(tmp_path.as_posix() + "/**/*.parquet", hive_partitioning=False).to_pandas()
     assert_df_equals(df.exclude("Borough").to_pandas(), read_back_pd_df)
 
     assert len(pd_df.to_pandas()) == 5
@@ -48,3 +54,74 @@ def test_csv_write_with_partitioning(tmp_path):
     assert_df_equals(df.exclude("Borough").to_pandas(), read_back_pd_df)
 
     assert len(pd_df.to_pandas()) == 5
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_arrow_ipc_write(tmp_path, compression):
+    df = DataFrame.read_csv(SERVICE_REQUESTS_CSV)
+
+    pd_df = df.write_arrow_ipc(tmp_path, compression=compression)
+    read_back_pd_df = DataFrame.read_arrow_ipc(tmp_path.as_posix() + "/*.arrow").to_pandas()
+    assert_df_equals(df.to_pandas(), read_back_pd_df)
+
+    assert len(pd_df.to_pandas()) == 1
+
+
+def test_arrow_ipc_write_with_partitioning(tmp_path):
+    df = DataFrame.read_csv(SERVICE_REQUESTS_CSV)
+
+    pd_df = df.write_arrow_ipc(tmp_path, partition_cols=["Borough"])
+
+    read_back_pd_df = DataFrame.read_arrow_ipc(tmp_path.as_posix() + "/**/*.arrow").to_pandas()
+    assert_df_equals(df.to_pandas(), read_back_pd_df)
+
+    assert len(pd_df.to_pandas()) == 5
+
+
+def test_parquet_write_max_rows_per_file(tmp_path):
+    df = DataFrame.read_csv(SERVICE_REQUESTS_CSV)
+    num_rows = len(df.to_pandas())
+
+    pd_df = df.write_parquet(tmp_path, max_rows_per_file=10).to_pandas()
+    read_back_pd_df = DataFrame.read_parquet(tmp_path.as_posix() + "/*.parquet").to_pandas()
+    assert_df_equals(df.to_pandas(), read_back_pd_df)
+
+    assert len(pd_df) == (num_rows + 9) // 10
+    for path in pd_df["file_path"]:
+        assert len(DataFrame.read_parquet(path).to_pandas()) <= 10
+
+
+def test_parquet_write_target_file_size(tmp_path):
+    df = DataFrame.read_csv(SERVICE_REQUESTS_CSV)
+
+    pd_df = df.write_parquet(tmp_path, target_file_size_bytes=1024).to_pandas()
+    read_back_pd_df = DataFrame.read_parquet(tmp_path.as_posix() + "/*.parquet").to_pandas()
+    assert_df_equals(df.to_pandas(), read_back_pd_df)
+
+    assert len(pd_df) > 1
+
+
+@pytest.mark.parametrize("write_fn", ["write_parquet", "write_csv"])
+def test_write_target_file_size_of_encoded_files(tmp_path, write_fn):
+    """Files are rolled over at the target size of the encoded files, rather than of the data in memory"""
+    df = DataFrame.from_pydict(
+        {"id": list(range(100_000)), "category": [f"category-{i % 10}" for i in range(100_000)]}
+    ).repartition(1)
+    target_file_size_bytes = 64 * 1024
+
+    pd_df = getattr(df, write_fn)(tmp_path, target_file_size_bytes=target_file_size_bytes).to_pandas()
+    file_sizes = sorted(os.path.getsize(path) for path in pd_df["file_path"])
+    assert len(file_sizes) > 1
+    assert file_sizes[-1] < 1.5 * target_file_size_bytes
+    # Every file other than the last one of the partition is filled up to about the target size
+    assert file_sizes[1] > 0.5 * target_file_size_bytes
+
+
+def test_csv_write_max_rows_per_file(tmp_path):
+    df = DataFrame.read_csv(SERVICE_REQUESTS_CSV)
+
+    pd_df = df.write_csv(tmp_path, max_rows_per_file=10).to_pandas()
+    read_back_pd_df = DataFrame.read_csv(tmp_path.as_posix() + "/*.csv").to_pandas()
+    assert_df_equals(df.to_pandas(), read_back_pd_df)
+
+    assert len(pd_df) > 1
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from daft import DataFrame
+from daft.context import get_context
+from daft.execution import physical_plan
+from daft.execution.physical_plan import _coalesce_by_size
+from daft.expressions import col
+from daft.logical import logical_plan
+from daft.logical.schema import ExpressionList
+
+
+@pytest.mark.parametrize(
+    ["sizes", "target_bytes", "expected"],
+    [
+        ([1, 1, 1, 1], 10, [4]),
+        ([5, 5, 5, 5], 10, [2, 2]),
+        ([20, 1, 1, 20], 10, [1, 2, 1]),
+        ([0, 0, 0], 0, [3]),
+    ],
+)
+def test_coalesce_by_size(sizes, target_bytes, expected):
+    assert _coalesce_by_size(sizes, target_bytes) == expected
+
+
+@pytest.fixture
+def df() -> DataFrame:
+    data = {"key": [i % 10 for i in range(100)], "value": list(range(100))}
+    return DataFrame.from_pydict(data).repartition(8)
+
+
+def test_groupby_coalesces_small_partitions(df):
+    result = df.groupby(col("key")).agg([(col("value").alias("sum"), "sum")])
+    result.collect()
+    assert result._result.num_partitions() == 1
+    assert sorted(result.to_pydict()["key"]) == list(range(10))
+    assert sorted(result.to_pydict()["sum"]) == sorted(sum(range(k, 100, 10)) for k in range(10))
+
+
+def test_groupby_keeps_partitions_over_target(df, monkeypatch):
+    monkeypatch.setattr(physical_plan, "ADAPTIVE_TARGET_PARTITION_BYTES", 0)
+    result = df.groupby(col("key")).agg([(col("value").alias("sum"), "sum")])
+    result.collect()
+    assert result._result.num_partitions() == 8
+
+
+def test_distinct_coalesces_small_partitions(df):
+    result = df.select(col("key")).distinct()
+    result.collect()
+    assert result._result.num_partitions() == 1
+    assert sorted(result.to_pydict()["key"]) == list(range(10))
+
+
+def test_join_after_coalesced_groupby(df):
+    agged = df.groupby(col("key")).agg([(col("value").alias("sum"), "sum")])
+    other = DataFrame.from_pydict({"key": list(range(10)), "other": list(range(10))}).repartition(8, col("key"))
+    joined = agged.join(other, on=[col("key")]).sort(col("key")).to_pydict()
+    assert joined["key"] == list(range(10))
+    assert joined["other"] == list(range(10))
+
+
+def test_count_rows_after_coalesced_groupby(df):
+    assert df.groupby(col("key")).agg([(col("value").alias("sum"), "sum")]).count_rows() == 10
+
+
+def _adaptive_repartition(df: DataFrame, num_partitions: int) -> DataFrame:
+    return DataFrame(
+        logical_plan.Repartition(
+            df._plan,
+            partition_by=ExpressionList([]),
+            num_partitions=num_partitions,
+            scheme=logical_plan.PartitionScheme.RANDOM,
+            adaptive=True,
+        )
+    )
+
+
+def test_num_partitions_of_coalesced_result(df):
+    repartitioned = _adaptive_repartition(df, 8)
+    assert repartitioned.num_partitions() == 8
+    repartitioned.collect()
+    assert repartitioned._result.num_partitions() == 1
+    assert repartitioned.num_partitions() == 1
+    assert sorted(repartitioned.to_pydict()["value"]) == list(range(100))
+
+
+@pytest.mark.parametrize("limit", [0, 5, 1000])
+def test_limit_after_coalesced_repartition(df, limit, monkeypatch):
+    # Keep the limit from being pushed down below the repartition
+    monkeypatch.setattr(get_context().runner(), "optimize", lambda plan: plan)
+    limited = _adaptive_repartition(df, 8).limit(limit)
+    assert limited.num_partitions() == 8
+    limited.collect()
+    # The output is padded up to the planned number of partitions only if the limit is reached
+    assert limited.num_partitions() == (8 if limit < 100 else 1)
+    assert len(limited.to_pydict()["value"]) == min(limit, 100)
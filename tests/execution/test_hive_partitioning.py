@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from daft.execution.hive_partitioning import (
+    hive_partition_root,
+    hive_partition_values,
+    infer_hive_partition_fields,
+    parse_hive_partitions,
+    partition_might_match,
+)
+from daft.expressions import ExpressionList, col
+from daft.logical.field import Field
+from daft.types import ExpressionType
+
+
+def test_parse_hive_partitions():
+    assert parse_hive_partitions("s3://bucket/table/year=2023/city=New%20York/part-0.parquet", "bucket/table") == {
+        "year": "2023",
+        "city": "New York",
+    }
+    assert parse_hive_partitions("/table/year=__HIVE_DEFAULT_PARTITION__/a=b=c/x=1.parquet", "/table") == {
+        "year": None,
+        "a": "b=c",
+    }
+    assert parse_hive_partitions("/table/part-0.parquet", "/table") == {}
+
+
+def test_parse_hive_partitions_below_root():
+    # Directories above the listed root are not partitions of the listed files
+    assert parse_hive_partitions("/data/env=prod/table/year=2023/0.parquet", "/data/env=prod/table") == {"year": "2023"}
+    assert parse_hive_partitions("/data/env=prod/table/year=2023/0.parquet", "/data/env=prod/table/year=2023") == {}
+    assert parse_hive_partitions("/data/env=prod/0.parquet", "/data/env=prod/0.parquet") == {}
+
+
+def test_hive_partition_root():
+    assert hive_partition_root("file:///data/env=prod/table/**/*.parquet") == "/data/env=prod/table"
+    assert hive_partition_root("/data/env=prod/table/year=*/0.parquet") == "/data/env=prod/table"
+    assert hive_partition_root("/data/env=prod/table/") == "/data/env=prod/table"
+    assert hive_partition_root("/data/env=prod/table/year=2023/0.parquet") == "/data/env=prod/table/year=2023/0.parquet"
+
+
+def test_infer_hive_partition_fields():
+    paths = [
+        "/table/year=2022/score=1/day=2022-01-01/0.parquet",
+        "/table/year=2023/score=1.5/day=2023-01-01/0.parquet",
+        "/table/year=__HIVE_DEFAULT_PARTITION__/score=2/day=2023-01-02/0.parquet",
+    ]
+    fields = infer_hive_partition_fields(paths, "/table")
+    assert fields == [
+        Field("year", ExpressionType.integer()),
+        Field("score", ExpressionType.float()),
+        Field("day", ExpressionType.string()),
+    ]
+    assert hive_partition_values(paths[0], fields, "/table") == {"year": 2022, "score": 1.0, "day": "2022-01-01"}
+    assert hive_partition_values(paths[2], fields, "/table") == {"year": None, "score": 2.0, "day": "2023-01-02"}
+
+
+@pytest.mark.parametrize(
+    ["predicate", "expected"],
+    [
+        (col("year") == 2022, True),
+        (col("year") == 2023, False),
+        (col("year") > 2020, True),
+        ((col("year") == 2023) | (col("day") == "2022-01-01"), True),
+        (col("year").is_null(), False),
+        (col("other") == 1, True),
+    ],
+)
+def test_partition_might_match(predicate, expected):
+    assert partition_might_match(ExpressionList([predicate]), {"year": 2022, "day": "2022-01-01"}) == expected
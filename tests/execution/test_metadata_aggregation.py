@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pathlib
+
+import pyarrow as pa
+import pytest
+from pyarrow import parquet
+
+from daft.dataframe import DataFrame
+from daft.expressions import col
+from daft.runners import partitioning
+
+
+@pytest.fixture(scope="function")
+def parquet_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    for i in range(3):
+        table = pa.table(
+            {
+                "a": list(range(i * 10, i * 10 + 10)),
+                "b": [None if j % 3 == 0 else float(j) for j in range(10)],
+                "c": [str(j) for j in range(10)],
+            }
+        )
+        partition_dir = tmp_path / f"part={i % 2}"
+        partition_dir.mkdir(exist_ok=True)
+        parquet.write_table(table, str(partition_dir / f"{i}.parquet"), row_group_size=4)
+    return tmp_path
+
+
+@pytest.fixture(scope="function")
+def row_groups_read(monkeypatch) -> list[list[int] | None]:
+    """Records the row groups of every Parquet file read"""
+    from_parquet = partitioning.vPartition.from_parquet.__func__
+    row_groups_read = []
+
+    def recording_from_parquet(cls, *args, row_groups=None, **kwargs):
+        row_groups_read.append(row_groups)
+        return from_parquet(cls, *args, row_groups=row_groups, **kwargs)
+
+    monkeypatch.setattr(partitioning.vPartition, "from_parquet", classmethod(recording_from_parquet))
+    return row_groups_read
+
+
+@pytest.mark.parametrize(
+    "predicate, expected_count, expected_row_groups_read",
+    [
+        (None, 30, []),
+        (col("a") >= 10, 20, []),
+        (col("part") == 1, 10, []),
+        (col("a") > 12, 17, [[0]]),
+        (col("a") > 100, 0, []),
+    ],
+)
+def test_count_rows_from_metadata(parquet_dir, row_groups_read, predicate, expected_count, expected_row_groups_read):
+    df = DataFrame.read_parquet(str(parquet_dir / "**" / "*.parquet"))
+    if predicate is not None:
+        df = df.where(predicate)
+    row_groups_read.clear()
+    assert df.count_rows() == expected_count
+    assert row_groups_read == expected_row_groups_read
+
+
+def test_min_max_count_from_metadata(parquet_dir, row_groups_read):
+    df = DataFrame.read_parquet(str(parquet_dir / "**" / "*.parquet"))
+    row_groups_read.clear()
+    assert df.agg([("a", "min"), ("b", "count"), ("part", "max")]).to_pydict() == {"a": [0], "b": [18], "part": [1]}
+    assert row_groups_read == []
+
+    # Only row groups whose statistics can't resolve the predicate are read
+    filtered_df = df.where(col("a") > 12).agg([("a", "min"), ("b", "count")])
+    assert filtered_df.to_pydict() == {"a": [13], "b": [10]}
+    assert row_groups_read == [[0]]
+
+    # Aggregating no rows results in no rows
+    assert df.where(col("a") > 100).agg([("a", "max")]).to_pydict() == {"a": []}
+
+
+def test_min_max_from_inexact_metadata(parquet_dir, row_groups_read):
+    """Statistics of strings and floats may not be exact, so their row groups are read"""
+    df = DataFrame.read_parquet(str(parquet_dir / "**" / "*.parquet"))
+    row_groups_read.clear()
+    assert df.agg([("b", "max"), ("c", "min")]).to_pydict() == {"b": [8.0], "c": ["0"]}
+    assert len(row_groups_read) == 3
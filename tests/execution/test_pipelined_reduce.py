@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from daft import DataFrame
+from daft.context import get_context
+from daft.execution import execution_step, physical_plan, physical_plan_factory
+from daft.expressions import col
+
+NUM_PARTITIONS = 4
+
+
+@pytest.fixture
+def events(monkeypatch) -> list[str]:
+    """Merges fanout outputs as early as possible, and records the order in which fanouts and reduces run
+
+    Steps are run one at a time so that the order is deterministic.
+    """
+    monkeypatch.setattr(get_context().runner(), "_num_threads", 1)
+    monkeypatch.setattr(physical_plan, "PIPELINED_REDUCE_MERGE_BYTES", 0)
+    events: list[str] = []
+
+    def record(cls: type, method: str, event: str) -> None:
+        run = getattr(cls, method)
+
+        def recording_run(self, inputs):
+            events.append(event)
+            return run(self, inputs)
+
+        monkeypatch.setattr(cls, method, recording_run)
+
+    record(execution_step.FanoutHash, "_fanout_hash", "fanout")
+    record(execution_step.FanoutRange, "_fanout_range", "fanout")
+    record(execution_step.ReduceMerge, "_reduce_merge", "reduce")
+    record(execution_step.ReduceMergeAndSort, "_reduce_merge_and_sort", "reduce")
+    return events
+
+
+@pytest.fixture
+def df() -> DataFrame:
+    df = DataFrame.from_pydict({"key": [i % 7 for i in range(100)], "value": list(range(100))})
+    df = df.repartition(NUM_PARTITIONS)
+    df.collect()
+    return df
+
+
+def test_pipelined_repartition(df, events):
+    result = df.repartition(NUM_PARTITIONS, col("key")).to_pydict()
+    assert sorted(zip(result["key"], result["value"])) == sorted((i % 7, i) for i in range(100))
+
+    # Reduces start before the last fanout, and partially reduced partitions are reduced again at the end
+    assert events.index("reduce") < len(events) - events[::-1].index("fanout") - 1
+    assert events.count("reduce") > NUM_PARTITIONS
+
+
+def test_unpipelined_sort(df, events):
+    # Sorting reduces are not pipelined, since they would have to sort their partial reduces again
+    result = df.sort(col("value"), desc=True).to_pydict()
+    assert result["value"] == list(reversed(range(100)))
+    assert events == ["fanout"] * NUM_PARTITIONS + ["reduce"] * NUM_PARTITIONS
+
+
+def test_unpipelined_repartition(df, events, monkeypatch):
+    monkeypatch.setattr(physical_plan, "PIPELINED_REDUCE_MERGE_BYTES", 1024 * 1024 * 1024)
+    df.repartition(NUM_PARTITIONS, col("key")).collect()
+    assert events == ["fanout"] * NUM_PARTITIONS + ["reduce"] * NUM_PARTITIONS
+
+
+def test_reduces_are_not_pipelined_by_default(df, events, monkeypatch):
+    # Runners such as the RayRunner that set results before they materialize use the default
+    get_materializing_physical_plan = physical_plan_factory.get_materializing_physical_plan
+    monkeypatch.setattr(
+        physical_plan_factory,
+        "get_materializing_physical_plan",
+        lambda plan, psets, **kwargs: get_materializing_physical_plan(plan, psets),
+    )
+    df.repartition(NUM_PARTITIONS, col("key")).collect()
+    assert events == ["fanout"] * NUM_PARTITIONS + ["reduce"] * NUM_PARTITIONS
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fsspec
+import pandas as pd
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+
+from daft.context import get_context
+from daft.dataframe import DataFrame
+from daft.execution.prefetching import FilePrefetcher
+from daft.expressions import col
+from daft.filesystem import (
+    cat_file,
+    disable_disk_cache,
+    enable_disk_cache,
+    glob_path_with_stats,
+)
+from tests.conftest import assert_df_equals
+
+
+class ThrottledMemoryFileSystem(MemoryFileSystem):
+    """In-memory filesystem that simulates the latency of fetching files from remote storage"""
+
+    protocol = "throttledmemory"
+    latency_seconds = 0.02
+    lock = threading.Lock()
+    num_fetching = 0
+    max_num_fetching = 0
+    num_bytes_fetched = 0
+    num_whole_files_fetched = 0
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        if path.startswith(f"{cls.protocol}://"):
+            path = path[len(f"{cls.protocol}://") :]
+        return super()._strip_protocol(path)
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        cls = type(self)
+        with cls.lock:
+            cls.num_fetching += 1
+            cls.max_num_fetching = max(cls.max_num_fetching, cls.num_fetching)
+        time.sleep(self.latency_seconds)
+        data = super().cat_file(path, start=start, end=end, **kwargs)
+        with cls.lock:
+            cls.num_fetching -= 1
+            cls.num_bytes_fetched += len(data)
+            cls.num_whole_files_fetched += start is None and end is None
+        return data
+
+
+@pytest.fixture(scope="function")
+def throttled_fs():
+    fsspec.register_implementation(ThrottledMemoryFileSystem.protocol, ThrottledMemoryFileSystem, clobber=True)
+    fs = ThrottledMemoryFileSystem()
+    ThrottledMemoryFileSystem.max_num_fetching = 0
+    ThrottledMemoryFileSystem.num_bytes_fetched = 0
+    ThrottledMemoryFileSystem.num_whole_files_fetched = 0
+    yield fs
+    for path in fs.find("/prefetching"):
+        fs.rm(path)
+
+
+def test_prefetcher_fetches_ahead(throttled_fs):
+    paths = [f"throttledmemory://prefetching/{i}.txt" for i in range(8)]
+    for i, path in enumerate(paths):
+        throttled_fs.pipe(path, bytes([i]) * 10)
+
+    with FilePrefetcher(paths, [10 for _ in paths], num_files=4, max_bytes=30) as prefetcher:
+        for i in range(len(paths)):
+            assert prefetcher.bytes_in_flight() <= 30
+            assert prefetcher.fetch(i) == bytes([i]) * 10
+    assert 1 < ThrottledMemoryFileSystem.max_num_fetching <= 3
+
+
+def test_prefetcher_skips_files(throttled_fs):
+    paths = [f"throttledmemory://prefetching/{i}.txt" for i in range(4)]
+    for i, path in enumerate(paths):
+        throttled_fs.pipe(path, bytes([i]) * 10)
+
+    # Files of unknown size or larger than the budget are not prefetched, and files can be skipped
+    with FilePrefetcher(paths, [10, None, 100, 10], num_files=4, max_bytes=50) as prefetcher:
+        assert prefetcher.fetch(1) is None
+        assert prefetcher.fetch(2) is None
+        assert prefetcher.fetch(3) == bytes([3]) * 10
+        assert prefetcher.bytes_in_flight() == 0
+
+
+def test_prefetcher_disabled(throttled_fs):
+    paths = [f"throttledmemory://prefetching/{i}.txt" for i in range(2)]
+    with FilePrefetcher(paths, [10, 10], num_files=0) as prefetcher:
+        assert prefetcher.fetch(0) is None
+        assert prefetcher.fetch(1) is None
+    assert ThrottledMemoryFileSystem.max_num_fetching == 0
+
+
+def test_read_csv_prefetches_remote_files(throttled_fs):
+    pd_df = pd.DataFrame({"a": list(range(40)), "b": [f"s{i}" for i in range(40)]})
+    for i in range(0, 40, 5):
+        throttled_fs.pipe(f"/prefetching/{i:02}.csv", pd_df.iloc[i : i + 5].to_csv(index=False).encode())
+
+    daft_df = DataFrame.read_csv("throttledmemory://prefetching/*.csv", target_partition_size_bytes=1_000_000)
+    assert daft_df.num_partitions() == 1
+    assert_df_equals(daft_df.to_pandas(), pd_df, assert_ordering=True)
+    assert ThrottledMemoryFileSystem.max_num_fetching > 1
+
+
+@pytest.mark.skipif(get_context().runner_config.name not in {"py"}, reason="requires PyRunner to be in use")
+def test_read_csv_prefetches_files_of_next_read_tasks(throttled_fs, monkeypatch):
+    pd_df = pd.DataFrame({"a": list(range(40)), "b": [f"s{i}" for i in range(40)]})
+    for i in range(0, 40, 5):
+        throttled_fs.pipe(f"/prefetching/{i:02}.csv", pd_df.iloc[i : i + 5].to_csv(index=False).encode())
+    monkeypatch.setattr(get_context().runner(), "_num_threads", 1)
+
+    # Each read task reads a single file, and fetches the files of the next read tasks while decoding it, which the next
+    # read tasks take over instead of fetching them again
+    daft_df = DataFrame.read_csv("throttledmemory://prefetching/*.csv")
+    assert daft_df.num_partitions() == 8
+    assert_df_equals(daft_df.to_pandas(), pd_df, assert_ordering=True)
+    assert ThrottledMemoryFileSystem.max_num_fetching > 1
+    assert ThrottledMemoryFileSystem.num_whole_files_fetched == 8
+
+
+def test_read_parquet_prefetches_only_read_columns(throttled_fs):
+    pd_df = pd.DataFrame({"a": list(range(4000)), **{f"b{i}": [f"s{j}" for j in range(4000)] for i in range(8)}})
+    for i in range(0, 4000, 1000):
+        with throttled_fs.open(f"/prefetching/{i:04}.parquet", "wb") as f:
+            pd_df.iloc[i : i + 1000].to_parquet(f, index=False, row_group_size=250)
+    files_size = sum(throttled_fs.size(path) for path in throttled_fs.ls("/prefetching", detail=False))
+
+    daft_df = DataFrame.read_parquet("throttledmemory://prefetching/*.parquet", target_partition_size_bytes=1_000_000)
+    assert daft_df.num_partitions() == 1
+    ThrottledMemoryFileSystem.max_num_fetching = 0
+    ThrottledMemoryFileSystem.num_bytes_fetched = 0
+
+    # Only the footers and the column chunks of the selected column are fetched, ahead of decoding the files
+    assert_df_equals(daft_df.select(col("a")).to_pandas(), pd_df[["a"]], assert_ordering=True)
+    assert ThrottledMemoryFileSystem.max_num_fetching > 1
+    assert 0 < ThrottledMemoryFileSystem.num_bytes_fetched < files_size / 4
+
+
+def test_read_parquet_splits_fetch_file_once_into_disk_cache(throttled_fs, tmpdir):
+    pd_df = pd.DataFrame({"a": list(range(4000)), "b": [f"s{i}" for i in range(4000)]})
+    with throttled_fs.open("/prefetching/file.parquet", "wb") as f:
+        pd_df.to_parquet(f, index=False, row_group_size=500)
+    file_size = throttled_fs.size("/prefetching/file.parquet")
+
+    cache = enable_disk_cache(str(tmpdir))
+    try:
+        daft_df = DataFrame.read_parquet(
+            "throttledmemory://prefetching/*.parquet", target_partition_size_bytes=file_size // 4
+        )
+        assert daft_df.num_partitions() > 1
+        ThrottledMemoryFileSystem.num_whole_files_fetched = 0
+
+        # Each split of the file is read from the disk cache, after the file is downloaded once for all of the splits
+        assert_df_equals(daft_df.to_pandas(), pd_df, assert_ordering=True)
+        assert ThrottledMemoryFileSystem.num_whole_files_fetched == 1
+        assert cache.stats().misses == 1
+    finally:
+        disable_disk_cache()
+
+
+def test_concurrent_reads_download_file_once_into_disk_cache(throttled_fs, tmpdir):
+    path = "throttledmemory://prefetching/file.bin"
+    throttled_fs.pipe(path, b"0" * 100)
+    [listing_info] = glob_path_with_stats(path)
+
+    cache = enable_disk_cache(str(tmpdir))
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contents = list(executor.map(lambda _: cat_file(path, listing_info.version()), range(8)))
+        assert contents == [b"0" * 100 for _ in range(8)]
+        assert ThrottledMemoryFileSystem.num_whole_files_fetched == 1
+        assert cache.stats().misses == 1
+    finally:
+        disable_disk_cache()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+from pyarrow import parquet
+
+from daft.datasources import StorageType
+from daft.execution.scan_planning import FileSplit, plan_scan_tasks
+
+
+@pytest.fixture(scope="function")
+def parquet_file(tmp_path) -> tuple[str, int, int]:
+    """Writes a Parquet file with 10 row groups, returning its path, size and the size of each row group"""
+    path = str(tmp_path / "data.parquet")
+    # Disable compression, dictionaries and statistics so that all row groups have the same size
+    parquet.write_table(
+        pa.Table.from_pydict({"foo": list(range(100))}),
+        path,
+        row_group_size=10,
+        compression="NONE",
+        use_dictionary=False,
+        write_statistics=False,
+    )
+    metadata = parquet.ParquetFile(path).metadata
+    row_group_size = metadata.row_group(0).column(0).total_compressed_size
+    size = (tmp_path / "data.parquet").stat().st_size
+    return path, size, row_group_size
+
+
+@pytest.mark.parametrize(
+    ["row_groups_per_task", "expected_ranges"], [(3, [(0, 3), (3, 6), (6, 9), (9, 10)]), (5, [(0, 5), (5, 10)])]
+)
+def test_plan_scan_tasks_splits_large_parquet_files(parquet_file, row_groups_per_task, expected_ranges) -> None:
+    path, size, row_group_size = parquet_file
+    tasks = plan_scan_tasks(
+        [path], [size], StorageType.PARQUET, target_partition_size_bytes=row_groups_per_task * row_group_size
+    )
+    assert [[split.row_groups for split in task] for task in tasks] == [[r] for r in expected_ranges]
+    assert all(split.path == path for task in tasks for split in task)
+
+
+def test_plan_scan_tasks_does_not_split_small_parquet_files(parquet_file) -> None:
+    path, size, _ = parquet_file
+    tasks = plan_scan_tasks([path], [size], StorageType.PARQUET, target_partition_size_bytes=size)
+    assert tasks == [[FileSplit(path=path, size=size)]]
+
+
+def test_plan_scan_tasks_does_not_split_csv_files(tmp_path) -> None:
+    path = str(tmp_path / "data.csv")
+    tasks = plan_scan_tasks([path], [1000], StorageType.CSV, target_partition_size_bytes=10)
+    assert tasks == [[FileSplit(path=path, size=1000)]]
+
+
+def test_plan_scan_tasks_packs_small_files() -> None:
+    paths = [f"file_{i}.csv" for i in range(5)]
+    sizes = [40, 40, 40, 100, 10]
+    tasks = plan_scan_tasks(paths, sizes, StorageType.CSV, target_partition_size_bytes=100)
+    assert [[split.path for split in task] for task in tasks] == [
+        ["file_0.csv", "file_1.csv"],
+        ["file_2.csv"],
+        ["file_3.csv"],
+        ["file_4.csv"],
+    ]
+
+
+def test_plan_scan_tasks_one_file_per_task_by_default() -> None:
+    paths = [f"file_{i}.json" for i in range(3)]
+    tasks = plan_scan_tasks(paths, [1, 1, 1], StorageType.JSON)
+    assert tasks == [[FileSplit(path=path, size=1)] for path in paths]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from daft import DataFrame
+from daft.execution import execution_step, physical_plan
+from daft.execution.execution_step import ExecutionStepBuilder, ReduceMergeAndJoin
+from daft.expressions import col
+from daft.logical.logical_plan import JoinType
+from daft.runners.partitioning import PartitionMetadata
+
+NUM_PARTITIONS = 4
+
+
+@pytest.fixture
+def num_joins(monkeypatch) -> list[int]:
+    """Makes every partition much larger than the median skewed, and counts the joins that are run"""
+    monkeypatch.setattr(physical_plan, "ADAPTIVE_TARGET_PARTITION_BYTES", 1)
+    monkeypatch.setattr(physical_plan, "SKEWED_PARTITION_FACTOR", 2)
+    num_joins = [0]
+    reduce_merge_and_join = execution_step.ReduceMergeAndJoin._reduce_merge_and_join
+
+    def counting_reduce_merge_and_join(self, inputs):
+        num_joins[0] += 1
+        return reduce_merge_and_join(self, inputs)
+
+    monkeypatch.setattr(execution_step.ReduceMergeAndJoin, "_reduce_merge_and_join", counting_reduce_merge_and_join)
+    return num_joins
+
+
+def _skewed_df() -> DataFrame:
+    # Key 0 is much more frequent than all other keys
+    keys = [0] * 200 + list(range(1, 20))
+    df = DataFrame.from_pydict({"key": keys, "left": list(range(len(keys)))}).repartition(NUM_PARTITIONS)
+    # Skewed partitions are split up by the input partitions they come from
+    df.collect()
+    return df
+
+
+def _other_df() -> DataFrame:
+    return DataFrame.from_pydict({"key": list(range(0, 40, 2)), "right": list(range(20))}).repartition(NUM_PARTITIONS)
+
+
+def _expected_join() -> set[tuple]:
+    left = _skewed_df().to_pydict()
+    right = dict(zip(*_other_df().to_pydict().values()))
+    return {(key, value, right[key]) for key, value in zip(left["key"], left["left"]) if key in right}
+
+
+def test_skewed_join(num_joins):
+    joined = _skewed_df().join(_other_df(), on=[col("key")], strategy="hash")
+    result = joined.to_pydict()
+    assert joined._result.num_partitions() == NUM_PARTITIONS
+
+    rows = list(zip(result["key"], result["left"], result["right"]))
+    assert len(rows) == len(set(rows))
+    assert set(rows) == _expected_join()
+    # The partition with the frequent key is split up into several joins
+    assert num_joins[0] > NUM_PARTITIONS
+
+
+def test_unskewed_join(num_joins, monkeypatch):
+    monkeypatch.setattr(physical_plan, "SKEWED_PARTITION_FACTOR", 1000)
+    joined = _skewed_df().join(_other_df(), on=[col("key")], strategy="hash")
+    rows = set(zip(*joined.to_pydict().values()))
+    assert rows == _expected_join()
+    assert num_joins[0] == NUM_PARTITIONS
+
+
+@dataclass(frozen=True)
+class _SizedResult:
+    """A materialized fanout slice that only has a size"""
+
+    side: str
+    size_bytes: int
+
+    def partition(self) -> _SizedResult:
+        return self
+
+    def metadata(self) -> PartitionMetadata:
+        return PartitionMetadata(num_rows=0, size_bytes=self.size_bytes)
+
+
+def _fanout_plan(num_fanouts: int):
+    for _ in range(num_fanouts):
+        yield ExecutionStepBuilder(inputs=[])
+
+
+@pytest.mark.parametrize(
+    ["how", "split_side"],
+    [(JoinType.INNER, "left"), (JoinType.LEFT, "left"), (JoinType.RIGHT, "right")],
+)
+def test_skewed_join_splits_outer_side(monkeypatch, how, split_side):
+    monkeypatch.setattr(physical_plan, "ADAPTIVE_TARGET_PARTITION_BYTES", 100)
+    monkeypatch.setattr(physical_plan, "SKEWED_PARTITION_FACTOR", 2)
+    # Left and right joins can't be planned yet, so the join type of an inner join is swapped out
+    join = _skewed_df().join(_other_df(), on=[col("key")], strategy="hash").plan()
+    monkeypatch.setattr(join, "_how", how)
+
+    # Partition 0 is skewed on both sides, and each of the 2 fanouts of a side contributes a slice of 100 bytes to it
+    sizes = [100] + [1] * (NUM_PARTITIONS - 1)
+    plan = physical_plan.hash_join(_fanout_plan(2), _fanout_plan(2), num_partitions=NUM_PARTITIONS, join=join)
+    fanout_sides = iter(["left"] * 2 + ["right"] * 2)
+    joins = []
+    for step in plan:
+        if isinstance(step, execution_step.MultiOutputExecutionStep):
+            side = next(fanout_sides)
+            step.results = [_SizedResult(side, size) for size in sizes]
+        elif isinstance(step, execution_step.SingleOutputExecutionStep):
+            step.result = _SizedResult("joined", 0)
+        if isinstance(step, (ExecutionStepBuilder, execution_step.SingleOutputExecutionStep)):
+            [instruction] = step.instructions
+            if isinstance(instruction, ReduceMergeAndJoin):
+                joins.append(step.inputs)
+
+    # The skewed partition is joined in 2 splits of its slices from the split side, with all the slices of the other
+    split_joins = [inputs for inputs in joins if len(inputs) < 4]
+    assert len(joins) == NUM_PARTITIONS + 1
+    assert len(split_joins) == 2
+    for inputs in split_joins:
+        assert [result.side for result in inputs].count(split_side) == 1
@@ -8,6 +8,7 @@ import pytest
 
 from daft import DataFrame
 from daft.expressions import col
+from daft.udf_library import url_udfs
 from tests.conftest import assert_df_equals
 
 
@@ -60,3 +61,38 @@ def test_download_with_duplicate_urls(files):
         [pathlib.Path(fn).read_bytes() if pathlib.Path(fn).exists() else None for fn in files * 2]
     )
     assert_df_equals(df.to_pandas(), pd_df, sort_key="id")
+
+
+@pytest.mark.parametrize("max_size_bytes", [10, 100])
+def test_download_with_max_size_bytes(files, max_size_bytes):
+    data = {"id": list(range(len(files))), "filenames": [str(f) for f in files]}
+    df = DataFrame.from_pydict(data)
+    df = df.with_column("bytes", col("filenames").url.download(max_size_bytes=max_size_bytes))
+    pd_df = pd.DataFrame.from_dict(data)
+    pd_df["bytes"] = pd.Series(
+        [
+            pathlib.Path(fn).read_bytes() if len(pathlib.Path(fn).read_bytes()) <= max_size_bytes else None
+            for fn in files
+        ]
+    )
+    assert_df_equals(df.to_pandas(), pd_df, sort_key="id")
+
+
+@pytest.mark.parametrize("max_retries", [0, 2])
+def test_download_retries(files, monkeypatch, max_retries):
+    monkeypatch.setattr(url_udfs, "_DOWNLOAD_RETRY_BACKOFF_SECONDS", 0)
+    fetch = url_udfs.URLDownloader._fetch
+    failed_urls = set()
+
+    def flaky_fetch(self, url):
+        if url not in failed_urls:
+            failed_urls.add(url)
+            raise ConnectionError("connection reset")
+        return fetch(self, url)
+
+    monkeypatch.setattr(url_udfs.URLDownloader, "_fetch", flaky_fetch)
+    urls = [str(f) for f in files] + [None]
+    results = url_udfs.URLDownloader(max_connections=4, max_retries=max_retries).download(urls)
+
+    expected = [pathlib.Path(fn).read_bytes() if max_retries > 0 else None for fn in files] + [None]
+    assert results == expected
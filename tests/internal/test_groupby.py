@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import math
+import random
+import threading
+
+import pyarrow as pa
+import pytest
+
+from daft.internal.kernels import groupby
+from daft.internal.kernels.groupby import (
+    group_rows,
+    grouped_aggregate,
+    kernel_num_threads,
+)
+
+key_types = [pa.int8(), pa.int32(), pa.uint64(), pa.float64(), pa.date32(), pa.string(), pa.binary()]
+
+
+def _to_key(values: list[int | None], dtype: pa.DataType) -> pa.ChunkedArray:
+    if pa.types.is_string(dtype):
+        return pa.chunked_array([[str(v) if v is not None else None for v in values]], type=dtype)
+    if pa.types.is_binary(dtype):
+        return pa.chunked_array([[str(v).encode() if v is not None else None for v in values]], type=dtype)
+    if pa.types.is_date(dtype):
+        return pa.chunked_array([pa.array(values, type=pa.int32()).cast(dtype)])
+    return pa.chunked_array([values], type=dtype)
+
+
+@pytest.mark.parametrize("num_keys", [1, 2, 3])
+@pytest.mark.parametrize("dtype", key_types, ids=[repr(it) for it in key_types])
+def test_group_rows(dtype, num_keys):
+    random.seed(0)
+    num_rows = 200
+    key_values = [[random.choice([0, 1, 2, None]) for _ in range(num_rows)] for _ in range(num_keys)]
+    keys = [_to_key(values, dtype) for values in key_values]
+
+    first_rows, group_ids = group_rows(keys)
+    assert first_rows.type == pa.uint64() and group_ids.type == pa.uint64()
+
+    expected_groups: dict[tuple, int] = {}
+    for row in zip(*key_values):
+        expected_groups.setdefault(row, len(expected_groups))
+    rows = list(zip(*key_values))
+    assert [rows[i] for i in first_rows.to_pylist()] == list(expected_groups)
+    assert group_ids.to_pylist() == [expected_groups[row] for row in rows]
+
+
+def test_group_rows_nan_and_chunked():
+    keys = [pa.chunked_array([[1.0, math.nan, None], [math.nan, 1.0, None]])]
+    first_rows, group_ids = group_rows(keys, expected_num_groups=3)
+    assert first_rows.to_pylist() == [0, 1, 2]
+    assert group_ids.to_pylist() == [0, 1, 2, 1, 0, 2]
+
+
+def test_group_rows_empty():
+    first_rows, group_ids = group_rows([pa.chunked_array([[]], type=pa.int64())])
+    assert len(first_rows) == 0 and len(group_ids) == 0
+
+
+GROUP_IDS = pa.array([0, 1, 0, 2, 1, 0], type=pa.uint64())
+
+
+@pytest.mark.parametrize(
+    ["op", "values", "expected"],
+    [
+        ("sum", [1, 2, 3, None, None, 4], [8, 2, None]),
+        ("mean", [1, 2, 3, None, None, 5], [3.0, 2.0, None]),
+        ("count", [1, 2, 3, None, None, 4], [3, 1, 0]),
+        ("min", [3, 2, 1, None, None, 4], [1, 2, None]),
+        ("max", [3, 2, 1, None, None, 4], [4, 2, None]),
+        ("min", ["b", "c", "a", None, "d", None], ["a", "c", None]),
+        ("max", ["b", "c", "a", None, "d", None], ["b", "d", None]),
+        ("list", [1, 2, 3, None, None, 4], [[1, 3, 4], [2, None], [None]]),
+        ("concat", [[1], [2], [3, 4], [5], [], [6]], [[1, 3, 4, 6], [2], [5]]),
+    ],
+)
+def test_grouped_aggregate(op, values, expected):
+    result = grouped_aggregate(pa.chunked_array([values]), GROUP_IDS, 3, op)
+    assert result.to_pylist() == expected
+
+
+def test_grouped_aggregate_types():
+    arr = pa.chunked_array([[1, 2, 3, None, None, 4]], type=pa.int16())
+    assert grouped_aggregate(arr, GROUP_IDS, 3, "sum").type == pa.int16()
+    assert grouped_aggregate(arr, GROUP_IDS, 3, "min").type == pa.int16()
+    assert grouped_aggregate(arr, GROUP_IDS, 3, "mean").type == pa.float64()
+    assert grouped_aggregate(arr, GROUP_IDS, 3, "count").type == pa.int64()
+    assert grouped_aggregate(arr, GROUP_IDS, 3, "list").type == pa.list_(pa.int16())
+
+
+def test_grouped_min_max_nan():
+    arr = pa.chunked_array([[math.nan, math.nan, 1.0, math.nan, None, 0.5]])
+    mins = grouped_aggregate(arr, GROUP_IDS, 3, "min").to_pylist()
+    maxs = grouped_aggregate(arr, GROUP_IDS, 3, "max").to_pylist()
+    assert mins[0] == 0.5 and maxs[0] == 1.0
+    assert math.isnan(mins[1]) and math.isnan(maxs[1])
+    assert math.isnan(mins[2]) and math.isnan(maxs[2])
+
+
+@pytest.mark.parametrize("op", ["sum", "mean", "count", "min", "max", "list"])
+def test_grouped_aggregate_empty(op):
+    result = grouped_aggregate(pa.chunked_array([[]], type=pa.int64()), pa.array([], type=pa.uint64()), 0, op)
+    assert len(result) == 0
+
+
+def test_group_rows_multikey_nulls():
+    # Rows with a null key are grouped by their other keys
+    num_rows = 10_000
+    keys = [
+        pa.chunked_array([[i % 100 for i in range(num_rows)]], type=pa.int64()),
+        pa.chunked_array([[None] * num_rows], type=pa.int64()),
+    ]
+    first_rows, group_ids = group_rows(keys)
+    assert first_rows.to_pylist() == list(range(100))
+    assert group_ids.to_pylist() == [i % 100 for i in range(num_rows)]
+
+
+def test_kernel_num_threads():
+    assert groupby._num_threads() == groupby._NUM_THREADS
+    with kernel_num_threads(1):
+        assert groupby._num_threads() == 1
+        # The limit only applies to the thread that set it
+        other_thread_num_threads = []
+        thread = threading.Thread(target=lambda: other_thread_num_threads.append(groupby._num_threads()))
+        thread.start()
+        thread.join()
+        assert other_thread_num_threads == [groupby._NUM_THREADS]
+    assert groupby._num_threads() == groupby._NUM_THREADS
@@ -114,3 +114,23 @@ def test_hash_chunked_large_string_array_with_reference(shift, str_len, num_chun
         else:
             ref_value = xxhash.xxh3_64_intdigest(scalar.encode())
             assert ref_value == hash_scalar
+
+
+@pytest.mark.parametrize("num_chunks", range(1, 4))
+def test_hash_chunked_bool_array_with_reference(num_chunks):
+    arr = pa.chunked_array([[True, False, False, True] for _ in range(num_chunks)], type=pa.bool_())
+    hash_all = hash_chunked_array(arr)
+    assert len(hash_all) == len(arr)
+    for v, hv in zip(arr, hash_all):
+        assert hv.as_py() == xxhash.xxh3_64_intdigest(bytes([v.as_py()]))
+
+
+null_types = number_types + [pa.bool_(), pa.string(), pa.large_string(), pa.binary()]
+
+
+@pytest.mark.parametrize("dtype", null_types, ids=[repr(it) for it in null_types])
+def test_hash_chunked_null_array_with_seed_reference(dtype):
+    arr = pa.chunked_array([[None, None, None]], type=dtype)
+    seed = pa.chunked_array([[1, 2, 3]], type=pa.uint64())
+    hash_all = hash_chunked_array(arr, seed=seed)
+    assert hash_all.to_pylist() == [xxhash.xxh3_64_intdigest(b"", seed=s) for s in seed.to_pylist()]
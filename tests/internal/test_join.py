@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import itertools
+import math
+import random
+
+import pyarrow as pa
+import pytest
+
+from daft.internal.kernels.join import hash_join
+
+key_types = [pa.int8(), pa.int32(), pa.uint64(), pa.float32(), pa.float64(), pa.date32(), pa.string(), pa.binary()]
+
+
+def _reference_join(left_keys: list[list], right_keys: list[list]) -> list[tuple[int, int]]:
+    def is_valid(row: tuple) -> bool:
+        return all(v is not None and not (isinstance(v, float) and math.isnan(v)) for v in row)
+
+    left_rows = list(zip(*left_keys))
+    right_rows = list(zip(*right_keys))
+    return [
+        (i, j)
+        for (i, left_row), (j, right_row) in itertools.product(enumerate(left_rows), enumerate(right_rows))
+        if is_valid(left_row) and left_row == right_row
+    ]
+
+
+def _to_key(values: list[int | None], dtype: pa.DataType) -> pa.ChunkedArray:
+    if pa.types.is_string(dtype):
+        return pa.chunked_array([[str(v) if v is not None else None for v in values]], type=dtype)
+    if pa.types.is_binary(dtype):
+        return pa.chunked_array([[str(v).encode() if v is not None else None for v in values]], type=dtype)
+    if pa.types.is_date(dtype):
+        return pa.chunked_array([pa.array(values, type=pa.int32()).cast(dtype)])
+    return pa.chunked_array([values], type=dtype)
+
+
+@pytest.mark.parametrize("num_keys", [1, 2, 3])
+@pytest.mark.parametrize("dtype", key_types, ids=[repr(it) for it in key_types])
+def test_hash_join(dtype, num_keys):
+    random.seed(0)
+    left_values = [[random.choice([None, 0, 1, 2, 3]) for _ in range(50)] for _ in range(num_keys)]
+    right_values = [[random.choice([None, 1, 2, 3, 4]) for _ in range(40)] for _ in range(num_keys)]
+    left_keys = [_to_key(values, dtype) for values in left_values]
+    right_keys = [_to_key(values, dtype) for values in right_values]
+
+    left_indices, right_indices = hash_join(left_keys, right_keys)
+    assert left_indices.type == pa.uint64() and right_indices.type == pa.uint64()
+    result = list(zip(left_indices.to_pylist(), right_indices.to_pylist()))
+    assert sorted(result) == _reference_join([k.to_pylist() for k in left_keys], [k.to_pylist() for k in right_keys])
+    assert left_indices.to_pylist() == sorted(left_indices.to_pylist())
+
+
+def test_hash_join_nan_keys_do_not_match():
+    left_keys = [pa.chunked_array([[1.0, float("nan"), None, 2.0]])]
+    right_keys = [pa.chunked_array([[float("nan"), None, 1.0, 2.0]])]
+    left_indices, right_indices = hash_join(left_keys, right_keys)
+    assert list(zip(left_indices.to_pylist(), right_indices.to_pylist())) == [(0, 2), (3, 3)]
+
+
+def test_hash_join_chunked_and_mismatched_types():
+    left_keys = [pa.chunked_array([[1, 2], [3, 2]], type=pa.int64())]
+    right_keys = [pa.chunked_array([[2], [3, 5]], type=pa.int32())]
+    left_indices, right_indices = hash_join(left_keys, right_keys)
+    assert list(zip(left_indices.to_pylist(), right_indices.to_pylist())) == [(1, 0), (2, 1), (3, 0)]
+
+
+def test_hash_join_empty():
+    left_keys = [pa.chunked_array([[1, 2]], type=pa.int64())]
+    right_keys = [pa.chunked_array([[]], type=pa.int64())]
+    left_indices, right_indices = hash_join(left_keys, right_keys)
+    assert len(left_indices) == 0 and len(right_indices) == 0
+
+
+def test_hash_join_multikey_nulls():
+    # Rows with a null in any key do not match, however many rows share the null
+    num_rows = 10_000
+    left_keys = [
+        pa.chunked_array([list(range(num_rows))], type=pa.int64()),
+        pa.chunked_array([[None if i % 2 == 0 else i for i in range(num_rows)]], type=pa.int64()),
+    ]
+    right_keys = [
+        pa.chunked_array([list(reversed(range(num_rows)))], type=pa.int64()),
+        pa.chunked_array([[None if i % 3 == 0 else i for i in reversed(range(num_rows))]], type=pa.int64()),
+    ]
+    left_indices, right_indices = hash_join(left_keys, right_keys)
+    expected = [i for i in range(num_rows) if i % 2 != 0 and i % 3 != 0]
+    assert left_indices.to_pylist() == expected
+    assert right_indices.to_pylist() == [num_rows - 1 - i for i in expected]
@@ -2,9 +2,20 @@ from __future__ import annotations
 
 import pytest
 
+from daft.context import get_context
+from daft.dataframe import DataFrame
+from daft.errors import SchemaMismatchError
 from daft.expressions import ExpressionList, col
+from daft.logical import logical_plan
 from daft.logical.field import Field
-from daft.logical.logical_plan import Filter, InMemoryScan, Projection
+from daft.logical.logical_plan import (
+    Filter,
+    InMemoryScan,
+    Join,
+    JoinStrategy,
+    Projection,
+    Repartition,
+)
 from daft.logical.schema import Schema
 from daft.runners.partitioning import PartitionCacheEntry
 from daft.types import ExpressionType
@@ -122,3 +133,75 @@ def test_scan_projection_filter_projection_chain(schema) -> None:
     projection = Projection(projection_alias, ExpressionList([col("out")]), custom_resource_request=None)
 
     assert projection.schema().column_names() == ["out"]
+
+
+def test_schema_unify() -> None:
+    left = Schema(
+        [
+            Field("a", ExpressionType.integer()),
+            Field("b", ExpressionType.null()),
+            Field("c", ExpressionType.date()),
+            Field("d", ExpressionType.from_py_type(list)),
+        ]
+    )
+    right = Schema(
+        [
+            Field("e", ExpressionType.string()),
+            Field("a", ExpressionType.float()),
+            Field("b", ExpressionType.integer()),
+            Field("c", ExpressionType.date()),
+            Field("d", ExpressionType.from_py_type(dict)),
+        ]
+    )
+    unified = left.unify(right)
+    assert unified.column_names() == ["a", "b", "c", "d", "e"]
+    assert unified["a"].dtype == ExpressionType.float()
+    assert unified["b"].dtype == ExpressionType.integer()
+    assert unified["c"].dtype == ExpressionType.date()
+    assert unified["d"].dtype == ExpressionType.python_object()
+    assert unified["e"].dtype == ExpressionType.string()
+
+
+@pytest.mark.parametrize(
+    ["left", "right"],
+    [
+        (ExpressionType.logical(), ExpressionType.integer()),
+        (ExpressionType.integer(), ExpressionType.string()),
+        (ExpressionType.date(), ExpressionType.string()),
+        (ExpressionType.bytes(), ExpressionType.string()),
+    ],
+)
+def test_schema_unify_mismatched_types(left, right) -> None:
+    with pytest.raises(SchemaMismatchError, match="Column a has mismatched types"):
+        Schema([Field("a", left)]).unify(Schema([Field("a", right)]))
+
+
+def test_join_strategy(monkeypatch) -> None:
+    large_df = DataFrame.from_pydict({"id": list(range(1000)), "values": [str(i) for i in range(1000)]}).repartition(4)
+    small_df = DataFrame.from_pydict({"id": [1, 2, 3], "other_values": ["a", "b", "c"]})
+    runner = get_context().runner()
+
+    # Joins are planned as hash joins, and their strategy is chosen by the optimizer
+    join = large_df.join(small_df, on="id").plan()
+    assert join._strategy is None
+    assert all(isinstance(child, Repartition) for child in join._children())
+
+    # The smaller side is broadcast, so neither side is repartitioned
+    for left, right, broadcast_left in [(large_df, small_df, False), (small_df, large_df, True)]:
+        join = runner.optimize(left.join(right, on="id").plan())
+        assert isinstance(join, Join)
+        assert join._strategy == JoinStrategy.BROADCAST
+        assert join._broadcast_left == broadcast_left
+        assert [child.id() for child in join._children()] == [left.plan().id(), right.plan().id()]
+        assert join.num_partitions() == 4
+
+    # Sides that are estimated to be larger than the threshold are hash joined, unless broadcasting is requested
+    monkeypatch.setattr(logical_plan, "BROADCAST_JOIN_THRESHOLD_BYTES", 0)
+    join = runner.optimize(large_df.join(small_df, on="id").plan())
+    assert join._strategy == JoinStrategy.HASH
+    assert all(isinstance(child, Repartition) for child in join._children())
+    assert join._children()[0].id() != large_df.plan().id()
+
+    join = large_df.join(small_df, on="id", strategy="broadcast").plan()
+    assert join._strategy == JoinStrategy.BROADCAST
+    assert join._broadcast_left is False
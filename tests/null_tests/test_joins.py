@@ -7,8 +7,9 @@ from daft.errors import ExpressionTypeError
 from tests.conftest import assert_pydict_equals
 
 
+@pytest.mark.parametrize("strategy", [None, "hash", "broadcast"])
 @pytest.mark.parametrize("repartition_nparts", [1, 2, 4])
-def test_inner_join(repartition_nparts):
+def test_inner_join(repartition_nparts, strategy):
     daft_df = DataFrame.from_pydict(
         {
             "id": [1, None, 3],
@@ -21,7 +22,7 @@ def test_inner_join(repartition_nparts):
             "values_right": ["a2", "b2", "c2"],
         }
     ).repartition(repartition_nparts)
-    daft_df = daft_df.join(daft_df2, on="id", how="inner")
+    daft_df = daft_df.join(daft_df2, on="id", how="inner", strategy=strategy)
 
     expected = {
         "id": [1, 3],
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import pyarrow as pa
+import pytest
+from pyarrow import parquet
+
 from daft.dataframe import DataFrame
 from daft.expressions import col
+from daft.internal.rule_runner import Once, RuleBatch, RuleRunner
 from daft.logical import logical_plan
+from daft.logical.logical_plan import LogicalPlan
+from daft.logical.optimizer import PushDownClausesIntoScan, PushDownLimit
+
+
+@pytest.fixture(scope="function")
+def optimizer() -> RuleRunner[LogicalPlan]:
+    return RuleRunner([RuleBatch("push_down_limit", Once, [PushDownLimit(), PushDownClausesIntoScan()])])
 
 
 def test_limit(valid_data: list[dict[str, float]]) -> None:
@@ -14,3 +26,39 @@ def test_limit(valid_data: list[dict[str, float]]) -> None:
     df = df.limit(10)
 
     assert isinstance(df.plan(), logical_plan.GlobalLimit)
+
+
+@pytest.fixture(scope="function")
+def valid_data_parquet_path(valid_data: list[dict[str, float]], tmp_path) -> str:
+    path = str(tmp_path / "valid_data.parquet")
+    parquet.write_table(pa.Table.from_pylist(valid_data), path)
+    return path
+
+
+def test_push_down_limit_into_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    optimized_plan = optimizer(df.limit(2).plan())
+
+    assert isinstance(optimized_plan, logical_plan.GlobalLimit)
+    assert optimized_plan._num == 2
+    [scan] = optimized_plan._children()
+    assert isinstance(scan, logical_plan.TabularFilesScan)
+    assert scan._limit_rows == 2
+
+
+def test_push_down_smallest_limit_into_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    optimized_plan = optimizer(df.limit(1).limit(2).plan())
+
+    scans = [node for node in optimized_plan.post_order() if isinstance(node, logical_plan.TabularFilesScan)]
+    assert [scan._limit_rows for scan in scans] == [1]
+    assert df.limit(1).limit(2).to_pandas()["sepal_length"].tolist() == [5.1]
+
+
+def test_no_push_down_filter_into_limited_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    df = df.limit(2).where(col("sepal_length") < 5.0)
+    optimized_plan = optimizer(df.plan())
+
+    assert isinstance(optimized_plan, logical_plan.Filter)
+    assert df.to_pandas()["sepal_length"].tolist() == [4.9]
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import pyarrow as pa
 import pytest
+from pyarrow import parquet
 
+from daft.dataframe import DataFrame
+from daft.expressions import ExpressionList, col
 from daft.internal.rule_runner import Once, RuleBatch, RuleRunner
-from daft.logical.logical_plan import LogicalPlan
+from daft.logical.logical_plan import (
+    COUNT_ROWS_OP,
+    Filter,
+    LocalAggregate,
+    LocalCount,
+    LogicalPlan,
+    TabularFilesScan,
+)
 from daft.logical.optimizer import (
     FoldProjections,
     PushDownClausesIntoScan,
@@ -16,3 +27,113 @@ def optimizer() -> RuleRunner[LogicalPlan]:
     return RuleRunner(
         [RuleBatch("push_into_scan", Once, [PushDownPredicates(), FoldProjections(), PushDownClausesIntoScan()])]
     )
+
+
+@pytest.fixture(scope="function")
+def valid_data_parquet_path(valid_data: list[dict[str, float]], tmp_path) -> str:
+    path = str(tmp_path / "valid_data.parquet")
+    parquet.write_table(pa.Table.from_pylist(valid_data), path)
+    return path
+
+
+def test_push_down_filter_into_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    scan = df.plan()
+    assert isinstance(scan, TabularFilesScan)
+
+    unoptimized = df.where(col("sepal_length") > 4.8)
+    optimized = TabularFilesScan(
+        schema=scan._schema,
+        source_info=scan._source_info,
+        predicate=ExpressionList([col("sepal_length") > 4.8]),
+        filepaths_child=scan._filepaths_child,
+        filepaths_column_name=scan._filepaths_column_name,
+    )
+    assert optimizer(unoptimized.plan()).is_eq(optimized)
+
+
+def test_push_down_filter_and_projection_into_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    scan = df.plan()
+    assert isinstance(scan, TabularFilesScan)
+
+    unoptimized = df.where(col("sepal_length") > 4.8).select("sepal_width")
+    # Projection is pushed into the scan on the second pass, after the filter has been absorbed by the scan
+    optimized_plan = optimizer(optimizer(unoptimized.plan()))
+    assert isinstance(optimized_plan, TabularFilesScan)
+    assert optimized_plan.schema().column_names() == ["sepal_width"]
+    assert optimized_plan._predicate == ExpressionList([col("sepal_length") > 4.8])
+
+
+def test_push_down_multiple_filters_into_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    unoptimized = df.where(col("sepal_length") > 4.8).where(col("sepal_length") < 5.0)
+    optimized_plan = optimizer(unoptimized.plan())
+    assert isinstance(optimized_plan, TabularFilesScan)
+    assert len(optimized_plan._predicate) == 2
+    assert optimized_plan.num_partitions() == df.plan().num_partitions()
+    assert unoptimized.to_pandas()["sepal_length"].tolist() == [4.9]
+
+
+def test_push_down_count_into_parquet_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    scan = df.plan()
+    assert isinstance(scan, TabularFilesScan)
+
+    unoptimized = LocalCount(
+        TabularFilesScan(
+            schema=scan._schema,
+            source_info=scan._source_info,
+            columns=["sepal_length"],
+            filepaths_child=scan._filepaths_child,
+            filepaths_column_name=scan._filepaths_column_name,
+        )
+    )
+    optimized_plan = optimizer(unoptimized)
+    assert isinstance(optimized_plan, TabularFilesScan)
+    [(expr, op)] = optimized_plan._aggregation
+    assert expr.is_eq(col("sepal_length")._count().alias("count")) and op == COUNT_ROWS_OP
+    assert optimized_plan.schema() == unoptimized.schema()
+
+
+def test_push_down_aggregation_into_parquet_scan(valid_data_parquet_path: str, optimizer) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    agg = [
+        (col("sepal_length")._min().alias("sepal_length"), "min"),
+        (col("variety")._count().alias("variety"), "count"),
+    ]
+    unoptimized = LocalAggregate(df.plan(), agg=agg)
+    optimized_plan = optimizer(unoptimized)
+    assert isinstance(optimized_plan, TabularFilesScan)
+    assert optimized_plan._aggregation is not None
+    assert all(
+        e.is_eq(expected_e) and op == expected_op
+        for (e, op), (expected_e, expected_op) in zip(optimized_plan._aggregation, agg)
+    )
+    assert optimized_plan.schema() == unoptimized.schema()
+
+    # Filters and limits over the aggregated rows can't be pushed into the scan
+    assert isinstance(optimizer(Filter(optimized_plan, ExpressionList([col("sepal_length") > 4.8]))), Filter)
+
+
+@pytest.mark.parametrize(
+    "agg, group_by",
+    [
+        ([(col("sepal_length")._sum().alias("sepal_length"), "sum")], None),
+        ([(col("sepal_length")._min().alias("sepal_length"), "min")], ExpressionList([col("variety")])),
+        ([((col("sepal_length") + 1)._min().alias("sepal_length"), "min")], None),
+    ],
+)
+def test_push_down_aggregation_into_parquet_scan_unsupported(
+    valid_data_parquet_path: str, optimizer, agg, group_by
+) -> None:
+    df = DataFrame.read_parquet(valid_data_parquet_path)
+    unoptimized = LocalAggregate(df.plan(), agg=agg, group_by=group_by)
+    assert isinstance(optimizer(unoptimized), LocalAggregate)
+
+
+def test_push_down_count_into_csv_scan_unsupported(optimizer, tmp_path) -> None:
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    unoptimized = LocalCount(DataFrame.read_csv(str(path)).plan())
+    assert isinstance(optimizer(unoptimized), LocalCount)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import gc
+import os
+import threading
+
+import pyarrow as pa
+import pytest
+
+from daft.context import get_context
+from daft.dataframe import DataFrame
+from daft.expressions import col
+from daft.runners import memory_manager
+from daft.runners.memory_manager import PartitionMemoryManager
+from daft.runners.partitioning import vPartition
+
+
+def _arrow_partition(partition_id: int) -> vPartition:
+    table = pa.table({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+    return vPartition.from_arrow_table(table, partition_id=partition_id)
+
+
+def _spill_files(manager: PartitionMemoryManager) -> list[str]:
+    return os.listdir(manager._spill_directory)
+
+
+def test_spill_and_reload(tmp_path):
+    manager = PartitionMemoryManager(0, spill_directory=str(tmp_path))
+    first = manager.add(_arrow_partition(0))
+    second = manager.add(_arrow_partition(1))
+
+    # The most recently added partition is kept in memory
+    assert first.is_spilled()
+    assert not second.is_spilled()
+    assert manager.in_memory_bytes() == second.size_bytes()
+    assert manager.spilled_bytes() == first.size_bytes()
+    assert len(_spill_files(manager)) == 1
+
+    assert first.get().to_pydict() == _arrow_partition(0).to_pydict()
+    assert first.get().partition_id == 0
+    assert first.metadata() == _arrow_partition(0).metadata()
+
+
+def test_spills_least_recently_used(tmp_path):
+    budget = _arrow_partition(0).size_bytes() * 2
+    manager = PartitionMemoryManager(budget, spill_directory=str(tmp_path))
+    first = manager.add(_arrow_partition(0))
+    second = manager.add(_arrow_partition(1))
+    first.get()
+    third = manager.add(_arrow_partition(2))
+
+    assert not first.is_spilled()
+    assert second.is_spilled()
+    assert not third.is_spilled()
+
+
+def test_python_objects_are_not_spilled(tmp_path):
+    manager = PartitionMemoryManager(0, spill_directory=str(tmp_path))
+    df = DataFrame.from_pydict({"obj": [object() for _ in range(10)]})
+    df.collect()
+    [partition] = df._result.values()
+    python_objects = manager.add(partition)
+    manager.add(_arrow_partition(1))
+
+    assert not python_objects.is_spilled()
+    assert python_objects.get() is partition
+
+
+def test_spill_files_are_deleted(tmp_path):
+    manager = PartitionMemoryManager(0, spill_directory=str(tmp_path))
+    first = manager.add(_arrow_partition(0))
+    second = manager.add(_arrow_partition(1))
+    assert len(_spill_files(manager)) == 1
+
+    del first
+    gc.collect()
+    assert _spill_files(manager) == []
+    assert manager.in_memory_bytes() == second.size_bytes()
+
+    spill_directory = manager._spill_directory
+    del second, manager
+    gc.collect()
+    assert not os.path.exists(spill_directory)
+
+
+def test_spills_are_written_without_the_lock(tmp_path, monkeypatch):
+    manager = PartitionMemoryManager(0, spill_directory=str(tmp_path))
+    lock_was_free = []
+    write_arrow_ipc_file = memory_manager.write_arrow_ipc_file
+
+    def checking_write_arrow_ipc_file(partition, path):
+        def try_lock():
+            acquired = manager._lock.acquire(blocking=False)
+            lock_was_free.append(acquired)
+            if acquired:
+                manager._lock.release()
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        write_arrow_ipc_file(partition, path)
+
+    monkeypatch.setattr(memory_manager, "write_arrow_ipc_file", checking_write_arrow_ipc_file)
+    first = manager.add(_arrow_partition(0))
+    manager.add(_arrow_partition(1))
+    assert first.is_spilled()
+    assert lock_was_free == [True]
+
+
+@pytest.mark.skipif(get_context().runner_config.name not in {"py"}, reason="requires PyRunner to be in use")
+def test_pyrunner_spills_on_worker_threads(tmp_path, monkeypatch):
+    manager = PartitionMemoryManager(0, spill_directory=str(tmp_path))
+    monkeypatch.setattr(get_context().runner(), "_memory_manager", manager)
+    monkeypatch.setattr(get_context().runner(), "_num_threads", 2)
+    spilling_threads = set()
+    write_arrow_ipc_file = memory_manager.write_arrow_ipc_file
+
+    def recording_write_arrow_ipc_file(partition, path):
+        spilling_threads.add(threading.current_thread().name)
+        write_arrow_ipc_file(partition, path)
+
+    monkeypatch.setattr(memory_manager, "write_arrow_ipc_file", recording_write_arrow_ipc_file)
+    df = DataFrame.from_pydict({"value": list(range(1000))}).repartition(4).sort(col("value"))
+    assert df.to_pydict()["value"] == list(range(1000))
+    assert len(spilling_threads) > 0
+    # The scheduler thread of the PyRunner doesn't write spills
+    assert threading.current_thread().name not in spilling_threads
+
+
+@pytest.mark.skipif(get_context().runner_config.name not in {"py"}, reason="requires PyRunner to be in use")
+@pytest.mark.parametrize("memory_budget_bytes", [0, 1024])
+def test_pyrunner_with_memory_budget(tmp_path, monkeypatch, memory_budget_bytes):
+    manager = PartitionMemoryManager(memory_budget_bytes, spill_directory=str(tmp_path))
+    monkeypatch.setattr(get_context().runner(), "_memory_manager", manager)
+
+    df = DataFrame.from_pydict({"key": [i % 7 for i in range(1000)], "value": list(range(1000))})
+    df = df.repartition(4).sort(col("value"), desc=True)
+    assert df.to_pydict()["value"] == list(reversed(range(1000)))
+    assert manager.spilled_bytes() > 0
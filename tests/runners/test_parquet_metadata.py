@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pathlib
+import time
+
+import pyarrow as pa
+from pyarrow import parquet
+
+from daft.filesystem import (
+    get_file_version,
+    get_filesystem_from_path,
+    glob_path_with_stats,
+)
+from daft.runners.parquet_metadata import (
+    ParquetMetadataCache,
+    get_parquet_metadata,
+    get_parquet_metadata_cache,
+)
+from daft.runners.partitioning import vPartition, vPartitionReadOptions
+
+
+def test_get_parquet_metadata_cached(tmp_path: pathlib.Path, monkeypatch):
+    path = str(tmp_path / "data.parquet")
+    parquet.write_table(pa.table({"a": list(range(10))}), path)
+    [listing_info] = glob_path_with_stats(path)
+    version = listing_info.version()
+    assert version is not None
+
+    # Lookups use the version from the listing, without requesting the details of the file again
+    def info(*args, **kwargs):
+        raise AssertionError("file details should not be requested")
+
+    monkeypatch.setattr(type(get_filesystem_from_path(path)), "info", info)
+    metadata = get_parquet_metadata(path, version=version)
+    assert get_parquet_metadata(path, version=version) is metadata
+    assert get_parquet_metadata_cache().get(version) is metadata
+
+    # Reads reuse the cached footer
+    assert vPartition.from_parquet(path, partition_id=0, version=version).to_pydict() == {"a": list(range(10))}
+    assert vPartition.from_parquet(
+        path, partition_id=0, read_options=vPartitionReadOptions(num_rows=0), version=version
+    ).to_pydict() == {"a": []}
+    assert get_parquet_metadata(path, version=version) is metadata
+
+    # Files without a known version are not cached
+    assert get_parquet_metadata(path) is not metadata
+    monkeypatch.undo()
+
+    # Modified files have a new version in their listing, and have their footers read again
+    time.sleep(0.01)
+    parquet.write_table(pa.table({"a": list(range(20))}), path)
+    [listing_info] = glob_path_with_stats(path)
+    assert get_parquet_metadata(path, version=listing_info.version()).num_rows == 20
+
+
+def test_parquet_metadata_cache_eviction(tmp_path: pathlib.Path):
+    versions_and_metadata = []
+    for i in range(3):
+        path = str(tmp_path / f"{i}.parquet")
+        parquet.write_table(pa.table({"a": [i]}), path)
+        versions_and_metadata.append((get_file_version(path), parquet.read_metadata(path)))
+    metadata_size = versions_and_metadata[0][1].serialized_size
+
+    cache = ParquetMetadataCache(max_bytes=2 * metadata_size)
+    for version, metadata in versions_and_metadata:
+        cache.put(version, metadata)
+    assert len(cache) == 2
+    assert cache.size_bytes() <= 2 * metadata_size
+    assert cache.get(versions_and_metadata[0][0]) is None
+    assert cache.get(versions_and_metadata[2][0]) is versions_and_metadata[2][1]
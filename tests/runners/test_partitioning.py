@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import gzip
+import json
+import lzma
+
 import numpy as np
 import pyarrow as pa
 import pytest
+from pyarrow import ipc, parquet
 
 from daft.expressions import Expression, col
-from daft.logical.schema import ExpressionList
+from daft.logical.field import Field
+from daft.logical.schema import ExpressionList, Schema
+from daft.runners import partitioning
 from daft.runners.blocks import ArrowDataBlock, DataBlock
-from daft.runners.partitioning import PyListTile, vPartition
+from daft.runners.partitioning import (
+    PyListTile,
+    vPartition,
+    vPartitionReadOptions,
+    vPartitionSchemaInferenceOptions,
+)
+from daft.types import ExpressionType
 
 
 def test_vpartition_eval_expression() -> None:
@@ -197,6 +210,27 @@ def test_vpartition_sort_desc() -> None:
         assert is_sorted(arrow_table[i].to_numpy())
 
 
+@pytest.mark.parametrize("partition_id", [None, 1])
+def test_vpartition_join_partition_id(partition_id) -> None:
+    left_schema = Schema([Field("id", ExpressionType.integer()), Field("a", ExpressionType.integer())])
+    right_schema = Schema([Field("id", ExpressionType.integer()), Field("b", ExpressionType.integer())])
+    left = vPartition.from_pydict({"id": [1, 2, 3], "a": [4, 5, 6]}, schema=left_schema, partition_id=0)
+    right = vPartition.from_pydict({"id": [3, 2], "b": [7, 8]}, schema=right_schema, partition_id=1)
+
+    # The joined vPartition takes the partition ID of the left side, unless another partition ID is given
+    joined = left.join(
+        right,
+        left_on=ExpressionList([col("id")]),
+        right_on=ExpressionList([col("id")]),
+        output_projection=ExpressionList([col("id"), col("a"), col("b")]),
+        partition_id=partition_id,
+    )
+    expected_partition_id = 0 if partition_id is None else partition_id
+    assert joined.partition_id == expected_partition_id
+    assert all(tile.partition_id == expected_partition_id for tile in joined.columns.values())
+    assert sorted(zip(*joined.to_pydict().values())) == [(2, 5, 8), (3, 6, 7)]
+
+
 @pytest.mark.parametrize("n", [1, 2, 3, 4])
 def test_split_by_index_even(n) -> None:
     tiles = {}
@@ -251,3 +285,151 @@ def test_partition_quantiles_small_sample_large_partitions():
     quantiled_partition = partition.quantiles(10)
     quantile_boundaries = quantiled_partition.columns["foo"].block.data.to_pylist()
     assert sorted(quantile_boundaries) == quantile_boundaries, "quantile boundaries should be in sorted order"
+
+
+@pytest.mark.parametrize(
+    ["predicate", "expected_row_groups"],
+    [
+        (col("a") < 10, [0]),
+        (col("a") >= 10, [1, 2]),
+        (10 < col("a"), [1, 2]),
+        (col("a") == 25, [2]),
+        (col("a") != 25, [0, 1, 2]),
+        ((col("a") < 5) | (col("a") > 25), [0, 2]),
+        (~(col("a") < 20), [2]),
+        (col("b").is_null(), [1]),
+        (~col("b").is_null(), [0, 2]),
+        (col("a") == 100, []),
+        (col("a") + 1 == 100, [0, 1, 2]),
+    ],
+)
+def test_vpartition_from_parquet_prunes_row_groups(tmp_path, predicate, expected_row_groups) -> None:
+    row_groups = [
+        {"a": list(range(0, 10)), "b": ["foo"] * 10},
+        {"a": list(range(10, 20)), "b": [None] * 10},
+        {"a": list(range(20, 30)), "b": ["bar"] * 10},
+    ]
+    path = str(tmp_path / "data.parquet")
+    with parquet.ParquetWriter(path, pa.schema([("a", pa.int64()), ("b", pa.string())])) as writer:
+        for data in row_groups:
+            writer.write_table(pa.Table.from_pydict(data, schema=writer.schema))
+
+    part = vPartition.from_parquet(
+        path, partition_id=0, read_options=vPartitionReadOptions(predicate=ExpressionList([predicate]))
+    )
+    assert part.to_pydict()["a"] == [a for i in expected_row_groups for a in row_groups[i]["a"]]
+
+
+@pytest.mark.parametrize("num_rows", [0, 1, 10, 15, 30, 100])
+@pytest.mark.parametrize("row_groups", [None, [1, 2]])
+def test_vpartition_from_parquet_num_rows(tmp_path, num_rows, row_groups) -> None:
+    path = str(tmp_path / "data.parquet")
+    parquet.write_table(pa.Table.from_pydict({"a": list(range(30))}), path, row_group_size=10)
+
+    part = vPartition.from_parquet(
+        path, partition_id=0, read_options=vPartitionReadOptions(num_rows=num_rows), row_groups=row_groups
+    )
+    expected = list(range(30)) if row_groups is None else list(range(10, 30))
+    assert part.to_pydict()["a"] == expected[:num_rows]
+
+
+@pytest.mark.parametrize("block_size", [16, 1024 * 1024])
+@pytest.mark.parametrize("num_rows", [None, 0, 1, 50, 1000])
+def test_vpartition_from_csv_streaming(tmp_path, monkeypatch, block_size, num_rows) -> None:
+    monkeypatch.setattr(partitioning, "_STREAMING_READ_BLOCK_SIZE_BYTES", block_size)
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n" + "".join(f"{i},{'foo' if i % 2 else ''}\n" for i in range(100)))
+
+    part = vPartition.from_csv(str(path), partition_id=0, read_options=vPartitionReadOptions(num_rows=num_rows))
+    assert part.to_pydict()["a"] == list(range(100))[:num_rows]
+
+
+@pytest.mark.parametrize("num_rows", [None, 0, 1, 50, 1000])
+def test_vpartition_from_csv_streaming_compressed(tmp_path, monkeypatch, num_rows) -> None:
+    monkeypatch.setattr(partitioning, "_STREAMING_READ_BLOCK_SIZE_BYTES", 16)
+    path = tmp_path / "data.csv.gz"
+    path.write_bytes(gzip.compress(("a\n" + "".join(f"{i}\n" for i in range(100))).encode()))
+
+    part = vPartition.from_csv(str(path), partition_id=0, read_options=vPartitionReadOptions(num_rows=num_rows))
+    assert part.to_pydict()["a"] == list(range(100))[:num_rows]
+
+
+@pytest.mark.parametrize("num_rows", [None, 0, 1, 50, 1000])
+def test_vpartition_from_csv_streaming_python_file(tmp_path, monkeypatch, num_rows) -> None:
+    # XZ files are not decompressed by Arrow, so they are read through a Python file object
+    monkeypatch.setattr(partitioning, "_STREAMING_READ_BLOCK_SIZE_BYTES", 16)
+    path = tmp_path / "data.csv.xz"
+    data = ("a\n" + "".join(f"{i}\n" for i in range(10000))).encode()
+    path.write_bytes(lzma.compress(data))
+
+    bytes_read = []
+    cancellable_read = partitioning._CancellableFile.read
+
+    def read(self, size=-1):
+        result = cancellable_read(self, size)
+        bytes_read.append(len(result))
+        return result
+
+    monkeypatch.setattr(partitioning._CancellableFile, "read", read)
+
+    part = vPartition.from_csv(str(path), partition_id=0, read_options=vPartitionReadOptions(num_rows=num_rows))
+    assert part.to_pydict()["a"] == list(range(10000))[:num_rows]
+    if num_rows is not None:
+        # Reading stops shortly after enough rows were read instead of decompressing the rest of the file
+        assert sum(bytes_read) < len(data) // 10
+
+
+@pytest.mark.parametrize("block_size", [16, 1024 * 1024])
+@pytest.mark.parametrize("num_rows", [None, 0, 1, 50, 1000])
+def test_vpartition_from_json_streaming(tmp_path, monkeypatch, block_size, num_rows) -> None:
+    monkeypatch.setattr(partitioning, "_STREAMING_READ_BLOCK_SIZE_BYTES", block_size)
+    path = tmp_path / "data.json"
+    rows = [{"a": i, "b": {"foo": i} if i >= 50 else None} for i in range(100)]
+    path.write_text("\n".join(json.dumps(row) for row in rows))
+
+    part = vPartition.from_json(str(path), partition_id=0, read_options=vPartitionReadOptions(num_rows=num_rows))
+    assert part.to_pydict() == {"a": [row["a"] for row in rows][:num_rows], "b": [row["b"] for row in rows][:num_rows]}
+
+
+def test_vpartition_from_csv_streaming_with_schema(tmp_path, monkeypatch) -> None:
+    # Types inferred from the first block alone would not fit the values of later blocks
+    monkeypatch.setattr(partitioning, "_STREAMING_READ_BLOCK_SIZE_BYTES", 16)
+    path = tmp_path / "data.csv"
+    path.write_text("a\n" + "".join(f"{i}\n" for i in range(10)) + "0.5\n")
+
+    schema = Schema([Field("a", ExpressionType.float())])
+    part = vPartition.from_csv(
+        str(path), partition_id=0, schema_options=vPartitionSchemaInferenceOptions(schema=schema)
+    )
+    assert part.to_pydict()["a"] == [float(i) for i in range(10)] + [0.5]
+
+
+@pytest.mark.parametrize("num_rows", [None, 0, 1, 150, 1000])
+@pytest.mark.parametrize("column_names", [None, ["b"]])
+def test_vpartition_from_arrow_ipc(tmp_path, num_rows, column_names) -> None:
+    path = tmp_path / "data.arrow"
+    table = pa.table({"a": list(range(300)), "b": [str(i) for i in range(300)]})
+    with ipc.new_file(str(path), table.schema) as writer:
+        writer.write_table(table, max_chunksize=100)
+
+    part = vPartition.from_arrow_ipc(
+        str(path), partition_id=0, read_options=vPartitionReadOptions(num_rows=num_rows, column_names=column_names)
+    )
+    expected = table.slice(length=num_rows) if num_rows is not None else table
+    if column_names is not None:
+        expected = expected.select(column_names)
+    assert part.to_pydict() == expected.to_pydict()
+
+
+def test_vpartition_from_arrow_ipc_memory_mapped(tmp_path) -> None:
+    path = tmp_path / "data.arrow"
+    table = pa.table({"a": np.arange(1_000_000)})
+    with ipc.new_file(str(path), table.schema) as writer:
+        writer.write_table(table)
+    del table
+
+    # Uncompressed local files are memory-mapped, so reading them does not allocate memory for their data
+    allocated_bytes = pa.total_allocated_bytes()
+    part = vPartition.from_arrow_ipc(str(path), partition_id=0)
+    assert pa.total_allocated_bytes() - allocated_bytes < 1024 * 1024
+    assert len(part) == 1_000_000
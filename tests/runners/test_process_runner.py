@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import gc
+import os
+import shutil
+
+import pyarrow as pa
+import pytest
+
+from daft import context, udf
+from daft.dataframe import DataFrame
+from daft.execution.execution_step import ExecutionStepBuilder
+from daft.expressions import col
+from daft.runners import process_runner
+from daft.runners.partitioning import vPartition
+from daft.runners.process_runner import ProcessRunner, SharedMemoryPartition
+
+
+@pytest.fixture(scope="module")
+def runner() -> ProcessRunner:
+    """Runs DataFrames in this module on a ProcessRunner, whose worker processes are shared by all tests"""
+    runner = ProcessRunner(num_workers=2)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(context, "_RUNNER", runner)
+        yield runner
+
+
+@udf(return_type=int)
+def get_pid(c):
+    return [os.getpid()] * len(c)
+
+
+@udf(return_type=int)
+def fail(c):
+    raise ValueError("UDF failed")
+
+
+def test_process_runner_runs_in_workers(runner):
+    df = DataFrame.from_pydict({"key": [i % 7 for i in range(100)], "value": list(range(100))}).repartition(4)
+    df = df.with_column("pid", get_pid(col("value")))
+    df = df.repartition(3, col("key")).sort(col("value"))
+    result = df.to_pydict()
+    assert result["value"] == list(range(100))
+    assert result["key"] == [i % 7 for i in range(100)]
+    assert os.getpid() not in result["pid"]
+
+
+def test_process_runner_python_objects(runner):
+    class Point:
+        def __init__(self, x: int) -> None:
+            self.x = x
+
+    df = DataFrame.from_pydict({"id": list(range(10)), "point": [Point(i) for i in range(10)]}).repartition(2)
+    df = df.where(col("id") < 5).sort(col("id"))
+    assert [point.x for point in df.to_pydict()["point"]] == list(range(5))
+
+
+def test_process_runner_deletes_shared_memory(runner):
+    df = DataFrame.from_pydict({"value": list(range(100))}).repartition(4)
+    df = df.with_column("double", col("value") * 2)
+    assert sorted(df.to_pydict()["double"]) == list(range(0, 200, 2))
+
+    del df
+    gc.collect()
+    assert os.listdir(runner._shared_memory_directory) == []
+
+
+def test_process_runner_raises_worker_errors(runner):
+    df = DataFrame.from_pydict({"value": list(range(100))}).repartition(2)
+    with pytest.raises(ValueError, match="UDF failed"):
+        df.with_column("failed", fail(col("value"))).collect()
+
+
+def test_no_op_steps_pass_on_shared_memory(runner):
+    shared = runner._to_shared_memory(vPartition.from_arrow_table(pa.table({"value": list(range(10))}), partition_id=0))
+    assert isinstance(shared, SharedMemoryPartition)
+    step = ExecutionStepBuilder(inputs=[shared]).build_materialization_request_single()
+    runner._build_partitions(step)
+    assert step.result.partition() is shared
+
+
+def test_shared_memory_root_needs_free_space(tmp_path, monkeypatch):
+    monkeypatch.setattr(process_runner, "SHARED_MEMORY_ROOT", str(tmp_path))
+    monkeypatch.setattr(process_runner, "SHARED_MEMORY_MIN_FREE_BYTES", 0)
+    assert process_runner._get_shared_memory_root() == str(tmp_path)
+    monkeypatch.setattr(process_runner, "SHARED_MEMORY_MIN_FREE_BYTES", shutil.disk_usage(tmp_path).total + 1)
+    assert process_runner._get_shared_memory_root() is None
+
+
+def test_shared_memory_directory(tmp_path):
+    runner = ProcessRunner(num_workers=1, shared_memory_directory=str(tmp_path))
+    assert os.path.dirname(runner._shared_memory_directory) == str(tmp_path)
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import threading
+import time
+
 import pandas as pd
+import psutil
+import pytest
 
+from daft import udf
+from daft.context import get_context
 from daft.dataframe import DataFrame
 from daft.expressions import col
+from daft.internal.kernels import groupby
+from daft.resource_request import ResourceRequest
+from daft.runners.pyrunner import PyRunner
 from tests.assets.assets import IRIS_CSV
 
 
@@ -29,3 +39,77 @@ def test_pyrunner_with_pandas():
     daft_pd_df = df.to_pandas()
     assert len(daft_pd_df) == len(pd_df)
     assert daft_pd_df.reset_index(drop=True).equals(pd_df.reset_index(drop=True))
+
+
+def test_pyrunner_runs_steps_serially_by_default():
+    assert PyRunner()._num_threads == 1
+    assert PyRunner(num_threads=4)._num_threads == 4
+
+
+@pytest.fixture
+def concurrency(monkeypatch) -> list[int]:
+    """Runs the PyRunner on 4 threads, and records the number of UDF calls that run concurrently"""
+    monkeypatch.setattr(get_context().runner(), "_num_threads", 4)
+    return []
+
+
+def _tracking_udf(concurrency: list[int], barrier: threading.Barrier | None):
+    running = [0]
+    lock = threading.Lock()
+
+    @udf(return_type=int)
+    def track(c):
+        with lock:
+            running[0] += 1
+            concurrency.append(running[0])
+        if barrier is not None:
+            barrier.wait()
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return [1] * len(c)
+
+    return track
+
+
+@pytest.mark.skipif(get_context().runner_config.name not in {"py"}, reason="requires PyRunner to be in use")
+def test_pyrunner_runs_steps_concurrently(concurrency):
+    # Every partition waits for all others to be running, which fails unless they run concurrently
+    track = _tracking_udf(concurrency, threading.Barrier(4, timeout=10))
+    df = DataFrame.from_pydict({"id": list(range(100))}).repartition(4)
+    df = df.with_column("tracked", track(col("id")))
+    result = df.sort(col("id")).to_pydict()
+    assert result["id"] == list(range(100))
+    assert result["tracked"] == [1] * 100
+    assert max(concurrency) == 4
+
+
+@pytest.mark.skipif(get_context().runner_config.name not in {"py"}, reason="requires PyRunner to be in use")
+def test_pyrunner_limits_concurrency_by_resource_requests(concurrency):
+    track = _tracking_udf(concurrency, None)
+    df = DataFrame.from_pydict({"id": list(range(100))}).repartition(4)
+    # Only one step requesting more than half the memory of the machine can run at a time
+    df = df.with_column(
+        "tracked",
+        track(col("id")),
+        resource_request=ResourceRequest(memory_bytes=psutil.virtual_memory().total // 2 + 1),
+    )
+    assert df.to_pydict()["tracked"] == [1] * 100
+    assert max(concurrency) == 1
+
+
+@pytest.mark.skipif(get_context().runner_config.name not in {"py"}, reason="requires PyRunner to be in use")
+def test_pyrunner_limits_kernel_threads_of_concurrent_steps(concurrency):
+    kernel_num_threads = []
+
+    @udf(return_type=int)
+    def record_kernel_num_threads(c):
+        kernel_num_threads.append(groupby._num_threads())
+        return [1] * len(c)
+
+    # Steps that run on the thread pool may only use the single CPU that they reserve by default
+    df = DataFrame.from_pydict({"id": list(range(100))}).repartition(4)
+    df = df.with_column("recorded", record_kernel_num_threads(col("id")))
+    assert df.to_pydict()["recorded"] == [1] * 100
+    assert kernel_num_threads == [1] * 4
+    assert groupby._num_threads() == groupby._NUM_THREADS